@@ -0,0 +1,187 @@
+"""Server-side admission for agents and implementations with a declared ``max_concurrency``.
+
+``assign`` used to push every Assign straight onto the agent's redis queue, so a slow agent
+could accumulate thousands of queued tasks the server no longer controlled: other agents sat
+idle, and cancelling queued work still took a round trip through the agent. An agent
+(``Agent.max_concurrency``) or an implementation (``Implementation.max_concurrency``) may now
+declare how much work it runs at once (0 = unlimited):
+
+- :func:`admit` decides, when a task is created, whether it fits. A task that does not is
+  saved ``pending`` (``latest_event_kind=QUEUED``, plus a QUEUED event) and never sent.
+- :func:`release` is run after a task of the agent frees its slot (the Task ``post_save``
+  fan-out, see :func:`release_if_held`) and by the ``reconcile_tasks`` sweep: it admits
+  the oldest held tasks that now fit, and ``RedisControllBackend.release_held`` dispatches them.
+- :func:`settle` finishes a held task server-side (cancel / interrupt before dispatch).
+
+A slot is taken by an unfinished, non-pending task — DISCONNECTED tasks excepted: their
+executor is gone, so they run nowhere. Held tasks are released oldest first; within one
+implementation the order is strict (a new task never overtakes a held one of the same
+implementation), across implementations a task held on its implementation's limit does
+not block the others. Both admission and release lock the agent row, so concurrent
+assigns and releases for one agent are serialised and never overshoot the limit.
+
+Held tasks count as open work in :data:`facade.scheduling.in_flight`, so the load-aware
+schedulers route new action-targeted work away from a saturated agent.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from facade import enums, models, transport
+
+HELD_MESSAGE = "Held by the server: the agent is at its concurrency limit."
+RELEASED_MESSAGE = "Released to the agent."
+
+
+@dataclass
+class _Slots:
+    """The running work of one agent, counted against its limits."""
+
+    limit: int
+    running: int = 0
+    by_implementation: Counter = field(default_factory=Counter)
+    held_implementations: set = field(default_factory=set)
+
+    def fits(self, implementation: models.Implementation) -> bool:
+        if self.limit and self.running >= self.limit:
+            return False
+        return not implementation.max_concurrency or self.by_implementation[implementation.pk] < implementation.max_concurrency
+
+    def take(self, implementation: models.Implementation) -> None:
+        self.running += 1
+        self.by_implementation[implementation.pk] += 1
+
+
+def _is_limited(task: models.Task) -> bool:
+    return bool(task.agent.max_concurrency or (task.implementation is not None and task.implementation.max_concurrency))
+
+
+def _slots(agent_limits: Dict[int, int]) -> Dict[int, _Slots]:
+    """Count the running and held work of each agent (one grouped scan of its open tasks)."""
+    slots = {agent_id: _Slots(limit=limit) for agent_id, limit in agent_limits.items()}
+    rows = (
+        models.Task.objects.filter(agent_id__in=list(agent_limits), is_done=False)
+        .exclude(latest_event_kind=enums.TaskEventKind.DISCONNECTED)
+        .values("agent_id", "implementation_id", "pending")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    for row in rows:
+        agent_slots = slots[row["agent_id"]]
+        if row["pending"]:
+            agent_slots.held_implementations.add(row["implementation_id"])
+        else:
+            agent_slots.running += row["n"]
+            agent_slots.by_implementation[row["implementation_id"]] += row["n"]
+    return slots
+
+
+def _lock_agents(agent_ids: Iterable[int]) -> Dict[int, int]:
+    """Lock the agent rows (in id order, so concurrent batches cannot deadlock) and return their limits."""
+    return dict(models.Agent.objects.select_for_update().filter(id__in=list(agent_ids)).order_by("id").values_list("id", "max_concurrency"))
+
+
+def admit(tasks: Sequence[models.Task]) -> None:
+    """Mark the (unsaved) ``tasks`` that do not fit their agent as ``pending``, in order.
+
+    Must run inside the transaction that saves them. Tasks of unlimited agents and
+    implementations cost nothing: no lock, no query.
+    """
+    limited = [task for task in tasks if _is_limited(task)]
+    if not limited:
+        return
+
+    slots = _slots(_lock_agents({task.agent_id for task in limited}))
+    for task in limited:
+        agent_slots = slots[task.agent_id]
+        if task.implementation_id not in agent_slots.held_implementations and agent_slots.fits(task.implementation):
+            agent_slots.take(task.implementation)
+            continue
+        task.pending = True
+        task.latest_event_kind = enums.TaskEventKind.QUEUED
+        agent_slots.held_implementations.add(task.implementation_id)
+
+
+def _create_events(tasks: Sequence[models.Task], kind: enums.TaskEventKind, message: str) -> None:
+    events = models.TaskEvent.objects.bulk_create([models.TaskEvent(task=task, kind=kind, message=message) for task in tasks])
+    # ``bulk_create`` sends no post_save: publish the events like ``task_event_post_save`` would.
+    for event in events:
+        transaction.on_commit(lambda event=event: transport.publish_task_event(event))
+
+
+def record_held(tasks: Sequence[models.Task]) -> None:
+    """Write the QUEUED event of each saved, held task (one insert; published on commit)."""
+    held = [task for task in tasks if task.pending]
+    if held:
+        _create_events(held, enums.TaskEventKind.QUEUED, HELD_MESSAGE)
+
+
+def release(agent_id: int) -> List[models.Task]:
+    """Admit the oldest held tasks of ``agent_id`` that now fit, returning them (not yet sent).
+
+    Must run inside a transaction; the caller dispatches the returned tasks once it commits.
+    """
+    limits = _lock_agents([agent_id])
+    if agent_id not in limits:
+        return []
+    agent_slots = _slots(limits)[agent_id]
+
+    released: List[models.Task] = []
+    held = (
+        models.Task.objects.select_for_update(of=("self",))
+        .filter(agent_id=agent_id, pending=True, is_done=False)
+        .select_related("agent", "implementation__action", "caller__user", "caller__client", "caller__organization")
+        .order_by("created_at", "id")
+    )
+    blocked = set()
+    for task in held:
+        if agent_slots.limit and agent_slots.running >= agent_slots.limit:
+            break
+        if task.implementation_id in blocked or not agent_slots.fits(task.implementation):
+            blocked.add(task.implementation_id)  # keep the per-implementation order strict
+            continue
+        agent_slots.take(task.implementation)
+        task.pending = False
+        task.latest_event_kind = enums.TaskEventKind.STARTED
+        task.save(update_fields=["pending", "latest_event_kind"])
+        released.append(task)
+
+    if released:
+        _create_events(released, enums.TaskEventKind.BOUND, RELEASED_MESSAGE)
+    return released
+
+
+def release_if_held(agent_id: int) -> None:
+    """Release held work of ``agent_id`` after one of its tasks freed a slot (a no-op without held work)."""
+    if not models.Task.objects.filter(agent_id=agent_id, pending=True, is_done=False).exists():
+        return
+    # Lazy: facade.backend imports facade.signals, which calls this.
+    from facade.backend import controll_backend
+
+    controll_backend.release_held(agent_id)
+
+
+def settle(task_id: int, kind: enums.TaskEventKind, instruct_kind: enums.TaskInstructKind) -> bool:
+    """Finish a held task in ``kind`` without involving the agent. Returns whether it was still held.
+
+    False means the task was released in the meantime; the caller then goes through the agent.
+    """
+    with transaction.atomic():
+        task = models.Task.objects.select_for_update().get(pk=task_id)
+        if not task.pending or task.is_done:
+            return False
+        task.pending = False
+        task.is_done = True
+        task.finished_at = timezone.now()
+        task.latest_event_kind = kind
+        task.latest_instruct_kind = instruct_kind
+        task.save(update_fields=["pending", "is_done", "finished_at", "latest_event_kind", "latest_instruct_kind"])
+        models.TaskEvent.objects.create(task=task, kind=kind, message="Settled before dispatch: the task was still held by the server.")
+    return True
@@ -0,0 +1,58 @@
+"""Writers of the availability index (``models.ActionAvailability``).
+
+The index projects every Implementation to ``(organization, action, agent, available)`` so
+the matcher's "which agents can run these actions" is one indexed lookup. It is written at
+the two places its inputs change:
+
+* **Registration** — a created Implementation is projected by ``implementation_post_save``;
+  the ``implement_agent`` reconcile re-projects one whose action changed. Deleting an
+  Implementation (the reconcile's reap) cascades to its row.
+* **Liveness transitions** — claim, release and revoke are ``Agent.save()`` calls, so
+  ``agent_post_save`` re-projects the agent's rows with :func:`set_agent_available`.
+
+``available`` is the transition-driven half of :func:`facade.backend.agent_is_available`:
+a webhook agent, or a websocket agent that is ``connected``. Heartbeat freshness expires
+without a write (the heartbeat renewal is a lock-free update that fires no signal), so
+readers that dispatch still confirm it on the candidate rows.
+
+Both writers recount the live agents of the structure-usage index (:mod:`facade.usages`)
+for the actions they touched.
+"""
+
+from facade import enums, models, usages
+
+
+def projected_available(agent: models.Agent) -> bool:
+    """The ``available`` flag of ``agent``'s rows."""
+    return agent.kind == enums.AgentKind.WEBHOOK.value or bool(agent.connected)
+
+
+def project_implementation(implementation: models.Implementation) -> None:
+    """Write (insert or overwrite) ``implementation``'s row in one statement."""
+    models.ActionAvailability.objects.bulk_create(
+        [
+            models.ActionAvailability(
+                implementation_id=implementation.pk,
+                organization_id=implementation.action.organization_id,
+                action_id=implementation.action_id,
+                agent_id=implementation.agent_id,
+                available=projected_available(implementation.agent),
+            )
+        ],
+        update_conflicts=True,
+        unique_fields=["implementation"],
+        update_fields=["organization", "action", "agent", "available"],
+    )
+    usages.refresh_live_agents([implementation.action_id])
+
+
+def set_agent_available(agent: models.Agent) -> int:
+    """Re-project ``agent``'s rows after a liveness transition; returns the rows changed."""
+    available = projected_available(agent)
+    changed = models.ActionAvailability.objects.filter(agent_id=agent.pk).exclude(available=available)
+    action_ids = list(changed.values_list("action_id", flat=True).distinct())
+    if not action_ids:
+        return 0
+    updated = changed.update(available=available)
+    usages.refresh_live_agents(action_ids)
+    return updated
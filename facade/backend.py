@@ -1,14 +1,19 @@
+import time
 import uuid
 from random import choice
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 
-from django.db.models import Q
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
 
-from facade import enums, inputs, liveness, models, types, messages
+from channels.db import database_sync_to_async
+from facade import admission, dependency_cache, enums, idempotency, inputs, liveness, models, outbox, replay, types, messages, scheduling, signals, transport
 from facade.caller_context import CallerContext
 from facade.consumers.async_consumer import AgentConsumer
 from facade.higher_order import build_lower_args, build_lower_dependencies
-from facade.provenance import mint_token_for_task
+from facade.provenance import mint_token_for_task, mint_tokens_for_tasks, principal as provenance_principal
 from facade.provenance.canonical import args_hash
 from kante.types import Info
 import logging
@@ -32,33 +37,81 @@ def agent_is_available(agent: models.Agent) -> bool:
     return liveness.agent_is_live(agent.connected, agent.last_seen)
 
 
-def build_agent_dependency_dict(agent: models.Agent, dep: models.Dependency) -> Dict[str, Any]:
+def _dependency_implementations(agents: List[models.Agent], dep: models.Dependency) -> Dict[Tuple[int, str], Tuple[int, bool]]:
+    """``(agent id, action key) -> (implementation id, has nested dependencies)`` for ``dep``'s action demands, in one query."""
+    action_keys = {(action_dependency.demand.key if action_dependency.demand else None) or action_dependency.key for action_dependency in dep.get_action_dependencies()}
+    if not agents or not action_keys:
+        return {}
+    rows = (
+        models.Implementation.objects.filter(agent__in=agents, action__key__in=action_keys)
+        .annotate(nested=Exists(models.Dependency.objects.filter(implementation=OuterRef("pk"))))
+        .values_list("agent_id", "action__key", "pk", "nested")
+    )
+    return {(agent_id, action_key): (pk, nested) for agent_id, action_key, pk, nested in rows}
+
+
+def build_agent_dependency_dict(agent: models.Agent, dep: models.Dependency, implementations: Dict[Tuple[int, str], Tuple[int, bool]] | None = None) -> Dict[str, Any]:
     # Only action demands map to callable implementations here; the dependency's state
     # demands are agent-SELECTION criteria (enforced in logic.auto_resolve and the agent
     # filter) and have no per-call representation.
-    implementations: Dict[str, str] = {}
+    if implementations is None:
+        implementations = _dependency_implementations([agent], dep)
+
+    actions: Dict[str, Any] = {}
 
     for action_dependency in dep.get_action_dependencies():
         # The demand's app/key identify the target action; the slot key is only the
         # caller-facing name and doubles as the action key when the demand doesn't pin one.
         action_key = (action_dependency.demand.key if action_dependency.demand else None) or action_dependency.key
-        try:
-            implementation = models.Implementation.objects.get(action__key=action_key, agent=agent)
-        except models.Implementation.DoesNotExist:
+        if (agent.pk, action_key) not in implementations:
             raise ValueError(f"No implementation found for dependency demand {action_dependency} on agent {agent}")
 
-        if implementation.dependencies.exists():
+        implementation_id, nested = implementations[(agent.pk, action_key)]
+        if nested:
             raise NotImplementedError("Nested dependencies are not supported yet, but they are coming soon!")
 
-        implementations[action_dependency.key] = {"implementation": str(implementation.pk), "dependencies": {}}
+        actions[action_dependency.key] = {"implementation": str(implementation_id), "dependencies": {}}
 
     return {
         "agent": str(agent.pk),
-        "actions": implementations,
+        "actions": actions,
     }
 
 
+def _resolve_dependency_agents(agents, dep: models.Dependency) -> List[Dict[str, Any]]:
+    """Cap ``agents`` at the dependency's instance bounds and build one entry per agent."""
+    if dep.max_viable_instances is not None:
+        agents = agents[: dep.max_viable_instances]
+    agents = list(agents)
+    if dep.min_viable_instances is not None and len(agents) < dep.min_viable_instances:
+        raise ValueError(f"Not enough agents found for dependency {dep.key}. Required at least {dep.min_viable_instances} but found only {len(agents)}. Please ensure that there are enough agents available to resolve this dependency.")
+
+    implementations = _dependency_implementations(agents, dep)
+    return [build_agent_dependency_dict(agent, dep, implementations) for agent in agents]
+
+
 def build_dependency_dict(implementation: models.Implementation, ctx: CallerContext, dependency_overwrites: List[inputs.ResolvedDependencyInputModel]) -> Dict[str, str]:
+    """Resolve the dependencies ``implementation`` declares into the dict an Assign carries.
+
+    Served from :data:`facade.dependency_cache.dependency_cache` when the same implementation
+    was resolved for the same organization and overwrites since the last agent / implementation
+    / dependency change.
+    """
+    organization_id = ctx.organization.pk if ctx.organization is not None else None
+    key = (implementation.pk, organization_id, dependency_cache.fingerprint(dependency_overwrites))
+    generation = dependency_cache.dependency_cache.generation()
+    if generation is not None:
+        cached = dependency_cache.dependency_cache.get(key, generation)
+        if cached is not None:
+            return cached
+
+    dep_kwargs = _build_dependency_dict(implementation, ctx, dependency_overwrites)
+    if generation is not None:
+        dependency_cache.dependency_cache.put(key, generation, dep_kwargs)
+    return dep_kwargs
+
+
+def _build_dependency_dict(implementation: models.Implementation, ctx: CallerContext, dependency_overwrites: List[inputs.ResolvedDependencyInputModel]) -> Dict[str, str]:
     dependencies = models.Dependency.objects.filter(implementation=implementation).all()
 
     dep_kwargs = {}
@@ -73,28 +126,15 @@ def build_dependency_dict(implementation: models.Implementation, ctx: CallerCont
                     raise ValueError(f"Dependency {dep.key} is not auto resolvable, but was provided with an overwrite that has auto_resolve set to true. Please either set auto_resolve to false for this dependency overwrite, or make the dependency auto resolvable in the system.")
 
                 agents = models.Agent.objects.filter(app__identifier=dep.app_filter, organization=ctx.organization).filter(agent_available_q("")).all()
-                if dep.max_viable_instances is not None:
-                    agents = agents[: dep.max_viable_instances]
-                if dep.min_viable_instances is not None and len(agents) < dep.min_viable_instances:
-                    raise ValueError(f"Not enough agents found for dependency {dep.key}. Required at least {dep.min_viable_instances} but found only {len(agents)}. Please ensure that there are enough agents available to resolve this dependency.")
-
             else:
                 agents = models.Agent.objects.filter(pk__in=[agent_id.agent for agent_id in overwrite.mapped_agents]).filter(agent_available_q("")).all()
-                if dep.max_viable_instances is not None:
-                    agents = agents[: dep.max_viable_instances]
-                if dep.min_viable_instances is not None and len(agents) < dep.min_viable_instances:
-                    raise ValueError(f"Not enough agents found for dependency {dep.key}. Required at least {dep.min_viable_instances} but found only {len(agents)}. Please ensure that there are enough agents available to resolve this dependency.")
 
-            dep_kwargs[dep.key] = [build_agent_dependency_dict(agent, dep) for agent in agents]
+            dep_kwargs[dep.key] = _resolve_dependency_agents(agents, dep)
             continue
         else:
             if dep.auto_resolvable:
                 agents = models.Agent.objects.filter(app__identifier=dep.app_filter, organization=ctx.organization).filter(agent_available_q("")).all()
-                if dep.max_viable_instances is not None:
-                    agents = agents[: dep.max_viable_instances]
-                if dep.min_viable_instances is not None and len(agents) < dep.min_viable_instances:
-                    raise ValueError(f"Not enough agents found for dependency {dep.key}. Required at least {dep.min_viable_instances} but found only {len(agents)}. Please ensure that there are enough agents available to resolve this dependency.")
-                dep_kwargs[dep.key] = [build_agent_dependency_dict(agent, dep) for agent in agents]
+                dep_kwargs[dep.key] = _resolve_dependency_agents(agents, dep)
             else:
                 raise ValueError(f"Dependency {dep.key} was not provided with an overwrite, and is not auto resolvable. Please provide a dependency overwrite for this dependency to ensure it can be resolved properly.")
 
@@ -137,6 +177,7 @@ class RedisControllBackend:
         inging_kind,
         to_agent_factory,
         propagate_children: bool = False,
+        settled_kind=None,
     ) -> models.Task:
         """The shared request phase of a two-phase lifecycle op.
 
@@ -145,23 +186,80 @@ class RedisControllBackend:
         the target, and (when ``propagate_children``) for every still-running descendant. The
         op resolves only when the executing agent sends the matching confirmation event. Raises
         if the task is already terminal.
+
+        A task still held by :mod:`facade.admission`, or whose Assign is still in the outbox
+        (:func:`facade.outbox.withdraw`), never reached its agent: it is settled server-side in
+        ``settled_kind`` at once, or, for an op without one, refused.
         """
         task = models.Task.objects.select_related("agent").get(id=task_id)
         if task.is_done:
             raise ValueError("Task is already terminal")
+        if task.pending and settled_kind is None:
+            raise ValueError("Task is held by the server and has not started yet")
+        if settled_kind is None and outbox.is_unsent(task.pk):
+            raise ValueError("Task has not been sent to its agent yet")
+
+        # Grouped per agent so a propagated op reaches every agent of the tree in one
+        # pipelined queue push, rather than a lookup and a push per descendant.
+        outgoing: Dict[int, Tuple[models.Agent, List[messages.ToAgentMessage]]] = {}
+        if task.pending and admission.settle(task.pk, settled_kind, instruct_kind):
+            task.refresh_from_db()
+        elif not task.pending and settled_kind is not None and outbox.withdraw(task.pk, settled_kind, instruct_kind):
+            task.refresh_from_db()
+        else:
+            task.latest_instruct_kind = instruct_kind
+            task.save(update_fields=["latest_instruct_kind"])
+            models.TaskEvent.objects.create(task=task, kind=inging_kind)
+            outgoing.setdefault(task.agent_id, (task.agent, []))[1].append(to_agent_factory(str(task.pk)))
 
-        targets = [task]
         if propagate_children:
-            targets += list(models.Task.objects.filter(root_id=task.id, is_done=False))
-
-        for target in targets:
-            target.latest_instruct_kind = instruct_kind
-            target.save(update_fields=["latest_instruct_kind"])
-            models.TaskEvent.objects.create(task=target, kind=inging_kind)
-            AgentConsumer.broadcast(target.agent_id, to_agent_factory(str(target.pk)))
-
+            # Held descendants and those still in the outbox never reached an agent (a handful
+            # at most, each behind its row lock).
+            for held_id in models.Task.objects.filter(root_id=task.id, is_done=False, pending=True).values_list("id", flat=True):
+                admission.settle(held_id, settled_kind, instruct_kind)
+            for unsent_id in models.TaskOutbox.objects.filter(task__root_id=task.id, task__is_done=False).values_list("task_id", flat=True):
+                outbox.withdraw(unsent_id, settled_kind, instruct_kind)
+            self._request_descendants_control(task, instruct_kind=instruct_kind, inging_kind=inging_kind, to_agent_factory=to_agent_factory, outgoing=outgoing)
+
+        transport.deliver_to_agents(list(outgoing.values()))
         return task
 
+    def _request_descendants_control(
+        self,
+        root: models.Task,
+        *,
+        instruct_kind,
+        inging_kind,
+        to_agent_factory,
+        outgoing: Dict[int, Tuple[models.Agent, List[messages.ToAgentMessage]]],
+    ) -> None:
+        """Put every running descendant of ``root`` into the request phase as one set.
+
+        A tree of thousands of tasks used to cost a save, an event insert and a publish per
+        descendant. Here one ``UPDATE … RETURNING`` stamps them all, their ``-ING`` events
+        go in with a single ``bulk_create`` and are published together, the change feeds get
+        one batched event each, and the control messages are added to ``outgoing`` per agent.
+        """
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {models.Task._meta.db_table} SET latest_instruct_kind = %s, updated_at = %s "
+                    "WHERE root_id = %s AND NOT is_done AND NOT pending RETURNING id, agent_id, parent_id",
+                    [getattr(instruct_kind, "value", instruct_kind), timezone.now(), root.pk],
+                )
+                rows = cursor.fetchall()
+            if not rows:
+                return
+            # ``bulk_create`` and a raw UPDATE send no signals: publish like their receivers would.
+            events = models.TaskEvent.objects.bulk_create([models.TaskEvent(task_id=task_id, kind=inging_kind) for task_id, _, _ in rows])
+            transaction.on_commit(lambda: transport.publish_task_events(events))
+            signals.announce_tasks_updated(root.pk, rows)
+
+        agents = models.Agent.objects.only(*transport.AGENT_TRANSPORT_FIELDS).in_bulk({agent_id for _, agent_id, _ in rows if agent_id})
+        for task_id, agent_id, _ in rows:
+            if agent_id in agents:
+                outgoing.setdefault(agent_id, (agents[agent_id], []))[1].append(to_agent_factory(str(task_id)))
+
     def cancel(self, input: inputs.CancelInputModel) -> models.Task:
         # Two-phase: CANCELING now; CANCELLED + is_done only when the agent confirms with
         # CancelledEvent. Sent to the mother only (the actor winds down its own children).
@@ -170,6 +268,7 @@ class RedisControllBackend:
             instruct_kind=enums.TaskInstructKind.CANCEL,
             inging_kind=enums.TaskEventKind.CANCELLING,
             to_agent_factory=lambda a: messages.Cancel(task=a),
+            settled_kind=enums.TaskEventKind.CANCELLED,
         )
 
     def interrupt(self, input: inputs.InterruptInputModel) -> models.Task:
@@ -181,6 +280,7 @@ class RedisControllBackend:
             inging_kind=enums.TaskEventKind.INTERRUPTING,
             to_agent_factory=lambda a: messages.Interrupt(task=a),
             propagate_children=True,
+            settled_kind=enums.TaskEventKind.INTERRUPTED,
         )
 
     def pause(self, input: inputs.PauseInputModel) -> models.Task:
@@ -191,25 +291,20 @@ class RedisControllBackend:
             to_agent_factory=lambda a: messages.Pause(task=a),
         )
 
-    def assign(self, principal: "CallerContext | Any", input: inputs.AssignInputModel) -> models.Task:
-        ctx = CallerContext.coerce(principal)
-        # Replay/reuse of prior results is the orchestrator's decision: tasks carry an
-        # indexed ``args_hash`` and the ``reusable_task_for`` query surfaces prior completed
-        # pure runs — the server never short-circuits an assign itself.
+    def _resolve_candidates(self, ctx: CallerContext, input: inputs.AssignInputModel) -> Tuple[models.Action, List[models.Implementation], Dict[str, Any] | None]:
+        """Resolve the action an assign input targets and the implementations that may run it.
 
-        # ``org`` is a required field on the Assign message — fail loudly here rather than
-        # crashing on ``None.slug`` further down (also covers the higher-order path).
-        if ctx.organization is None:
-            raise ValueError("Cannot assign without an organization")
+        An ``action`` / ``action_hash`` target yields every available implementation (ordered
+        by id, agent loaded) for the scheduler to choose from; the other targets pin exactly
+        one. The dependency dict is only returned for a ``dependency`` assign (it is pinned by
+        the parent's resolution); for every other target it is None and built by the caller.
+        """
+        assert ctx.organization is not None, "Cannot assign without an organization"
 
         action = None
-        implementation = None
-        resolution = None
-        agent = None
+        candidates: List[models.Implementation] = []
         dependency_dict = None
 
-        caller = get_caller_for_context(ctx)
-
         if input.dependency:
             assert input.method, "Method key must be provided when assigning to a dependency"
             assert input.parent, "Dependency assignments must have a parent task"
@@ -236,40 +331,27 @@ class RedisControllBackend:
             implementation_id = implementation_dep["implementation"]
             dependency_dict = implementation_dep["dependencies"]
 
-            implementation = models.Implementation.objects.get(id=implementation_id)
+            implementation = models.Implementation.objects.select_related("agent").get(id=implementation_id)
             action = implementation.action
-            action = implementation.action
-            agent = implementation.agent
+            candidates = [implementation]
 
         elif input.action:
             action = models.Action.objects.get(id=input.action)
-            implementation = models.Implementation.objects.filter(action=action).filter(agent_available_q("agent")).first()
-            if not implementation:
-                raise ValueError(f"No active implementation found for action {action.name}")
-
-            agent = implementation.agent
+            candidates = self._available_implementations(action)
 
         elif input.implementation:
-            implementation = models.Implementation.objects.get(id=input.implementation)
+            implementation = models.Implementation.objects.select_related("agent").get(id=input.implementation)
             action = implementation.action
-            agent = implementation.agent
             # A higher-order wrapper is virtual; its agent (== the lower implementation's
             # agent, by the co-location rule) is connectivity-checked in ``_assign_higher_order``,
             # which raises a ValueError. Skip the assert here so that path owns the check.
             if implementation.higher_order_for_id is None:
-                assert agent_is_available(agent), "Agent is not available (not connected, and not a webhook agent)"
+                assert agent_is_available(implementation.agent), "Agent is not available (not connected, and not a webhook agent)"
+            candidates = [implementation]
 
         elif input.action_hash:
             action = models.Action.objects.get(hash=input.action_hash, organization=ctx.organization)
-            implementation = models.Implementation.objects.filter(action=action).filter(agent_available_q("agent")).first()
-            if not implementation:
-                raise ValueError(f"No active implementation found for action {action.name}")
-            agent = implementation.agent
-
-        elif input.implementation:
-            implementation = models.Implementation.objects.get(id=input.implementation)
-            action = implementation.action
-            agent = implementation.agent
+            candidates = self._available_implementations(action)
 
         else:
             raise ValueError("You need to provide either, action_hash or action_id, to create an assignment for an agent")
@@ -277,31 +359,39 @@ class RedisControllBackend:
         if not action:
             raise ValueError("Could not determine action for this task")
 
-        # Higher-order implementations are orchestrated server-side: the wrapper task
-        # is virtual and a child task runs the resolved lower implementation.
-        if implementation is not None and implementation.higher_order_for_id is not None:
-            return self._assign_higher_order(ctx, input, implementation, caller)
-
-        acted_on = acted_on_from_args(input.args, action)
-
-        reference = input.reference or self.create_message_id()
-        if dependency_dict is None:
-            dependency_dict = build_dependency_dict(implementation, ctx, input.dependencies or [])
-
+        return action, candidates, dependency_dict
+
+    def _available_implementations(self, action: models.Action) -> List[models.Implementation]:
+        # The availability index narrows to the action's available rows; heartbeat freshness
+        # is not projected (it lapses without a write), so it is confirmed on the candidates.
+        rows = models.ActionAvailability.objects.filter(action=action, available=True).select_related("implementation__agent").order_by("implementation_id")
+        candidates = [row.implementation for row in rows if agent_is_available(row.implementation.agent)]
+        if not candidates:
+            raise ValueError(f"No active implementation found for action {action.name}")
+        return candidates
+
+    def _choose(self, candidates: List[models.Implementation], planned: Dict[int, int] | None = None) -> models.Implementation:
+        """The implementation a task runs on: the configured scheduler picks among several."""
+        if len(candidates) == 1:
+            return candidates[0]
+        return scheduling.get_scheduler().choose(candidates, planned or {})
+
+    def _new_task(self, input: inputs.AssignInputModel, action: models.Action, implementation: models.Implementation, agent: models.Agent, caller: models.Caller, dependency_dict: Dict[str, Any]) -> models.Task:
+        """The (unsaved) Task row of a resolved, non-higher-order assign."""
         # TODO: if ephemeral is set, we should not store the task in the database
-        task = models.Task.objects.create(
+        return models.Task(
             action=action,
             args=input.args,
             args_hash=args_hash(input.args or {}),
-            reference=reference,
+            reference=input.reference or self.create_message_id(),
             parent_id=input.parent,
             agent=agent,
-            acted_on=acted_on,
+            acted_on=acted_on_from_args(input.args, action),
             capture=input.capture if input.capture is not None else False,
             implementation=implementation,
             dependency=input.dependency,
             dependency_method=input.method,
-            resolution=resolution,
+            resolution=None,
             is_done=False,
             latest_event_kind=enums.TaskEventKind.STARTED,
             latest_instruct_kind=enums.TaskInstructKind.ASSIGN,
@@ -309,28 +399,164 @@ class RedisControllBackend:
             dependencies=dependency_dict,
             caller=caller,
             ephemeral=input.ephemeral if input.ephemeral is not None else False,
+            idempotency_key=input.idempotency_key,
         )
 
-        action = implementation.action
+    def _assign_message(self, ctx: CallerContext, task: models.Task, token: str | None) -> messages.Assign:
+        assert ctx.organization is not None, "Cannot assign without an organization"
+        implementation = task.implementation
+        return messages.Assign(
+            task=str(task.pk),
+            args=task.args,
+            user=str(ctx.user.sub),
+            org=str(ctx.organization.slug),
+            reference=task.reference,
+            capture=task.capture,
+            resolution=str(task.resolution_id) if task.resolution_id else None,
+            interface=implementation.interface,
+            action=str(implementation.action.hash),
+            implementation=str(implementation.pk),
+            token=token,
+        )
 
-        token = mint_token_for_task(task, ctx)
+    def assign(self, principal: "CallerContext | Any", input: inputs.AssignInputModel) -> models.Task:
+        ctx = CallerContext.coerce(principal)
+        task, message, fresh = self._write_assign(ctx, input)
+        if message is not None:
+            AgentConsumer.broadcast(task.agent, message=message)
+        if fresh:
+            self._assign_init_hooks(ctx, task, input)
+        return task
 
-        AgentConsumer.broadcast(
-            task.agent.pk,
-            message=messages.Assign(
-                task=str(task.pk),
+    async def aassign(self, principal: "CallerContext | Any", input: inputs.AssignInputModel) -> models.Task:
+        """:meth:`assign` for an async resolver (``REKUEST_ASSIGN_PIPELINE = "async"``).
+
+        The database work — resolution, admission, the insert and the token, which reads the
+        task's lineage — is one hop onto the ORM thread instead of the whole assign; the
+        queue push (redis.asyncio) or webhook POST (an async httpx client) then runs on the
+        event loop, so a slow redis or hook endpoint no longer holds the thread every other
+        sync resolver waits for.
+        """
+        ctx = await database_sync_to_async(CallerContext.coerce)(principal)
+        task, message, fresh = await database_sync_to_async(self._write_assign)(ctx, input)
+        if message is not None:
+            await transport.adeliver_to_agent(task.agent, message)
+        if input.hooks and fresh:
+            await database_sync_to_async(self._assign_init_hooks)(ctx, task, input)
+        return task
+
+    def _write_assign(self, ctx: CallerContext, input: inputs.AssignInputModel) -> Tuple[models.Task, messages.Assign | None, bool]:
+        """The persisting phase of an assign: the task, the Assign still to be sent, and whether init hooks are due.
+
+        The message is None when there is nothing left to send: the task is held by
+        :mod:`facade.admission`, its Assign went to the outbox (see :mod:`facade.outbox`), it is a higher-order wrapper (whose lower task was dispatched
+        by :meth:`_assign_higher_order`, and which runs no init hooks), an earlier assign
+        with the same ``idempotency_key`` created it (see :mod:`facade.idempotency`), or it
+        reuses a prior run (see :mod:`facade.replay`).
+        """
+        # Replay/reuse of prior results is the orchestrator's decision: tasks carry an
+        # indexed ``args_hash`` and the ``reusable_task_for`` query surfaces prior completed
+        # pure runs — the server only short-circuits an assign that opts in with ``reuse``.
+
+        # ``org`` is a required field on the Assign message — fail loudly here rather than
+        # crashing on ``None.slug`` further down (also covers the higher-order path).
+        if ctx.organization is None:
+            raise ValueError("Cannot assign without an organization")
+
+        key = input.idempotency_key
+        if key:
+            # A retry within the cache window costs this read and a primary-key fetch.
+            recalled = idempotency.recall(ctx, key)
+            if recalled is not None:
+                existing = models.Task.objects.select_related("agent", "implementation").filter(pk=recalled).first()
+                if existing is not None:
+                    return existing, None, False
+
+        caller = get_caller_for_context(ctx)
+
+        if key:
+            existing = models.Task.objects.select_related("agent", "implementation").filter(caller=caller, idempotency_key=key).first()
+            if existing is not None:
+                idempotency.remember(ctx, key, existing.pk)
+                return existing, None, False
+
+        action, candidates, dependency_dict = self._resolve_candidates(ctx, input)
+        implementation = self._choose(candidates)
+        agent = implementation.agent
+
+        # Higher-order implementations are orchestrated server-side: the wrapper task
+        # is virtual and a child task runs the resolved lower implementation.
+        if implementation.higher_order_for_id is not None:
+            return self._assign_higher_order(ctx, input, implementation, caller), None, False
+
+        if input.reuse is not None:
+            prior = replay.find_reusable(action, implementation, args_hash(input.args or {}), input.reuse)
+            if prior is not None:
+                return self._replay_task(input, action, prior, caller), None, False
+
+        if dependency_dict is None:
+            dependency_dict = build_dependency_dict(implementation, ctx, input.dependencies or [])
+
+        task = self._new_task(input, action, implementation, agent, caller, dependency_dict)
+        with transaction.atomic():
+            admission.admit([task])
+            if key:
+                # Two racing attempts both got here: the insert lets exactly one of them win.
+                if not idempotency.insert_claimed(task):
+                    existing = models.Task.objects.select_related("agent", "implementation").get(caller=caller, idempotency_key=key)
+                    transaction.on_commit(lambda: idempotency.remember(ctx, key, existing.pk))
+                    return existing, None, False
+                signals.announce_task_saved(task, created=True)
+                transaction.on_commit(lambda: idempotency.remember(ctx, key, task.pk))
+            else:
+                task.save()
+            admission.record_held([task])
+            if not task.pending and outbox.enabled():
+                # Sent by the dispatcher: committed with the task, so a crash loses nothing.
+                outbox.enqueue([task])
+                return task, None, True
+
+        if task.pending:
+            return task, None, True
+        return task, self._assign_message(ctx, task, mint_token_for_task(task, ctx)), True
+
+    def _replay_task(self, input: inputs.AssignInputModel, action: models.Action, prior: models.Task, caller: models.Caller) -> models.Task:
+        """A completed task mirroring ``prior``'s result: its yields, then COMPLETED, never dispatched.
+
+        The copied events point at the run they mirror through ``delegated_to``, as the
+        events a higher-order wrapper unfolds from its child do.
+        """
+        with transaction.atomic():
+            task = models.Task.objects.create(
+                action=action,
                 args=input.args,
-                user=str(ctx.user.sub),
-                org=str(ctx.organization.slug),
-                reference=reference,
-                capture=input.capture if input.capture is not None else False,
-                resolution=str(resolution.pk) if resolution else None,
-                interface=implementation.interface,
-                action=str(implementation.action.hash),
-                implementation=str(implementation.pk),
-                token=token,
-            ),
-        )
+                args_hash=prior.args_hash,
+                reference=input.reference or self.create_message_id(),
+                parent_id=input.parent,
+                agent_id=prior.agent_id,
+                implementation=prior.implementation,
+                acted_on=acted_on_from_args(input.args, action),
+                capture=False,
+                is_done=True,
+                finished_at=timezone.now(),
+                latest_event_kind=enums.TaskEventKind.COMPLETED,
+                latest_instruct_kind=enums.TaskInstructKind.ASSIGN,
+                hooks=input.hooks or [],
+                dependencies=prior.dependencies,
+                caller=caller,
+                ephemeral=input.ephemeral if input.ephemeral is not None else False,
+                idempotency_key=input.idempotency_key,
+                replay_of=prior,
+            )
+            yields = models.TaskEvent.objects.filter(task=prior, kind=enums.TaskEventKind.YIELD).order_by("id").values_list("returns", flat=True)
+            events = [models.TaskEvent(task=task, kind=enums.TaskEventKind.YIELD, returns=returns, delegated_to=prior) for returns in yields]
+            events.append(models.TaskEvent(task=task, kind=enums.TaskEventKind.COMPLETED, message=f"Reused the result of task {prior.pk}.", delegated_to=prior))
+            # ``bulk_create`` sends no post_save: publish the events like ``task_event_post_save`` would.
+            events = models.TaskEvent.objects.bulk_create(events)
+            transaction.on_commit(lambda: transport.publish_task_events(events))
+        return task
+
+    def _assign_init_hooks(self, ctx: CallerContext, task: models.Task, input: inputs.AssignInputModel) -> None:
         if input.hooks:
             for hook in input.hooks:
                 if hook.kind == enums.HookKind.INIT:
@@ -345,7 +571,95 @@ class RedisControllBackend:
                         ),
                     )
 
-        return task
+    def assign_many(self, principal: "CallerContext | Any", assigns: List[inputs.AssignInputModel]) -> List[models.Task]:
+        """Assign a fan-out of tasks for one caller, returning them in input order.
+
+        Equivalent to calling :meth:`assign` per input, but what the batch shares is paid once:
+        the caller, each distinct target (action / implementation / action hash) with its
+        candidate implementations, and each dependency dict are resolved once, the rows are written with one ``bulk_create``, the
+        provenance tokens are minted in one pass, and each agent's Assign messages go out in one
+        queue push (in outbox mode, one ``TaskOutbox`` row each, written with the tasks). Every
+        batched target is resolved before anything is written, so a bad input fails the batch
+        without creating its tasks. Tasks over an agent's or implementation's
+        ``max_concurrency`` are written but held (see :mod:`facade.admission`).
+
+        ``dependency`` assigns (a random pick per task), inputs with an ``idempotency_key`` or a
+        ``reuse`` policy and higher-order targets keep their own path: they are assigned one by one, through
+        :meth:`assign`, after the batch.
+        """
+        ctx = CallerContext.coerce(principal)
+        if ctx.organization is None:
+            raise ValueError("Cannot assign without an organization")
+
+        caller = get_caller_for_context(ctx)
+
+        targets: Dict[Tuple[str | None, str | None, str | None], Tuple[models.Action, List[models.Implementation]]] = {}
+        planned: Dict[int, int] = {}
+        dependency_dicts: Dict[Tuple[int, Tuple[str, ...]], Dict[str, Any]] = {}
+        batched: List[Tuple[int, inputs.AssignInputModel, models.Task]] = []
+        one_by_one: List[int] = []
+
+        for index, input in enumerate(assigns):
+            if input.dependency or input.idempotency_key or input.reuse is not None:
+                one_by_one.append(index)
+                continue
+
+            target_key = (input.action, input.implementation, input.action_hash)
+            if target_key not in targets:
+                action, candidates, _ = self._resolve_candidates(ctx, input)
+                targets[target_key] = (action, candidates)
+            action, candidates = targets[target_key]
+
+            # Chosen per task, counting this batch's earlier picks, so a sweep over one action
+            # spreads across its agents instead of landing on a single one.
+            implementation = self._choose(candidates, planned)
+            agent = implementation.agent
+
+            if implementation.higher_order_for_id is not None:
+                one_by_one.append(index)
+                continue
+
+            planned[agent.pk] = planned.get(agent.pk, 0) + 1
+
+            overwrites = input.dependencies or []
+            dependency_key = (implementation.pk, dependency_cache.fingerprint(overwrites))
+            if dependency_key not in dependency_dicts:
+                dependency_dicts[dependency_key] = build_dependency_dict(implementation, ctx, overwrites)
+
+            batched.append((index, input, self._new_task(input, action, implementation, agent, caller, dependency_dicts[dependency_key])))
+
+        tasks: List[models.Task | None] = [None] * len(assigns)
+        with transaction.atomic():
+            admission.admit([task for _, _, task in batched])
+            created = models.Task.objects.bulk_create([task for _, _, task in batched])
+
+            # ``bulk_create`` sends no post_save: fan the new rows out to the feeds ourselves.
+            for task in created:
+                signals.announce_task_saved(task, created=True)
+            admission.record_held(created)
+            dispatched = [task for task in created if not task.pending]
+            if outbox.enabled():
+                outbox.enqueue(dispatched)
+                dispatched = []
+
+        tokens = mint_tokens_for_tasks(dispatched, ctx)
+
+        outgoing: Dict[int, List[messages.Assign]] = {}
+        for task, token in zip(dispatched, tokens):
+            outgoing.setdefault(task.agent_id, []).append(self._assign_message(ctx, task, token))
+
+        agents = models.Agent.objects.only(*transport.AGENT_TRANSPORT_FIELDS).in_bulk(list(outgoing))
+        for agent_id, agent_messages in outgoing.items():
+            transport.deliver_many_to_agent(agents[agent_id], agent_messages)
+
+        for index, input, task in batched:
+            tasks[index] = task
+            self._assign_init_hooks(ctx, task, input)
+
+        for index in one_by_one:
+            tasks[index] = self.assign(ctx, assigns[index])
+
+        return [task for task in tasks if task is not None]
 
     def _assign_higher_order(self, ctx: CallerContext, input: inputs.AssignInputModel, higher: models.Implementation, caller: models.Caller) -> models.Task:
         """Orchestrate a higher-order task: remap args/deps, run a child on the lower agent.
@@ -396,10 +710,13 @@ class RedisControllBackend:
             dependencies=higher_dependencies,
             caller=caller,
             ephemeral=input.ephemeral if input.ephemeral is not None else False,
+            # Not claimed with ON CONFLICT: a racing duplicate fails on the constraint here,
+            # before its lower task is dispatched.
+            idempotency_key=input.idempotency_key,
         )
 
         # The child task that actually runs on the resolved lower agent.
-        lower_task = models.Task.objects.create(
+        lower_task = models.Task(
             action=lower_action,
             args=lower_args,
             args_hash=args_hash(lower_args or {}),
@@ -416,11 +733,20 @@ class RedisControllBackend:
             dependencies=lower_dependencies,
             caller=caller,
         )
+        with transaction.atomic():
+            admission.admit([lower_task])
+            lower_task.save()
+            admission.record_held([lower_task])
+            if not lower_task.pending and outbox.enabled():
+                outbox.enqueue([lower_task])
+                return higher_task
+        if lower_task.pending:
+            return higher_task
 
         token = mint_token_for_task(lower_task, ctx)
 
         AgentConsumer.broadcast(
-            lower_agent.pk,
+            lower_agent,
             message=messages.Assign(
                 task=str(lower_task.pk),
                 args=lower_args,
@@ -446,11 +772,103 @@ class RedisControllBackend:
             to_agent_factory=lambda a: messages.Resume(task=a, step=input.step),
         )
 
+    def release_held(self, agent_id: int) -> List[models.Task]:
+        """Dispatch the held tasks of ``agent_id`` that fit its freed slots (see :mod:`facade.admission`).
+
+        The release and the Assign messages are decided under the agent's row lock; the
+        messages go out in one queue push once it commits (or, in outbox mode, are left to the
+        dispatcher in the same transaction).
+        """
+        with transaction.atomic():
+            released = admission.release(agent_id)
+            if not released:
+                return []
+            if outbox.enabled():
+                outbox.enqueue(released)
+                return released
+
+            outgoing = self._assign_messages_by_caller(released)
+            agent = released[0].agent
+            transaction.on_commit(lambda: transport.deliver_many_to_agent(agent, outgoing))
+
+        return released
+
+    def _assign_messages_by_caller(self, tasks: List[models.Task]) -> List[messages.Assign]:
+        """The Assign of each of ``tasks`` (in order), minted per caller outside its request."""
+        tokens: Dict[int, str | None] = {}
+        contexts: Dict[int, CallerContext] = {}
+        by_caller: Dict[int, List[models.Task]] = {}
+        for task in tasks:
+            by_caller.setdefault(task.caller_id, []).append(task)
+        for caller_tasks in by_caller.values():
+            caller = caller_tasks[0].caller
+            ctx = CallerContext(user=caller.user, client=caller.client, organization=caller.organization, roles=provenance_principal.roles_for_caller(caller))
+            tokens.update(zip((task.pk for task in caller_tasks), mint_tokens_for_tasks(caller_tasks, ctx)))
+            contexts.update(dict.fromkeys((task.pk for task in caller_tasks), ctx))
+        return [self._assign_message(contexts[task.pk], task, tokens[task.pk]) for task in tasks]
+
+    def dispatch_outbox(self, limit: int = outbox.BATCH_SIZE) -> int:
+        """Send the Assigns of up to ``limit`` outbox rows and delete them (see :mod:`facade.outbox`).
+
+        The rows are leased in a short transaction (:func:`facade.outbox.claim`, ``SKIP
+        LOCKED``), so concurrent dispatchers drain disjoint batches and no lock is held while
+        the pushes and webhook POSTs run. Every WEBSOCKET agent's run goes out in one pipelined
+        push; the webhook POSTs that follow renew the lease once half of it is spent and skip
+        rows withdrawn meanwhile. Rows are deleted once their run went out: a crash in between
+        leaves them to be sent again once the lease expires, never drops them. Returns the
+        number of rows drained.
+        """
+        claim = self.create_message_id()
+        leased_at = time.monotonic()
+        claimed = outbox.claim(claim, limit)
+        if not claimed:
+            return 0
+
+        rows = list(
+            models.TaskOutbox.objects.filter(pk__in=claimed, claimed_by=claim)
+            .select_related("task__agent", "task__implementation__action", "task__caller__user", "task__caller__client", "task__caller__organization")
+            .order_by("id")
+        )
+        # A task finished before its turn has nothing left to start, and one cancelled or
+        # interrupted while leased is settled rather than started.
+        tasks, row_ids = [], {}
+        for row in rows:
+            instruct = getattr(row.task.latest_instruct_kind, "value", row.task.latest_instruct_kind)
+            if row.task.is_done:
+                continue
+            if instruct in outbox.SETTLED_KINDS:
+                outbox.settle_unsent(row.task.pk)
+                continue
+            tasks.append(row.task)
+            row_ids[row.task.pk] = row.pk
+        batches: Dict[int, Tuple[models.Agent, List[Tuple[int, messages.ToAgentMessage]]]] = {}
+        for task, message in zip(tasks, self._assign_messages_by_caller(tasks)):
+            batches.setdefault(task.agent_id, (task.agent, []))[1].append((row_ids[task.pk], message))
+
+        queued = [(agent, run) for agent, run in batches.values() if agent.kind != enums.AgentKind.WEBHOOK.value]
+        transport.deliver_to_agents([(agent, [message for _, message in run]) for agent, run in queued])
+        models.TaskOutbox.objects.filter(pk__in=[row_id for _, run in queued for row_id, _ in run], claimed_by=claim).delete()
+
+        held = set(claimed)
+        for agent, run in batches.values():
+            if agent.kind != enums.AgentKind.WEBHOOK.value:
+                continue
+            for row_id, message in run:
+                if time.monotonic() - leased_at > settings.REKUEST_OUTBOX_LEASE / 2:
+                    held = set(outbox.renew(claim))
+                    leased_at = time.monotonic()
+                if row_id in held:
+                    transport.deliver_to_agent(agent, message)
+            models.TaskOutbox.objects.filter(pk__in=[row_id for row_id, _ in run], claimed_by=claim).delete()
+        models.TaskOutbox.objects.filter(pk__in=claimed, claimed_by=claim).delete()
+
+        return len(claimed)
+
     def bounce(self, info: Info, input: inputs.BounceInputModel) -> models.Agent:
         agent = models.Agent.objects.get(id=input.agent)
 
         AgentConsumer.broadcast(
-            agent.id,
+            agent,
             message=messages.Bounce(
                 agent=agent.id,
             ),
@@ -463,7 +881,7 @@ class RedisControllBackend:
         agent.save()
 
         AgentConsumer.broadcast(
-            agent.id,
+            agent,
             message=messages.Kick(
                 agent=agent.id,
                 reason=input.reason,
@@ -482,7 +900,7 @@ class RedisControllBackend:
         agent = models.Agent.objects.get(id=input.agent)
 
         AgentConsumer.broadcast(
-            agent.id,
+            agent,
             message=messages.Kick(
                 agent=agent.id,
             ),
@@ -495,15 +913,15 @@ class RedisControllBackend:
         drawers = models.MemoryDrawer.objects.filter(id__in=input.drawers).prefetch_related("shelve__agent").all()
 
         for drawer in drawers:
-            if drawer.shelve.agent.pk not in agents:
-                agents[drawer.shelve.agent.pk] = set()
-            agents[drawer.shelve.agent.pk].add(str(drawer.pk))
+            agent = drawer.shelve.agent
+            if agent.pk not in agents:
+                agents[agent.pk] = (agent, set())
+            agents[agent.pk][1].add(str(drawer.pk))
 
-        for agent_id, drawers in agents.items():
-            agent = models.Agent.objects.get(id=agent_id)
+        for agent_id, (agent, drawers) in agents.items():
             logging.info(f"collecting {drawers} from agent {agent_id}")
             AgentConsumer.broadcast(
-                agent.pk,
+                agent,
                 message=messages.Collect(
                     drawers=list(drawers),
                 ),
@@ -0,0 +1,33 @@
+"""Helpers shared by the benchmark and load-test management commands."""
+
+from types import SimpleNamespace
+from typing import Any, List
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """The ``q`` quantile (0..1) of ``samples`` by nearest rank; 0.0 when there are none."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+# Demand inputs for the matcher benchmarks: stand-ins with every attribute the demand
+# renderers in ``facade.managers`` read, defaulted to None.
+def match(**fields: Any) -> SimpleNamespace:
+    """A port match (``PortMatchInput``)."""
+    shape = dict(at=None, key=None, kind=None, identifier=None, dimension=None, descriptors=None, nullable=None, children=None)
+    shape.update(fields)
+    return SimpleNamespace(**shape)
+
+
+def port_demand(matches, kind="args", **forced: Any) -> SimpleNamespace:
+    """A port demand (``PortDemandInput``) over ``matches``."""
+    shape = dict(force_length=None, force_non_nullable_length=None, force_structure_length=None)
+    shape.update(forced)
+    return SimpleNamespace(kind=kind, matches=matches, **shape)
+
+
+def action_demand(**fields: Any) -> SimpleNamespace:
+    """An action demand (``ActionDemandInput``)."""
+    shape = dict(hash=None, key=None, app=None, version=None, name=None, arg_matches=None, return_matches=None, force_arg_length=None, force_return_length=None, protocols=None)
+    shape.update(fields)
+    return SimpleNamespace(**shape)
@@ -22,10 +22,18 @@ class PatchEvent(BaseModel):
 
 
 class TaskEventCreatedEvent(BaseModel):
-    """A model representing a task event created."""
+    """A model representing a task event created.
+
+    Besides the ids it carries the task columns ``TaskChangeFilter`` reads, so a filtered
+    subscriber can drop a change without loading it.
+    """
 
     event: int | None = Field(None, description="The event that was created.")
     create: int | None = Field(None, description="The task created.")
+    action: int | None = Field(None, description="The action of the task.")
+    agent: int | None = Field(None, description="The agent executing the task, if any.")
+    acted_on: list[str] = Field(default_factory=list, description="The structures the task acts on.")
+    kind: str | None = Field(None, description="The kind of the event (only set alongside ``event``).")
 
 
 class ChildTaskEvent(BaseModel):
@@ -33,6 +41,7 @@ class ChildTaskEvent(BaseModel):
 
     create: int | None = Field(None, description="The task that was created.")
     update: int | None = Field(None, description="The task that was updated.")
+    updates: list[int] | None = Field(None, description="The tasks that were updated together (a set-based transition of a task tree).")
 
 
 class AgentEvent(BaseModel):
@@ -57,9 +57,6 @@ Authenticator = Callable[[messages.Register], Awaitable["models.Agent"]]
 # displace other live connections — both are no-ops by default (unit tests).
 RegisterConnectionCallable = Callable[[str], Awaitable[None]]
 KickOthersCallable = Callable[[], Awaitable[None]]
-# Wired by the adapter so the protocol can join the caller event group
-# (``task_caller_{caller_id}``) and receive the events of work it originated.
-RegisterCallerCallable = Callable[[str], Awaitable[None]]
 
 
 async def _noop_register_connection(agent_id: str) -> None:
@@ -70,10 +67,6 @@ async def _noop_kick_others() -> None:
     return None
 
 
-async def _noop_register_caller(caller_id: str) -> None:
-    return None
-
-
 class FromAgentPayload(BaseModel):
     """Pydantic model representing the payload sent by the agent."""
 
@@ -302,7 +295,6 @@ class AgentProtocol:
         authenticator: Authenticator = default_authenticator,
         register_connection: RegisterConnectionCallable = _noop_register_connection,
         kick_others: KickOthersCallable = _noop_kick_others,
-        register_caller: RegisterCallerCallable = _noop_register_caller,
         connection_id: Optional[str] = None,
         heartbeat_interval: Optional[float] = None,
         heartbeat_timeout: Optional[float] = None,
@@ -314,7 +306,6 @@ class AgentProtocol:
         self.authenticator = authenticator
         self.register_connection = register_connection
         self.kick_others = kick_others
-        self.register_caller = register_caller
         # Identifies this connection so the backend can tell, on disconnect,
         # whether we are still the agent's active connection or were displaced.
         self.connection_id = connection_id or str(uuid.uuid4())
@@ -390,10 +381,10 @@ class AgentProtocol:
             await self.close(codes.AGENT_IS_BLOCKED_CODE)
             return
 
-        # Join the caller event group: an agent assigns *dependent* work and must receive its
-        # results back over this socket. Done before Init so no event is missed.
+        # Ensure the agent's Caller identity exists: an agent assigns *dependent* work and gets
+        # its results back as ``…Event`` mirrors pushed onto its own agent queue (see
+        # ``facade.transport``), so they are retained even across a brief disconnect.
         caller_id = await self.backend.get_or_create_caller_id(agent.pk)
-        await self.register_caller(caller_id)
 
         # Join the agent's connection group first (so we can later be kicked). Done before the
         # claim even though we may still lose it: a rejected registration closes the socket,
@@ -12,8 +12,9 @@ monkeypatching the ``redis``/``redis.asyncio`` factories.
 
 import abc
 import asyncio
+import weakref
 from collections import defaultdict
-from typing import DefaultDict, Dict, Optional, Tuple
+from typing import DefaultDict, Dict, Mapping, Optional, Sequence, Tuple
 
 import redis
 import redis.asyncio as aredis
@@ -43,6 +44,19 @@ def _sync_pool(host: str, port: int) -> "redis.ConnectionPool":
     return pool
 
 
+# The async counterpart for producers on an event loop (``transport.adeliver_to_agent``). A
+# redis.asyncio pool is bound to the loop it was first used on, so there is one per loop.
+_async_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, int], aredis.ConnectionPool]]" = weakref.WeakKeyDictionary()
+
+
+def _async_pool(host: str, port: int) -> "aredis.ConnectionPool":
+    pools = _async_pools.setdefault(asyncio.get_running_loop(), {})
+    pool = pools.get((host, port))
+    if pool is None:
+        pool = pools[(host, port)] = aredis.ConnectionPool(host=host, port=port)
+    return pool
+
+
 class AgentQueue(abc.ABC):
     """A per-agent message queue: producers ``push``, the consumer ``pop``s."""
 
@@ -54,6 +68,29 @@ class AgentQueue(abc.ABC):
         classmethod ``AgentConsumer.broadcast``) which runs in a sync context.
         """
 
+    async def apush(self, agent_id: str, message_json: str) -> None:
+        """:meth:`push` for a producer running on an event loop.
+
+        The default calls ``push``; a backend whose push blocks on the network overrides it.
+        """
+        self.push(agent_id, message_json)
+
+    def push_many(self, agent_id: str, messages_json: Sequence[str]) -> None:
+        """Enqueue several messages for ``agent_id``, to be popped in the given order.
+
+        The default pushes one by one; a backend that can enqueue in one round-trip overrides it.
+        """
+        for message_json in messages_json:
+            self.push(agent_id, message_json)
+
+    def push_batches(self, batches: Mapping[str, Sequence[str]]) -> None:
+        """Enqueue a run of messages for each of several agents (``{agent_id: messages}``).
+
+        The default pushes agent by agent; a backend that can pipeline overrides it.
+        """
+        for agent_id, messages_json in batches.items():
+            self.push_many(agent_id, messages_json)
+
     @abc.abstractmethod
     async def pop(self, agent_id: str) -> Optional[str]:
         """Block until a message is available for ``agent_id`` and return it.
@@ -93,6 +130,28 @@ class RedisAgentQueue(AgentQueue):
         connection = redis.Redis(connection_pool=_sync_pool(self.host, self.port))
         connection.lpush(f"{agent_id}{QUEUE_SUFFIX}", message_json)
 
+    async def apush(self, agent_id: str, message_json: str) -> None:
+        await aredis.Redis(connection_pool=_async_pool(self.host, self.port)).lpush(f"{agent_id}{QUEUE_SUFFIX}", message_json)
+
+    def push_many(self, agent_id: str, messages_json: Sequence[str]) -> None:
+        # One variadic LPUSH: the values land head-first in argument order and ``pop`` takes
+        # from the tail, so the agent still receives them in the given order.
+        if not messages_json:
+            return
+        connection = redis.Redis(connection_pool=_sync_pool(self.host, self.port))
+        connection.lpush(f"{agent_id}{QUEUE_SUFFIX}", *messages_json)
+
+    def push_batches(self, batches: Mapping[str, Sequence[str]]) -> None:
+        # One LPUSH per agent, all in one pipelined round-trip (not a MULTI: each agent's
+        # push stands on its own, as separate ``push_many`` calls would).
+        batches = {agent_id: messages_json for agent_id, messages_json in batches.items() if messages_json}
+        if not batches:
+            return
+        pipe = redis.Redis(connection_pool=_sync_pool(self.host, self.port)).pipeline(transaction=False)
+        for agent_id, messages_json in batches.items():
+            pipe.lpush(f"{agent_id}{QUEUE_SUFFIX}", *messages_json)
+        pipe.execute()
+
     async def pop(self, agent_id: str) -> Optional[str]:
         if self._async_connection is None:
             self._async_connection = aredis.Redis(host=self.host, port=self.port)
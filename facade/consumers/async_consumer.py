@@ -2,10 +2,9 @@ import logging
 import uuid
 from typing import Optional
 
-from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
 
-from facade import caller_events, codes, messages, models
+from facade import codes, messages, models
 from facade.consumers.agent_protocol import AgentProtocol
 from facade.consumers.agent_queue import RedisAgentQueue
 
@@ -17,11 +16,6 @@ def _agent_group(agent_id: str) -> str:
     return f"agent-{agent_id}"
 
 
-def _caller_group(caller_id: str) -> str:
-    """Channel-layer group carrying the task events a caller originated."""
-    return f"task_caller_{caller_id}"
-
-
 class AgentConsumer(AsyncWebsocketConsumer):
     """Thin Channels adapter around :class:`AgentProtocol`.
 
@@ -33,39 +27,43 @@ class AgentConsumer(AsyncWebsocketConsumer):
     groups = ["broadcast"]
 
     @classmethod
-    def broadcast(cls, agent_id: int, message: messages.ToAgentMessage) -> None:
+    def broadcast(cls, agent: "models.Agent | int | str", message: messages.ToAgentMessage) -> None:
         """Send a message to a specific agent over its transport (thin facade).
 
         Kept for the existing backend/signal call sites; delegates to the typed
         :func:`facade.transport.deliver_to_agent`, which picks redis queue (WEBSOCKET) vs
         HMAC-signed POST (WEBHOOK). Called only AFTER the row is persisted, so a failed
         delivery is recoverable from the DB.
+
+        Pass the ``Agent`` when the caller already holds it (with the
+        ``transport.AGENT_TRANSPORT_FIELDS`` loaded); an id costs a lookup of those columns.
         """
         from facade import transport  # lazy: transport imports this consumer's queue module
 
-        agent = models.Agent.objects.only("id", "kind", "hook_url", "hook_url_secret").get(id=agent_id)
+        if not isinstance(agent, models.Agent):
+            agent = models.Agent.objects.only(*transport.AGENT_TRANSPORT_FIELDS).get(id=agent)
         transport.deliver_to_agent(agent, message)
 
     async def connect(self) -> None:
         """Accept the socket and build a protocol bound to this transport."""
         # Lazily start the process-wide stale-agent reaper (idempotent). Under daphne there is
         # no lifespan hook, so the first websocket connection is our startup signal.
+        from facade import outbox  # lazy: avoids import at app-load time
         from facade.reaper import ensure_reaper_started  # lazy: avoids import at app-load time
 
         ensure_reaper_started()
+        outbox.ensure_started()
         await self.accept()
         # Identifies this connection within its agent group so a force-register
         # can displace the others without closing itself.
         self.connection_id = str(uuid.uuid4())
         self._agent_group: Optional[str] = None
-        self._caller_group: Optional[str] = None
         self.protocol = AgentProtocol(
             send=lambda text: self.send(text_data=text),
             close=lambda code: self.close(code=code),
             queue=RedisAgentQueue.from_settings(),
             register_connection=self.register_connection,
             kick_others=self.kick_others,
-            register_caller=self.register_caller,
             connection_id=self.connection_id,
         )
 
@@ -74,42 +72,6 @@ class AgentConsumer(AsyncWebsocketConsumer):
         self._agent_group = _agent_group(agent_id)
         await self.channel_layer.group_add(self._agent_group, self.channel_name)
 
-    async def register_caller(self, caller_id: str) -> None:
-        """Join the caller event group so events of work this identity originated reach us."""
-        self._caller_group = _caller_group(caller_id)
-        await self.channel_layer.group_add(self._caller_group, self.channel_name)
-
-    async def channel_TaskEventCreatedEvent(self, event: dict) -> None:
-        """Forward a caller-bound task event to this socket as a ``…Event`` mirror.
-
-        Producer side: ``facade/transport.py`` broadcasts ``TaskEventCreatedEvent`` to
-        ``task_caller_{caller_id}`` on every TaskEvent save (this WS forward consumes every
-        caller event, root and child; the slim GraphQL change feeds consume the separate
-        ``root_tasks_*`` topics). We only forward the ``event`` branch — the ``create`` branch
-        is covered authoritatively by ``AssignResponse``, so forwarding it too would race the
-        ack. Best-effort: a brief disconnect simply misses events.
-        """
-        protocol = getattr(self, "protocol", None)
-        if protocol is None or protocol.session is None:
-            return  # not registered yet — nothing to correlate against
-
-        event_id = (event.get("message") or {}).get("event")
-        if event_id is None:
-            return  # a `create` (or malformed) payload — not a task event
-
-        message = await self._build_execution_event(event_id)
-        if message is not None:
-            await protocol.send_to_agent_message(message)
-
-    @database_sync_to_async
-    def _build_execution_event(self, event_id):
-        """Load the TaskEvent and map it to its …Event mirror (off the event loop)."""
-        try:
-            event = models.TaskEvent.objects.select_related("task").get(id=event_id)
-        except models.TaskEvent.DoesNotExist:
-            return None
-        return caller_events.build_execution_event(event)
-
     async def kick_others(self) -> None:
         """Tell every other connection in this agent's group to close."""
         if self._agent_group is None:
@@ -133,9 +95,6 @@ class AgentConsumer(AsyncWebsocketConsumer):
         group = getattr(self, "_agent_group", None)
         if group is not None:
             await self.channel_layer.group_discard(group, self.channel_name)
-        caller_group = getattr(self, "_caller_group", None)
-        if caller_group is not None:
-            await self.channel_layer.group_discard(caller_group, self.channel_name)
         if hasattr(self, "protocol"):
             await self.protocol.shutdown()
         logger.warning(f"Agent disconnected with code {code}")
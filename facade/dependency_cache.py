@@ -0,0 +1,101 @@
+"""Process-local cache of resolved dependency dicts (``backend.build_dependency_dict``).
+
+Resolving an implementation's dependencies walks its ``Dependency`` rows, selects the
+available agents of each, and looks up the implementation every agent offers for each
+demanded action — on every assign. The result only changes when an agent's availability
+or an implementation / dependency changes, so it is cached per
+``(implementation id, organization id, overwrite fingerprint)``.
+
+Invalidation is generational, so it reaches every worker: the ``post_save`` /
+``post_delete`` signals of ``Agent`` (connect, disconnect and revoke are saves),
+``Implementation`` and ``Dependency`` call :func:`invalidate` on commit, which bumps a
+counter in redis; an entry stored under an older generation is a miss. Liveness also
+lapses without a write (a heartbeat that stops), which no signal sees, so an entry is
+trusted for :data:`TTL_SECONDS` at most. If redis is unreachable the cache is bypassed.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+import redis
+from django.conf import settings
+
+from facade.consumers.agent_queue import _sync_pool
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = "rekuest:dependency_cache:generation"
+# How long a resolution is trusted without an invalidation (bounds liveness that lapses silently).
+TTL_SECONDS = 10.0
+MAX_ENTRIES = 1024
+
+CacheKey = Tuple[Hashable, ...]
+
+
+def _connection() -> redis.Redis:
+    return redis.Redis(connection_pool=_sync_pool(settings.AGENT_REDIS_HOST, settings.AGENT_REDIS_PORT))
+
+
+def fingerprint(overwrites: Iterable[Any]) -> Tuple[str, ...]:
+    """A hashable stand-in for a list of dependency overwrites (pydantic models)."""
+    return tuple(overwrite.model_dump_json() for overwrite in overwrites)
+
+
+class DependencyCache:
+    """An LRU of resolved dependency dicts, tagged with the generation they were built in."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, Tuple[int, float, Dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def generation(self) -> Optional[int]:
+        """The current generation, or None when redis cannot be reached (do not cache then)."""
+        try:
+            return int(_connection().get(GENERATION_KEY) or 0)
+        except redis.RedisError:
+            logger.warning("Could not read the dependency cache generation; resolving uncached", exc_info=True)
+            return None
+
+    def get(self, key: CacheKey, generation: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry_generation, stored_at, value = entry
+            if entry_generation != generation or time.monotonic() - stored_at > TTL_SECONDS:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Callers get their own copy: the dict ends up on (and may be edited with) a task row.
+        return copy.deepcopy(value)
+
+    def put(self, key: CacheKey, generation: int, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (generation, time.monotonic(), copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every resolution, in this process and (via the generation) in all others."""
+        with self._lock:
+            self._entries.clear()
+        try:
+            _connection().incr(GENERATION_KEY)
+        except redis.RedisError:
+            # Other workers then serve their entries until TTL_SECONDS runs out.
+            logger.warning("Could not bump the dependency cache generation", exc_info=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+dependency_cache = DependencyCache()
@@ -5,6 +5,12 @@ on the *data* that flows through the port (e.g. ``{"axes": "c"}``). They are com
 write time, into a PostgreSQL JSONPath predicate stored on the relational ArgPort/ReturnPort
 row, and evaluated at query time via ``jsonb_path_match`` against a candidate descriptor object.
 
+Alongside the predicate, a port stores its *descriptor facts* (:func:`descriptor_facts`): the
+normalized ``[key]`` / ``[key, value]`` facts any candidate it accepts must carry, taken from its
+``EXISTS`` and ``EQUALS``/``MATCHES`` descriptors. They sit in a GIN-indexed text array, so a
+candidate's own facts (:func:`candidate_facts`) rule ports out by array containment before the
+exact ``jsonb_path_match`` runs, and a search can start from the descriptors themselves.
+
 This module is intentionally dependency-light (only ``json``, ``re`` and the operator enum) so it
 can be imported from migrations and unit tests without pulling in the mutation layer.
 """
@@ -93,3 +99,65 @@ def compile_descriptors_to_jsonpath(descriptors) -> str | None:
 # Provides descriptors compile identically to requires descriptors (same operator set); the
 # alias keeps call sites self-documenting about which side they are compiling.
 compile_returndescriptors_to_jsonpath = compile_descriptors_to_jsonpath
+
+
+# =========================================================================
+# Descriptor facts
+# =========================================================================
+
+
+def _fact(key: str, *value) -> str:
+    """The text form of one fact: ``["axes"]`` (key present) or ``["axes","c"]`` (key equals)."""
+    return json.dumps([key, *value], separators=(",", ":"))
+
+
+def _fact_scalar(value) -> tuple[bool, object]:
+    """``(indexable, normalized)`` for a descriptor value.
+
+    Only JSON scalars are compared by JSONPath ``==``. Integral floats are folded onto ints,
+    because JSONPath compares numbers by value (``1 == 1.0``) while their text differs.
+    """
+    if isinstance(value, bool) or value is None or isinstance(value, (str, int)):
+        return True, value
+    if isinstance(value, float):
+        return True, int(value) if value.is_integer() else value
+    return False, None
+
+
+def descriptor_facts(descriptors) -> list[str]:
+    """The sorted facts every candidate accepted by ``descriptors`` carries.
+
+    Only ``EXISTS`` (True) and ``EQUALS``/``MATCHES`` on a scalar at a top-level key give a
+    fact; the other operators (and dotted keys, which reach into nested candidate objects)
+    constrain nothing here and are left to the JSONPath check, so the facts are a necessary
+    condition only.
+    """
+    facts: set[str] = set()
+    for desc in descriptors or []:
+        key = desc.key[2:] if desc.key.startswith("$.") else desc.key
+        if "." in key:
+            continue
+        op = desc.operator
+        if op == RequiresOperator.EXISTS and desc.value is True:
+            facts.add(_fact(key))
+        elif op in (RequiresOperator.MATCHES, RequiresOperator.EQUALS):
+            indexable, value = _fact_scalar(desc.value)
+            if indexable:
+                facts.add(_fact(key, value))
+    return sorted(facts)
+
+
+def candidate_facts(candidate: dict) -> list[str]:
+    """The sorted facts a candidate descriptor object carries.
+
+    Every key is present; a scalar value is equal to itself, and a list is equal to each of
+    its scalar elements (JSONPath's lax mode unwraps arrays on comparison).
+    """
+    facts: set[str] = set()
+    for key, value in candidate.items():
+        facts.add(_fact(key))
+        for element in value if isinstance(value, list) else [value]:
+            indexable, normalized = _fact_scalar(element)
+            if indexable:
+                facts.add(_fact(key, normalized))
+    return sorted(facts)
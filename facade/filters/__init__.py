@@ -30,6 +30,7 @@ from .agent import (
     ImplementationAgentFilter,
 )
 from .task import (
+    TaskChangeFilter,
     TaskEventFilter,
     TaskEventOrder,
     TaskFilter,
@@ -100,6 +101,7 @@ __all__ = [
     "TaskOrder",
     "TaskFilter",
     "TaskEventOrder",
+    "TaskChangeFilter",
     "TaskEventFilter",
     "TaskInstructFilter",
     "TestCaseFilter",
@@ -9,6 +9,7 @@ import strawberry
 import strawberry_django
 from django.db.models import Max, Q
 from rekuest_core import enums as renums
+from rekuest_core.inputs import types as ritypes
 from strawberry import auto
 from strawberry.types import Info
 from strawberry_django.fields.filter_order import filter_field
@@ -73,6 +74,14 @@ class ActionFilter:
         """
         return _filter_by_port_demands(info, queryset, value, prefix)
 
+    @filter_field
+    def descriptors(self, info: Info, queryset, value: list[ritypes.DescriptorInput], prefix: str):
+        """Filter to actions with an input port that constrains, and accepts, an object carrying these descriptors."""
+        if len(value) == 0:
+            return queryset, Q()
+        subquery = managers.get_action_descriptor_subquery(value, organization_id=info.context.request.organization.id)
+        return queryset.filter(**{f"{prefix}id__in": subquery}), Q()
+
     @filter_field
     def protocols(self, info: Info, queryset, value: list[str], prefix: str):
         return queryset.filter(**{f"{prefix}protocols__name__in": value}), Q()
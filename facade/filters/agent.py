@@ -87,7 +87,7 @@ class AgentFilter:
             if len(new_ids) == 0:
                 raise ValueError(f"No actions found that match the given action demands {ports_demand}")
 
-            queryset = queryset.filter(Exists(models.Implementation.objects.filter(agent=OuterRef(f"{prefix}pk"), action_id__in=new_ids)))
+            queryset = queryset.filter(Exists(models.ActionAvailability.objects.filter(agent=OuterRef(f"{prefix}pk"), action_id__in=new_ids)))
 
         return queryset, Q()
 
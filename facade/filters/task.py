@@ -11,7 +11,7 @@ from strawberry import auto
 from strawberry.types import Info
 from strawberry_django.fields.filter_order import filter_field
 
-from facade import enums, models
+from facade import channel_events, enums, models
 
 
 @strawberry_django.order_type(models.Task)
@@ -90,6 +90,50 @@ class TaskFilter:
         return queryset.filter(**{f"{prefix}created_at__gt": value}), Q()
 
 
+@strawberry.input(description="Narrow a task change feed to the changes a client cares about")
+class TaskChangeFilter:
+    """The ``tasks`` subscription's filter, checked in-process against each channel payload.
+
+    Its fields are lists (any of), unlike ``TaskFilter``'s single ``action`` / ``agent``, and it
+    only covers what the broadcast carries, so a non-matching change is dropped before the
+    subscription loads anything from the database. ``LOOKUPS`` is the same predicates as Task
+    lookups, for the ``since`` replay.
+    """
+
+    actions: list[strawberry.ID] | None = strawberry.field(default=None, description="Only tasks of these actions")
+    agents: list[strawberry.ID] | None = strawberry.field(default=None, description="Only tasks executed by these agents")
+    kinds: list[enums.TaskEventKind] | None = strawberry.field(default=None, description="Only events of these kinds (task creates always pass)")
+    acted_on: list[str] | None = strawberry.field(default=None, description="Only tasks that acted on any of these structures")
+
+    # field -> the Task lookup ``matches`` checks in-process; drives ``as_q`` for the ``since`` replay.
+    LOOKUPS = {
+        "actions": "action_id__in",
+        "agents": "agent_id__in",
+        "acted_on": "acted_on__overlap",
+    }
+
+    def as_q(self, prefix: str = "") -> Q:
+        """The task-side predicates as a ``Q`` on ``Task`` (``prefix="task__"`` from TaskEvent)."""
+        q = Q()
+        for field, lookup in self.LOOKUPS.items():
+            value = getattr(self, field)
+            if value:
+                q &= Q(**{f"{prefix}{lookup}": value})
+        return q
+
+    def matches(self, message: channel_events.TaskEventCreatedEvent) -> bool:
+        """Whether a ``task_event_channel`` payload passes this filter — no database access."""
+        if self.actions and str(message.action) not in self.actions:
+            return False
+        if self.agents and (message.agent is None or str(message.agent) not in self.agents):
+            return False
+        if self.acted_on and not set(self.acted_on).intersection(message.acted_on):
+            return False
+        if self.kinds and message.event is not None and message.kind not in self.kinds:
+            return False
+        return True
+
+
 @strawberry_django.order_type(models.TaskEvent)
 class TaskEventOrder:
     created_at: auto
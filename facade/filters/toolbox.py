@@ -72,9 +72,9 @@ class ShortcutFilter:
         if len(value) == 0:
             return queryset, Q()
 
-        # Shortcuts have no relational port rows; the manager falls back to the JSONB scan.
-        ids = managers.get_action_ids_by_port_demands(value, model="facade_shortcut")
-        return queryset.filter(**{f"{prefix}id__in": ids}), Q()
+        # RawSQL subquery over the shortcut port rows (see ActionFilter.demands).
+        subquery = managers.get_action_port_demand_subquery(value, model="facade_shortcut")
+        return queryset.filter(**{f"{prefix}id__in": subquery}), Q()
 
     @filter_field
     def toolbox(self, info: Info, queryset, value: strawberry.ID, prefix: str):
@@ -0,0 +1,70 @@
+"""Port fingerprints: the structural shape of an Action's root ports as an indexed text array.
+
+Every root port contributes one fingerprint per subset of its structural fields (kind,
+identifier, dimension — absent fields are left out) at its own position and at any
+position (``"*"``). A purely structural root match (``PortMatchInput`` with no key,
+nullable, descriptors or children) has exactly one fingerprint, and the action satisfies it
+iff the fingerprint is in the array — the same answer as the correlated ``EXISTS`` of
+``facade.managers._match_exists_sql``. So ``Action.arg_fingerprints @> ARRAY[...]`` answers
+all of a demand's structural matches from one GIN probe; "args are exactly (@mikro/image,
+INT)" adds the ``arg_count`` equality.
+
+The arrays are written at registration (``rebuild_relational_ports``) and by
+:func:`refresh_fingerprints` for rows built directly.
+"""
+
+import itertools
+import json
+import typing as t
+
+ANY_POSITION = "*"
+
+# (index, kind, identifier, dimension) of one root port.
+RootPort = t.Tuple[int, t.Optional[str], t.Optional[str], t.Optional[str]]
+
+
+def fingerprint(position: int | str, kind: str | None, identifier: str | None, dimension: str | None) -> str:
+    """The fingerprint of a port shape; a None field is unconstrained."""
+    return json.dumps([position, kind, identifier, dimension], separators=(",", ":"))
+
+
+def port_fingerprints(ports: t.Iterable[RootPort]) -> list[str]:
+    """The sorted, de-duplicated fingerprints of an action's root ports."""
+    fingerprints: set[str] = set()
+    for index, kind, identifier, dimension in ports:
+        fields = (kind, identifier, dimension)
+        present = [slot for slot, value in enumerate(fields) if value is not None]
+        for size in range(len(present) + 1):
+            for subset in itertools.combinations(present, size):
+                shape = [fields[slot] if slot in subset else None for slot in range(3)]
+                fingerprints.add(fingerprint(index, *shape))
+                fingerprints.add(fingerprint(ANY_POSITION, *shape))
+    return sorted(fingerprints)
+
+
+def definition_fingerprints(ports: t.Sequence[t.Any] | None) -> list[str]:
+    """:func:`port_fingerprints` of a definition's root port models."""
+    return port_fingerprints((index, port.kind.value if hasattr(port.kind, "value") else port.kind, port.identifier, getattr(port, "dimension", None)) for index, port in enumerate(ports or []))
+
+
+def match_fingerprint(match: t.Any) -> str | None:
+    """The fingerprint a root match is answered by, or None when it needs the EXISTS engine.
+
+    Matches are duck-typed like everywhere in ``facade.managers``. Only kind, identifier,
+    dimension and ``at`` are fingerprinted; a match on anything else (or on nothing at all)
+    is not.
+    """
+    if match.key is not None or match.nullable is not None or getattr(match, "descriptors", None) or match.children:
+        return None
+    kind = match.kind.value if hasattr(match.kind, "value") else match.kind
+    dimension = getattr(match, "dimension", None)
+    if kind is None and match.identifier is None and dimension is None and match.at is None:
+        return None
+    return fingerprint(match.at if match.at is not None else ANY_POSITION, kind, match.identifier, dimension)
+
+
+def refresh_fingerprints(action: t.Any) -> None:
+    """Recompute ``action``'s fingerprint arrays from its stored root port rows and save them."""
+    action.arg_fingerprints = port_fingerprints(action.arg_ports.filter(parent__isnull=True).values_list("index", "kind", "identifier", "dimension"))
+    action.return_fingerprints = port_fingerprints(action.return_ports.filter(parent__isnull=True).values_list("index", "kind", "identifier", "dimension"))
+    action.save(update_fields=["arg_fingerprints", "return_fingerprints"])
@@ -8,16 +8,25 @@ shared ``agent.hook_url_secret`` — there is no JWT on the HTTP path.
 Delivery is persist-then-POST: callers persist the Task/event row *before* calling
 out here, so a failed POST is logged (not raised) and the persisted row remains the durable
 record from which a later redelivery sweep can re-POST.
+
+A HookAgent may opt into **batching** (``hook_batch_window_ms > 0``): messages queued within
+the window go out as one signed POST whose body is a JSON array of the individual messages, in
+enqueue order. A buffer that reaches ``hook_batch_max`` is flushed immediately.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import logging
-from typing import TYPE_CHECKING
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import httpx
+from asgiref.sync import sync_to_async
 
 if TYPE_CHECKING:
     from facade import models
@@ -29,6 +38,8 @@ _TIMEOUT = 10.0
 
 # Module-level client: connection pooling across many deliveries.
 _client = httpx.Client(timeout=_TIMEOUT)
+# The async path (``adeliver_to_hook``) pools per event loop: an AsyncClient is bound to its loop.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
 
 
 def sign(secret: str, body: bytes) -> str:
@@ -43,27 +54,155 @@ def verify(secret: str | None, body: bytes, signature: str | None) -> bool:
     return hmac.compare_digest(sign(secret, body), signature)
 
 
-def deliver_to_hook(agent: "models.Agent", body: str) -> bool:
-    """POST ``body`` (a JSON message) to ``agent.hook_url``, HMAC-signed. Never raises.
-
-    Returns True on a 2xx response. Failures are logged — the persisted Task/event
-    row is the durable record, so a failed delivery is recoverable, not lost.
-    """
-    url = getattr(agent, "hook_url", None)
-    if not url:
-        logger.error("HookAgent %s has no hook_url; dropping message", getattr(agent, "pk", "?"))
-        return False
-
+def _signed(secret: str | None, body: str) -> Tuple[bytes, Dict[str, str]]:
+    """The raw body and the headers of a POST, HMAC-signed when a secret is set."""
     raw = body.encode("utf-8")
     headers = {"Content-Type": "application/json"}
-    secret = getattr(agent, "hook_url_secret", None)
     if secret:
         headers[SIGNATURE_HEADER] = sign(secret, raw)
+    return raw, headers
+
 
+def _post(agent_pk: object, url: str, secret: str | None, body: str) -> bool:
+    """POST an already-serialized body, HMAC-signed when a secret is set. Never raises."""
+    raw, headers = _signed(secret, body)
     try:
         response = _client.post(url, content=raw, headers=headers)
         response.raise_for_status()
         return True
     except Exception:
-        logger.error("Failed to deliver message to HookAgent %s at %s", getattr(agent, "pk", "?"), url, exc_info=True)
+        logger.error("Failed to deliver message to HookAgent %s at %s", agent_pk, url, exc_info=True)
+        return False
+
+
+async def _apost(agent_pk: object, url: str, secret: str | None, body: str) -> bool:
+    """:func:`_post` on the event loop. Never raises."""
+    raw, headers = _signed(secret, body)
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(timeout=_TIMEOUT)
+    try:
+        response = await client.post(url, content=raw, headers=headers)
+        response.raise_for_status()
+        return True
+    except Exception:
+        logger.error("Failed to deliver message to HookAgent %s at %s", agent_pk, url, exc_info=True)
+        return False
+
+
+@dataclass
+class _Batch:
+    """One HookAgent's pending messages plus the endpoint they will be flushed to."""
+
+    url: str
+    secret: str | None
+    bodies: List[str] = field(default_factory=list)
+    timer: Optional[threading.Timer] = None
+
+
+class HookBatcher:
+    """Per-agent buffers that coalesce outbound messages into one JSON-array POST.
+
+    Deliveries arrive from sync code (``on_commit`` callbacks, the postman backend), so the
+    window is driven by a ``threading.Timer`` armed on the first message of a batch — not by
+    the event loop. The endpoint is re-read from the agent on every enqueue, so a batch is
+    always flushed to the latest ``hook_url``/secret. Like a single POST, a batch is
+    best-effort over the persisted rows: a lost flush is recoverable from the DB.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._batches: Dict[str, _Batch] = {}
+
+    def enqueue(self, agent: "models.Agent", url: str, body: str) -> None:
+        key = str(agent.pk)
+        window = max(int(getattr(agent, "hook_batch_window_ms", 0) or 0), 1) / 1000.0
+        limit = max(int(getattr(agent, "hook_batch_max", 1) or 1), 1)
+        full: Optional[_Batch] = None
+
+        with self._lock:
+            batch = self._batches.get(key)
+            if batch is None:
+                batch = _Batch(url=url, secret=getattr(agent, "hook_url_secret", None))
+                self._batches[key] = batch
+            batch.url = url
+            batch.secret = getattr(agent, "hook_url_secret", None)
+            batch.bodies.append(body)
+
+            if len(batch.bodies) >= limit:
+                full = self._batches.pop(key)
+            elif batch.timer is None:
+                batch.timer = threading.Timer(window, self.flush, args=(key,))
+                batch.timer.daemon = True
+                batch.timer.start()
+
+        if full is not None:
+            self._send(key, full)
+
+    def flush(self, key: object) -> bool:
+        """Flush one agent's pending batch now. Returns False if nothing was pending."""
+        with self._lock:
+            batch = self._batches.pop(str(key), None)
+        if batch is None:
+            return False
+        self._send(str(key), batch)
+        return True
+
+    def flush_all(self) -> None:
+        """Flush every pending batch now (shutdown, tests)."""
+        with self._lock:
+            pending = list(self._batches.items())
+            self._batches.clear()
+        for key, batch in pending:
+            self._send(key, batch)
+
+    def __contains__(self, key: object) -> bool:
+        return str(key) in self._batches
+
+    @staticmethod
+    def _send(key: str, batch: _Batch) -> None:
+        if batch.timer is not None:
+            batch.timer.cancel()
+        # The bodies are already-serialized JSON objects — join them rather than re-parse.
+        _post(key, batch.url, batch.secret, "[" + ",".join(batch.bodies) + "]")
+
+
+batcher = HookBatcher()
+
+
+def deliver_to_hook(agent: "models.Agent", body: str) -> bool:
+    """POST ``body`` (a JSON message) to ``agent.hook_url``, HMAC-signed. Never raises.
+
+    Returns True on a 2xx response — or, for an agent with batching enabled, once the
+    message is buffered for the next batched POST. Failures are logged — the persisted
+    Task/event row is the durable record, so a failed delivery is recoverable, not lost.
+    """
+    url = getattr(agent, "hook_url", None)
+    if not url:
+        logger.error("HookAgent %s has no hook_url; dropping message", getattr(agent, "pk", "?"))
         return False
+
+    if getattr(agent, "hook_batch_window_ms", 0):
+        batcher.enqueue(agent, url, body)
+        return True
+
+    return _post(getattr(agent, "pk", "?"), url, getattr(agent, "hook_url_secret", None), body)
+
+
+async def adeliver_to_hook(agent: "models.Agent", body: str) -> bool:
+    """:func:`deliver_to_hook` for a caller on an event loop. Never raises.
+
+    A single POST is awaited on the loop. A batching agent's message goes to the (thread-driven)
+    :data:`batcher` off the loop, as a full buffer is flushed synchronously.
+    """
+    url = getattr(agent, "hook_url", None)
+    if not url:
+        logger.error("HookAgent %s has no hook_url; dropping message", getattr(agent, "pk", "?"))
+        return False
+
+    if getattr(agent, "hook_batch_window_ms", 0):
+        await sync_to_async(batcher.enqueue, thread_sensitive=False)(agent, url, body)
+        return True
+
+    return await _apost(getattr(agent, "pk", "?"), url, getattr(agent, "hook_url_secret", None), body)
@@ -5,16 +5,21 @@ like Done/Yield/Progress, and ``AssignRequest`` for server-to-server origination
 ``POST /agi/http/<agent_id>``, HMAC-signed with the agent's ``hook_url_secret``. The request
 is verified, parsed, and routed through the SAME :func:`route_from_agent_message` the socket
 uses; the reply (``EventAck`` / ``AssignResponse``) is returned in the HTTP response.
+
+The body may also be a JSON **array** of FromAgent messages (the upstream twin of batched
+webhook delivery). They are routed in order and the response is an array of replies at the
+same positions — ``{}`` for a message without a reply, ``{"error": …}`` for one that failed.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+from typing import Optional
 
 from django.http import HttpRequest, HttpResponse, JsonResponse
 
-from facade import enums, hooks, models
+from facade import enums, hooks, messages, models
 from facade.consumers.agent_protocol import FromAgentPayload
 from facade.hooks import SIGNATURE_HEADER
 from facade.message_router import UnknownAgentMessage, route_from_agent_message
@@ -23,8 +28,12 @@ from facade.persist_backend import persist_backend
 logger = logging.getLogger(__name__)
 
 
+def _reply_body(reply: Optional[messages.ToAgentMessage]) -> dict:
+    return reply.model_dump() if reply is not None else {}
+
+
 async def hook_intake(request: HttpRequest, agent_id: str) -> HttpResponse:
-    """Authenticate (HMAC), validate, and route one FromAgent message from a HookAgent."""
+    """Authenticate (HMAC), validate, and route one FromAgent message (or an array of them) from a HookAgent."""
     if request.method != "POST":
         return HttpResponse(status=405)
 
@@ -39,16 +48,38 @@ async def hook_intake(request: HttpRequest, agent_id: str) -> HttpResponse:
         return JsonResponse({"error": "Invalid signature"}, status=401)
 
     try:
-        payload = FromAgentPayload(message=json.loads(body))
+        raw = json.loads(body)
+        batched = isinstance(raw, list)
+        # Validate the whole batch before routing any of it, so a malformed array is rejected
+        # atomically instead of half-applied.
+        payloads = [FromAgentPayload(message=item) for item in raw] if batched else [FromAgentPayload(message=raw)]
     except Exception as e:
         return JsonResponse({"error": f"Invalid message: {e}"}, status=400)
 
-    try:
-        reply = await route_from_agent_message(persist_backend, agent.pk, payload.message)
-    except UnknownAgentMessage as e:
-        return JsonResponse({"error": f"Unhandled message: {e}"}, status=400)
-    except Exception as e:
-        logger.error("Hook intake failed", exc_info=True)
-        return JsonResponse({"error": str(e)}, status=400)
+    if not batched:
+        try:
+            reply = await route_from_agent_message(persist_backend, agent.pk, payloads[0].message)
+        except UnknownAgentMessage as e:
+            return JsonResponse({"error": f"Unhandled message: {e}"}, status=400)
+        except Exception as e:
+            logger.error("Hook intake failed", exc_info=True)
+            return JsonResponse({"error": str(e)}, status=400)
+
+        return JsonResponse(_reply_body(reply))
+
+    # Earlier messages of a batch are already persisted when a later one fails, so a failure
+    # is reported in its slot rather than failing the whole request.
+    replies = []
+    for payload in payloads:
+        try:
+            reply = await route_from_agent_message(persist_backend, agent.pk, payload.message)
+        except UnknownAgentMessage as e:
+            replies.append({"error": f"Unhandled message: {e}"})
+            continue
+        except Exception as e:
+            logger.error("Hook intake failed", exc_info=True)
+            replies.append({"error": str(e)})
+            continue
+        replies.append(_reply_body(reply))
 
-    return JsonResponse(reply.model_dump() if reply is not None else {})
+    return JsonResponse(replies, safe=False)
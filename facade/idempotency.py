@@ -0,0 +1,88 @@
+"""Idempotency keys of GraphQL assigns (``AssignInput.idempotencyKey``).
+
+A client that retries an assign after a timeout cannot know whether the first attempt went
+through. With an idempotency key the retry is answered with the task the first attempt
+created, and that task is dispatched once:
+
+- The key is claimed by the task row itself: ``(caller, idempotency_key)`` is unique
+  (``task_caller_idempotency_uniq``), and :func:`insert_claimed` writes the row with
+  ``INSERT … ON CONFLICT DO NOTHING RETURNING id``, so of two racing attempts exactly one
+  inserts and the other finds the winner's row.
+- Recently claimed keys are remembered in redis for :data:`TTL_SECONDS`, so a burst of
+  retries is answered by one cache read and one primary-key fetch — no resolution, no insert.
+  The cache is only a shortcut: when redis is unreachable the constraint still decides.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+import redis
+from django.conf import settings
+from django.db import connection
+
+from facade import models
+from facade.caller_context import CallerContext
+from facade.consumers.agent_queue import _sync_pool
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "rekuest:assign_idempotency"
+# Retries arrive within seconds to minutes; older keys are answered by the constraint.
+TTL_SECONDS = 600
+
+
+def _connection() -> redis.Redis:
+    return redis.Redis(connection_pool=_sync_pool(settings.AGENT_REDIS_HOST, settings.AGENT_REDIS_PORT))
+
+
+def cache_key(ctx: CallerContext, key: str) -> str:
+    """The redis key of ``key`` for the caller identity of ``ctx`` (a Caller is unique on it)."""
+    client = getattr(ctx.client, "pk", None)
+    organization = getattr(ctx.organization, "pk", None)
+    return f"{KEY_PREFIX}:{organization}:{client}:{getattr(ctx.user, 'pk', None)}:{key}"
+
+
+def recall(ctx: CallerContext, key: str) -> Optional[int]:
+    """The id of the task recently created under ``key``, if redis remembers one."""
+    try:
+        task_id = _connection().get(cache_key(ctx, key))
+    except redis.RedisError:
+        logger.warning("Could not read the assign idempotency cache", exc_info=True)
+        return None
+    return int(task_id) if task_id is not None else None
+
+
+def remember(ctx: CallerContext, key: str, task_id: int) -> None:
+    try:
+        _connection().set(cache_key(ctx, key), task_id, ex=TTL_SECONDS)
+    except redis.RedisError:
+        logger.warning("Could not write the assign idempotency cache", exc_info=True)
+
+
+def insert_claimed(task: models.Task) -> bool:
+    """Insert ``task`` unless its caller already has a task with its idempotency key.
+
+    Returns True (and sets ``task.pk``) when this call inserted the row, False when the key
+    was taken. Like ``bulk_create``, the insert sends no ``post_save``.
+    """
+    fields = [field for field in models.Task._meta.concrete_fields if not field.primary_key]
+    # ``pre_save`` stamps the auto_now(_add) columns, as ``save`` would.
+    values = [field.get_db_prep_save(field.pre_save(task, True), connection) for field in fields]
+    table = models.Task._meta.db_table
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    placeholders = ", ".join(["%s"] * len(fields))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({columns}) VALUES ({placeholders}) "
+            "ON CONFLICT (caller_id, idempotency_key) WHERE idempotency_key IS NOT NULL DO NOTHING RETURNING id",
+            values,
+        )
+        row = cursor.fetchone()
+    if row is None:
+        return False
+    task.pk = row[0]
+    task._state.adding = False
+    task._state.db = connection.alias
+    return True
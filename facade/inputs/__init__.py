@@ -33,6 +33,8 @@ from .task import (
     PauseInputModel,
     ResumeInput,
     ResumeInputModel,
+    ReuseInput,
+    ReuseInputModel,
 )
 from .blok import (
     BlokAgentMappingInput,
@@ -131,6 +133,8 @@ __all__ = [
     "PauseInputModel",
     "ResumeInput",
     "ResumeInputModel",
+    "ReuseInput",
+    "ReuseInputModel",
     # blok
     "BlokAgentMappingInput",
     "CreateBlokInput",
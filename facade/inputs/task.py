@@ -32,6 +32,24 @@ class HookInput:
     hash: rscalars.ActionHash
 
 
+class ReuseInputModel(BaseModel):
+    """Opt-in reuse of a prior completed run of a pure action (see :mod:`facade.replay`).
+
+    Attributes:
+        max_age: Only reuse a run that finished at most this many seconds ago
+        same_version: Only reuse a run of the same implementation version
+    """
+
+    max_age: float | None = Field(default=None, ge=0, description="Only reuse a run that finished at most this many seconds ago (any age when unset).")
+    same_version: bool = Field(default=False, description="Only reuse a run of the same implementation version: the same interface of the same release as the implementation chosen for this assign.")
+
+
+@pydantic.input(ReuseInputModel, description="When (and which) prior completed run of a pure action an assign may reuse instead of dispatching.")
+class ReuseInput:
+    max_age: float | None = None
+    same_version: bool = False
+
+
 class AssignInputModel(BaseModel):
     """Base model for assigning arguments to an action.
 
@@ -50,6 +68,8 @@ class AssignInputModel(BaseModel):
         ephemeral: Whether the task is ephemeral
         is_hook: Whether the task is a hook
         step: Whether the task should step to breakpoints
+        idempotency_key: Optional key making a retried assign return the first attempt's task
+        reuse: Optional policy for reusing a prior completed run of a pure action
     """
 
     action: str | None = Field(default=None, description="The action ID to assign to")
@@ -99,6 +119,8 @@ class AssignInputModel(BaseModel):
     is_hook: bool | None = Field(default=None, description="Whether the task is a hook")
     step: bool | None = Field(default=None, description="Whether the task should step. Ie. go to the next breakpoint")
     policy: enums.AssignPolicy | None = Field(default=None, description="The policy for the task. This defines how the task should be handled.")
+    idempotency_key: str | None = Field(default=None, max_length=255, description="Opt-in idempotency key: a retried assign with the same key (for the same caller) returns the task the first attempt created, dispatched once.")
+    reuse: ReuseInputModel | None = Field(default=None, description="Opt-in: if a prior completed run of this (pure) action with the same args matches the policy, return a task mirroring its result instead of dispatching.")
 
 
 @pydantic.input(AssignInputModel, description="The input for assigning args to a action.")
@@ -123,6 +145,8 @@ class AssignInput:
     ephemeral: bool = False
     log: bool = False
     is_hook: bool | None = False
+    idempotency_key: str | None = None
+    reuse: ReuseInput | None = None
 
 
 class CancelInputModel(BaseModel):
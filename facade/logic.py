@@ -9,93 +9,147 @@ import jsonpatch
 
 
 def auto_resolve(info: Info, implementation: models.Implementation, resolution: models.Resolution, visited_implementations: set[str] | None = None) -> None:
-    if not visited_implementations:
-        visited_implementations = set()
-
-    for dependency in implementation.dependencies.all():
-        print(f"Resolving, {dependency}")
-        agentsqs = models.Agent.objects.filter(organization=info.context.request.organization)
-
-        matched_ids: dict[str, list[int]] = {}
-
-        action_dependencies = dependency.get_action_dependencies()
-        # An empty demand still hits the matcher's "No search params provided" guard.
-        per_demand_ids = managers.get_action_ids_by_action_demands(
-            [action_dependency.demand or ActionDemandInputModel() for action_dependency in action_dependencies],
-            organization_id=info.context.request.organization.id,
+    """Resolve ``implementation``'s dependency tree into ``resolution``, one tree level at a time.
+
+    A level costs a fixed number of statements however many dependencies it holds: its
+    Dependency rows, every action demand in one ``UNION ALL`` and every state demand's
+    definitions in another, the candidate implementations and their agents' States; the
+    agents are chosen in Python and the level's Resolutions and ResolvedDependencies are
+    bulk-written. Chosen implementations with dependencies of their own form the next level.
+    """
+    visited = set(visited_implementations or ())
+    frontier = [(implementation, resolution)]
+    while frontier:
+        frontier = _resolve_level(info, frontier, visited)
+
+
+def _state_row_satisfies(row: dict, filters: dict) -> bool:
+    """``managers.state_demand_state_filters`` kwargs evaluated against a loaded State row."""
+    return all(row[name[: -len("__in")]] in value if name.endswith("__in") else row[name] == value for name, value in filters.items())
+
+
+def _resolve_level(info: Info, frontier: list[tuple[models.Implementation, models.Resolution]], visited: set) -> list[tuple[models.Implementation, models.Resolution]]:
+    """Resolve the dependencies of the ``(implementation, resolution)`` pairs of one level; returns the next level."""
+    organization = info.context.request.organization
+    parents = {parent.pk: (parent, parent_resolution) for parent, parent_resolution in frontier}
+    position = {parent_id: index for index, parent_id in enumerate(parents)}
+    dependencies = sorted(models.Dependency.objects.filter(implementation_id__in=parents), key=lambda dependency: (position[dependency.implementation_id], dependency.pk))
+    if not dependencies:
+        return []
+
+    action_dependencies = [dependency.get_action_dependencies() for dependency in dependencies]
+    state_dependencies = [[state_dependency for state_dependency in dependency.get_state_dependencies() if state_dependency.demand] for dependency in dependencies]
+
+    # An empty demand still hits the matcher's "No search params provided" guard.
+    action_ids = iter(
+        managers.get_action_ids_by_action_demands(
+            [action_dependency.demand or ActionDemandInputModel() for group in action_dependencies for action_dependency in group],
+            organization_id=organization.id,
         )
+    )
+    state_filters = iter(managers.state_demands_state_filters([state_dependency.demand for group in state_dependencies for state_dependency in group]))
 
-        for action_dependency, new_ids in zip(action_dependencies, per_demand_ids):
+    # Per dependency: the matched action ids of each action key, and the state filters.
+    plans = []
+    for dependency, action_group, state_group in zip(dependencies, action_dependencies, state_dependencies):
+        matched_ids: dict[str, list[int]] = {}
+        for action_dependency in action_group:
+            new_ids = next(action_ids)
             if len(new_ids) == 0:
                 raise ValueError(f"No actions found that match the given action demands {action_dependency}")
-
-            # Further logic to create resolution would go here.
-            agentsqs = agentsqs.filter(implementations__action__id__in=new_ids)
             matched_ids[action_dependency.key] = new_ids
-
-        # The agent must ALSO satisfy every state demand of the dependency — each demand may
-        # be met by a different State of the agent (same AND pattern as the action demands).
-        for state_dependency in dependency.get_state_dependencies():
-            if not state_dependency.demand:
-                continue
-
-            state_filters = managers.state_demand_state_filters(state_dependency.demand)
-
-            if "definition_id__in" in state_filters and not state_filters["definition_id__in"]:
+        filters = []
+        for state_dependency in state_group:
+            demand_filters = next(state_filters)
+            if "definition_id__in" in demand_filters and not demand_filters["definition_id__in"]:
                 raise ValueError(f"No state definitions found that match the given state demand {state_dependency}")
-
-            agentsqs = agentsqs.filter(Exists(models.State.objects.filter(agent=OuterRef("pk"), **state_filters)))
-
-        # todo: select best agent from agentsqs
-        selected_agent = agentsqs.first()
-
-        if not selected_agent:
+            filters.append(demand_filters)
+        plans.append((dependency, matched_ids, filters))
+
+    all_action_ids = {action_id for _, matched_ids, _ in plans for ids in matched_ids.values() for action_id in ids}
+    # Candidates come from the availability index (one row per implementation, org-scoped).
+    candidates = list(
+        models.Implementation.objects.filter(availability__organization=organization, availability__action_id__in=all_action_ids)
+        .annotate(nested=Exists(models.Dependency.objects.filter(implementation=OuterRef("pk"))))
+        .select_related("action", "agent")
+        .order_by("pk")
+    )
+    implementations_by_agent: dict[int, list[models.Implementation]] = {}
+    for candidate in candidates:
+        implementations_by_agent.setdefault(candidate.agent_id, []).append(candidate)
+
+    states_by_agent: dict[int, list[dict]] = {}
+    if any(filters for _, _, filters in plans):
+        # A dependency with state demands only may be met by any agent of the org.
+        if any(filters and not matched_ids for _, matched_ids, filters in plans):
+            states = models.State.objects.filter(agent__organization=organization)
+        else:
+            states = models.State.objects.filter(agent_id__in=implementations_by_agent)
+        for row in states.values("agent_id", "key", "app_identifier", "definition__hash", "definition_id"):
+            states_by_agent.setdefault(row["agent_id"], []).append(row)
+
+    sub_resolutions: list[models.Resolution] = []
+    resolved: list[models.ResolvedDependency] = []
+    next_level: list[tuple[models.Implementation, models.Resolution]] = []
+    for dependency, matched_ids, filters in plans:
+        if not matched_ids:
+            # No action demand: nothing to bind, but some agent must still carry a matching
+            # State for every state demand.
+            if filters and not any(all(any(_state_row_satisfies(row, demand_filters) for row in rows) for demand_filters in filters) for rows in states_by_agent.values()):
+                raise ValueError(f"No agent found that can satisfy dependency {dependency.key}")
+            continue
+        parent, parent_resolution = parents[dependency.implementation_id]
+
+        # The agent must offer an implementation for EVERY action demand (each may be met by a
+        # different one) and carry a matching State for every state demand; lowest id wins.
+        selected_agent = next(
+            (
+                agent_id
+                for agent_id in sorted(implementations_by_agent)
+                if all(any(candidate.action_id in ids for candidate in implementations_by_agent[agent_id]) for ids in matched_ids.values())
+                and all(any(_state_row_satisfies(row, demand_filters) for row in states_by_agent.get(agent_id, [])) for demand_filters in filters)
+            ),
+            None,
+        )
+        if selected_agent is None:
             raise ValueError(f"No agent found that can satisfy dependency {dependency.key}")
 
+        wanted = max(dependency.prefered_instances or 1, 1)
         for key, action_id_list in matched_ids.items():
-            implementations = models.Implementation.objects.filter(
-                action__id__in=action_id_list,
-                agent=selected_agent,
-            )
-
             count = 0
-
-            for impl in implementations:
-                if impl.id in visited_implementations:
+            for impl in implementations_by_agent[selected_agent]:
+                if impl.action_id not in action_id_list or impl.id in visited:
                     continue
-                else:
-                    if impl.dependencies.exists():
-                        visited_implementations.add(impl.id)
-                        sresolution = models.Resolution.objects.create(
-                            name=f"Auto-resolve for {dependency}{key} on {implementation}",
-                            implementation=impl,
-                            creator=info.context.request.user,
-                            organization=info.context.request.organization,
-                        )
-                        auto_resolve(info, impl, sresolution, visited_implementations=visited_implementations)
-
-                        models.ResolvedDependency.objects.create(
-                            key=key,
-                            resolution=resolution,
-                            dependency=dependency,
-                            resolution_key=str(uuid.uuid4()),
-                            implementation=impl,
-                            down_stream_resolution=sresolution,
-                        )
-                    else:
-                        models.ResolvedDependency.objects.create(
-                            key=key,
-                            resolution=resolution,
-                            dependency=dependency,
-                            resolution_key=str(uuid.uuid4()),
-                            implementation=impl,
-                        )
-                        visited_implementations.add(impl.id)
-
-                    count += 1
-                if count >= dependency.prefered_instances:
+                visited.add(impl.id)
+                down_stream_resolution = None
+                if impl.nested:
+                    down_stream_resolution = models.Resolution(
+                        name=f"Auto-resolve for {dependency}{key} on {parent}",
+                        implementation=impl,
+                        creator=info.context.request.user,
+                        organization=organization,
+                    )
+                    sub_resolutions.append(down_stream_resolution)
+                    next_level.append((impl, down_stream_resolution))
+                resolved.append(
+                    models.ResolvedDependency(
+                        key=key,
+                        resolution=parent_resolution,
+                        dependency=dependency,
+                        resolution_key=str(uuid.uuid4()),
+                        implementation=impl,
+                        down_stream_resolution=down_stream_resolution,
+                    )
+                )
+                count += 1
+                if count >= wanted:
                     break
 
+    # Postgres returns the new pks, so the ResolvedDependencies can point at the sub-resolutions.
+    models.Resolution.objects.bulk_create(sub_resolutions)
+    models.ResolvedDependency.objects.bulk_create(resolved)
+    return next_level
+
 
 def get_latest_state(
     agent: models.Agent,
@@ -0,0 +1,73 @@
+"""Microbenchmark of demand rendering: statements per second with and without the plan cache.
+
+Renders a few representative demands — a fingerprinted exact-signature port demand, a nested
+demand with descriptors and count constraints, and a three-demand ``UNION ALL`` of action
+demands — ``--iterations`` times each, once with the plan cache cleared before every render
+(every statement rendered from scratch) and once warm (bound against the cached plan). Nothing
+is sent to the database.
+
+    python manage.py bench_demand_plans --iterations 20000
+"""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict
+
+from django.core.management.base import BaseCommand
+
+from facade import managers
+from facade.benchmarks import action_demand, match, port_demand
+from rekuest_core.enums import PortKind
+
+
+def workloads() -> Dict[str, Callable[[], Any]]:
+    exact = [port_demand([match(at=0, identifier="@mikro/image"), match(at=1, kind=PortKind.INT)], force_length=2)]
+    nested = [
+        port_demand(
+            [
+                match(identifier="@mikro/image", descriptors=[SimpleNamespace(key="axes", value="c")]),
+                match(kind=PortKind.DICT, children=[match(kind=PortKind.DICT, children=[match(kind=PortKind.STRUCTURE, identifier="@mikro/mask")])]),
+            ],
+            force_non_nullable_length=1,
+            force_structure_length=1,
+        ),
+        port_demand([match(kind=PortKind.INT, nullable=False)], kind="returns"),
+    ]
+    actions = [
+        action_demand(app="imagej", key="open_image"),
+        action_demand(arg_matches=[match(identifier="@mikro/image")], return_matches=[match(identifier="@mikro/image")], protocols=["segmenter"]),
+        action_demand(hash="bench-hash"),
+    ]
+    return {
+        "port exact": lambda: managers._port_demand_statement(exact, "1"),
+        "port nested": lambda: managers._port_demand_statement(nested, "1"),
+        "actions x3": lambda: managers._action_demands_statement(actions, "1"),
+    }
+
+
+def throughput(render: Callable[[], Any], iterations: int, cold: bool) -> float:
+    """Renders per second of ``render``; ``cold`` clears the plan cache before each."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        if cold:
+            managers.demand_plans.clear()
+        render()
+    return iterations / (time.perf_counter() - start)
+
+
+class Command(BaseCommand):
+    help = "Measure demand rendering throughput with a cold and a warm plan cache."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--iterations", type=int, default=20000, help="Renders per workload and mode.")
+
+    def handle(self, *args, **options) -> None:
+        iterations = options["iterations"]
+        self.stdout.write(f"{'workload':<14}{'cold/s':>12}{'warm/s':>12}{'speedup':>10}")
+        for name, render in workloads().items():
+            cold = throughput(render, iterations, cold=True)
+            warm = throughput(render, iterations, cold=False)
+            self.stdout.write(f"{name:<14}{cold:>12.0f}{warm:>12.0f}{warm / cold:>9.1f}x")
+        managers.demand_plans.clear()
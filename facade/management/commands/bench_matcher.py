@@ -0,0 +1,254 @@
+"""Benchmark the port matcher against a synthetic catalog: latency percentiles, plans, regressions.
+
+Generates a synthetic organization of ``--actions`` actions with realistic port trees — images
+carrying ``requires``/``provides`` descriptors, nested DICT/LIST containers, QUANTITY ports and
+plain scalars — written straight into the relational port rows one level at a time, then runs a
+fixed mix of demands through ``get_action_port_demand_subquery`` and
+``get_action_ids_by_action_demands``, ``--iterations`` times each after one warm-up run. Prints
+p50 / p95 / p99 per workload and, with ``--plans``, writes each workload's
+``EXPLAIN (ANALYZE, BUFFERS)`` plan into that directory.
+
+``--write-baseline`` records the run's percentiles; ``--baseline`` compares against such a file
+and fails when a workload's p95 exceeds the baseline's by more than ``--threshold``. Baselines
+only compare runs over the same catalog size and seed.
+
+    python manage.py bench_matcher --actions 100000 --write-baseline bench.json
+    python manage.py bench_matcher --actions 100000 --baseline bench.json --plans bench-plans
+
+The organization is keyed by size and seed and kept for the next run (a million actions take a
+while to generate); ``--drop`` deletes it afterwards.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+from authentikate.models import App, Organization
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from facade import managers, models
+from facade.benchmarks import action_demand, match, percentile, port_demand
+from facade.descriptors import compile_descriptors_to_jsonpath, descriptor_facts
+from facade.fingerprints import port_fingerprints
+from rekuest_core.enums import PortKind
+
+BATCH_SIZE = 1000
+
+IDENTIFIERS = ("@mikro/image", "@mikro/roi", "@mikro/table", "@mikro/mask", "@kabinet/pod", "@lok/room")
+SCALARS = ("INT", "FLOAT", "STRING", "BOOL", "DATE")
+VOLTAGE = "[length] ** 2 * [mass] / [current] / [time] ** 3"
+DIMENSIONS = ("[length]", "[time]", VOLTAGE)
+AXES = ("c", "z", "t")
+
+
+# --------------------------------------------------------------------------- #
+# Synthetic catalog
+# --------------------------------------------------------------------------- #
+def random_port(rng: random.Random, key: str, descriptor_field: str, depth: int = 0) -> dict[str, Any]:
+    """One port spec (the stored ``args``/``returns`` JSON shape), containers up to two levels deep."""
+    roll = rng.random()
+    port: dict[str, Any] = {"key": key, "kind": None, "identifier": None, "nullable": rng.random() < 0.2, "dimension": None, "children": []}
+    if roll < 0.4:
+        port.update(kind="STRUCTURE", identifier=rng.choice(IDENTIFIERS))
+        if rng.random() < 0.5:
+            port[descriptor_field] = [{"key": "axes", "operator": "EQUALS", "value": rng.choice(AXES)}]
+            if rng.random() < 0.3:
+                port[descriptor_field].append({"key": "channels", "operator": "GTE", "value": rng.randint(1, 4)})
+    elif roll < 0.7 or depth >= 2:
+        port.update(kind=rng.choice(SCALARS))
+    elif roll < 0.8:
+        port.update(kind="QUANTITY", dimension=rng.choice(DIMENSIONS))
+    elif roll < 0.9:
+        port.update(kind="LIST", children=[random_port(rng, "item", descriptor_field, depth + 1)])
+    else:
+        port.update(kind="DICT", children=[random_port(rng, f"field{index}", descriptor_field, depth + 1) for index in range(rng.randint(1, 3))])
+    return port
+
+
+def write_ports(level: List[tuple[dict[str, Any], str, models.BasePort]], port_model: type[models.BasePort], descriptor_field: str) -> None:
+    """Insert a level of port rows, then their children, one ``bulk_create`` per tree level."""
+    while level:
+        port_model.objects.bulk_create([row for _, _, row in level])
+        level = [port_row(child, row.action, port_model, descriptor_field, row, index, path) for spec, path, row in level for index, child in enumerate(spec["children"])]
+
+
+def port_row(spec: dict[str, Any], action: models.Action, port_model: type[models.BasePort], descriptor_field: str, parent: models.BasePort | None, index: int, parent_path: str) -> tuple[dict[str, Any], str, models.BasePort]:
+    path = f"{parent_path}.{spec['key']}" if parent_path else spec["key"]
+    descriptors = [SimpleNamespace(**descriptor) for descriptor in spec.get(descriptor_field) or []]
+    row = port_model(
+        action=action,
+        parent=parent,
+        index=index,
+        key=spec["key"],
+        key_path=path,
+        kind=spec["kind"],
+        identifier=spec["identifier"],
+        dimension=spec["dimension"],
+        compiled_jsonpath=compile_descriptors_to_jsonpath(descriptors),
+        descriptor_facts=descriptor_facts(descriptors),
+        nullable=spec["nullable"],
+    )
+    return spec, path, row
+
+
+def generate_catalog(organization: Organization, actions: int, seed: int, progress: Callable[[int], None] | None = None) -> None:
+    """Write ``actions`` synthetic actions with their port rows into ``organization``."""
+    rng = random.Random(seed)
+    app, _ = App.objects.get_or_create(identifier="bench-matcher-app")
+    for start in range(0, actions, BATCH_SIZE):
+        batch = []
+        for number in range(start, min(start + BATCH_SIZE, actions)):
+            args = [random_port(rng, f"arg{index}", "requires") for index in range(rng.randint(1, 5))]
+            returns = [random_port(rng, f"return{index}", "provides") for index in range(rng.randint(1, 3))]
+            batch.append(
+                models.Action(
+                    app=app,
+                    organization=organization,
+                    key=f"bench-{number}",
+                    version="1.0.0",
+                    name=f"Bench Action {number}",
+                    description="A synthetic action",
+                    hash=f"bench-{seed}-{number}",
+                    args=args,
+                    returns=returns,
+                    arg_count=len(args),
+                    return_count=len(returns),
+                    arg_fingerprints=port_fingerprints((index, port["kind"], port["identifier"], port["dimension"]) for index, port in enumerate(args)),
+                    return_fingerprints=port_fingerprints((index, port["kind"], port["identifier"], port["dimension"]) for index, port in enumerate(returns)),
+                )
+            )
+        with transaction.atomic():
+            models.Action.objects.bulk_create(batch)
+            write_ports([port_row(spec, action, models.ArgPort, "requires", None, index, "") for action in batch for index, spec in enumerate(action.args)], models.ArgPort, "requires")
+            write_ports([port_row(spec, action, models.ReturnPort, "provides", None, index, "") for action in batch for index, spec in enumerate(action.returns)], models.ReturnPort, "provides")
+        if progress is not None:
+            progress(start + len(batch))
+
+
+# --------------------------------------------------------------------------- #
+# Workloads
+# --------------------------------------------------------------------------- #
+def port_workloads() -> Dict[str, List[SimpleNamespace]]:
+    """Port demand mixes, each run through ``get_action_port_demand_subquery``."""
+    image = match(identifier="@mikro/image")
+    return {
+        "port signature": [port_demand([match(at=0, identifier="@mikro/image"), match(at=1, kind=PortKind.INT)], force_length=2)],
+        "port descriptors": [port_demand([match(identifier="@mikro/image", nullable=False, descriptors=[SimpleNamespace(key="axes", value="c"), SimpleNamespace(key="channels", value=3)])])],
+        "port nested": [port_demand([match(kind=PortKind.DICT, children=[match(kind=PortKind.STRUCTURE, identifier="@mikro/roi")])])],
+        "port quantity": [port_demand([match(kind=PortKind.QUANTITY, dimension=VOLTAGE)])],
+        "port counts": [port_demand([image], force_non_nullable_length=1, force_structure_length=1)],
+        "port args+returns": [port_demand([image]), port_demand([match(identifier="@mikro/table")], kind="returns")],
+    }
+
+
+def action_workloads() -> Dict[str, List[SimpleNamespace]]:
+    """Action demand mixes, each run through ``get_action_ids_by_action_demands``."""
+    return {
+        "actions key": [action_demand(key="bench-7")],
+        "actions ports": [action_demand(arg_matches=[match(identifier="@mikro/image")], return_matches=[match(identifier="@mikro/mask")])],
+        "actions x3": [
+            action_demand(key="bench-42"),
+            action_demand(arg_matches=[match(kind=PortKind.LIST, children=[match(identifier="@mikro/image")])]),
+            action_demand(return_matches=[match(kind=PortKind.QUANTITY, dimension=VOLTAGE)], force_return_length=1),
+        ],
+    }
+
+
+def workloads(organization_id: Any) -> Dict[str, tuple[Callable[[], Any], Callable[[], str]]]:
+    """Each workload's ``(run, explain)``: the timed call and its ``EXPLAIN (ANALYZE, BUFFERS)`` text."""
+
+    def port(demands):
+        def queryset():
+            return models.Action.objects.filter(id__in=managers.get_action_port_demand_subquery(demands, organization_id=organization_id)).values_list("id", flat=True)
+
+        return (lambda: list(queryset()), lambda: queryset().explain(analyze=True, buffers=True))
+
+    def actions(demands):
+        def explain():
+            sql, params = managers._action_demands_statement(demands, organization_id)
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params)
+                return "\n".join(row[0] for row in cursor.fetchall())
+
+        return (lambda: managers.get_action_ids_by_action_demands(demands, organization_id=organization_id), explain)
+
+    runs = {name: port(demands) for name, demands in port_workloads().items()}
+    runs.update({name: actions(demands) for name, demands in action_workloads().items()})
+    return runs
+
+
+def latencies(run: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    """p50 / p95 / p99 of ``run`` in milliseconds, after one warm-up call."""
+    run()
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"p50": percentile(samples, 0.50), "p95": percentile(samples, 0.95), "p99": percentile(samples, 0.99)}
+
+
+def regressions(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    """The workloads whose p95 exceeds ``threshold`` times the baseline's."""
+    return [f"{name}: p95 {result['p95']:.2f}ms > {threshold:.2f} x {baseline[name]['p95']:.2f}ms" for name, result in results.items() if name in baseline and result["p95"] > baseline[name]["p95"] * threshold]
+
+
+class Command(BaseCommand):
+    help = "Benchmark the port matcher on a synthetic catalog and fail on latency regressions."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--actions", type=int, default=10000, help="Actions in the synthetic catalog.")
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic catalog.")
+        parser.add_argument("--iterations", type=int, default=50, help="Timed runs per workload.")
+        parser.add_argument("--plans", help="Directory to write each workload's EXPLAIN (ANALYZE, BUFFERS) plan to.")
+        parser.add_argument("--baseline", help="Baseline file to compare against.")
+        parser.add_argument("--threshold", type=float, default=1.25, help="Allowed p95 ratio over the baseline.")
+        parser.add_argument("--write-baseline", help="Write this run's percentiles to this file.")
+        parser.add_argument("--drop", action="store_true", help="Delete the synthetic organization afterwards.")
+
+    def handle(self, *args, **options) -> None:
+        actions, seed = options["actions"], options["seed"]
+        organization = self.catalog(actions, seed)
+        try:
+            results = self.measure(organization, options["iterations"], options["plans"])
+        finally:
+            if options["drop"]:
+                organization.delete()
+
+        if options["write_baseline"]:
+            Path(options["write_baseline"]).write_text(json.dumps({"actions": actions, "seed": seed, "workloads": results}, indent=2))
+        if options["baseline"]:
+            baseline = json.loads(Path(options["baseline"]).read_text())
+            if (baseline["actions"], baseline["seed"]) != (actions, seed):
+                raise CommandError(f"The baseline was taken on {baseline['actions']} actions (seed {baseline['seed']}), not {actions} (seed {seed})")
+            failed = regressions(results, baseline["workloads"], options["threshold"])
+            if failed:
+                raise CommandError("Matcher regressions:\n" + "\n".join(failed))
+
+    def catalog(self, actions: int, seed: int) -> Organization:
+        """The synthetic organization, generated unless a complete one is left from an earlier run."""
+        organization, _ = Organization.objects.get_or_create(slug=f"bench-matcher-{actions}-{seed}")
+        if models.Action.objects.filter(organization=organization).count() != actions:
+            models.Action.objects.filter(organization=organization).delete()
+            generate_catalog(organization, actions, seed, progress=lambda done: self.stdout.write(f"generated {done}/{actions} actions", ending="\r"))
+            self.stdout.write("")
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE facade_action, facade_argport, facade_returnport")
+        return organization
+
+    def measure(self, organization: Organization, iterations: int, plans: str | None) -> Dict[str, Dict[str, float]]:
+        results: Dict[str, Dict[str, float]] = {}
+        self.stdout.write(f"{'workload':<20}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        for name, (run, explain) in workloads(organization.id).items():
+            results[name] = latencies(run, iterations)
+            self.stdout.write(f"{name:<20}{results[name]['p50']:>10.2f}{results[name]['p95']:>10.2f}{results[name]['p99']:>10.2f}")
+            if plans:
+                Path(plans).mkdir(parents=True, exist_ok=True)
+                (Path(plans) / f"{name.replace(' ', '_').replace('+', '_')}.txt").write_text(explain())
+        return results
@@ -0,0 +1,104 @@
+"""Benchmark re-registering a 500-port action: delete-and-insert against the ``key_path`` diff sync.
+
+Builds one action whose single argument is a DICT of ``--fields`` DICTs of five ports each (the
+field, an image with a descriptor, a LIST of ROIs and a scalar — 501 ports at the default 100),
+then applies a series of re-registrations to its rows, ``--iterations`` times each, with both
+writers: ``replace`` (delete every row, insert them again level by level) and ``sync``
+(``rebuild_relational_ports``' diff). Prints the mean time, the statements each writer issued
+and the WAL it wrote (the table and index churn). Everything runs in one transaction that is
+rolled back.
+
+    python manage.py bench_port_sync --fields 100 --iterations 20
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, List
+
+from authentikate.models import App, Organization
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rekuest_core.inputs.models import ArgPortInputModel
+
+from facade import models
+from facade.descriptors import compile_descriptors_to_jsonpath
+from facade.mutations.implementation import _replace_ports, _sync_ports
+
+WRITERS: Dict[str, Callable[..., None]] = {"replace": _replace_ports, "sync": _sync_ports}
+
+
+def port_tree(fields: int, axes: str = "c", extra: bool = False) -> List[ArgPortInputModel]:
+    """The action's args; ``axes`` is field 0's image descriptor, ``extra`` adds a field."""
+
+    def field(index: int) -> Dict[str, Any]:
+        return {
+            "key": f"field{index}",
+            "kind": "DICT",
+            "children": [
+                {"key": "image", "kind": "STRUCTURE", "identifier": "@mikro/image", "requires": [{"key": "axes", "operator": "EQUALS", "value": axes if index == 0 else "c"}]},
+                {"key": "rois", "kind": "LIST", "children": [{"key": "item", "kind": "STRUCTURE", "identifier": "@mikro/roi"}]},
+                {"key": "threshold", "kind": "FLOAT", "nullable": True},
+            ],
+        }
+
+    count = fields + 1 if extra else fields
+    return [ArgPortInputModel.model_validate({"key": "options", "kind": "DICT", "children": [field(index) for index in range(count)]})]
+
+
+def wal_position() -> str:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_current_wal_insert_lsn()")
+        return cursor.fetchone()[0]
+
+
+def wal_bytes_since(position: str) -> int:
+    """WAL written since ``position`` — the table and index churn a writer causes."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), %s)", [position])
+        return int(cursor.fetchone()[0])
+
+
+def scenarios(fields: int) -> Dict[str, List[ArgPortInputModel]]:
+    return {
+        "unchanged": port_tree(fields),
+        "one descriptor": port_tree(fields, axes="z"),
+        "one field added": port_tree(fields, extra=True),
+    }
+
+
+class Command(BaseCommand):
+    help = "Compare delete-and-insert with the key_path diff sync when re-registering a large action."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--fields", type=int, default=100, help="DICT fields of the argument (five ports each).")
+        parser.add_argument("--iterations", type=int, default=20, help="Re-registrations per scenario and writer.")
+
+    def handle(self, *args, **options) -> None:
+        with transaction.atomic():
+            self.run(options["fields"], options["iterations"])
+            transaction.set_rollback(True)
+
+    def run(self, fields: int, iterations: int) -> None:
+        organization = Organization.objects.create(slug="bench-port-sync")
+        app = App.objects.create(identifier="bench-port-sync-app")
+        action = models.Action.objects.create(app=app, organization=organization, key="bench-port-sync", version="1.0.0", name="Bench Port Sync", description="", hash="bench-port-sync")
+        original = port_tree(fields)
+        _replace_ports(original, action, models.ArgPort, "requires", compile_descriptors_to_jsonpath)
+        self.stdout.write(f"{models.ArgPort.objects.filter(action=action).count()} ports")
+
+        self.stdout.write(f"{'scenario':<18}{'writer':<9}{'ms':>9}{'statements':>12}{'WAL kB':>9}")
+        for name, changed in scenarios(fields).items():
+            for writer_name, writer in WRITERS.items():
+                elapsed, wal = 0.0, 0
+                for _ in range(iterations):
+                    # Start every iteration from the originally registered rows.
+                    _replace_ports(original, action, models.ArgPort, "requires", compile_descriptors_to_jsonpath)
+                    before = wal_position()
+                    with CaptureQueriesContext(connection) as ctx:
+                        start = time.perf_counter()
+                        writer(changed, action, models.ArgPort, "requires", compile_descriptors_to_jsonpath)
+                        elapsed += time.perf_counter() - start
+                    wal += wal_bytes_since(before)
+                self.stdout.write(f"{name:<18}{writer_name:<9}{elapsed / iterations * 1000:>9.2f}{len(ctx.captured_queries):>12}{wal / iterations / 1024:>9.1f}")
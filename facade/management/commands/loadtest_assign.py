@@ -0,0 +1,123 @@
+"""Load-test the assign pipelines: a burst of concurrent assigns through each, p50 / p99 latency.
+
+Runs ``--concurrency`` assigns at once against the live database and redis, once per pipeline:
+``sync`` drives ``RedisControllBackend.assign`` the way a sync resolver runs (``sync_to_async``,
+on the thread-sensitive executor every sync resolver shares), ``async`` drives ``aassign``.
+The target is an implementation of ``--agent``, assigned with that agent's identity as the
+caller, so point it at a scratch agent: every Assign lands on its queue. While a burst runs a
+probe times a no-op ``sync_to_async`` call every ``--probe-interval`` seconds — the wait any
+other sync resolver sees meanwhile. The tasks are deleted afterwards unless ``--keep``.
+
+    python manage.py loadtest_assign --agent 12 --concurrency 500
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List
+
+from asgiref.sync import sync_to_async
+from django.core.management.base import BaseCommand, CommandError
+
+from facade import inputs, models
+from facade.backend import controll_backend
+from facade.benchmarks import percentile
+from facade.caller_context import CallerContext
+
+PIPELINES = ("sync", "async")
+REFERENCE_PREFIX = "loadtest-assign"
+
+
+@dataclass
+class BurstResult:
+    p50: float
+    p99: float
+    slowest: float
+    probe_p99: float
+
+
+def _noop() -> None:
+    return None
+
+
+async def burst(assign: Callable[[int], Awaitable[object]], concurrency: int, probe_interval: float) -> BurstResult:
+    """Run ``concurrency`` calls of ``assign`` at once, probing the sync executor meanwhile."""
+    latencies: List[float] = []
+    probes: List[float] = []
+    finished = asyncio.Event()
+
+    async def timed(index: int) -> None:
+        start = time.perf_counter()
+        await assign(index)
+        latencies.append(time.perf_counter() - start)
+
+    async def probe() -> None:
+        while not finished.is_set():
+            start = time.perf_counter()
+            await sync_to_async(_noop)()
+            probes.append(time.perf_counter() - start)
+            await asyncio.sleep(probe_interval)
+
+    prober = asyncio.create_task(probe())
+    try:
+        await asyncio.gather(*(timed(index) for index in range(concurrency)))
+    finally:
+        finished.set()
+        await prober
+
+    return BurstResult(p50=percentile(latencies, 0.50), p99=percentile(latencies, 0.99), slowest=max(latencies), probe_p99=percentile(probes, 0.99))
+
+
+def _target(agent_id: int) -> tuple[CallerContext, models.Implementation]:
+    agent = models.Agent.objects.select_related("user", "client", "organization").filter(pk=agent_id).first()
+    if agent is None:
+        raise CommandError(f"Agent {agent_id} does not exist")
+    implementation = models.Implementation.objects.filter(agent=agent, higher_order_for__isnull=True).order_by("pk").first()
+    if implementation is None:
+        raise CommandError(f"Agent {agent_id} has no implementation to assign to")
+    return CallerContext.from_agent(agent), implementation
+
+
+def _cleanup(ctx: CallerContext) -> int:
+    caller = models.Caller.objects.filter(client=ctx.client, user=ctx.user, organization=ctx.organization).first()
+    deleted, _ = models.Task.objects.filter(caller=caller, reference__startswith=REFERENCE_PREFIX).delete()
+    return deleted
+
+
+async def run(agent_id: int, concurrency: int, probe_interval: float, keep: bool) -> dict[str, BurstResult]:
+    ctx, implementation = await sync_to_async(_target)(agent_id)
+
+    def assign_input(pipeline: str, index: int) -> inputs.AssignInputModel:
+        return inputs.AssignInputModel(implementation=str(implementation.pk), args={}, reference=f"{REFERENCE_PREFIX}-{pipeline}-{index}")
+
+    pipelines = {
+        "sync": lambda index: sync_to_async(controll_backend.assign)(ctx, assign_input("sync", index)),
+        "async": lambda index: controll_backend.aassign(ctx, assign_input("async", index)),
+    }
+    results = {}
+    try:
+        for name in PIPELINES:
+            results[name] = await burst(pipelines[name], concurrency, probe_interval)
+    finally:
+        if not keep:
+            await sync_to_async(_cleanup)(ctx)
+    return results
+
+
+class Command(BaseCommand):
+    help = "Load-test the sync and async assign pipelines with a burst of concurrent assigns."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--agent", type=int, required=True, help="The (scratch) agent to assign to; its identity is the caller.")
+        parser.add_argument("--concurrency", type=int, default=500, help="Assigns in flight at once, per pipeline.")
+        parser.add_argument("--probe-interval", type=float, default=0.01, help="Seconds between two probes of the sync executor.")
+        parser.add_argument("--keep", action="store_true", help="Keep the created tasks.")
+
+    def handle(self, *args, **options) -> None:
+        results = asyncio.run(run(options["agent"], options["concurrency"], options["probe_interval"], options["keep"]))
+        self.stdout.write(f"{options['concurrency']} concurrent assigns per pipeline")
+        self.stdout.write(f"{'pipeline':<10}{'p50':>10}{'p99':>10}{'slowest':>10}{'probe p99':>12}")
+        for name, result in results.items():
+            self.stdout.write(f"{name:<10}{result.p50 * 1000:>8.1f}ms{result.p99 * 1000:>8.1f}ms{result.slowest * 1000:>8.1f}ms{result.probe_p99 * 1000:>10.1f}ms")
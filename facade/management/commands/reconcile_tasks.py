@@ -6,6 +6,11 @@ timer is gone and the work would stay ``is_done=False`` forever. This sweep re-r
 DB-authoritative reconcile op for any websocket agent that is disconnected past the grace
 window — multi-worker-safe, idempotent. Run it on a schedule.
 
+It also releases work held by admission (``facade.admission``) whose slot was freed without
+the release running — a worker that died between the commit and the release, or a bulk
+``update()`` that bypassed ``post_save``, and sends the Assigns still in the outbox
+(``facade.outbox``) of a process that died before draining them.
+
     python manage.py reconcile_tasks
 """
 
@@ -17,13 +22,14 @@ from asgiref.sync import async_to_sync
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
-from facade import enums, models
+from facade import enums, models, outbox
+from facade.backend import controll_backend
 from facade.grace import grace_seconds
 from facade.persist_backend import persist_backend
 
 
 class Command(BaseCommand):
-    help = "Fail orphaned in-flight work of websocket executors that are disconnected past the grace window."
+    help = "Fail orphaned in-flight work of websocket executors that are disconnected past the grace window, release held work that fits, and dispatch the assign outbox."
 
     def handle(self, *args, **options) -> None:
         # Phase 0 — heal agents whose ``connected`` is stuck True past the stale window (crashed
@@ -48,4 +54,11 @@ class Command(BaseCommand):
         for agent_id in agent_ids:
             async_to_sync(persist_backend.reconcile_orphaned_executor_work)(agent_id)
 
-        self.stdout.write(self.style.SUCCESS(f"reconcile_tasks: healed {healed} stuck agent(s), reconciled {len(agent_ids)} orphaned executor(s)."))
+        held_agent_ids = list(models.Task.objects.filter(pending=True, is_done=False).values_list("agent_id", flat=True).distinct())
+        released = sum(len(controll_backend.release_held(agent_id)) for agent_id in held_agent_ids)
+
+        dispatched = outbox.drain()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"reconcile_tasks: healed {healed} stuck agent(s), reconciled {len(agent_ids)} orphaned executor(s), released {released} held task(s), dispatched {dispatched} outbox assign(s).")
+        )
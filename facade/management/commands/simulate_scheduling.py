@@ -0,0 +1,132 @@
+"""Simulate the assign schedulers over a fleet of agents and compare their makespan.
+
+Pure in-memory (no database, no redis): each strategy in ``facade.scheduling.SCHEDULERS`` routes
+the same seeded workload — a burst of tasks for one action, arriving over ``--spread`` seconds —
+to ``--agents`` simulated agents with mixed capacities (parallel slots). Every agent runs up to
+``capacity`` tasks at once and queues the rest; the scheduler sees the same load signal the
+server uses (each agent's unfinished task count). Reports makespan (last completion) and the
+per-task latency.
+
+    python manage.py simulate_scheduling --agents 20 --tasks 2000
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+import statistics
+from collections import deque
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Deque, Dict, Iterable, List
+
+from django.core.management.base import BaseCommand
+
+from facade import scheduling
+
+
+@dataclass
+class SimAgent:
+    pk: int
+    capacity: int
+    running: int = 0
+    waiting: Deque[float] = field(default_factory=deque)  # durations of queued tasks
+    assigned: int = 0
+
+
+@dataclass
+class SimResult:
+    makespan: float
+    mean_latency: float
+    p95_latency: float
+    busiest: int
+
+
+class SimLoad:
+    """The simulated fleet as a :class:`facade.scheduling.Load` (running + queued per agent)."""
+
+    def __init__(self, agents: Dict[int, SimAgent]) -> None:
+        self.agents = agents
+
+    def counts(self, agent_ids: Iterable[int]) -> Dict[int, int]:
+        return {agent_id: self.agents[agent_id].running + len(self.agents[agent_id].waiting) for agent_id in agent_ids}
+
+
+def build_fleet(n_agents: int, seed: int) -> List[int]:
+    """Mixed capacities: mostly single-slot agents, some with 2 or 4 slots."""
+    rng = random.Random(seed)
+    return [rng.choice((1, 1, 1, 2, 2, 4)) for _ in range(n_agents)]
+
+
+def build_workload(n_tasks: int, spread: float, mean_duration: float, seed: int) -> List[tuple[float, float]]:
+    """``(arrival, duration)`` per task: uniform arrivals, log-normal (heavy-ish tail) durations."""
+    rng = random.Random(seed + 1)
+    sigma = 0.75
+    mu = -0.5 * sigma**2  # unit mean, scaled below
+    return sorted((rng.uniform(0, spread), mean_duration * rng.lognormvariate(mu, sigma)) for _ in range(n_tasks))
+
+
+def simulate(scheduler_name: str, capacities: List[int], workload: List[tuple[float, float]]) -> SimResult:
+    agents = {pk: SimAgent(pk=pk, capacity=capacity) for pk, capacity in enumerate(capacities, start=1)}
+    candidates = [SimpleNamespace(pk=pk, agent_id=pk, action_id=1, agent=SimpleNamespace(capacity=agent.capacity)) for pk, agent in agents.items()]
+
+    scheduler_class = scheduling.SCHEDULERS[scheduler_name]
+    scheduler = scheduler_class(SimLoad(agents)) if issubclass(scheduler_class, scheduling.LeastInFlight) else scheduler_class()
+
+    # Event queue of completions: (time, agent pk, arrival time of the finished task).
+    completions: List[tuple[float, int, float]] = []
+    arrivals_of: Dict[int, Deque[float]] = {pk: deque() for pk in agents}
+    latencies: List[float] = []
+    now = 0.0
+
+    def start(agent: SimAgent, at: float) -> None:
+        while agent.running < agent.capacity and agent.waiting:
+            agent.running += 1
+            heapq.heappush(completions, (at + agent.waiting.popleft(), agent.pk, arrivals_of[agent.pk].popleft()))
+
+    def complete_until(until: float) -> None:
+        nonlocal now
+        while completions and completions[0][0] <= until:
+            now, pk, arrived = heapq.heappop(completions)
+            latencies.append(now - arrived)
+            agents[pk].running -= 1
+            start(agents[pk], now)
+
+    for arrival, duration in workload:
+        complete_until(arrival)
+        chosen = scheduler.choose(candidates, {})  # pyright: ignore[reportArgumentType]  # duck-typed candidates
+        agent = agents[chosen.agent_id]
+        agent.assigned += 1
+        agent.waiting.append(duration)
+        arrivals_of[agent.pk].append(arrival)
+        start(agent, arrival)
+
+    complete_until(float("inf"))
+
+    latencies.sort()
+    return SimResult(
+        makespan=now,
+        mean_latency=statistics.fmean(latencies),
+        p95_latency=latencies[int(0.95 * (len(latencies) - 1))],
+        busiest=max(agent.assigned for agent in agents.values()),
+    )
+
+
+class Command(BaseCommand):
+    help = "Simulate the assign schedulers over a fleet of agents and compare their makespan."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--agents", type=int, default=20, help="Number of simulated agents.")
+        parser.add_argument("--tasks", type=int, default=2000, help="Number of tasks assigned to the action.")
+        parser.add_argument("--spread", type=float, default=60.0, help="Seconds over which the tasks arrive.")
+        parser.add_argument("--duration", type=float, default=1.0, help="Mean task duration (seconds).")
+        parser.add_argument("--seed", type=int, default=7, help="Seed for the fleet and the workload.")
+
+    def handle(self, *args, **options) -> None:
+        capacities = build_fleet(options["agents"], options["seed"])
+        workload = build_workload(options["tasks"], options["spread"], options["duration"], options["seed"])
+        self.stdout.write(f"{options['agents']} agents ({sum(capacities)} slots), {options['tasks']} tasks over {options['spread']:.0f}s, mean duration {options['duration']:.2f}s")
+        self.stdout.write(f"{'scheduler':<16}{'makespan':>12}{'mean lat.':>12}{'p95 lat.':>12}{'busiest':>10}")
+        for name in scheduling.SCHEDULERS:
+            result = simulate(name, capacities, workload)
+            self.stdout.write(f"{name:<16}{result.makespan:>11.1f}s{result.mean_latency:>11.2f}s{result.p95_latency:>11.2f}s{result.busiest:>10}")
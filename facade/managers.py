@@ -1,10 +1,15 @@
 import json
 import re
+import threading
 import typing as t
+from collections import OrderedDict
+from dataclasses import dataclass
 
 from django.db import connection
 from django.db.models.expressions import RawSQL
 
+from facade.descriptors import candidate_facts
+from facade.fingerprints import match_fingerprint
 from rekuest_core.inputs.types import ActionDemandInput, PortMatchInput
 
 qt = re.compile(r"@(?P<package>[^\/]*)\/(?P<interface>[^\/]*)")
@@ -16,37 +21,90 @@ MatchInput = PortMatchInput
 
 
 # =========================================================================
-# Relational port-matching engine (Actions only)
+# Relational port-matching engine
 #
 # Actions flatten their ports into the indexed ``facade_argport`` /
-# ``facade_returnport`` tables (see facade.mutations.implementation). Matching
-# an ``Action`` therefore becomes a set of correlated ``EXISTS`` subqueries over
-# those tables instead of a sequential scan over the ``args``/``returns`` JSONB
-# blobs. This uses the (action_id, parent_id), kind and identifier indexes,
+# ``facade_returnport`` tables (see facade.mutations.implementation); Shortcuts
+# and StateDefinitions have port tables of the same shape. Matching therefore
+# becomes a set of correlated ``EXISTS`` subqueries over those tables instead of
+# a sequential scan over the ``args``/``returns``/``ports`` JSONB blobs. This uses the (action_id, parent_id), kind and identifier indexes,
 # supports arbitrary nesting depth (via the self-referential ``parent`` FK), and
 # enforces the compiled ``requires``/``provides`` micro-constraints via
 # ``jsonb_path_match`` against a candidate descriptor object.
+#
+# Root matches that are purely structural skip the subqueries altogether: they
+# are answered by ``@>`` on the Action's GIN-indexed port fingerprint arrays
+# (see facade.fingerprints), one probe per demand side.
+#
+# The statement of a demand depends only on its shape — which fields are set,
+# the nesting, the counts — never on the values. Each builder therefore comes in
+# two halves: a renderer (``_*_sql``) writing named placeholders from the shape,
+# and a binder (``_bind_*``) collecting the values under the same names. Rendered
+# statements are cached per shape as a ``DemandPlan`` (positional SQL plus the
+# placeholder order), so a repeated shape is only bound; its statement text is
+# stable, which also lets psycopg prepare it server-side when the database is
+# configured with ``server_side_binding``.
 # =========================================================================
 
 # Physical table names for the relational port rows, keyed by demand type.
 PORT_TABLE = {"args": "facade_argport", "returns": "facade_returnport"}
+# The port tables of every model matched by port demands.
+OWNER_PORT_TABLES = {
+    "facade_action": PORT_TABLE,
+    "facade_shortcut": {"args": "facade_shortcutargport", "returns": "facade_shortcutreturnport"},
+}
+STATE_PORT_TABLE = "facade_stateport"
+# The column of each port table referencing its owner row.
+PORT_OWNER_COLUMN = {
+    "facade_argport": "action_id",
+    "facade_returnport": "action_id",
+    "facade_shortcutargport": "shortcut_id",
+    "facade_shortcutreturnport": "shortcut_id",
+    STATE_PORT_TABLE: "definition_id",
+}
+# The Action's fingerprint array of each port table (see facade.fingerprints).
+FINGERPRINT_COLUMN = {PORT_TABLE["args"]: "arg_fingerprints", PORT_TABLE["returns"]: "return_fingerprints"}
+
+# Semantic qualifiers of an action demand: tri-state — None matches either.
+ACTION_QUALIFIERS = ("pure", "idempotent", "stateful")
+
+# Distinct demand shapes kept rendered; dashboards repeat a handful of them.
+PLAN_CACHE_SIZE = 1024
+
+
+def _match_fields(match: MatchInput) -> list[tuple[str, str, t.Any]]:
+    """The ``(param prefix, port column, value)`` of each structural field set on ``match``.
+
+    The single source of both the rendered conditions and the bound values, so the two
+    halves cannot disagree on which fields a match constrains.
+    """
+    # getattr: demand objects are duck-typed (SimpleNamespace in tests, PortMatchInput at
+    # runtime) and not all shapes carry the QUANTITY dimension field.
+    fields = (
+        ("at", "index", match.at),
+        ("key", "key", match.key),
+        ("kind", "kind", match.kind.value if match.kind is not None else None),
+        ("ident", "identifier", match.identifier),
+        ("dim", "dimension", getattr(match, "dimension", None)),
+        ("null", "nullable", match.nullable),
+    )
+    return [field for field in fields if field[2] is not None]
 
 
-def _build_match_exists(
+def _match_exists_sql(
     match: MatchInput,
     table: str,
     action_alias: str,
     parent_alias: str | None,
     id_path: str,
-    params: dict[str, t.Any],
 ) -> str:
-    """Build one correlated ``EXISTS`` clause for a single match.
+    """Render one correlated ``EXISTS`` clause for a single match.
 
     A match is a ``PortMatchInput``-shaped object, handled purely via attribute access:
     structural fields target the port shape, and the optional ``descriptors`` activate the
     object-level ``jsonb_path_match`` branch.
 
-    Root matches correlate to the outer action row (``action_id = <action>.id`` and
+    Root matches correlate to the outer owner row (e.g. ``action_id = <action>.id`` and
     ``parent_id IS NULL``); nested matches correlate to their parent port row
     (``parent_id = <parent>.id``). Children recurse, so nesting depth is unbounded.
     """
@@ -54,43 +112,14 @@ def _build_match_exists(
     conditions: list[str] = []
 
     if parent_alias is None:
-        conditions.append(f"{alias}.action_id = {action_alias}.id")
+        conditions.append(f"{alias}.{PORT_OWNER_COLUMN[table]} = {action_alias}.id")
         conditions.append(f"{alias}.parent_id IS NULL")
     else:
         conditions.append(f"{alias}.parent_id = {parent_alias}.id")
 
-    if match.at is not None:
-        key = f"at_{id_path}"
-        params[key] = match.at
-        conditions.append(f"{alias}.index = %({key})s")
-
-    if match.key is not None:
-        key = f"key_{id_path}"
-        params[key] = match.key
-        conditions.append(f"{alias}.key = %({key})s")
-
-    if match.kind is not None:
-        key = f"kind_{id_path}"
-        params[key] = match.kind.value
-        conditions.append(f"{alias}.kind = %({key})s")
-
-    if match.identifier is not None:
-        key = f"ident_{id_path}"
-        params[key] = match.identifier
-        conditions.append(f"{alias}.identifier = %({key})s")
-
-    # getattr: demand objects are duck-typed (SimpleNamespace in tests, PortMatchInput at
-    # runtime) and not all shapes carry the QUANTITY dimension field.
-    dimension = getattr(match, "dimension", None)
-    if dimension is not None:
-        key = f"dim_{id_path}"
-        params[key] = dimension
-        conditions.append(f"{alias}.dimension = %({key})s")
-
-    if match.nullable is not None:
-        key = f"null_{id_path}"
-        params[key] = match.nullable
-        conditions.append(f"{alias}.nullable = %({key})s")
+    fields = _match_fields(match)
+    for prefix, column, _ in fields:
+        conditions.append(f"{alias}.{column} = %({prefix}_{id_path})s")
 
     descriptors = getattr(match, "descriptors", None)
     if descriptors and parent_alias is None:
@@ -98,41 +127,94 @@ def _build_match_exists(
         # root port in the organization — the compiled predicate is unindexable in that
         # direction, so a structural field must narrow the candidate set first. Nested
         # children are exempt: their parent already narrows.
-        has_structural_narrowing = any(value is not None for value in (match.at, match.key, match.kind, match.identifier, dimension))
+        has_structural_narrowing = any(prefix != "null" for prefix, _, _ in fields)
         if not has_structural_narrowing:
             raise ValueError("A root port match with descriptors must also narrow structurally (identifier, kind, key, at or dimension) — descriptor-only matches would scan every port in the organization.")
     if descriptors:
         # Micro-constraint: the port's compiled requires/provides JSONPath must be satisfied by
-        # the candidate object, assembled here from the runtime descriptor key/value pairs
-        # (duplicate keys: last wins). A NULL compiled_jsonpath means the port declares no
-        # constraints, so it accepts any object. ``silent => true`` makes structurally-invalid
-        # evaluations return NULL instead of raising. Matches without descriptors skip this
-        # branch and stay purely structural.
-        candidate_object = {descriptor.key: descriptor.value for descriptor in descriptors}
-        key = f"obj_{id_path}"
-        params[key] = json.dumps(candidate_object)
-        conditions.append(f"({alias}.compiled_jsonpath IS NULL OR jsonb_path_match(%({key})s::jsonb, {alias}.compiled_jsonpath::jsonpath, '{{}}'::jsonb, true))")
+        # the candidate object (see ``_bind_match``). A NULL compiled_jsonpath means the port
+        # declares no constraints, so it accepts any object. ``silent => true`` makes
+        # structurally-invalid evaluations return NULL instead of raising. Matches without
+        # descriptors skip this branch and stay purely structural. The port's descriptor facts
+        # must be among the candidate's first: a cheap array test that rules out most ports
+        # before the JSONPath is evaluated (see facade.descriptors).
+        conditions.append(f"{alias}.descriptor_facts <@ %(facts_{id_path})s::text[]")
+        conditions.append(f"({alias}.compiled_jsonpath IS NULL OR jsonb_path_match(%(obj_{id_path})s::jsonb, {alias}.compiled_jsonpath::jsonpath, '{{}}'::jsonb, true))")
 
     for child_index, child in enumerate(match.children or []):
-        conditions.append(_build_match_exists(child, table, action_alias, alias, f"{id_path}_{child_index}", params))
+        conditions.append(_match_exists_sql(child, table, action_alias, alias, f"{id_path}_{child_index}"))
 
     inner = " AND ".join(conditions)
     return f"EXISTS (SELECT 1 FROM {table} {alias} WHERE {inner})"
 
 
-def _root_count_subquery(table: str, action_alias: str, extra_condition: str, param_key: str, value: int, params: dict[str, t.Any]) -> str:
-    """Build a ``(SELECT COUNT(*) ...) = N`` clause over an action's root ports."""
-    params[param_key] = value
-    return f"(SELECT COUNT(*) FROM {table} pc WHERE pc.action_id = {action_alias}.id AND pc.parent_id IS NULL AND {extra_condition}) = %({param_key})s"
+def _bind_match(match: MatchInput, id_path: str, params: dict[str, t.Any]) -> None:
+    """Collect the values of :func:`_match_exists_sql`'s placeholders into ``params``."""
+    for prefix, _, value in _match_fields(match):
+        params[f"{prefix}_{id_path}"] = value
+    descriptors = getattr(match, "descriptors", None)
+    if descriptors:
+        # The candidate object, assembled from the runtime descriptor key/value pairs
+        # (duplicate keys: last wins).
+        candidate = {descriptor.key: descriptor.value for descriptor in descriptors}
+        params[f"obj_{id_path}"] = json.dumps(candidate)
+        params[f"facts_{id_path}"] = candidate_facts(candidate)
+    for child_index, child in enumerate(match.children or []):
+        _bind_match(child, f"{id_path}_{child_index}", params)
+
+
+def _match_shape(match: MatchInput) -> tuple[t.Any, ...]:
+    """What :func:`_match_exists_sql` renders from: the fields set, descriptors, the children."""
+    return (
+        tuple(prefix for prefix, _, _ in _match_fields(match)),
+        bool(getattr(match, "descriptors", None)),
+        tuple(_match_shape(child) for child in match.children or []),
+    )
+
+
+def _root_matches_sql(matches: t.Sequence[MatchInput] | None, table: str, action_alias: str, id_prefix: str) -> list[str]:
+    """Render the clauses of a demand's root matches over ``table``.
+
+    On the action port tables, purely structural matches collapse into one containment
+    test on the action's fingerprint array (GIN-indexed); the rest keep their correlated
+    ``EXISTS``.
+    """
+    clauses: list[str] = []
+    fingerprinted = False
+    for index, match in enumerate(matches or []):
+        if table not in FINGERPRINT_COLUMN or match_fingerprint(match) is None:
+            clauses.append(_match_exists_sql(match, table, action_alias, None, f"{id_prefix}_{index}"))
+        else:
+            fingerprinted = True
+    if fingerprinted:
+        clauses.insert(0, f"{action_alias}.{FINGERPRINT_COLUMN[table]} @> %(fp_{id_prefix})s::text[]")
+    return clauses
+
 
+def _bind_root_matches(matches: t.Sequence[MatchInput] | None, table: str, id_prefix: str, params: dict[str, t.Any]) -> None:
+    fingerprints: list[str] = []
+    for index, match in enumerate(matches or []):
+        fingerprint = match_fingerprint(match) if table in FINGERPRINT_COLUMN else None
+        if fingerprint is None:
+            _bind_match(match, f"{id_prefix}_{index}", params)
+        else:
+            fingerprints.append(fingerprint)
+    if fingerprints:
+        params[f"fp_{id_prefix}"] = fingerprints
 
-def _execute_ids(sql: str, params: dict[str, t.Any]) -> list[t.Any]:
+
+def _root_count_subquery(table: str, action_alias: str, extra_condition: str, param_key: str) -> str:
+    """Render a ``(SELECT COUNT(*) ...) = N`` clause over an owner's root ports."""
+    return f"(SELECT COUNT(*) FROM {table} pc WHERE pc.{PORT_OWNER_COLUMN[table]} = {action_alias}.id AND pc.parent_id IS NULL AND {extra_condition}) = %({param_key})s"
+
+
+def _execute_ids(sql: str, params: t.Mapping[str, t.Any] | t.Sequence[t.Any]) -> list[t.Any]:
     with connection.cursor() as cursor:
         cursor.execute(sql, params)
         return [row[0] for row in cursor.fetchall()]
 
 
-def _execute_rows(sql: str, params: dict[str, t.Any]) -> list[tuple[t.Any, ...]]:
+def _execute_rows(sql: str, params: t.Mapping[str, t.Any] | t.Sequence[t.Any]) -> list[tuple[t.Any, ...]]:
     with connection.cursor() as cursor:
         cursor.execute(sql, params)
         return cursor.fetchall()
@@ -146,61 +228,150 @@ def _demand_kind_value(kind: t.Any) -> t.Literal["args", "returns"]:
     return t.cast(t.Literal["args", "returns"], kind_value)
 
 
-def _port_demand_sql(
-    demands: t.Sequence[t.Any],
-    organization_id: str | None = None,
-) -> tuple[str, dict[str, t.Any]]:
-    """Build the (sql, named params) selecting facade_action ids satisfying EVERY demand."""
-    action_alias = "a"
+# =========================================================================
+# Demand plans
+# =========================================================================
+
+_NAMED_PARAM_RE = re.compile(r"%\((\w+)\)s")
+
+
+@dataclass(frozen=True)
+class DemandPlan:
+    """The rendered statement of a demand shape.
+
+    ``sql`` uses positional ``%s`` placeholders — ``RawSQL`` params are combined with the
+    rest of the query's params into one flat sequence by the ORM compiler, so a mapping
+    cannot be passed through — and ``keys`` names the bound value of each, in order.
+    """
+
+    sql: str
+    keys: tuple[str, ...]
+
+    @classmethod
+    def render(cls, named_sql: str) -> "DemandPlan":
+        return cls(_NAMED_PARAM_RE.sub("%s", named_sql), tuple(_NAMED_PARAM_RE.findall(named_sql)))
+
+    def bind(self, params: t.Mapping[str, t.Any]) -> list[t.Any]:
+        return [params[key] for key in self.keys]
+
+
+class DemandPlanCache:
+    """An LRU of :class:`DemandPlan` per demand shape."""
+
+    def __init__(self, max_entries: int = PLAN_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._plans: OrderedDict[tuple[t.Any, ...], DemandPlan] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, shape: tuple[t.Any, ...], render: t.Callable[[], str]) -> DemandPlan:
+        """The plan of ``shape``, rendering it with ``render`` on a miss."""
+        with self._lock:
+            plan = self._plans.get(shape)
+            if plan is not None:
+                self._plans.move_to_end(shape)
+                return plan
+        # Rendered outside the lock: two threads missing on one shape render the same plan.
+        plan = DemandPlan.render(render())
+        with self._lock:
+            self._plans[shape] = plan
+            while len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+demand_plans = DemandPlanCache()
+
+
+# =========================================================================
+# Port demands
+# =========================================================================
+
+
+def _port_demand_shape(demands: t.Sequence[t.Any], organization_id: str | None, model: str) -> tuple[t.Any, ...]:
+    return (
+        model,
+        organization_id is not None,
+        tuple(
+            (
+                _demand_kind_value(demand.kind),
+                tuple(_match_shape(match) for match in demand.matches or []),
+                demand.force_length is not None,
+                demand.force_non_nullable_length is not None,
+                demand.force_structure_length is not None,
+            )
+            for demand in demands
+        ),
+    )
+
+
+def _port_demand_sql(demands: t.Sequence[t.Any], organization_id: str | None = None, model: str = "facade_action") -> str:
+    """Render the statement selecting ``model`` ids satisfying EVERY demand."""
+    owner_alias = "a"
     clauses: list[str] = []
-    params: dict[str, t.Any] = {}
 
-    if organization_id is not None:
-        params["org"] = organization_id
-        clauses.append(f"{action_alias}.organization_id = %(org)s")
+    # Only actions are scoped to an organization; shortcuts are shared.
+    if organization_id is not None and model == "facade_action":
+        clauses.append(f"{owner_alias}.organization_id = %(org)s")
 
     for demand_index, demand in enumerate(demands):
-        table = PORT_TABLE[_demand_kind_value(demand.kind)]
+        table = OWNER_PORT_TABLES[model][_demand_kind_value(demand.kind)]
 
-        for match_index, match in enumerate(demand.matches or []):
-            clauses.append(_build_match_exists(match, table, action_alias, None, f"{demand_index}_{match_index}", params))
+        clauses.extend(_root_matches_sql(demand.matches, table, owner_alias, f"{demand_index}"))
 
         if demand.force_length is not None:
-            column = "arg_count" if table == PORT_TABLE["args"] else "return_count"
-            key = f"force_length_{demand_index}"
-            params[key] = demand.force_length
-            clauses.append(f"{action_alias}.{column} = %({key})s")
+            if model == "facade_action":
+                column = "arg_count" if table == PORT_TABLE["args"] else "return_count"
+                clauses.append(f"{owner_alias}.{column} = %(force_length_{demand_index})s")
+            else:
+                clauses.append(_root_count_subquery(table, owner_alias, "TRUE", f"force_length_{demand_index}"))
 
         if demand.force_non_nullable_length is not None:
-            clauses.append(_root_count_subquery(table, action_alias, "pc.nullable = false", f"force_non_nullable_{demand_index}", demand.force_non_nullable_length, params))
+            clauses.append(_root_count_subquery(table, owner_alias, "pc.nullable = false", f"force_non_nullable_{demand_index}"))
 
         if demand.force_structure_length is not None:
-            clauses.append(_root_count_subquery(table, action_alias, "pc.kind = 'STRUCTURE'", f"force_structure_{demand_index}", demand.force_structure_length, params))
+            clauses.append(_root_count_subquery(table, owner_alias, "pc.kind = 'STRUCTURE'", f"force_structure_{demand_index}"))
 
     if not clauses:
         raise ValueError("No search params provided")
 
-    sql = f"SELECT {action_alias}.id FROM facade_action {action_alias} WHERE " + " AND ".join(clauses)
-    return sql, params
-
-
-_NAMED_PARAM_RE = re.compile(r"%\((\w+)\)s")
-
+    return f"SELECT {owner_alias}.id FROM {model} {owner_alias} WHERE " + " AND ".join(clauses)
 
-def _to_positional(sql: str, params: dict[str, t.Any]) -> tuple[str, list[t.Any]]:
-    """Convert pyformat named placeholders to positional ``%s`` ones.
 
-    ``RawSQL`` params are combined with the rest of the query's params into one flat
-    sequence by the ORM compiler, so a mapping cannot be passed through — the same
-    statement needs its params positional to be embeddable as a subquery.
-    """
-    ordered_keys = _NAMED_PARAM_RE.findall(sql)
-    return _NAMED_PARAM_RE.sub("%s", sql), [params[key] for key in ordered_keys]
+def _bind_port_demands(demands: t.Sequence[t.Any], organization_id: str | None = None, model: str = "facade_action") -> dict[str, t.Any]:
+    params: dict[str, t.Any] = {}
+    if organization_id is not None:
+        params["org"] = organization_id
+    for demand_index, demand in enumerate(demands):
+        table = OWNER_PORT_TABLES[model][_demand_kind_value(demand.kind)]
+        _bind_root_matches(demand.matches, table, f"{demand_index}", params)
+        params[f"force_length_{demand_index}"] = demand.force_length
+        params[f"force_non_nullable_{demand_index}"] = demand.force_non_nullable_length
+        params[f"force_structure_{demand_index}"] = demand.force_structure_length
+    return params
+
+
+def _port_demand_statement(demands: t.Sequence[t.Any], organization_id: str | None, model: str = "facade_action") -> tuple[str, list[t.Any]]:
+    """The positional (sql, params) of a port demand, rendered once per shape."""
+    if model not in OWNER_PORT_TABLES:
+        raise ValueError(f"{model} has no relational port rows to match port demands against")
+    plan = demand_plans.get(
+        ("ports", _port_demand_shape(demands, organization_id, model)),
+        lambda: _port_demand_sql(demands, organization_id=organization_id, model=model),
+    )
+    return plan.sql, plan.bind(_bind_port_demands(demands, organization_id=organization_id, model=model))
 
 
 def get_action_port_demand_subquery(
     demands: t.Sequence[t.Any],
     organization_id: str | None = None,
+    model: str = "facade_action",
 ) -> RawSQL:
     """The port-demand statement as a ``RawSQL`` id subquery for ``filter(id__in=...)``.
 
@@ -209,9 +380,8 @@ def get_action_port_demand_subquery(
     in Python and shipping the list back as an ``IN`` literal (unbounded for
     unselective demands).
     """
-    sql, params = _port_demand_sql(demands, organization_id=organization_id)
-    positional_sql, positional_params = _to_positional(sql, params)
-    return RawSQL(positional_sql, positional_params)
+    sql, params = _port_demand_statement(demands, organization_id, model)
+    return RawSQL(sql, params)
 
 
 def get_action_ids_by_port_demands(
@@ -227,37 +397,68 @@ def get_action_ids_by_port_demands(
     single statement is exactly the set intersection of per-demand results — without the
     N round trips.
 
-    For ``facade_action`` this uses the indexed relational port engine. Other models
-    (e.g. ``facade_shortcut``) keep their own ``args``/``returns`` JSONB and fall back to
-    the JSONB-scan matcher per demand, since only Actions own relational port rows.
-    Queryset filters should prefer ``get_action_port_demand_subquery`` (no id
-    materialization); this id-list form serves callers that consume the ids in Python.
+    ``model`` is ``facade_action`` or ``facade_shortcut``; both own relational port rows
+    (see ``OWNER_PORT_TABLES``) and share the indexed engine. ``organization_id`` only
+    scopes actions. Queryset filters should prefer ``get_action_port_demand_subquery``
+    (no id materialization); this id-list form serves callers that consume the ids in
+    Python.
     """
-    if model != "facade_action":
-        ids: set[t.Any] | None = None
-        for demand in demands:
-            new_ids = _json_scan_ids(
-                demand.matches,
-                type=_demand_kind_value(demand.kind),
-                force_length=demand.force_length,
-                force_non_nullable_length=demand.force_non_nullable_length,
-                force_structure_length=demand.force_structure_length,
-                model=model,
-            )
-            ids = set(new_ids) if ids is None else ids.intersection(new_ids)
-        return list(ids or [])
+    return _execute_ids(*_port_demand_statement(demands, organization_id, model))
+
+
+def get_action_descriptor_subquery(
+    descriptors: t.Sequence[t.Any],
+    kind: t.Any = "args",
+    organization_id: str | None = None,
+) -> RawSQL:
+    """Ids of actions with a port that constrains, and accepts, the given candidate object.
+
+    A descriptor-first search: the candidate's facts select, through the GIN index on
+    ``descriptor_facts``, the ports declaring at least one ``EXISTS``/``EQUALS`` fact the
+    candidate carries (``&&``); the exact compiled JSONPath then confirms them. Ports at any
+    depth count. Ports that constrain only through other operators are not found.
+    """
+    if not descriptors:
+        raise ValueError("No descriptors provided")
+    table = PORT_TABLE[_demand_kind_value(kind)]
+    candidate = {descriptor.key: descriptor.value for descriptor in descriptors}
+    sql = (
+        f"SELECT p.action_id FROM {table} p"
+        + (" JOIN facade_action a ON a.id = p.action_id WHERE a.organization_id = %s AND" if organization_id is not None else " WHERE")
+        + " p.descriptor_facts && %s::text[] AND jsonb_path_match(%s::jsonb, p.compiled_jsonpath::jsonpath, '{}'::jsonb, true)"
+    )
+    params = [organization_id] if organization_id is not None else []
+    return RawSQL(sql, params + [candidate_facts(candidate), json.dumps(candidate)])
+
+
+# =========================================================================
+# Action demands
+# =========================================================================
+
 
-    sql, params = _port_demand_sql(demands, organization_id=organization_id)
-    return _execute_ids(sql, params)
+def _action_demand_shape(action_demand: ActionDemandInput | t.Any) -> tuple[t.Any, ...]:
+    # getattr: demands are duck-typed — ActionDependencyInput (facade/queries/action.py,
+    # facade/logic.py) carries the same match fields but no ``hash``, and SimpleNamespace
+    # test stand-ins may omit the identity fields.
+    if getattr(action_demand, "hash", None):
+        return ("hash",)
+    return (
+        tuple(bool(getattr(action_demand, field, None)) for field in ("key", "app", "version", "name")),
+        tuple(_match_shape(match) for match in action_demand.arg_matches or []),
+        tuple(_match_shape(match) for match in action_demand.return_matches or []),
+        action_demand.force_arg_length is not None,
+        action_demand.force_return_length is not None,
+        len(getattr(action_demand, "protocols", None) or []),
+        tuple(getattr(action_demand, qualifier, None) is not None for qualifier in ACTION_QUALIFIERS),
+    )
 
 
-def _action_demand_clauses(
+def _action_demand_sql(
     action_demand: ActionDemandInput | t.Any,
     action_alias: str,
     prefix: str,
-    params: dict[str, t.Any],
 ) -> list[str]:
-    """Build the WHERE clauses for one action demand (args + returns together).
+    """Render the WHERE clauses for one action demand (args + returns together).
 
     Demands are duck-typed via attribute access — ``ActionDemandInput`` (query filters and
     dependency declarations) and test ``SimpleNamespace`` stand-ins both work. The matching
@@ -269,57 +470,39 @@ def _action_demand_clauses(
     """
     clauses: list[str] = []
 
-    # getattr: demands are duck-typed — ActionDependencyInput (facade/queries/action.py,
-    # facade/logic.py) carries the same match fields but no ``hash``.
-    demand_hash = getattr(action_demand, "hash", None)
-    if demand_hash:
-        params[f"{prefix}_hash"] = demand_hash
+    if getattr(action_demand, "hash", None):
         clauses.append(f"{action_alias}.hash = %({prefix}_hash)s")
     else:
-        # getattr: SimpleNamespace test stand-ins may omit the identity fields.
         if getattr(action_demand, "key", None):
-            params[f"{prefix}_key"] = action_demand.key
             clauses.append(f"{action_alias}.key = %({prefix}_key)s")
 
         if getattr(action_demand, "app", None):
-            params[f"{prefix}_app"] = action_demand.app
             clauses.append(f"{action_alias}.app_id IN (SELECT id FROM authentikate_app WHERE identifier = %({prefix}_app)s)")
 
         if getattr(action_demand, "version", None):
-            params[f"{prefix}_version"] = action_demand.version
             clauses.append(f"{action_alias}.version = %({prefix}_version)s")
 
         if action_demand.name:
-            params[f"{prefix}_name"] = action_demand.name
             clauses.append(f"{action_alias}.name = %({prefix}_name)s")
 
-        for index, match in enumerate(action_demand.arg_matches or []):
-            clauses.append(_build_match_exists(match, PORT_TABLE["args"], action_alias, None, f"{prefix}_arg_{index}", params))
-
-        for index, match in enumerate(action_demand.return_matches or []):
-            clauses.append(_build_match_exists(match, PORT_TABLE["returns"], action_alias, None, f"{prefix}_ret_{index}", params))
+        clauses.extend(_root_matches_sql(action_demand.arg_matches, PORT_TABLE["args"], action_alias, f"{prefix}_arg"))
+        clauses.extend(_root_matches_sql(action_demand.return_matches, PORT_TABLE["returns"], action_alias, f"{prefix}_ret"))
 
         if action_demand.force_arg_length is not None:
-            params[f"{prefix}_force_arg_length"] = action_demand.force_arg_length
             clauses.append(f"{action_alias}.arg_count = %({prefix}_force_arg_length)s")
 
         if action_demand.force_return_length is not None:
-            params[f"{prefix}_force_return_length"] = action_demand.force_return_length
             clauses.append(f"{action_alias}.return_count = %({prefix}_force_return_length)s")
 
         # getattr: only the newer demand shapes carry ``protocols``. The action must
         # implement ALL requested protocols (one EXISTS per name, ANDed) — mirrors the
         # name-based matching of ``ActionFilter.protocols``.
-        for protocol_index, protocol_name in enumerate(getattr(action_demand, "protocols", None) or []):
+        for protocol_index, _ in enumerate(getattr(action_demand, "protocols", None) or []):
             key = f"{prefix}_protocol_{protocol_index}"
-            params[key] = protocol_name
             clauses.append(f"EXISTS (SELECT 1 FROM facade_action_protocols ap_{key} JOIN facade_protocol p_{key} ON p_{key}.id = ap_{key}.protocol_id WHERE ap_{key}.action_id = {action_alias}.id AND p_{key}.name = %({key})s)")
 
-        # Semantic qualifiers: tri-state — None matches either.
-        for qualifier in ("pure", "idempotent", "stateful"):
-            value = getattr(action_demand, qualifier, None)
-            if value is not None:
-                params[f"{prefix}_{qualifier}"] = value
+        for qualifier in ACTION_QUALIFIERS:
+            if getattr(action_demand, qualifier, None) is not None:
                 clauses.append(f"{action_alias}.{qualifier} = %({prefix}_{qualifier})s")
 
     if not clauses:
@@ -328,6 +511,47 @@ def _action_demand_clauses(
     return clauses
 
 
+def _bind_action_demand(action_demand: ActionDemandInput | t.Any, prefix: str, params: dict[str, t.Any]) -> None:
+    demand_hash = getattr(action_demand, "hash", None)
+    if demand_hash:
+        params[f"{prefix}_hash"] = demand_hash
+        return
+    for field in ("key", "app", "version", "name"):
+        params[f"{prefix}_{field}"] = getattr(action_demand, field, None)
+    _bind_root_matches(action_demand.arg_matches, PORT_TABLE["args"], f"{prefix}_arg", params)
+    _bind_root_matches(action_demand.return_matches, PORT_TABLE["returns"], f"{prefix}_ret", params)
+    params[f"{prefix}_force_arg_length"] = action_demand.force_arg_length
+    params[f"{prefix}_force_return_length"] = action_demand.force_return_length
+    for protocol_index, protocol_name in enumerate(getattr(action_demand, "protocols", None) or []):
+        params[f"{prefix}_protocol_{protocol_index}"] = protocol_name
+    for qualifier in ACTION_QUALIFIERS:
+        params[f"{prefix}_{qualifier}"] = getattr(action_demand, qualifier, None)
+
+
+def _action_demands_sql(action_demands: t.Sequence[ActionDemandInput | t.Any], organization_id: str | None) -> str:
+    """Render the ``UNION ALL`` of one tagged select per action demand."""
+    action_alias = "a"
+    selects: list[str] = []
+    for index, action_demand in enumerate(action_demands):
+        clauses = _action_demand_sql(action_demand, action_alias, f"d{index}")
+        if organization_id is not None:
+            clauses.insert(0, f"{action_alias}.organization_id = %(org)s")
+        # ``index`` is a loop counter, never user input — safe to inline as the demand tag.
+        selects.append(f"SELECT {index} AS demand_index, {action_alias}.id FROM facade_action {action_alias} WHERE " + " AND ".join(clauses))
+    return "\nUNION ALL\n".join(selects)
+
+
+def _action_demands_statement(action_demands: t.Sequence[ActionDemandInput | t.Any], organization_id: str | None) -> tuple[str, list[t.Any]]:
+    """The positional (sql, params) of a run of action demands, rendered once per shape."""
+    shape = ("actions", organization_id is not None, tuple(_action_demand_shape(action_demand) for action_demand in action_demands))
+    plan = demand_plans.get(shape, lambda: _action_demands_sql(action_demands, organization_id))
+
+    params: dict[str, t.Any] = {"org": organization_id}
+    for index, action_demand in enumerate(action_demands):
+        _bind_action_demand(action_demand, f"d{index}", params)
+    return plan.sql, plan.bind(params)
+
+
 def get_action_ids_by_action_demands(
     action_demands: t.Sequence[ActionDemandInput | t.Any],
     organization_id: str | None = None,
@@ -339,188 +563,73 @@ def get_action_ids_by_action_demands(
     What is consolidated here is the SQL: one ``UNION ALL`` statement instead of one query
     per demand.
     """
-    action_alias = "a"
-    params: dict[str, t.Any] = {}
-    selects: list[str] = []
-
-    if organization_id is not None:
-        params["org"] = organization_id
-
-    for index, action_demand in enumerate(action_demands):
-        clauses = _action_demand_clauses(action_demand, action_alias, f"d{index}", params)
-        if organization_id is not None:
-            clauses.insert(0, f"{action_alias}.organization_id = %(org)s")
-        # ``index`` is a loop counter, never user input — safe to inline as the demand tag.
-        selects.append(f"SELECT {index} AS demand_index, {action_alias}.id FROM facade_action {action_alias} WHERE " + " AND ".join(clauses))
-
-    if not selects:
+    if not action_demands:
         return []
 
     results: list[list[t.Any]] = [[] for _ in action_demands]
-    for demand_index, action_id in _execute_rows("\nUNION ALL\n".join(selects), params):
+    for demand_index, action_id in _execute_rows(*_action_demands_statement(action_demands, organization_id)):
         results[demand_index].append(action_id)
     return results
 
 
 # =========================================================================
-# Legacy JSONB-scan matcher
+# State matching
 #
-# Retained for models that carry ``args``/``returns`` (or ``ports``) as JSONB but
-# have no relational port rows: Shortcuts and State schemas. It only compares the
-# coarse key/kind/identifier fields and matches children positionally one level
-# deep; this is acceptable for those secondary lookups.
+# StateDefinitions flatten their ``ports`` into ``facade_stateport`` rows, so state
+# demands share the relational engine (and its full semantics) with actions.
 # =========================================================================
 
 
-def _reject_unsupported_legacy_match_fields(matches: t.Sequence[MatchInput] | None, model: str) -> None:
-    """Refuse demands the JSONB scanner cannot express instead of silently degrading them.
+def _state_demand_sql(match_lists: t.Sequence[t.Sequence[MatchInput]]) -> str:
+    parts: list[str] = []
+    for demand_index, matches in enumerate(match_lists):
+        clauses = _root_matches_sql(matches, STATE_PORT_TABLE, "d", f"s{demand_index}")
+        if not clauses:
+            raise ValueError("No search params provided")
+        parts.append(f"SELECT {demand_index} AS demand_index, d.id FROM facade_statedefinition d WHERE " + " AND ".join(clauses))
+    return " UNION ALL ".join(parts)
 
-    The legacy scanner only compares key/kind/identifier (children positionally, one level
-    deep). ``descriptors`` and ``nullable`` used to be dropped without a word, so a
-    descriptor-bearing demand against e.g. shortcuts would quietly return purely structural
-    matches — results that look right and aren't.
-    """
-    for match in matches or []:
-        if getattr(match, "descriptors", None):
-            raise ValueError(f"Descriptor matching (requires/provides) is not supported for {model}: only Actions have relational port rows with compiled constraints. Remove 'descriptors' from the demand.")
-        if getattr(match, "nullable", None) is not None:
-            raise ValueError(f"'nullable' matching is not supported for {model}: the legacy JSONB scanner only compares key/kind/identifier. Remove 'nullable' from the demand.")
-        _reject_unsupported_legacy_match_fields(getattr(match, "children", None), model)
-
-
-def build_child_recursively(item: MatchInput, prefix, value_path, parts, params):
-    if item.key:
-        parts.append(f"{prefix}->>'key' = %({value_path}_key)s")
-        params[f"{value_path}_key"] = item.key
-
-    if item.kind:
-        parts.append(f"{prefix}->>'kind' = %({value_path}_kind)s")
-        params[f"{value_path}_kind"] = item.kind.value
-
-    if item.identifier:
-        parts.append(f"{prefix}->>'identifier' = %({value_path}_identifier)s")
-        params[f"{value_path}_identifier"] = item.identifier
-
-
-def build_sql_for_item_recursive(item: MatchInput, index: int, at_value: int | None = None, prefix: str = "arg"):
-    sql_parts = []
-    params = {}
-
-    if at_value is not None:
-        sql_parts.append(f"idx = %({prefix}_at_{index})s")
-        params[f"{prefix}_at_{index}"] = at_value + 1
-
-    if item.key:
-        sql_parts.append(f"item->>'key' = %({prefix}_key_{index})s")
-        params[f"{prefix}_key_{index}"] = item.key
-
-    if item.kind:
-        sql_parts.append(f"item->>'kind' = %({prefix}_kind_{index})s")
-        params[f"{prefix}_kind_{index}"] = item.kind.value
-
-    if item.identifier:
-        sql_parts.append(f"item->>'identifier' = %({prefix}_identifier_{index})s")
-        params[f"{prefix}_identifier_{index}"] = item.identifier
-
-    if item.children:
-        child_parts = []
-        child_params = {}
-        for idx, child in enumerate(item.children):
-            build_child_recursively(
-                child,
-                f"item->'children'->{idx + 1}",
-                f"children_{index}_{idx}",
-                child_parts,
-                child_params,
-            )
-        sql_parts += child_parts
-        params.update(child_params)
-
-    return (" AND ".join(sql_parts), params)
-
-
-def _json_scan_params(
-    search_params: t.Sequence[MatchInput] | None,
-    type: t.Literal["args", "returns"] = "args",
-    force_length: t.Optional[int] = None,
-    force_non_nullable_length: t.Optional[int] = None,
-    force_structure_length: t.Optional[int] = None,
-    model: str = "facade_shortcut",
-):
-    individual_queries = []
-    all_params = {}
-    if search_params:
-        _reject_unsupported_legacy_match_fields(search_params, model)
-        for index, item in enumerate(search_params):
-            sql_part, params = build_sql_for_item_recursive(item, index, at_value=item.at)
-            subquery = f"EXISTS (SELECT 1 FROM jsonb_array_elements({type}) WITH ORDINALITY AS j(item, idx) WHERE {sql_part})"
-            individual_queries.append(subquery)
-            all_params.update(params)
-
-    if force_length is not None:
-        individual_queries.append(f"jsonb_array_length({type}) = {force_length}")
-
-    if force_non_nullable_length is not None:
-        sql_part = "item->>'nullable'::text = 'false'"
-        individual_queries.append(f"""(SELECT COUNT(*) FROM jsonb_array_elements({type}) AS j(item) WHERE {sql_part}) = {force_non_nullable_length}""")
-
-    if force_structure_length is not None:
-        sql_part = "item->>'kind' = 'STRUCTURE'"
-        individual_queries.append(f"""(SELECT COUNT(*) FROM jsonb_array_elements({type}) AS j(item) WHERE {sql_part}) = {force_structure_length}""")
-
-    if not individual_queries:
-        raise ValueError("No search params provided")
 
-    full_sql = f"SELECT id FROM {model} WHERE " + " AND ".join(individual_queries)
-    return full_sql, all_params
+def get_state_ids_by_demands(matches: t.Sequence[MatchInput] | None = None) -> list[t.Any]:
+    """Return ids of StateDefinitions with ports satisfying every match."""
+    return get_state_ids_by_demand_batch([matches or []])[0]
 
 
-def _json_scan_ids(
-    demands: t.Sequence[MatchInput] | None = None,
-    type: t.Literal["args", "returns"] = "args",
-    force_length: t.Optional[int] = None,
-    force_non_nullable_length: t.Optional[int] = None,
-    force_structure_length: t.Optional[int] = None,
-    model: str = "facade_shortcut",
-) -> list[t.Any]:
-    full_sql, all_params = _json_scan_params(
-        demands,
-        type=type,
-        force_length=force_length,
-        force_non_nullable_length=force_non_nullable_length,
-        force_structure_length=force_structure_length,
-        model=model,
-    )
-    return _execute_ids(full_sql, all_params)
-
-
-def build_state_params(
-    search_params: t.Sequence[MatchInput] | None,
-    model: str = "facade_statedefinition",
-):
-    individual_queries = []
-    all_params = {}
-    if search_params:
-        _reject_unsupported_legacy_match_fields(search_params, model)
-        for index, item in enumerate(search_params):
-            sql_part, params = build_sql_for_item_recursive(item, index, at_value=item.at)
-            subquery = f"EXISTS (SELECT 1 FROM jsonb_array_elements(ports) WITH ORDINALITY AS j(item, idx) WHERE {sql_part})"
-            individual_queries.append(subquery)
-            all_params.update(params)
-
-    if not individual_queries:
-        raise ValueError("No search params provided")
+def get_state_ids_by_demand_batch(match_lists: t.Sequence[t.Sequence[MatchInput]]) -> list[list[t.Any]]:
+    """:func:`get_state_ids_by_demands` for several match lists, index-aligned, in one ``UNION ALL`` round trip."""
+    if not match_lists:
+        return []
 
-    full_sql = f"SELECT id FROM {model} WHERE " + " AND ".join(individual_queries)
-    return full_sql, all_params
+    shape = tuple(tuple(_match_shape(match) for match in matches or []) for matches in match_lists)
+    plan = demand_plans.get(("states", shape), lambda: _state_demand_sql(match_lists))
+    params: dict[str, t.Any] = {}
+    for demand_index, matches in enumerate(match_lists):
+        _bind_root_matches(matches, STATE_PORT_TABLE, f"s{demand_index}", params)
+
+    results: list[list[t.Any]] = [[] for _ in match_lists]
+    for demand_index, definition_id in _execute_rows(plan.sql, plan.bind(params)):
+        results[demand_index].append(definition_id)
+    return results
 
 
-def get_state_ids_by_demands(
-    matches: t.Sequence[MatchInput] | None = None,
-    model: str = "facade_statedefinition",
-) -> list[t.Any]:
-    full_sql, all_params = build_state_params(matches, model=model)
-    return _execute_ids(full_sql, all_params)
+def state_demands_state_filters(demands: t.Sequence[t.Any]) -> list[dict[str, t.Any]]:
+    """:func:`state_demand_state_filters` for several demands; their ``matches`` resolve in one round trip."""
+    definition_ids = iter(get_state_ids_by_demand_batch([demand.matches for demand in demands if demand.matches]))
+    all_filters = []
+    for demand in demands:
+        filters: dict[str, t.Any] = {}
+        if getattr(demand, "key", None):
+            filters["key"] = demand.key
+        if getattr(demand, "app", None):
+            filters["app_identifier"] = demand.app
+        if getattr(demand, "hash", None):
+            filters["definition__hash"] = demand.hash
+        if demand.matches:
+            filters["definition_id__in"] = next(definition_ids)
+        if not filters:
+            raise ValueError(f"No search params provided {demand}")
+        all_filters.append(filters)
+    return all_filters
 
 
 def state_demand_state_filters(demand: t.Any) -> dict[str, t.Any]:
@@ -531,15 +640,4 @@ def state_demand_state_filters(demand: t.Any) -> dict[str, t.Any]:
     agent filter, dependency resolution and the ``state_for`` query so their semantics stay
     in lockstep. Raises when the demand carries no criteria at all.
     """
-    filters: dict[str, t.Any] = {}
-    if getattr(demand, "key", None):
-        filters["key"] = demand.key
-    if getattr(demand, "app", None):
-        filters["app_identifier"] = demand.app
-    if getattr(demand, "hash", None):
-        filters["definition__hash"] = demand.hash
-    if demand.matches:
-        filters["definition_id__in"] = get_state_ids_by_demands(demand.matches)
-    if not filters:
-        raise ValueError(f"No search params provided {demand}")
-    return filters
+    return state_demands_state_filters([demand])[0]
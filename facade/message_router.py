@@ -3,7 +3,7 @@
 Both transports — the WebSocket ``AgentProtocol`` and the HTTP HookAgent intake — feed
 their validated FromAgent messages through :func:`route_from_agent_message`. It performs
 the side effects (persisting events, originating caller work) and **returns** the optional
-reply message (``EventAck`` / ``AssignResponse``) rather than sending it, so each
+reply message (``EventAck`` / ``AssignResponse`` / ``AssignResponseBatch``) rather than sending it, so each
 transport delivers the reply its own way (over the socket, or in the HTTP response).
 
 ``HeartbeatEvent`` is intentionally NOT handled here — it is WebSocket-only liveness and
@@ -74,6 +74,26 @@ async def route_from_agent_message(
                 return messages.AssignResponse(request=message.id, reference=message.reference, task=None, created=False, error=str(e))
             return messages.AssignResponse(request=message.id, reference=message.reference, task=str(task.pk), created=created)
 
+        case messages.AssignRequestBatch():
+            # A fan-out of dependent work: one reply carrying each request's ack, in order.
+            try:
+                results = await backend.on_caller_assign_many(
+                    agent_id,
+                    message,
+                    connection_id=connection_id,
+                    session_id=session_id,
+                )
+            except Exception as e:
+                logger.error("AssignRequestBatch failed", exc_info=True)
+                results = [(None, False, str(e))] * len(message.requests)
+            return messages.AssignResponseBatch(
+                request=message.id,
+                responses=[
+                    messages.AssignResponse(request=request.id, reference=request.reference, task=str(task.pk) if task else None, created=created, error=error)
+                    for request, (task, created, error) in zip(message.requests, results)
+                ],
+            )
+
         # Caller lifecycle-control requests (two-phase; the outcome streams back as …Event mirrors).
         case messages.CancelRequest():
             return await _control(backend.on_caller_cancel, agent_id, message, connection_id, session_id)
@@ -62,6 +62,7 @@ class ToAgentMessageType(str, Enum):
     PROTOCOL_ERROR = "PROTOCOL_ERROR"
     EVENT_ACK = "EVENT_ACK"
     ASSIGN_RESPONSE = "ASSIGN_RESPONSE"
+    ASSIGN_RESPONSE_BATCH = "ASSIGN_RESPONSE_BATCH"
     # Caller-bound event-stream mirrors — one per TaskEventKind — streamed back to the
     # participant that originated the task (see ``ExecutionEvent`` and subclasses).
     BOUND_EVENT = "BOUND_EVENT"
@@ -110,6 +111,7 @@ class FromAgentMessageType(str, Enum):
     STATE_SNAPSHOT = "STATE_SNAPSHOT"
     SESSION_INIT = "SESSION_INIT"
     ASSIGN_REQUEST = "ASSIGN_REQUEST"
+    ASSIGN_REQUEST_BATCH = "ASSIGN_REQUEST_BATCH"
     # Caller-issued lifecycle control requests over the socket (mirroring ASSIGN_REQUEST).
     CANCEL_REQUEST = "CANCEL_REQUEST"
     INTERRUPT_REQUEST = "INTERRUPT_REQUEST"
@@ -592,6 +594,31 @@ class AssignResponse(Message):
     error: Optional[str] = Field(default=None, description="A human-readable error if the assign was rejected (e.g. a parentless root assign).")
 
 
+class AssignRequestBatch(Message):
+    """Several ``AssignRequest``\ s in one frame — an agent fanning out dependent work.
+
+    Each request keeps its own semantics (``parent`` required, idempotent on ``reference``); the
+    backend resolves what the batch shares once and writes the new tasks together. Answered by
+    one ``AssignResponseBatch`` carrying an ``AssignResponse`` per request, in order.
+    """
+
+    type: Literal[FromAgentMessageType.ASSIGN_REQUEST_BATCH] = FromAgentMessageType.ASSIGN_REQUEST_BATCH
+    requests: List[AssignRequest] = Field(description="The assign requests, answered in this order.")
+
+
+class AssignResponseBatch(Message):
+    """The backend's ack of an ``AssignRequestBatch``: one ``AssignResponse`` per request, in order.
+
+    A request rejected on its own (e.g. a parentless assign) carries its ``error`` while the rest
+    go through; an error resolving or writing the new tasks NACKs every request that would have
+    created one.
+    """
+
+    type: Literal[ToAgentMessageType.ASSIGN_RESPONSE_BATCH] = ToAgentMessageType.ASSIGN_RESPONSE_BATCH
+    request: str = Field(description="The id of the AssignRequestBatch this result answers.")
+    responses: List[AssignResponse] = Field(description="One response per request, in request order.")
+
+
 class ControlRequest(Message):
     """Base for a caller's lifecycle-control request over the socket (cancel/interrupt/…).
 
@@ -672,9 +699,10 @@ class ExecutionEvent(Message):
     When a participant originates work (``AssignRequest``), each resulting task
     event is streamed back to it over its own socket as one of the ``…Event`` subclasses
     below — a minimal mirror of the persisted ``TaskEvent``, so the caller never
-    needs GraphQL to read results. Delivery is best-effort (the ``task_caller_{caller_id}``
-    channel-layer group); on a brief disconnect events are missed and the caller
-    re-inquires on reconnect.
+    needs GraphQL to read results. The mirror is built once when the event is persisted and
+    pushed, already serialized, onto the caller agent's own queue — so it survives a brief
+    disconnect like any other queued message. A mirror for a task the agent no longer tracks
+    (e.g. after a fresh-session restart) can be dropped by its ``task`` id.
 
     Correlation: ``task`` is the key the caller already learned from
     ``AssignResponse``. ``event`` is the originating ``TaskEvent`` id (a stable
@@ -846,6 +874,7 @@ ToAgentMessage = Union[
     Kick,
     EventAck,
     AssignResponse,
+    AssignResponseBatch,
     ControlResponse,
     BoundEvent,
     QueuedEvent,
@@ -867,4 +896,4 @@ ToAgentMessage = Union[
     FailedEvent,
     CriticalEvent,
 ]
-FromAgentMessage = Union[Critical, Log, Progress, Started, Completed, Failed, Yield, Register, HeartbeatEvent, Resumed, Paused, Cancelled, Interrupted, StatePatch, StateSnapshot, Lock, Unlock, SessionInit, AssignRequest, CancelRequest, InterruptRequest, PauseRequest, ResumeRequest]
+FromAgentMessage = Union[Critical, Log, Progress, Started, Completed, Failed, Yield, Register, HeartbeatEvent, Resumed, Paused, Cancelled, Interrupted, StatePatch, StateSnapshot, Lock, Unlock, SessionInit, AssignRequest, AssignRequestBatch, CancelRequest, InterruptRequest, PauseRequest, ResumeRequest]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.3 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0012_remove_task_originating_connection_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='agent',
+            name='hook_batch_window_ms',
+            field=models.PositiveIntegerField(default=0, help_text='For a WEBHOOK agent: how long (ms) outbound messages are buffered so they go out as one JSON-array POST. 0 disables batching (one POST per message).'),
+        ),
+        migrations.AddField(
+            model_name='agent',
+            name='hook_batch_max',
+            field=models.PositiveIntegerField(default=100, help_text='For a WEBHOOK agent with batching enabled: the most messages one batched POST carries. A full buffer is flushed before its window elapses.'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.3 on 2026-10-19 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0013_agent_hook_batch_window_ms_agent_hook_batch_max'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patch',
+            index=models.Index(fields=['session', 'global_rev'], name='patch_session_rev_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('root__isnull', True)), fields=['caller', 'created_at'], name='task_root_caller_created_idx'),
+        ),
+    ]
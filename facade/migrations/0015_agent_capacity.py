@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-19 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0014_patch_patch_session_rev_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='agent',
+            name='capacity',
+            field=models.PositiveIntegerField(default=1, help_text='Declared relative capacity (e.g. worker slots) — the weighted scheduler routes action-targeted work to agents in proportion to it.'),
+        ),
+    ]
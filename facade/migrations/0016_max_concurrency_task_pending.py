@@ -0,0 +1,32 @@
+# Generated by Django 6.0.3 on 2026-10-19 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0015_agent_capacity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='agent',
+            name='max_concurrency',
+            field=models.PositiveIntegerField(default=0, help_text='The most tasks dispatched to this Agent at once. Further tasks are held server-side (pending) until a running one finishes. 0 means unlimited.'),
+        ),
+        migrations.AddField(
+            model_name='implementation',
+            name='max_concurrency',
+            field=models.PositiveIntegerField(default=0, help_text='The most tasks of this implementation dispatched to its agent at once. Further tasks are held server-side (pending) until a running one finishes. 0 means unlimited.'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='pending',
+            field=models.BooleanField(default=False, help_text='Is this Task held server-side because its agent or implementation is at its max_concurrency? A pending task has not been sent to the agent yet.'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_done', False), ('pending', True)), fields=['agent', 'created_at'], name='task_agent_held_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.3 on 2026-10-19 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0016_max_concurrency_task_pending'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_done', False)), fields=['root'], name='task_root_open_idx'),
+        ),
+    ]
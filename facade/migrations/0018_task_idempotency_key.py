@@ -0,0 +1,22 @@
+# Generated by Django 6.0.3 on 2026-10-19 20:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0017_task_root_open_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='idempotency_key',
+            field=models.CharField(blank=True, help_text="The caller's idempotency key of the assign that created this Task: a retried assign with the same key returns this Task instead of creating another.", max_length=255, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='task',
+            constraint=models.UniqueConstraint(condition=models.Q(('idempotency_key__isnull', False)), fields=('caller', 'idempotency_key'), name='task_caller_idempotency_uniq'),
+        ),
+    ]
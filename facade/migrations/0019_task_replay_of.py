@@ -0,0 +1,19 @@
+# Generated by Django 6.0.3 on 2026-10-19 21:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0018_task_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='replay_of',
+            field=models.ForeignKey(blank=True, help_text='The prior completed run this Task reused instead of being dispatched (an assign with a reuse policy on a pure action)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='replays', to='facade.task'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.3 on 2026-10-19 21:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0019_task_replay_of'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('task', models.OneToOneField(help_text='The Task whose Assign has not been sent yet', on_delete=django.db.models.deletion.CASCADE, related_name='outbox', to='facade.task')),
+            ],
+        ),
+    ]
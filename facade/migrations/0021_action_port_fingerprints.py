@@ -0,0 +1,56 @@
+# Generated by Django 6.0.3 on 2026-10-19 22:10
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+from facade.fingerprints import port_fingerprints
+
+
+def backfill_port_fingerprints(apps, schema_editor):
+    """Existing actions get the fingerprints of their stored root port rows."""
+    Action = apps.get_model("facade", "Action")
+    ArgPort = apps.get_model("facade", "ArgPort")
+    ReturnPort = apps.get_model("facade", "ReturnPort")
+
+    def roots(port_model):
+        by_action = {}
+        for action_id, index, kind, identifier, dimension in port_model.objects.filter(parent__isnull=True).values_list("action_id", "index", "kind", "identifier", "dimension").iterator():
+            by_action.setdefault(action_id, []).append((index, kind, identifier, dimension))
+        return by_action
+
+    args, returns = roots(ArgPort), roots(ReturnPort)
+    actions = [
+        Action(pk=action_id, arg_fingerprints=port_fingerprints(args.get(action_id, [])), return_fingerprints=port_fingerprints(returns.get(action_id, [])))
+        for action_id in set(args) | set(returns)
+    ]
+    Action.objects.bulk_update(actions, ["arg_fingerprints", "return_fingerprints"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0020_taskoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='action',
+            name='arg_fingerprints',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), default=list, help_text='Pre-calculated structural fingerprints of the root input ports (see facade.fingerprints)', size=None),
+        ),
+        migrations.AddField(
+            model_name='action',
+            name='return_fingerprints',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), default=list, help_text='Pre-calculated structural fingerprints of the root output ports (see facade.fingerprints)', size=None),
+        ),
+        migrations.RunPython(backfill_port_fingerprints, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='action',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['arg_fingerprints'], name='action_arg_fp_gin_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='action',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['return_fingerprints'], name='action_return_fp_gin_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 6.0.3 on 2026-10-19 22:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_availability(apps, schema_editor):
+    """Every existing implementation gets its availability row."""
+    Implementation = apps.get_model("facade", "Implementation")
+    ActionAvailability = apps.get_model("facade", "ActionAvailability")
+
+    rows = [
+        ActionAvailability(
+            implementation_id=implementation_id,
+            organization_id=organization_id,
+            action_id=action_id,
+            agent_id=agent_id,
+            available=kind == "WEBHOOK" or bool(connected),
+        )
+        for implementation_id, organization_id, action_id, agent_id, kind, connected in Implementation.objects.values_list("id", "action__organization_id", "action_id", "agent_id", "agent__kind", "agent__connected").iterator()
+    ]
+    ActionAvailability.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentikate', '0005_alter_client_client_id'),
+        ('facade', '0021_action_port_fingerprints'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActionAvailability',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('available', models.BooleanField(default=False, help_text='Whether the agent can receive work: a webhook agent, or a connected websocket agent')),
+                ('action', models.ForeignKey(help_text='The implemented action', on_delete=django.db.models.deletion.CASCADE, related_name='availabilities', to='facade.action')),
+                ('agent', models.ForeignKey(help_text='The agent providing the implementation', on_delete=django.db.models.deletion.CASCADE, related_name='availabilities', to='facade.agent')),
+                ('implementation', models.OneToOneField(help_text='The implementation this row projects', on_delete=django.db.models.deletion.CASCADE, related_name='availability', to='facade.implementation')),
+                ('organization', models.ForeignKey(help_text='The organization of the implemented action', on_delete=django.db.models.deletion.CASCADE, related_name='action_availabilities', to='authentikate.organization')),
+            ],
+            options={
+                'indexes': [
+                    models.Index(fields=['action', 'agent'], name='availability_action_agent_idx'),
+                    models.Index(condition=models.Q(('available', True)), fields=['action', 'agent'], name='availability_available_idx'),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_availability, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 6.0.3 on 2026-10-19 23:05
+
+from types import SimpleNamespace
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+from facade.descriptors import descriptor_facts
+
+
+def backfill_descriptor_facts(apps, schema_editor):
+    """Existing port rows get the facts of the descriptors in their action's definition."""
+    Action = apps.get_model("facade", "Action")
+
+    def facts_by_path(ports, descriptor_field, parent_path=""):
+        for port in ports or []:
+            path = f"{parent_path}.{port.get('key')}" if parent_path else port.get("key")
+            facts = descriptor_facts([SimpleNamespace(**d) for d in port.get(descriptor_field) or []])
+            if facts:
+                yield path, facts
+            yield from facts_by_path(port.get("children"), descriptor_field, path)
+
+    for port_model_name, json_field, descriptor_field in (("ArgPort", "args", "requires"), ("ReturnPort", "returns", "provides")):
+        PortModel = apps.get_model("facade", port_model_name)
+        for action_id, ports in Action.objects.values_list("id", json_field).iterator():
+            by_path = dict(facts_by_path(ports, descriptor_field))
+            if not by_path:
+                continue
+            rows = list(PortModel.objects.filter(action_id=action_id, key_path__in=by_path))
+            for row in rows:
+                row.descriptor_facts = by_path[row.key_path]
+            PortModel.objects.bulk_update(rows, ["descriptor_facts"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0022_actionavailability'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='argport',
+            name='descriptor_facts',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), default=list, help_text='The normalized key/value facts every candidate accepted by the micro-constraints carries (see facade.descriptors)', size=None),
+        ),
+        migrations.AddField(
+            model_name='returnport',
+            name='descriptor_facts',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), default=list, help_text='The normalized key/value facts every candidate accepted by the micro-constraints carries (see facade.descriptors)', size=None),
+        ),
+        migrations.AddIndex(
+            model_name='argport',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['descriptor_facts'], name='argport_facts_gin_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='returnport',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['descriptor_facts'], name='returnport_facts_gin_idx'),
+        ),
+        migrations.RunPython(backfill_descriptor_facts, migrations.RunPython.noop),
+    ]
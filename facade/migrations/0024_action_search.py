@@ -0,0 +1,47 @@
+# Generated by Django 6.0.3 on 2026-10-19 23:30
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+def backfill_search_vectors(apps, schema_editor):
+    """Every existing action gets its weighted search document."""
+    schema_editor.execute(
+        "UPDATE facade_action a SET search_vector ="
+        " setweight(to_tsvector('simple', coalesce(a.name, '') || ' ' || coalesce(a.key, '')), 'A')"
+        " || setweight(to_tsvector('simple', coalesce(a.description, '')), 'B')"
+        " || setweight(to_tsvector('simple', coalesce((SELECT string_agg(c.name, ' ') FROM facade_collection c"
+        " JOIN facade_action_collections ac ON ac.collection_id = c.id WHERE ac.action_id = a.id), '')), 'C')"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0023_port_descriptor_facts'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='action',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(help_text='Weighted full-text document of name, key, description and collection names (see facade.search)', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='action',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='action_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='action',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='action_name_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='agent',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='agent_name_trgm_idx'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
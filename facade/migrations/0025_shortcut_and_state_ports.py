@@ -0,0 +1,114 @@
+# Generated by Django 6.0.3 on 2026-10-19 23:40
+
+from types import SimpleNamespace
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+from facade.descriptors import compile_descriptors_to_jsonpath, descriptor_facts
+
+
+def backfill_port_rows(apps, schema_editor):
+    """Flatten the ports of existing shortcuts and state definitions, one level at a time."""
+
+    def flatten(PortModel, owner_field, owner_id, ports, descriptor_field):
+        def build(port, parent, index, parent_path):
+            path = f"{parent_path}.{port.get('key')}" if parent_path else port.get("key")
+            descriptors = [SimpleNamespace(**d) for d in port.get(descriptor_field) or []]
+            return (
+                port,
+                path,
+                PortModel(
+                    **{f"{owner_field}_id": owner_id},
+                    parent=parent,
+                    index=index,
+                    key=port.get("key"),
+                    key_path=path,
+                    kind=port.get("kind"),
+                    identifier=port.get("identifier"),
+                    compiled_jsonpath=compile_descriptors_to_jsonpath(descriptors),
+                    descriptor_facts=descriptor_facts(descriptors),
+                    nullable=bool(port.get("nullable")),
+                    dimension=port.get("dimension"),
+                ),
+            )
+
+        level = [build(port, None, index, "") for index, port in enumerate(ports or [])]
+        while level:
+            PortModel.objects.bulk_create([row for _, _, row in level])
+            level = [build(child, row, child_index, path) for port, path, row in level for child_index, child in enumerate(port.get("children") or [])]
+
+    Shortcut = apps.get_model("facade", "Shortcut")
+    ShortcutArgPort = apps.get_model("facade", "ShortcutArgPort")
+    ShortcutReturnPort = apps.get_model("facade", "ShortcutReturnPort")
+    for shortcut_id, args, returns in Shortcut.objects.values_list("id", "args", "returns").iterator():
+        flatten(ShortcutArgPort, "shortcut", shortcut_id, args, "requires")
+        flatten(ShortcutReturnPort, "shortcut", shortcut_id, returns, "provides")
+
+    StateDefinition = apps.get_model("facade", "StateDefinition")
+    StatePort = apps.get_model("facade", "StatePort")
+    for definition_id, ports in StateDefinition.objects.values_list("id", "ports").iterator():
+        flatten(StatePort, "definition", definition_id, ports if isinstance(ports, list) else [], "provides")
+
+
+def port_fields(owner_field, owner_model, related_name, port_model):
+    return [
+        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+        ('index', models.IntegerField(help_text='The position of this port in the list')),
+        ('key', models.CharField(help_text="The local key (e.g. 'mask')", max_length=255, null=True)),
+        ('key_path', models.CharField(db_index=True, help_text="The full dot-notation path (e.g. 'options.advanced.mask')", max_length=500)),
+        ('kind', models.CharField(help_text='The structural kind (e.g. LIST, DICT, INT)', max_length=50, null=True)),
+        ('identifier', models.CharField(db_index=True, help_text="The macro-type (e.g. '@mikro/image')", max_length=255, null=True)),
+        ('dimension', models.CharField(blank=True, db_index=True, help_text='Canonical pint dimensionality for QUANTITY ports (the wiring-compatibility key)', max_length=255, null=True)),
+        ('compiled_jsonpath', models.TextField(blank=True, help_text='PostgreSQL JSONPath string for micro-constraints', null=True)),
+        ('descriptor_facts', django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), default=list, help_text='The normalized key/value facts every candidate accepted by the micro-constraints carries (see facade.descriptors)', size=None)),
+        ('nullable', models.BooleanField(default=False)),
+        (owner_field, models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name=related_name, to=owner_model)),
+        ('parent', models.ForeignKey(blank=True, help_text='If this port is nested inside a LIST or DICT', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='children', to=port_model)),
+    ]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0024_action_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShortcutArgPort',
+            fields=port_fields('shortcut', 'facade.shortcut', 'arg_ports', 'facade.shortcutargport'),
+            options={
+                'indexes': [
+                    models.Index(condition=models.Q(('parent__isnull', True)), fields=['shortcut', 'kind'], name='sc_argport_root_kind_idx'),
+                    models.Index(condition=models.Q(('parent__isnull', True)), fields=['shortcut', 'nullable'], name='sc_argport_root_null_idx'),
+                    django.contrib.postgres.indexes.GinIndex(fields=['descriptor_facts'], name='sc_argport_facts_gin_idx'),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name='ShortcutReturnPort',
+            fields=port_fields('shortcut', 'facade.shortcut', 'return_ports', 'facade.shortcutreturnport'),
+            options={
+                'indexes': [
+                    models.Index(condition=models.Q(('parent__isnull', True)), fields=['shortcut', 'kind'], name='sc_retport_root_kind_idx'),
+                    models.Index(condition=models.Q(('parent__isnull', True)), fields=['shortcut', 'nullable'], name='sc_retport_root_null_idx'),
+                    django.contrib.postgres.indexes.GinIndex(fields=['descriptor_facts'], name='sc_retport_facts_gin_idx'),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name='StatePort',
+            fields=port_fields('definition', 'facade.statedefinition', 'port_rows', 'facade.stateport'),
+            options={
+                'indexes': [
+                    models.Index(condition=models.Q(('parent__isnull', True)), fields=['definition', 'kind'], name='stateport_root_kind_idx'),
+                    models.Index(condition=models.Q(('parent__isnull', True)), fields=['definition', 'nullable'], name='stateport_root_null_idx'),
+                    django.contrib.postgres.indexes.GinIndex(fields=['descriptor_facts'], name='stateport_facts_gin_idx'),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_port_rows, migrations.RunPython.noop),
+    ]
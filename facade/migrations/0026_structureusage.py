@@ -0,0 +1,40 @@
+# Generated by Django 6.0.3 on 2026-10-19 23:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from facade import usages
+
+
+def backfill_usages(apps, schema_editor):
+    """Project the existing port rows and availability rows into the index."""
+    usages.refresh_usages()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentikate', '0005_alter_client_client_id'),
+        ('facade', '0025_shortcut_and_state_ports'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StructureUsage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('identifier', models.CharField(help_text="The lower-cased '@package/key' identifier", max_length=255)),
+                ('kind', models.CharField(help_text='STRUCTURE or INTERFACE', max_length=50)),
+                ('direction', models.CharField(help_text="'args' or 'returns': the port table the usage was found in", max_length=10)),
+                ('port_count', models.IntegerField(help_text="The action's ports in this direction using the identifier, at any depth")),
+                ('live_agents', models.IntegerField(default=0, help_text='Agents that can run the action right now (see ActionAvailability)')),
+                ('action', models.ForeignKey(help_text='The using action', on_delete=django.db.models.deletion.CASCADE, related_name='structure_usages', to='facade.action')),
+                ('organization', models.ForeignKey(help_text='The organization of the using action', on_delete=django.db.models.deletion.CASCADE, related_name='structure_usages', to='authentikate.organization')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['organization', 'kind', 'identifier'], name='structureusage_org_ident_idx')],
+                'constraints': [models.UniqueConstraint(fields=('action', 'kind', 'identifier', 'direction'), name='structureusage_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_usages, migrations.RunPython.noop),
+    ]
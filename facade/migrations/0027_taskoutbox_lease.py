@@ -0,0 +1,23 @@
+# Generated by Django 6.0.3 on 2026-10-19 23:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0026_structureusage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='taskoutbox',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, help_text='When a dispatcher leased the row to send it (null: not claimed)', null=True),
+        ),
+        migrations.AddField(
+            model_name='taskoutbox',
+            name='claimed_by',
+            field=models.CharField(blank=True, help_text='The claim that leased the row', max_length=64, null=True),
+        ),
+    ]
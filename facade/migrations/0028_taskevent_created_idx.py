@@ -0,0 +1,17 @@
+# Generated by Django 6.0.3 on 2026-10-20 00:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0027_taskoutbox_lease'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='taskevent',
+            index=models.Index(fields=['created_at'], name='taskevent_created_idx'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 6.0.3 on 2026-10-20 00:20
+
+from django.db import migrations
+
+# The action's weighted search document (see facade.search), computed on the row as it is
+# written, so no code path can store a stale vector.
+ACTION_TRIGGER = """
+CREATE FUNCTION facade_action_search_vector() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.name, '') || ' ' || coalesce(NEW.key, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'B')
+        || setweight(to_tsvector('simple', coalesce((SELECT string_agg(c.name, ' ') FROM facade_collection c
+           JOIN facade_action_collections ac ON ac.collection_id = c.id WHERE ac.action_id = NEW.id), '')), 'C');
+    RETURN NEW;
+END
+$$;
+CREATE TRIGGER facade_action_search_vector BEFORE INSERT OR UPDATE OF name, key, description, search_vector
+    ON facade_action FOR EACH ROW EXECUTE FUNCTION facade_action_search_vector();
+"""
+
+# Collection membership and collection names are part of the document: touching the action's
+# ``search_vector`` column has the trigger above recompute it.
+COLLECTION_TRIGGERS = """
+CREATE FUNCTION facade_action_collections_search_vector() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        UPDATE facade_action SET search_vector = NULL WHERE id = OLD.action_id;
+    ELSE
+        UPDATE facade_action SET search_vector = NULL WHERE id = NEW.action_id;
+    END IF;
+    RETURN NULL;
+END
+$$;
+CREATE TRIGGER facade_action_collections_search_vector AFTER INSERT OR DELETE
+    ON facade_action_collections FOR EACH ROW EXECUTE FUNCTION facade_action_collections_search_vector();
+
+CREATE FUNCTION facade_collection_search_vector() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF NEW.name IS DISTINCT FROM OLD.name THEN
+        UPDATE facade_action SET search_vector = NULL
+            WHERE id IN (SELECT action_id FROM facade_action_collections WHERE collection_id = NEW.id);
+    END IF;
+    RETURN NULL;
+END
+$$;
+CREATE TRIGGER facade_collection_search_vector AFTER UPDATE OF name
+    ON facade_collection FOR EACH ROW EXECUTE FUNCTION facade_collection_search_vector();
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER IF EXISTS facade_collection_search_vector ON facade_collection;
+DROP FUNCTION IF EXISTS facade_collection_search_vector();
+DROP TRIGGER IF EXISTS facade_action_collections_search_vector ON facade_action_collections;
+DROP FUNCTION IF EXISTS facade_action_collections_search_vector();
+DROP TRIGGER IF EXISTS facade_action_search_vector ON facade_action;
+DROP FUNCTION IF EXISTS facade_action_search_vector();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facade', '0028_taskevent_created_idx'),
+    ]
+
+    operations = [
+        migrations.RunSQL(ACTION_TRIGGER + COLLECTION_TRIGGERS, DROP_TRIGGERS),
+        # Recompute every vector once: rows saved with a stale in-memory copy are healed.
+        migrations.RunSQL('UPDATE facade_action SET search_vector = NULL', migrations.RunSQL.noop),
+    ]
@@ -12,6 +12,7 @@ from .action import (
     ArgPort,
     BasePort,
     ReturnPort,
+    StructureUsage,
 )
 from .agent import (
     Agent,
@@ -25,6 +26,7 @@ from .task import (
     Task,
     TaskEvent,
     TaskInstruct,
+    TaskOutbox,
 )
 from .blok import (
     Blok,
@@ -38,10 +40,13 @@ from .catalog import (
     Collection,
     Protocol,
     Shortcut,
+    ShortcutArgPort,
+    ShortcutReturnPort,
     Toolbox,
     UICatalog,
 )
 from .implementation import (
+    ActionAvailability,
     Dependency,
     Implementation,
     Resolution,
@@ -54,6 +59,7 @@ from .state import (
     Snapshot,
     State,
     StateDefinition,
+    StatePort,
 )
 from .testcase import TestCase, TestResult
 from .threed import Placement, Space, ThreeDModel
@@ -67,11 +73,14 @@ __all__ = [
     "UICatalog",
     "Toolbox",
     "Shortcut",
+    "ShortcutArgPort",
+    "ShortcutReturnPort",
     # action
     "Action",
     "BasePort",
     "ArgPort",
     "ReturnPort",
+    "StructureUsage",
     # agent
     "Lock",
     "Agent",
@@ -83,16 +92,19 @@ __all__ = [
     "Resolution",
     "ResolvedDependency",
     "Implementation",
+    "ActionAvailability",
     # task
     "Task",
     "TaskEvent",
     "TaskInstruct",
+    "TaskOutbox",
     "AgentEvent",
     # testcase
     "TestCase",
     "TestResult",
     # state
     "StateDefinition",
+    "StatePort",
     "State",
     "Session",
     "Patch",
@@ -1,5 +1,8 @@
 from authentikate.models import App, Organization
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.db.models.functions import Upper
 from django_choices_field import TextChoicesField
@@ -86,6 +89,9 @@ class Action(models.Model):
 
     arg_count = models.IntegerField(default=0, help_text="Pre-calculated number of root input ports")
     return_count = models.IntegerField(default=0, help_text="Pre-calculated number of root output ports")
+    arg_fingerprints = ArrayField(base_field=models.TextField(), default=list, help_text="Pre-calculated structural fingerprints of the root input ports (see facade.fingerprints)")
+    return_fingerprints = ArrayField(base_field=models.TextField(), default=list, help_text="Pre-calculated structural fingerprints of the root output ports (see facade.fingerprints)")
+    search_vector = SearchVectorField(null=True, help_text="Weighted full-text document of name, key, description and collection names (see facade.search)")
 
     def __str__(self) -> str:
         return f"{self.name}"
@@ -105,6 +111,13 @@ class Action(models.Model):
             models.Index(fields=["hash"], name="action_hash_idx"),
             models.Index(fields=["organization", "key"], name="action_org_key_idx"),
             models.Index(fields=["name"], name="action_name_idx"),
+            # Purely structural port matches are answered by ``@>`` on the fingerprint arrays.
+            GinIndex(fields=["arg_fingerprints"], name="action_arg_fp_gin_idx"),
+            GinIndex(fields=["return_fingerprints"], name="action_return_fp_gin_idx"),
+            # Search: ranked prefix full-text, and trigrams for ``name__icontains``
+            # (``UPPER(name) LIKE``), which a b-tree cannot serve.
+            GinIndex(fields=["search_vector"], name="action_search_idx"),
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="action_name_trgm_idx"),
         ]
 
 
@@ -128,6 +141,7 @@ class BasePort(models.Model):
     # every descriptor (and every IN-list element), so a length cap would turn a large-but-valid
     # requires/provides declaration into a DataError at registration time.
     compiled_jsonpath = models.TextField(null=True, blank=True, help_text="PostgreSQL JSONPath string for micro-constraints")
+    descriptor_facts = ArrayField(base_field=models.TextField(), default=list, help_text="The normalized key/value facts every candidate accepted by the micro-constraints carries (see facade.descriptors)")
     nullable = models.BooleanField(default=False)
 
     class Meta:
@@ -144,6 +158,8 @@ class BasePort(models.Model):
             # Case-insensitive reverse lookup ("which actions use @mikro/image?") — the catalog
             # entities are lower-cased at registration while port identifiers keep original case.
             models.Index(Upper("identifier"), name="%(class)s_ident_upper_idx"),
+            # Descriptor facts: candidate containment (``<@``) and descriptor-first search (``&&``).
+            GinIndex(fields=["descriptor_facts"], name="%(class)s_facts_gin_idx"),
         ]
 
 
@@ -167,3 +183,37 @@ class ReturnPort(BasePort):
         return f"Return: {self.key_path} ({self.identifier})"
 
 
+class StructureUsage(models.Model):
+    """The structure-usage index: per action and direction, a structure or interface its ports use.
+
+    A projection of the port rows and the availability index kept current by the
+    ``facade.usages`` writers (registration and the agents' liveness transitions), so the
+    structure browser lists identifiers and counts their users from one indexed table instead
+    of aggregating both port tables joined to actions, implementations and agents.
+    """
+
+    organization = models.ForeignKey(
+        Organization,
+        on_delete=models.CASCADE,
+        related_name="structure_usages",
+        help_text="The organization of the using action",
+    )
+    action = models.ForeignKey(
+        Action,
+        on_delete=models.CASCADE,
+        related_name="structure_usages",
+        help_text="The using action",
+    )
+    identifier = models.CharField(max_length=255, help_text="The lower-cased '@package/key' identifier")
+    kind = models.CharField(max_length=50, help_text="STRUCTURE or INTERFACE")
+    direction = models.CharField(max_length=10, help_text="'args' or 'returns': the port table the usage was found in")
+    port_count = models.IntegerField(help_text="The action's ports in this direction using the identifier, at any depth")
+    live_agents = models.IntegerField(default=0, help_text="Agents that can run the action right now (see ActionAvailability)")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["action", "kind", "identifier", "direction"], name="structureusage_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["organization", "kind", "identifier"], name="structureusage_org_ident_idx"),
+        ]
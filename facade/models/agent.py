@@ -2,7 +2,9 @@ import uuid
 
 from authentikate.models import App, Client, Organization, Release, User
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django_choices_field import TextChoicesField
 
 from facade import enums, liveness
@@ -86,6 +88,22 @@ class Agent(models.Model):
     )
     hook_url = models.CharField(max_length=1000, help_text="The webhook URL for this Agent (only if webhook)", null=True, blank=True)
     hook_url_secret = models.CharField(max_length=1000, help_text="The webhook URL secret for this Agent (only if webhook)", null=True, blank=True)
+    hook_batch_window_ms = models.PositiveIntegerField(
+        default=0,
+        help_text="For a WEBHOOK agent: how long (ms) outbound messages are buffered so they go out as one JSON-array POST. 0 disables batching (one POST per message).",
+    )
+    hook_batch_max = models.PositiveIntegerField(
+        default=100,
+        help_text="For a WEBHOOK agent with batching enabled: the most messages one batched POST carries. A full buffer is flushed before its window elapses.",
+    )
+    capacity = models.PositiveIntegerField(
+        default=1,
+        help_text="Declared relative capacity (e.g. worker slots) — the weighted scheduler routes action-targeted work to agents in proportion to it.",
+    )
+    max_concurrency = models.PositiveIntegerField(
+        default=0,
+        help_text="The most tasks dispatched to this Agent at once. Further tasks are held server-side (pending) until a running one finishes. 0 means unlimited.",
+    )
     latest_event = TextChoicesField(
         max_length=1000,
         choices_enum=enums.AgentEventChoices,
@@ -124,6 +142,10 @@ class Agent(models.Model):
                 name="one_agent_per_client_user_organization",
             )
         ]
+        indexes = [
+            # AgentFilter.search is ``name__icontains`` (``UPPER(name) LIKE``): trigram-indexed.
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="agent_name_trgm_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name}"
@@ -1,7 +1,10 @@
 from authentikate.models import Client, Organization
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
+from .action import BasePort
+
 
 class Collection(models.Model):
     """A collection is a group of actions that are related to each other.
@@ -131,3 +134,37 @@ class Shortcut(models.Model):
         default=False,
         help_text="Use the result of this Shortcut (e.g. use the result in the next Shortcut)",
     )
+
+
+class ShortcutArgPort(BasePort):
+    """Inputs for the Shortcut, flattened like the Action's (see facade.managers)"""
+
+    shortcut = models.ForeignKey(Shortcut, on_delete=models.CASCADE, related_name="arg_ports")
+    parent = models.ForeignKey("self", on_delete=models.CASCADE, null=True, blank=True, related_name="children", help_text="If this port is nested inside a LIST or DICT")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["shortcut", "kind"], condition=models.Q(parent__isnull=True), name="sc_argport_root_kind_idx"),
+            models.Index(fields=["shortcut", "nullable"], condition=models.Q(parent__isnull=True), name="sc_argport_root_null_idx"),
+            GinIndex(fields=["descriptor_facts"], name="sc_argport_facts_gin_idx"),
+        ]
+
+    def __str__(self):
+        return f"Shortcut Arg: {self.key_path} ({self.identifier})"
+
+
+class ShortcutReturnPort(BasePort):
+    """Outputs for the Shortcut, flattened like the Action's (see facade.managers)"""
+
+    shortcut = models.ForeignKey(Shortcut, on_delete=models.CASCADE, related_name="return_ports")
+    parent = models.ForeignKey("self", on_delete=models.CASCADE, null=True, blank=True, related_name="children", help_text="If this port is nested inside a LIST or DICT")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["shortcut", "kind"], condition=models.Q(parent__isnull=True), name="sc_retport_root_kind_idx"),
+            models.Index(fields=["shortcut", "nullable"], condition=models.Q(parent__isnull=True), name="sc_retport_root_null_idx"),
+            GinIndex(fields=["descriptor_facts"], name="sc_retport_facts_gin_idx"),
+        ]
+
+    def __str__(self):
+        return f"Shortcut Return: {self.key_path} ({self.identifier})"
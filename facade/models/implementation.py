@@ -198,6 +198,10 @@ class Implementation(models.Model):
         default=enums.EffectClassChoices.NONE.value,
         help_text="The effect class of this implementation. NONE work is freely retryable/reclaimable; PHYSICAL work touches the real world and an ambiguous failure is terminal. Declared by the implementation, read at dispatch from task.implementation.effect — never caller-supplied.",
     )
+    max_concurrency = models.PositiveIntegerField(
+        default=0,
+        help_text="The most tasks of this implementation dispatched to its agent at once. Further tasks are held server-side (pending) until a running one finishes. 0 means unlimited.",
+    )
 
     class Meta:
         permissions = [("providable", "Can provide this implementation")]
@@ -214,3 +218,52 @@ class Implementation(models.Model):
 
     def __str__(self):
         return f"{self.action} implemented by {self.agent}"
+
+
+class ActionAvailability(models.Model):
+    """The availability index: one row per Implementation, ``(action, agent, available)``.
+
+    A projection of Implementation and Agent kept current by the ``facade.availability``
+    writers (registration and the agent's liveness transitions), so "which agents can run
+    this action right now" is one indexed lookup instead of a join over implementations and
+    agents. ``available`` mirrors :func:`facade.backend.agent_is_available` up to heartbeat
+    freshness, which lapses without a write and is checked on read.
+    """
+
+    implementation = models.OneToOneField(
+        Implementation,
+        on_delete=models.CASCADE,
+        related_name="availability",
+        help_text="The implementation this row projects",
+    )
+    organization = models.ForeignKey(
+        Organization,
+        on_delete=models.CASCADE,
+        related_name="action_availabilities",
+        help_text="The organization of the implemented action",
+    )
+    action = models.ForeignKey(
+        "Action",
+        on_delete=models.CASCADE,
+        related_name="availabilities",
+        help_text="The implemented action",
+    )
+    agent = models.ForeignKey(
+        "Agent",
+        on_delete=models.CASCADE,
+        related_name="availabilities",
+        help_text="The agent providing the implementation",
+    )
+    available = models.BooleanField(
+        default=False,
+        help_text="Whether the agent can receive work: a webhook agent, or a connected websocket agent",
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["action", "agent"], name="availability_action_agent_idx"),
+            models.Index(fields=["action", "agent"], condition=models.Q(available=True), name="availability_available_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.action} on {self.agent} ({'available' if self.available else 'unavailable'})"
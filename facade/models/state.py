@@ -1,7 +1,10 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from facade import enums
 
+from .action import BasePort
+
 
 class StateDefinition(models.Model):
     """A state definition is an abstract representation of a state and describes
@@ -23,6 +26,23 @@ class StateDefinition(models.Model):
     description = models.CharField(max_length=2000)
 
 
+class StatePort(BasePort):
+    """The ports of a StateDefinition, flattened like the Action's (see facade.managers)"""
+
+    definition = models.ForeignKey(StateDefinition, on_delete=models.CASCADE, related_name="port_rows")
+    parent = models.ForeignKey("self", on_delete=models.CASCADE, null=True, blank=True, related_name="children", help_text="If this port is nested inside a LIST or DICT")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["definition", "kind"], condition=models.Q(parent__isnull=True), name="stateport_root_kind_idx"),
+            models.Index(fields=["definition", "nullable"], condition=models.Q(parent__isnull=True), name="stateport_root_null_idx"),
+            GinIndex(fields=["descriptor_facts"], name="stateport_facts_gin_idx"),
+        ]
+
+    def __str__(self):
+        return f"State Port: {self.key_path} ({self.identifier})"
+
+
 class State(models.Model):
     """A state is a representation of the current state of a action.
 
@@ -92,6 +112,13 @@ class Patch(models.Model):
     global_rev = models.IntegerField(help_text="The current revision of the state in the global context (e.g. considering all patches that have been applied to this state)")
     task = models.ForeignKey("Task", on_delete=models.CASCADE, null=True, blank=True, help_text="The task that caused this patch (e.g. to be able to track changes by task)", related_name="patches")
 
+    class Meta:
+        indexes = [
+            # The ``since`` replay of ``watch_state`` / ``watch_agent``: a revision range within
+            # the agent's current session (and the cursor-is-current probe on the same key).
+            models.Index(fields=["session", "global_rev"], name="patch_session_rev_idx"),
+        ]
+
 
 class Snapshot(models.Model):
     state = models.ForeignKey(State, on_delete=models.CASCADE, related_name="snapshots")
@@ -42,6 +42,12 @@ class Task(models.Model):
         default=uuid.uuid4,
         help_text="The Unique identifier of this Task considering its parent",
     )
+    idempotency_key = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        help_text="The caller's idempotency key of the assign that created this Task: a retried assign with the same key returns this Task instead of creating another.",
+    )
     dependency = models.CharField(
         max_length=1000,
         null=True,
@@ -75,6 +81,14 @@ class Task(models.Model):
         help_text="The Root parent (the one that was created by the user (none if this is the root))",
         related_name="all_children",
     )
+    replay_of = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        help_text="The prior completed run this Task reused instead of being dispatched (an assign with a reuse policy on a pure action)",
+        related_name="replays",
+    )
     args = models.JSONField(blank=True, null=True, help_text="The Args", default=dict)
     args_hash = models.CharField(
         max_length=64,
@@ -118,6 +132,10 @@ class Task(models.Model):
         default=False,
         help_text="Is this Task done (e.g. has it been completed and resulted in an error?)",
     )
+    pending = models.BooleanField(
+        default=False,
+        help_text="Is this Task held server-side because its agent or implementation is at its max_concurrency? A pending task has not been sent to the agent yet.",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     finished_at = models.DateTimeField(null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -159,6 +177,31 @@ class Task(models.Model):
             models.Index(fields=["agent"], condition=models.Q(is_done=False), name="task_agent_open_idx"),
             # The assign dedupe — filter(caller=, reference=) — on the hottest write path.
             models.Index(fields=["caller", "reference"], name="task_caller_ref_idx"),
+            # The ``since`` replay of ``mytasks`` / ``tasks``: root tasks created after the cursor
+            # event, finished or not — which is why ``task_my_root_open_idx`` cannot answer it.
+            models.Index(
+                fields=["caller", "created_at"],
+                condition=models.Q(root__isnull=True),
+                name="task_root_caller_created_idx",
+            ),
+            # The admission queue (``facade.admission``): an agent's held tasks, oldest first.
+            models.Index(
+                fields=["agent", "created_at"],
+                condition=models.Q(pending=True, is_done=False),
+                name="task_agent_held_idx",
+            ),
+            # Propagated control (``RedisControllBackend._request_descendants_control``) updates
+            # the open descendants of a root in one statement: only live rows are indexed.
+            models.Index(fields=["root"], condition=models.Q(is_done=False), name="task_root_open_idx"),
+        ]
+        constraints = [
+            # An idempotency key claims one task per caller (``facade.idempotency``); keyless
+            # assigns are not indexed at all.
+            models.UniqueConstraint(
+                fields=["caller", "idempotency_key"],
+                condition=models.Q(idempotency_key__isnull=False),
+                name="task_caller_idempotency_uniq",
+            ),
         ]
 
 
@@ -203,6 +246,13 @@ class TaskEvent(models.Model):
         blank=True,
     )
 
+    class Meta:
+        indexes = [
+            # A resumed feed turns its commit-skew window into an id bound with one range
+            # probe here, then replays by primary-key range.
+            models.Index(fields=["created_at"], name="taskevent_created_idx"),
+        ]
+
 
 class TaskInstruct(models.Model):
     caller = models.ForeignKey(
@@ -228,6 +278,25 @@ class TaskInstruct(models.Model):
     )
 
 
+class TaskOutbox(models.Model):
+    """An Assign still to be sent for a Task, written in the transaction that created it.
+
+    Drained by ``RedisControllBackend.dispatch_outbox`` (see ``facade.outbox``): a dispatcher
+    leases the row (``claimed_at`` / ``claimed_by``), sends its message outside any transaction
+    and then deletes it. A row whose lease expired is sent again.
+    """
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    task = models.OneToOneField(
+        Task,
+        on_delete=models.CASCADE,
+        related_name="outbox",
+        help_text="The Task whose Assign has not been sent yet",
+    )
+    claimed_at = models.DateTimeField(null=True, blank=True, help_text="When a dispatcher leased the row to send it (null: not claimed)")
+    claimed_by = models.CharField(max_length=64, null=True, blank=True, help_text="The claim that leased the row")
+
+
 class AgentEvent(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     agent = models.ForeignKey(
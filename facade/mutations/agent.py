@@ -2,7 +2,8 @@ import uuid
 
 from django.db import transaction
 from kante.types import Info
-from facade.mutations.implementation import _create_implementation
+from facade.backend import controll_backend
+from facade.mutations.implementation import _create_implementation, rebuild_state_definition_ports
 import strawberry
 from facade import types, models, inputs, scalars, enums
 from rekuest_core.inputs.types import BlokImplementationInput, ImplementationInput, LockImplementationInput, StateImplementationInput
@@ -33,6 +34,22 @@ class AgentInput:
         default=None,
         description="For a WEBHOOK agent: the shared secret used to HMAC-sign messages in both directions (outbound delivery and POST intake).",
     )
+    hook_batch_window_ms: int | None = strawberry.field(
+        default=None,
+        description="For a WEBHOOK agent: buffer outbound messages for this many milliseconds and POST them as one JSON array. 0 disables batching.",
+    )
+    hook_batch_max: int | None = strawberry.field(
+        default=None,
+        description="For a WEBHOOK agent with batching enabled: the maximum number of messages in one batched POST.",
+    )
+    capacity: int | None = strawberry.field(
+        default=None,
+        description="The agent's relative capacity (e.g. its worker slots). With the weighted scheduler, action-targeted work is routed in proportion to it.",
+    )
+    max_concurrency: int | None = strawberry.field(
+        default=None,
+        description="The most tasks dispatched to the agent at once; further tasks are held server-side until one finishes. 0 means unlimited.",
+    )
 
 
 @strawberry.input
@@ -43,7 +60,7 @@ class DeleteAgentInput:
 def _register_state(agent: models.Agent, inputstate: StateImplementationInputModel) -> models.State:
     """Upsert one of the agent's states, defaulting the identity fields: ``key`` falls back
     to the interface, ``app_identifier`` to the agent's app identifier."""
-    state_definition, _ = models.StateDefinition.objects.update_or_create(
+    state_definition, created = models.StateDefinition.objects.update_or_create(
         hash=unique.hash_state_definition(inputstate.definition),
         defaults=dict(
             name=inputstate.definition.name,
@@ -51,6 +68,9 @@ def _register_state(agent: models.Agent, inputstate: StateImplementationInputMod
             description="A state definition",
         ),
     )
+    if created:
+        # The hash covers the ports, so an existing definition's port rows are current.
+        rebuild_state_definition_ports(state_definition)
 
     state, _ = models.State.objects.update_or_create(
         interface=inputstate.interface,
@@ -91,7 +111,8 @@ def ensure_agent(info: Info, input: AgentInput) -> types.Agent:
     ):
         drawer.delete()
 
-    # Configure the transport (idempotent): a HookAgent declares its kind + endpoint here.
+    # Configure the transport (idempotent): a HookAgent declares its kind + endpoint here, any
+    # agent its scheduling capacity and concurrency limit.
     updated_fields = []
     if input.kind is not None:
         agent.kind = getattr(input.kind, "value", input.kind)
@@ -102,9 +123,33 @@ def ensure_agent(info: Info, input: AgentInput) -> types.Agent:
     if input.hook_url_secret is not None:
         agent.hook_url_secret = input.hook_url_secret
         updated_fields.append("hook_url_secret")
+    if input.hook_batch_window_ms is not None:
+        if input.hook_batch_window_ms < 0:
+            raise ValueError("hook_batch_window_ms must not be negative")
+        agent.hook_batch_window_ms = input.hook_batch_window_ms
+        updated_fields.append("hook_batch_window_ms")
+    if input.hook_batch_max is not None:
+        if input.hook_batch_max < 1:
+            raise ValueError("hook_batch_max must be at least 1")
+        agent.hook_batch_max = input.hook_batch_max
+        updated_fields.append("hook_batch_max")
+    if input.capacity is not None:
+        if input.capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        agent.capacity = input.capacity
+        updated_fields.append("capacity")
+    if input.max_concurrency is not None:
+        if input.max_concurrency < 0:
+            raise ValueError("max_concurrency must not be negative")
+        agent.max_concurrency = input.max_concurrency
+        updated_fields.append("max_concurrency")
     if updated_fields:
         agent.save(update_fields=updated_fields)
 
+    if input.max_concurrency is not None:
+        # A raised (or lifted) limit frees slots for work held under the old one.
+        controll_backend.release_held(agent.pk)
+
     return agent
 
 
@@ -3,12 +3,13 @@ import logging
 import strawberry
 from django.db import transaction
 from django.db.models import Exists, OuterRef, Q
-from facade import inputs, models, types
-from facade.descriptors import compile_descriptors_to_jsonpath, compile_returndescriptors_to_jsonpath
+from facade import availability, inputs, models, types, usages
+from facade.descriptors import compile_descriptors_to_jsonpath, compile_returndescriptors_to_jsonpath, descriptor_facts
+from facade.fingerprints import definition_fingerprints
 from facade.protocol import infer_protocols
 from facade.unique import infer_action_scope
 from kante.types import Info
-from rekuest_core.inputs.models import DefinitionInputModel, ImplementationInputModel
+from rekuest_core.inputs.models import ArgPortInputModel, DefinitionInputModel, ImplementationInputModel, ReturnPortInputModel
 from rekuest_core import scalars as rscalars
 from authentikate.vars import get_user, get_client
 from facade.higher_order import validate_dependency_coverage, validate_higher_order_pairing
@@ -21,41 +22,52 @@ logger = logging.getLogger(__name__)
 # =========================================================
 # 2. THE PORT EXTRACTOR (The Relational Engine Builder)
 # =========================================================
+# The columns of a port row that are a pure function of its port definition.
+PORT_ROW_FIELDS = ("index", "key", "kind", "identifier", "dimension", "compiled_jsonpath", "descriptor_facts", "nullable")
+
+
+class _PortRow(t.NamedTuple):
+    """A port row as the definition wants it: where it hangs and its ``PORT_ROW_FIELDS``."""
+
+    parent_path: str | None
+    depth: int
+    fields: dict[str, t.Any]
+
+
+def _port_row_fields(port_data: t.Any, index: int, descriptor_field: str, compiler: t.Callable[[t.Any], str | None]) -> dict[str, t.Any]:
+    # children might be base PortInputModels without requires/provides
+    descriptors = getattr(port_data, descriptor_field, None) or []
+    return dict(
+        index=index,
+        key=port_data.key,
+        kind=port_data.kind.value if hasattr(port_data.kind, "value") else port_data.kind,
+        identifier=port_data.identifier,
+        dimension=port_data.dimension,
+        compiled_jsonpath=compiler(descriptors),
+        descriptor_facts=descriptor_facts(descriptors),
+        nullable=port_data.nullable,
+    )
+
+
 def _bulk_create_ports_level_by_level(
     port_datas: t.Sequence[t.Any],
-    action: models.Action,
-    port_model: type[models.ArgPort] | type[models.ReturnPort],
+    owner: models.Action | models.Shortcut | models.StateDefinition,
+    port_model: type[models.BasePort],
     descriptor_field: str,  # "requires" (args) | "provides" (returns)
     compiler: t.Callable[[t.Any], str | None],
+    owner_field: str = "action",
 ) -> None:
     """Flatten the pydantic port tree into relational rows, one bulk_create per depth level.
 
     Children reference their parent row's PK, so each level is built only after the previous
     level's bulk_create (Postgres RETURNING populates the pks) — O(tree depth) INSERT statements
-    instead of one per port.
+    instead of one per port. ``owner_field`` names the port model's FK to ``owner``.
     """
 
     def build(port_data, parent, index, parent_path):
         # The Semantic Materialized Path (e.g., "options.advanced.mask")
         path = f"{parent_path}.{port_data.key}" if parent_path else port_data.key
-        # children might be base PortInputModels without requires/provides
-        descriptors = getattr(port_data, descriptor_field, None) or []
-        return (
-            port_data,
-            path,
-            port_model(
-                action=action,
-                parent=parent,
-                index=index,
-                key=port_data.key,
-                key_path=path,
-                kind=port_data.kind.value if hasattr(port_data.kind, "value") else port_data.kind,
-                identifier=port_data.identifier,
-                compiled_jsonpath=compiler(descriptors),
-                nullable=port_data.nullable,
-                dimension=port_data.dimension,
-            ),
-        )
+        return port_data, path, port_model(**{owner_field: owner}, parent=parent, key_path=path, **_port_row_fields(port_data, index, descriptor_field, compiler))
 
     level = [build(port_data, None, index, "") for index, port_data in enumerate(port_datas or [])]
     while level:
@@ -67,23 +79,130 @@ def _bulk_create_ports_level_by_level(
         ]
 
 
+def _replace_ports(
+    port_datas: t.Sequence[t.Any],
+    owner: models.Action | models.Shortcut | models.StateDefinition,
+    port_model: type[models.BasePort],
+    descriptor_field: str,
+    compiler: t.Callable[[t.Any], str | None],
+    owner_field: str = "action",
+) -> None:
+    """Delete ``owner``'s port rows and insert them again from the definition."""
+    # CASCADE on the self-referential ``parent`` FK removes nested children too.
+    port_model.objects.filter(**{owner_field: owner}).delete()
+    _bulk_create_ports_level_by_level(port_datas, owner, port_model, descriptor_field, compiler, owner_field=owner_field)
+
+
+def _desired_port_rows(port_datas: t.Sequence[t.Any], descriptor_field: str, compiler: t.Callable[[t.Any], str | None]) -> dict[str, _PortRow] | None:
+    """The definition's rows by ``key_path``, parents first; None when sibling keys repeat."""
+    desired: dict[str, _PortRow] = {}
+
+    def visit(port_data, index, parent_path, depth):
+        path = f"{parent_path}.{port_data.key}" if parent_path else port_data.key
+        if path in desired:
+            return False
+        desired[path] = _PortRow(parent_path or None, depth, _port_row_fields(port_data, index, descriptor_field, compiler))
+        return all(visit(child, child_index, path, depth + 1) for child_index, child in enumerate(port_data.children or []))
+
+    if not all(visit(port_data, index, "", 0) for index, port_data in enumerate(port_datas or [])):
+        return None
+    return desired
+
+
+def _sync_ports(
+    port_datas: t.Sequence[t.Any],
+    owner: models.Action | models.Shortcut | models.StateDefinition,
+    port_model: type[models.BasePort],
+    descriptor_field: str,
+    compiler: t.Callable[[t.Any], str | None],
+    owner_field: str = "action",
+) -> None:
+    """Bring ``owner``'s port rows in line with the definition, writing only what changed.
+
+    Rows are identified by ``key_path``: a row still in the definition, under the same parent,
+    keeps its pk and is updated only when one of its ``PORT_ROW_FIELDS`` changed; rows no
+    longer in the definition are deleted (with their subtrees), new ones inserted one level at
+    a time. An unchanged tree costs one SELECT, a one-descriptor change one UPDATE of one row.
+    Definitions with repeated sibling keys cannot be keyed by path and are replaced wholesale.
+    """
+    desired = _desired_port_rows(port_datas, descriptor_field, compiler)
+    if desired is None:
+        _replace_ports(port_datas, owner, port_model, descriptor_field, compiler, owner_field=owner_field)
+        return
+
+    # Parents were inserted a level before their children, so id order visits them first.
+    paths: dict[int, str] = {}
+    kept: dict[str, models.BasePort] = {}
+    stale: set[int] = set()
+    for row in port_model.objects.filter(**{owner_field: owner}).order_by("id"):
+        paths[row.id] = row.key_path
+        wanted = desired.get(row.key_path)
+        if wanted is None or row.key_path in kept or row.parent_id in stale or paths.get(row.parent_id) != wanted.parent_path:
+            stale.add(row.id)
+        else:
+            kept[row.key_path] = row
+
+    if stale:
+        port_model.objects.filter(id__in=stale).delete()
+
+    changed = []
+    for path, row in kept.items():
+        fields = desired[path].fields
+        if any(getattr(row, name) != value for name, value in fields.items()):
+            for name, value in fields.items():
+                setattr(row, name, value)
+            changed.append(row)
+    if changed:
+        port_model.objects.bulk_update(changed, PORT_ROW_FIELDS, batch_size=500)
+
+    ids = {path: row.id for path, row in kept.items()}
+    levels: dict[int, list[str]] = {}
+    for path, wanted in desired.items():
+        if path not in kept:
+            levels.setdefault(wanted.depth, []).append(path)
+    for depth in sorted(levels):
+        rows = [port_model(**{owner_field: owner}, parent_id=ids[desired[path].parent_path] if desired[path].parent_path else None, key_path=path, **desired[path].fields) for path in levels[depth]]
+        port_model.objects.bulk_create(rows)
+        ids.update((row.key_path, row.id) for row in rows)
+
+
 def rebuild_relational_ports(action: models.Action, definition: DefinitionInputModel) -> None:
-    """Replace the relational ArgPort/ReturnPort rows for ``action`` from its definition.
+    """Bring the relational ArgPort/ReturnPort rows of ``action`` in line with its definition.
 
-    Existing rows are deleted first because this runs on every (re)registration; without
-    the purge, reconnecting agents would accumulate duplicate ports that the matching layer
-    would then double-count. Also refreshes the pre-calculated root-port counts on the Action.
+    Runs on every (re)registration whose definition changed, so the rows are synced by
+    ``key_path`` (:func:`_sync_ports`) rather than deleted and re-inserted: a fleet restarting
+    with a one-descriptor change rewrites one row, not every port and its index entries. Also
+    refreshes the pre-calculated root-port counts and structural fingerprints
+    (``facade.fingerprints``) on the Action when they changed.
     """
-    # CASCADE on the self-referential ``parent`` FK removes nested children too.
-    action.arg_ports.all().delete()
-    action.return_ports.all().delete()
+    _sync_ports(definition.args, action, models.ArgPort, "requires", compile_descriptors_to_jsonpath)
+    _sync_ports(definition.returns, action, models.ReturnPort, "provides", compile_returndescriptors_to_jsonpath)
+
+    derived = dict(
+        arg_count=len(definition.args or []),
+        return_count=len(definition.returns or []),
+        arg_fingerprints=definition_fingerprints(definition.args),
+        return_fingerprints=definition_fingerprints(definition.returns),
+    )
+    update_fields = [field for field, value in derived.items() if getattr(action, field) != value]
+    for field in update_fields:
+        setattr(action, field, derived[field])
+    if update_fields:
+        action.save(update_fields=update_fields)
+
+
+def rebuild_shortcut_ports(shortcut: models.Shortcut) -> None:
+    """Replace the relational ShortcutArgPort/ShortcutReturnPort rows from the shortcut's ports."""
+    args = [ArgPortInputModel.model_validate(port) for port in shortcut.args or []]
+    returns = [ReturnPortInputModel.model_validate(port) for port in shortcut.returns or []]
+    _replace_ports(args, shortcut, models.ShortcutArgPort, "requires", compile_descriptors_to_jsonpath, owner_field="shortcut")
+    _replace_ports(returns, shortcut, models.ShortcutReturnPort, "provides", compile_returndescriptors_to_jsonpath, owner_field="shortcut")
 
-    _bulk_create_ports_level_by_level(definition.args, action, models.ArgPort, "requires", compile_descriptors_to_jsonpath)
-    _bulk_create_ports_level_by_level(definition.returns, action, models.ReturnPort, "provides", compile_returndescriptors_to_jsonpath)
 
-    action.arg_count = len(definition.args or [])
-    action.return_count = len(definition.returns or [])
-    action.save(update_fields=["arg_count", "return_count"])
+def rebuild_state_definition_ports(definition: models.StateDefinition) -> None:
+    """Replace the relational StatePort rows from the definition's ports (which provide, like returns)."""
+    ports = [ReturnPortInputModel.model_validate(port) for port in definition.ports or []]
+    _replace_ports(ports, definition, models.StatePort, "provides", compile_returndescriptors_to_jsonpath, owner_field="definition")
 
 
 def _resolve_test_targets(definition: DefinitionInputModel, agent: models.Agent) -> list[models.Action]:
@@ -292,6 +411,7 @@ def _create_implementation(
         #    longer heals manually edited port rows (only count/existence divergence triggers a
         #    rebuild).
         rebuild_relational_ports(action, definition)
+        usages.refresh_usages([action.pk])
 
         # Derived M2Ms are RECONCILED (.set), not accumulated (.add): protocols feed the
         # matching engine's protocol demands, so a stale row (e.g. an action that stopped
@@ -324,7 +444,9 @@ def _create_implementation(
         implementation = models.Implementation.objects.filter(interface=input.interface, agent=agent).first()
 
     if implementation is not None:
-        if implementation.action.pk != action.pk:
+        previous_action_id = implementation.action.pk
+        action_changed = previous_action_id != action.pk
+        if action_changed:
             if implementation.action.implementations.count() == 1:
                 logger.info("Deleting Action because it has no more implementations")
                 implementation.action.delete()
@@ -335,7 +457,13 @@ def _create_implementation(
         implementation.needs_token = input.needs_token
         implementation.provenance_audience = resolved_audience
         implementation.effect = getattr(input.effect, "value", input.effect)
+        implementation.max_concurrency = input.max_concurrency
         implementation.save()
+        if action_changed:
+            # Creation is projected by implementation_post_save; a moved implementation is re-projected here.
+            availability.project_implementation(implementation)
+            # The previous action (when it survived) lost this agent.
+            usages.refresh_live_agents([previous_action_id])
     else:
         implementation = models.Implementation.objects.create(
             interface=input.interface,
@@ -346,6 +474,7 @@ def _create_implementation(
             needs_token=input.needs_token,
             provenance_audience=resolved_audience,
             effect=getattr(input.effect, "value", input.effect),
+            max_concurrency=input.max_concurrency,
         )
         if implementation_map is not None:
             implementation_map[input.interface] = implementation
@@ -13,6 +13,15 @@ def assign(info: Info, input: inputs.AssignInput) -> types.Task:
     return controll_backend.assign(info, model)
 
 
+async def aassign(info: Info, input: inputs.AssignInput) -> types.Task:
+    """``assign`` on the async pipeline (``REKUEST_ASSIGN_PIPELINE = "async"``)."""
+    return await controll_backend.aassign(info, input.to_pydantic())
+
+
+def assign_many(info: Info, inputs: list[inputs.AssignInput]) -> list[types.Task]:
+    return controll_backend.assign_many(info, [input.to_pydantic() for input in inputs])
+
+
 def pause(info: Info, input: inputs.PauseInput) -> types.Task:
     return controll_backend.pause(input)
 
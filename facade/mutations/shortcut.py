@@ -1,6 +1,7 @@
 from kante.types import Info
 import strawberry
 from facade import types, models, inputs
+from facade.mutations.implementation import rebuild_shortcut_ports
 import logging
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,7 @@ def create_shortcut(info: Info, input: inputs.CreateShortcutInput) -> types.Shor
         use_returns=input.use_returns,
         bind_number=input.bind_number,
     )
+    rebuild_shortcut_ports(shortcut)
 
     logger.info(f"Shortcut created: {shortcut}")
 
@@ -0,0 +1,188 @@
+"""Dispatcher of the assign outbox (``REKUEST_DISPATCH = "outbox"``).
+
+Inline, an assign mints the provenance token and pushes the Assign before the mutation
+returns, so every assign pays the queue round-trip and a worker that dies between the commit
+and the push leaves a task its agent never hears of. In outbox mode the assign writes a
+``TaskOutbox`` row in the task's own transaction (:func:`enqueue`) and returns — as do bulk
+assigns, held tasks released by :mod:`facade.admission` and the lower tasks of higher-order
+assigns; this loop drains the rows in
+batches (:meth:`RedisControllBackend.dispatch_outbox`): rows leased in a short transaction
+(:func:`claim`), tokens minted per caller, one pipelined push per batch outside any
+transaction, the rows deleted once it went out. A dispatcher that dies mid-send leaves its
+rows leased; they are claimed and sent again after ``REKUEST_OUTBOX_LEASE`` seconds, so
+delivery is at-least-once. The other duplicate is a dispatcher that outlives its lease: the
+queue pushes take one round-trip, but webhook Assigns are a POST each (up to the hook
+timeout), so the dispatcher renews its lease (:func:`renew`) once half of it is spent and
+deletes each webhook agent's rows as soon as its run went out. A POST that stalls past a whole
+lease can still be sent twice; an agent tells the resend by its task id.
+
+A cancel or interrupt of a task whose Assign has not gone out yet never reaches the agent:
+:func:`withdraw` deletes the row and settles the task server-side, the way
+:func:`facade.admission.settle` does for held tasks. A row already leased may be on its way,
+so the op goes through the agent; should the drain still find the task cancelled or
+interrupted before sending, it settles it instead (:func:`settle_unsent`).
+
+The loop is a daemon thread, since the drain is ORM work. A commit wakes it
+(:func:`wake`); otherwise it polls every ``REKUEST_OUTBOX_INTERVAL`` seconds, which bounds
+the lag of rows left by a crashed process. Like the reaper it is started lazily — by the
+first wake, or from :meth:`AgentConsumer.connect` — and the ``reconcile_tasks`` command
+drains the same rows on a schedule. Claims use ``SKIP LOCKED``, so several processes can
+dispatch concurrently.
+"""
+
+import datetime
+import logging
+import threading
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from facade import enums, models
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+
+# The ops a task still in the outbox is settled for, and the state it is settled in.
+SETTLED_KINDS = {
+    enums.TaskInstructKind.CANCEL.value: enums.TaskEventKind.CANCELLED,
+    enums.TaskInstructKind.INTERRUPT.value: enums.TaskEventKind.INTERRUPTED,
+}
+SETTLED_MESSAGE = "Settled before dispatch: its Assign was still in the outbox."
+
+_wakeup = threading.Event()
+_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+
+
+def enabled() -> bool:
+    return settings.REKUEST_DISPATCH == "outbox"
+
+
+def enqueue(tasks: List[models.Task]) -> None:
+    """Leave the Assigns of ``tasks`` to the dispatcher: one row each, in the caller's transaction."""
+    models.TaskOutbox.objects.bulk_create([models.TaskOutbox(task=task) for task in tasks])
+    transaction.on_commit(wake)
+
+
+def ensure_started() -> None:
+    """Start the dispatcher once per process when the outbox is in use; a no-op otherwise."""
+    global _thread
+    if not enabled():
+        return
+    with _lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        _thread = threading.Thread(target=_dispatch_loop, name="rekuest-outbox", daemon=True)
+        _thread.start()
+
+
+def wake() -> None:
+    """Have the dispatcher drain now (called on commit of a task with an outbox row)."""
+    ensure_started()
+    _wakeup.set()
+
+
+def claim(claimed_by: str, limit: int = BATCH_SIZE) -> List[int]:
+    """Lease up to ``limit`` unclaimed (or expired) rows to ``claimed_by``; returns their ids, oldest first.
+
+    Commits before returning, so the lease, not a row lock, keeps other dispatchers off the
+    rows while their messages are sent.
+    """
+    now = timezone.now()
+    expired = now - datetime.timedelta(seconds=settings.REKUEST_OUTBOX_LEASE)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "UPDATE facade_taskoutbox SET claimed_at = %s, claimed_by = %s WHERE id IN ("
+            " SELECT id FROM facade_taskoutbox WHERE claimed_at IS NULL OR claimed_at < %s"
+            " ORDER BY id LIMIT %s FOR UPDATE SKIP LOCKED"
+            ") RETURNING id",
+            [now, claimed_by, expired, limit],
+        )
+        return sorted(row[0] for row in cursor.fetchall())
+
+
+def renew(claimed_by: str) -> List[int]:
+    """Restart the lease of ``claimed_by``'s rows from now; returns the ids it still holds.
+
+    A row missing from the result was withdrawn (or deleted) meanwhile — its Assign must not go out.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("UPDATE facade_taskoutbox SET claimed_at = %s WHERE claimed_by = %s RETURNING id", [timezone.now(), claimed_by])
+        return sorted(row[0] for row in cursor.fetchall())
+
+
+def _lease_expired_before() -> datetime.datetime:
+    return timezone.now() - datetime.timedelta(seconds=settings.REKUEST_OUTBOX_LEASE)
+
+
+def _settle(task: models.Task, kind: enums.TaskEventKind, instruct_kind: enums.TaskInstructKind) -> None:
+    task.is_done = True
+    task.finished_at = timezone.now()
+    task.latest_event_kind = kind
+    task.latest_instruct_kind = instruct_kind
+    task.save(update_fields=["is_done", "finished_at", "latest_event_kind", "latest_instruct_kind"])
+    models.TaskEvent.objects.create(task=task, kind=kind, message=SETTLED_MESSAGE)
+
+
+def is_unsent(task_id: int) -> bool:
+    """Whether ``task_id``'s Assign is still in the outbox and no live dispatcher is sending it."""
+    return models.TaskOutbox.objects.filter(Q(claimed_at__isnull=True) | Q(claimed_at__lt=_lease_expired_before()), task_id=task_id).exists()
+
+
+def withdraw(task_id: int, kind: enums.TaskEventKind, instruct_kind: enums.TaskInstructKind) -> bool:
+    """Finish a task whose Assign was never sent in ``kind``, without involving the agent. Returns whether it was unsent.
+
+    An unclaimed row, or one whose lease expired (it would be sent again), is deleted; False
+    means a dispatcher holds it, and the caller then goes through the agent.
+    """
+    if not models.TaskOutbox.objects.filter(task_id=task_id).exists():
+        return False
+    with transaction.atomic():
+        task = models.Task.objects.select_for_update().get(pk=task_id)
+        if task.is_done:
+            return False
+        withdrawn, _ = models.TaskOutbox.objects.filter(Q(claimed_at__isnull=True) | Q(claimed_at__lt=_lease_expired_before()), task_id=task_id).delete()
+        if not withdrawn:
+            return False
+        _settle(task, kind, instruct_kind)
+    return True
+
+
+def settle_unsent(task_id: int) -> bool:
+    """Settle a leased task the drain found cancelled or interrupted instead of sending its Assign."""
+    with transaction.atomic():
+        task = models.Task.objects.select_for_update().get(pk=task_id)
+        instruct = getattr(task.latest_instruct_kind, "value", task.latest_instruct_kind)
+        if task.is_done or instruct not in SETTLED_KINDS:
+            return False
+        _settle(task, SETTLED_KINDS[instruct], enums.TaskInstructKind(instruct))
+    return True
+
+
+def drain() -> int:
+    """Dispatch outbox rows until none are left; returns how many were drained."""
+    from facade.backend import controll_backend  # lazy: the backend imports this module
+
+    drained = 0
+    while True:
+        batch = controll_backend.dispatch_outbox(BATCH_SIZE)
+        drained += batch
+        if batch < BATCH_SIZE:
+            return drained
+
+
+def _dispatch_loop() -> None:
+    """Drain on every wake-up or poll; never let one bad iteration kill the loop."""
+    while True:
+        _wakeup.wait(settings.REKUEST_OUTBOX_INTERVAL)
+        _wakeup.clear()
+        try:
+            drain()
+        except Exception:
+            logger.error("Outbox dispatch failed; retrying on the next wake-up.", exc_info=True)
+        finally:
+            close_old_connections()
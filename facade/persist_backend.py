@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
@@ -19,6 +19,10 @@ _TERMINAL_KINDS = (
     enums.TaskEventKind.CRITICAL,
 )
 
+# Why a parentless agent assign is refused (raised by ``on_caller_assign``, returned per
+# request by ``on_caller_assign_many``).
+_ROOT_ASSIGN_REFUSED = "An agent may only assign dependent work: 'parent' is required. Root tasks originate from the GraphQL assign mutation, where the initiator is an accountable human."
+
 
 class ModelPersistBackend:
     """The DB-truth backend (satisfies :class:`facade.ports.PersistBackend`).
@@ -121,7 +125,8 @@ class ModelPersistBackend:
         agent = await models.Agent.objects.aget(id=agent_id)
         if liveness.agent_is_live(agent.connected, agent.last_seen):
             return
-        in_flight = [a async for a in models.Task.objects.select_related("implementation", "action").filter(agent_id=agent_id, is_done=False)]
+        # Held tasks (``pending``) never reached the agent: they stay held for its next session.
+        in_flight = [a async for a in models.Task.objects.select_related("agent", "implementation", "action").filter(agent_id=agent_id, is_done=False, pending=False)]
         await self._fail_and_cascade_inflight(in_flight)
 
     def _revoke_lease_sync(self, agent_id: int) -> bool:
@@ -290,7 +295,7 @@ class ModelPersistBackend:
                         kind=enums.TaskEventKind.QUEUED,
                         message="Executor lost — idempotent action re-queued for redelivery.",
                     )
-                    await sync_to_async(AgentConsumer.broadcast)(task.agent_id, assign_message)
+                    await sync_to_async(AgentConsumer.broadcast)(task.agent, assign_message)
                     continue
                 # No re-dispatchable identity → fall through to fate-unknown.
 
@@ -347,7 +352,7 @@ class ModelPersistBackend:
         # We are deciding reclaim-vs-cascade now, so cancel any pending grace timer.
         self._executor_grace.cancel(agent_id)
 
-        in_flight = [a async for a in models.Task.objects.select_related("implementation", "action").filter(agent_id=agent_id, is_done=False)]
+        in_flight = [a async for a in models.Task.objects.select_related("agent", "implementation", "action").filter(agent_id=agent_id, is_done=False, pending=False)]
 
         # A different session means a FRESH process took over (the old one died): the prior
         # in-flight work is orphaned and must fail-and-cascade rather than be reclaimed.
@@ -377,9 +382,9 @@ class ModelPersistBackend:
     async def get_or_create_caller_id(self, agent_id: int) -> str:
         """The durable ``Caller`` id for an agent's identity (user/client/organization).
 
-        A connection joins ``task_caller_{caller_id}`` to receive the events of work it
-        originated. Mirrors ``get_caller_for_context`` (``facade/backend.py``) but resolves
-        the identity from the agent instead of a GraphQL request.
+        The events of work the agent originated are stamped with this caller and delivered back
+        to the agent's own transport. Mirrors ``get_caller_for_context`` (``facade/backend.py``)
+        but resolves the identity from the agent instead of a GraphQL request.
         """
         agent = await models.Agent.objects.select_related("user", "client", "organization").aget(id=agent_id)
         caller, _ = await models.Caller.objects.aget_or_create(
@@ -429,11 +434,81 @@ class ModelPersistBackend:
             return existing, False
 
         if message.parent is None:
-            raise PermissionError("An agent may only assign dependent work: 'parent' is required. Root tasks originate from the GraphQL assign mutation, where the initiator is an accountable human.")
+            raise PermissionError(_ROOT_ASSIGN_REFUSED)
 
         ctx = CallerContext.from_agent(agent, roles=principal.roles_for_caller(caller))
+        assign_input = self._assign_input(message)
+        # A dependent task's fate follows its parent, so nothing about this connection needs
+        # recording on the row: if this agent dies, the executor-death cascade covers its work,
+        # and if the parent's tree is cancelled the child goes with it.
+        return controll_backend.assign(ctx, assign_input), True
+
+    async def on_caller_assign_many(
+        self,
+        agent_id: int,
+        message: messages.AssignRequestBatch,
+        connection_id: str | None = None,
+        session_id: str | None = None,
+    ) -> List[Tuple[models.Task | None, bool, str | None]]:
+        """Assign a batch of *dependent* work requested by an agent over the socket.
+
+        Returns ``(task, created, error)`` per request, in order. Each request keeps
+        ``on_caller_assign``'s rules — idempotent on ``(caller, reference)``, ``parent``
+        required — but the new tasks are created together through the postman backend's
+        ``assign_many``.
+        """
+        return await database_sync_to_async(self._caller_assign_many_sync)(agent_id, message)
+
+    def _caller_assign_many_sync(self, agent_id: int, message: messages.AssignRequestBatch) -> List[Tuple[models.Task | None, bool, str | None]]:
+        from facade.backend import controll_backend
+        from facade.caller_context import CallerContext
+        from facade.provenance import principal
+
+        agent = models.Agent.objects.select_related("user", "client", "organization").get(id=agent_id)
+        caller, _ = models.Caller.objects.get_or_create(client=agent.client, user=agent.user, organization=agent.organization)
+
+        # Idempotency for the whole batch in one query; a reference repeated inside the batch
+        # resolves to the task its first occurrence creates.
+        existing = {task.reference: task for task in models.Task.objects.filter(caller=caller, reference__in=[request.reference for request in message.requests])}
+
+        results: List[Tuple[models.Task | None, bool, str | None]] = [(None, False, None)] * len(message.requests)
+        first_of: Dict[str, int] = {}
+        to_create: List[int] = []
+        repeats: List[Tuple[int, int]] = []
+        for index, request in enumerate(message.requests):
+            if request.reference in existing:
+                results[index] = (existing[request.reference], False, None)
+            elif request.reference in first_of:
+                repeats.append((index, first_of[request.reference]))
+            elif request.parent is None:
+                results[index] = (None, False, _ROOT_ASSIGN_REFUSED)
+            else:
+                first_of[request.reference] = index
+                to_create.append(index)
+
+        if to_create:
+            ctx = CallerContext.from_agent(agent, roles=principal.roles_for_caller(caller))
+            try:
+                created = controll_backend.assign_many(ctx, [self._assign_input(message.requests[index]) for index in to_create])
+            except Exception as e:
+                logging.error("AssignRequestBatch failed", exc_info=True)
+                for index in to_create:
+                    results[index] = (None, False, str(e))
+            else:
+                for index, task in zip(to_create, created):
+                    results[index] = (task, True, None)
+
+        for index, first in repeats:
+            task, _, error = results[first]
+            results[index] = (task, False, error)
+
+        return results
+
+    @staticmethod
+    def _assign_input(message: messages.AssignRequest) -> inputs.AssignInputModel:
+        """The postman ``AssignInputModel`` an ``AssignRequest`` describes."""
         hooks = [inputs.HookInputModel(**h) for h in message.hooks] if message.hooks else None
-        assign_input = inputs.AssignInputModel(
+        return inputs.AssignInputModel(
             reference=message.reference,
             args=message.args,
             action=message.action,
@@ -450,10 +525,6 @@ class ModelPersistBackend:
             ephemeral=message.ephemeral,
             step=message.step,
         )
-        # A dependent task's fate follows its parent, so nothing about this connection needs
-        # recording on the row: if this agent dies, the executor-death cascade covers its work,
-        # and if the parent's tree is cancelled the child goes with it.
-        return controll_backend.assign(ctx, assign_input), True
 
     def _caller_control_sync(self, agent_id: int, task_id: str, op: str, *, step: bool = False) -> models.Task:
         """Ownership-check then dispatch a control op on the sync postman backend.
@@ -482,7 +553,8 @@ class ModelPersistBackend:
 
     async def on_caller_cancel(self, agent_id: int, message: messages.CancelRequest, *, connection_id: str | None = None, session_id: str | None = None) -> models.Task:
         task = await database_sync_to_async(self._caller_control_sync)(agent_id, message.task, "cancel")
-        if message.auto_interrupt is not None:
+        # A task settled before dispatch (it was still held) has nothing left to escalate.
+        if message.auto_interrupt is not None and not task.is_done:
             self._auto_interrupt.schedule(message.task, float(message.auto_interrupt), lambda: self._escalate_to_interrupt(message.task))
         return task
 
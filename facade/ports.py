@@ -59,6 +59,13 @@ class PersistBackend(Protocol):
         connection_id: str | None = ...,
         session_id: str | None = ...,
     ) -> Tuple["models.Task", bool]: ...
+    async def on_caller_assign_many(
+        self,
+        agent_id: int,
+        message: messages.AssignRequestBatch,
+        connection_id: str | None = ...,
+        session_id: str | None = ...,
+    ) -> List[Tuple["models.Task | None", bool, str | None]]: ...
 
     # --- caller lifecycle controls (request phase) ---------------------------- #
     async def on_caller_cancel(self, agent_id: int, message: messages.CancelRequest, *, connection_id: str | None = ..., session_id: str | None = ...) -> "models.Task": ...
@@ -25,7 +25,7 @@ from __future__ import annotations
 import datetime
 import logging
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from django.conf import settings
 from joserfc import jwt
@@ -62,9 +62,13 @@ def _current_roles(ctx: Any) -> List[str]:
         return []
 
 
-def _sign(claims: Dict[str, Any]) -> str:
-    header = {"alg": keys.ALGORITHM, "kid": settings.PROVENANCE["KID"], "typ": "JWT"}
-    return jwt.encode(header, claims, keys.get_signing_key(), algorithms=keys.ALGORITHMS)
+def _root_principal(task: Any) -> Tuple[Any, Optional[str], bool]:
+    """The root of a child ``task``'s tree, the human who caused it (``rcb``), and whether it is one."""
+    root = _resolve_root(task)
+    root_caller = root.caller
+    if root_caller is None or root_caller.user_id is None:
+        return root, None, False
+    return root, str(root_caller.user.sub), principal.is_human_caller(root_caller)
 
 
 def mint_token_for_task(task: Any, ctx: Any) -> Optional[str]:
@@ -75,59 +79,77 @@ def mint_token_for_task(task: Any, ctx: Any) -> Optional[str]:
     (``needs_token=False``) or when the root principal cannot be confirmed human under a
     lenient policy. Raises ``ValueError`` for a non-human root under a strict policy.
     """
-    from facade.caller_context import CallerContext
+    return mint_tokens_for_tasks([task], ctx)[0]
 
-    ctx = CallerContext.coerce(ctx)
 
-    implementation = task.implementation
-    if implementation is None or not implementation.needs_token:
-        return None
+def mint_tokens_for_tasks(tasks: Sequence[Any], ctx: Any) -> List[Optional[str]]:
+    """Mint the provenance tokens of a batch of ``tasks`` assigned under one ``ctx``.
 
-    agent = task.agent
+    Per task the contract is exactly :func:`mint_token_for_task`'s (each token keeps its own
+    ``jti``, ``tsk`` and args hash); what a fan-out shares is resolved once — the requester's
+    human check, each distinct parent's root walk, each executing agent's ``act`` claim, and
+    the signing key.
+    """
+    from facade.caller_context import CallerContext
 
-    is_top = task.parent_id is None
-    root = task if is_top else _resolve_root(task)
+    ctx = CallerContext.coerce(ctx)
 
-    # Immediate causer of this hop, and the human at the root of the tree.
+    # Immediate causer of every hop in the batch; a top-level task's root human is this caller.
     sub = str(ctx.user.sub)
-    if is_top:
-        root_caused_by = sub
-        root_human = principal.is_human_by_roles(_current_roles(ctx))
-    else:
-        root_caller = root.caller
-        if root_caller is None or root_caller.user_id is None:
-            root_caused_by = None
-            root_human = False
-        else:
-            root_caused_by = str(root_caller.user.sub)
-            root_human = principal.is_human_caller(root_caller)
-
-    if not root_human:
-        message = f"Refusing to mint provenance token for task {task.pk}: root principal (root_caused_by={root_caused_by}) is not an accountable human."
-        if settings.PROVENANCE["STRICT"]:
-            raise ValueError(message)
-        logger.warning(message)
-        return None
+    requester_human = principal.is_human_by_roles(_current_roles(ctx))
 
     now = datetime.datetime.now(datetime.timezone.utc)
     exp = now + datetime.timedelta(seconds=settings.PROVENANCE["TOKEN_TTL_SECONDS"])
+    header = {"alg": keys.ALGORITHM, "kid": settings.PROVENANCE["KID"], "typ": "JWT"}
+    signing_key = keys.get_signing_key()
 
-    claims: Dict[str, Any] = {
-        # RFC-registered claims keep their canonical names for interop.
-        "iss": keys.issuer(),
-        "aud": _resolve_audience(implementation),
-        "sub": sub,
-        "act": {"sub": str(agent.user.sub), "cid": str(agent.client.client_id)},
-        "iat": int(now.timestamp()),
-        "exp": int(exp.timestamp()),
-        "jti": str(uuid.uuid4()),
-        # Rekuest provenance claims (compact symbols; see docs/design/provenance.md).
-        "tsk": str(task.pk),
-        "ptk": str(task.parent_id) if task.parent_id else None,
-        "rtk": str(root.pk),
-        "rcb": root_caused_by,
-        "ahs": canonical.args_hash(task.args or {}),
-        "aha": f"sha256-canonical-v{canonical.CANONICALIZATION_VERSION}",
-    }
-
-    return _sign(claims)
+    roots: Dict[Any, Tuple[Any, Optional[str], bool]] = {}
+    actors: Dict[int, Dict[str, str]] = {}
+    tokens: List[Optional[str]] = []
+
+    for task in tasks:
+        implementation = task.implementation
+        if implementation is None or not implementation.needs_token:
+            tokens.append(None)
+            continue
+
+        if task.parent_id is None:
+            root, root_caused_by, root_human = task, sub, requester_human
+        else:
+            if task.parent_id not in roots:
+                roots[task.parent_id] = _root_principal(task)
+            root, root_caused_by, root_human = roots[task.parent_id]
+
+        if not root_human:
+            message = f"Refusing to mint provenance token for task {task.pk}: root principal (root_caused_by={root_caused_by}) is not an accountable human."
+            if settings.PROVENANCE["STRICT"]:
+                raise ValueError(message)
+            logger.warning(message)
+            tokens.append(None)
+            continue
+
+        agent = task.agent
+        actor = actors.get(id(agent))
+        if actor is None:
+            actor = actors[id(agent)] = {"sub": str(agent.user.sub), "cid": str(agent.client.client_id)}
+
+        claims: Dict[str, Any] = {
+            # RFC-registered claims keep their canonical names for interop.
+            "iss": keys.issuer(),
+            "aud": _resolve_audience(implementation),
+            "sub": sub,
+            "act": dict(actor),
+            "iat": int(now.timestamp()),
+            "exp": int(exp.timestamp()),
+            "jti": str(uuid.uuid4()),
+            # Rekuest provenance claims (compact symbols; see docs/design/provenance.md).
+            "tsk": str(task.pk),
+            "ptk": str(task.parent_id) if task.parent_id else None,
+            "rtk": str(root.pk),
+            "rcb": root_caused_by,
+            "ahs": canonical.args_hash(task.args or {}),
+            "aha": f"sha256-canonical-v{canonical.CANONICALIZATION_VERSION}",
+        }
+        tokens.append(jwt.encode(header, claims, signing_key, algorithms=keys.ALGORITHMS))
+
+    return tokens
@@ -1,6 +1,6 @@
 from .task import reusable_task_for, my_tasks
 from .event import event
-from .action import action
+from .action import action, search_actions
 from .implementation import implementation_at, my_implementation_at, resolved_implementations
 from .state import (
     state_for,
@@ -20,6 +20,7 @@ __all__ = [
     "reusable_task_for",
     "my_tasks",
     "action",
+    "search_actions",
     "event",
     "implementation_at",
     "my_implementation_at",
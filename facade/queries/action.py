@@ -4,7 +4,7 @@ import strawberry
 from kante.types import Info
 from rekuest_core import scalars as rscalars
 from rekuest_core.inputs import types as rinputs
-from facade import models, types, managers
+from facade import models, types, managers, search
 
 logger = logging.getLogger(__name__)
 
@@ -42,3 +42,13 @@ def action(
             raise ValueError("You need to provide either, action_hash or action_id, if you want to inspect the action of an agent")
 
     return models.Action.objects.get(id=id)
+
+
+def search_actions(
+    info: Info,
+    query: str,
+    limit: int = 20,
+    offset: int = 0,
+) -> list[types.Action]:
+    """The organization's actions matching ``query`` (prefix terms over name, key, description and collections), best first."""
+    return list(search.search_actions(query, info.context.request.organization.id, limit=limit, offset=offset))
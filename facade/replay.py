@@ -0,0 +1,126 @@
+"""Server-side reuse of prior results for assigns that opt in (``AssignInput.reuse``).
+
+``queries.reusable_task_for`` leaves reuse to the orchestrator, which then pays a lookup
+before every assign. An assign may instead carry a reuse policy: when its action is pure and
+a completed, non-ephemeral run with the same canonical args matches the policy (finished
+within ``max_age``; of the same implementation version with ``same_version``), the backend
+returns a new, already completed task mirroring that run's result (``Task.replay_of``) and
+dispatches nothing. Without a policy an assign is never short-circuited.
+
+Matches come from ``task_replay_idx``. A pure run's result never changes, so the latest match
+per ``(organization, action hash, args hash)`` is also kept in a small in-process LRU:
+a hot repeated call skips the index scan and checks the policy against the cached entry.
+"""
+
+from __future__ import annotations
+
+import datetime
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from django.utils import timezone
+
+from facade import enums, inputs, models
+
+MAX_ENTRIES = 4096
+
+ReplayKey = Tuple[object, str, str]
+
+
+@dataclass(frozen=True)
+class Replayable:
+    """What the policy checks of a prior run, without loading it."""
+
+    task_id: int
+    finished_at: datetime.datetime
+    release_id: Optional[int]
+    interface: Optional[str]
+
+    def satisfies(self, policy: inputs.ReuseInputModel, implementation: models.Implementation) -> bool:
+        if policy.max_age is not None and timezone.now() - self.finished_at > datetime.timedelta(seconds=policy.max_age):
+            return False
+        if policy.same_version and (self.release_id != implementation.release_id or self.interface != implementation.interface):
+            return False
+        return True
+
+
+class ReplayCache:
+    """An LRU of the latest reusable run per ``(organization, action hash, args hash)``."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[ReplayKey, Replayable] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: ReplayKey) -> Optional[Replayable]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: ReplayKey, entry: Replayable) -> None:
+        with self._lock:
+            current = self._entries.get(key)
+            # Keep the newest run: a policy-filtered lookup may have found an older one.
+            if current is None or current.finished_at <= entry.finished_at:
+                self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: ReplayKey) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+replay_cache = ReplayCache()
+
+
+def find_reusable(action: models.Action, implementation: models.Implementation, args_hash: str, policy: inputs.ReuseInputModel) -> Optional[models.Task]:
+    """The prior completed run ``policy`` lets an assign of ``action`` reuse, or None.
+
+    Non-pure actions never match. The returned task is loaded with its implementation.
+    """
+    if not action.pure:
+        return None
+
+    key = (action.organization_id, action.hash, args_hash)
+    cached = replay_cache.get(key)
+    if cached is not None and cached.satisfies(policy, implementation):
+        prior = models.Task.objects.select_related("implementation").filter(pk=cached.task_id).first()
+        if prior is not None:
+            return prior
+        replay_cache.discard(key)  # the run was deleted
+
+    runs = models.Task.objects.filter(
+        action=action,
+        args_hash=args_hash,
+        is_done=True,
+        latest_event_kind=enums.TaskEventKind.COMPLETED,
+        ephemeral=False,
+        # A replay's finished_at is not the age of its result: only original runs are offered.
+        replay_of__isnull=True,
+    )
+    if policy.max_age is not None:
+        runs = runs.filter(finished_at__gte=timezone.now() - datetime.timedelta(seconds=policy.max_age))
+    if policy.same_version:
+        runs = runs.filter(implementation__release_id=implementation.release_id, implementation__interface=implementation.interface)
+    prior = runs.select_related("implementation").order_by("-finished_at").first()
+    if prior is not None and prior.finished_at is not None:
+        replay_cache.put(
+            key,
+            Replayable(
+                task_id=prior.pk,
+                finished_at=prior.finished_at,
+                release_id=prior.implementation.release_id if prior.implementation else None,
+                interface=prior.implementation.interface if prior.implementation else None,
+            ),
+        )
+    return prior
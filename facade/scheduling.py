@@ -0,0 +1,158 @@
+"""Which implementation an action-targeted assign lands on.
+
+An assign by ``action`` / ``action_hash`` names *what* to run, not *where*: every available
+implementation of the action is a candidate. Picking the planner's first row sent every task
+of a popular action to the same agent while equally capable ones sat idle, so the pick is a
+pluggable :class:`Scheduler`, chosen by ``settings.REKUEST_SCHEDULER``:
+
+- ``least_in_flight`` (default) — the agent with the fewest unfinished tasks.
+- ``weighted`` — the fewest unfinished tasks *per unit of declared capacity* (``Agent.capacity``).
+- ``round_robin`` — rotate through the candidates, per action.
+- ``first`` — the lowest implementation id (the old behaviour).
+
+A dotted path to a :class:`Scheduler` subclass is accepted as well.
+
+The load the first two read is :data:`in_flight`, a process-local view of each agent's open
+task ids: seeded from the ``task_agent_open_idx`` partial index the first time an agent is a
+candidate, then moved by the Task ``post_save`` fan-out (assign adds, a terminal transition
+removes). Bulk ``update()`` calls and other workers' assigns bypass it, so an agent's view is
+re-read from the table once it is :data:`RESYNC_SECONDS` old — it is a routing hint, never a
+source of truth.
+"""
+
+from __future__ import annotations
+
+import abc
+import itertools
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Protocol, Sequence, Set
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from facade import models
+
+# How long an agent's in-flight view is trusted before it is re-read from the task table.
+RESYNC_SECONDS = 30.0
+
+
+class Load(Protocol):
+    def counts(self, agent_ids: Iterable[int]) -> Dict[int, int]: ...
+
+
+class InFlight:
+    """Process-local open task ids per agent (see the module docstring)."""
+
+    def __init__(self) -> None:
+        self._open: Dict[int, Set[int]] = {}
+        self._synced_at: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def counts(self, agent_ids: Iterable[int]) -> Dict[int, int]:
+        """The number of unfinished tasks of each agent, reading stale or unseen agents from the DB."""
+        agent_ids = list(agent_ids)
+        now = time.monotonic()
+        with self._lock:
+            stale = [agent_id for agent_id in agent_ids if now - self._synced_at.get(agent_id, float("-inf")) > RESYNC_SECONDS]
+
+        if stale:
+            fresh: Dict[int, Set[int]] = {agent_id: set() for agent_id in stale}
+            for agent_id, task_id in models.Task.objects.filter(agent_id__in=stale, is_done=False).values_list("agent_id", "id"):
+                fresh[agent_id].add(task_id)
+            with self._lock:
+                self._open.update(fresh)
+                self._synced_at.update(dict.fromkeys(stale, now))
+
+        with self._lock:
+            return {agent_id: len(self._open.get(agent_id, ())) for agent_id in agent_ids}
+
+    def record(self, agent_id: Optional[int], task_id: int, is_done: bool) -> None:
+        """Apply one saved task to its agent's view (a no-op for an agent not yet seeded)."""
+        if agent_id is None:
+            return
+        with self._lock:
+            open_tasks = self._open.get(agent_id)
+            if open_tasks is None:
+                return
+            if is_done:
+                open_tasks.discard(task_id)
+            else:
+                open_tasks.add(task_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._open.clear()
+            self._synced_at.clear()
+
+
+in_flight = InFlight()
+
+
+class Scheduler(abc.ABC):
+    """Chooses one of an action's available implementations for a task."""
+
+    @abc.abstractmethod
+    def choose(self, candidates: Sequence[models.Implementation], planned: Mapping[int, int]) -> models.Implementation:
+        """Pick from ``candidates`` (non-empty, ordered by id, ``agent`` loaded).
+
+        ``planned`` counts the tasks already routed to each agent id by the current request
+        but not yet written (a bulk assign), so a batch spreads like consecutive assigns would.
+        """
+
+
+class FirstAvailable(Scheduler):
+    def choose(self, candidates: Sequence[models.Implementation], planned: Mapping[int, int]) -> models.Implementation:
+        return candidates[0]
+
+
+class RoundRobin(Scheduler):
+    def __init__(self) -> None:
+        self._cursors: Dict[int, Iterator[int]] = {}
+        self._lock = threading.Lock()
+
+    def choose(self, candidates: Sequence[models.Implementation], planned: Mapping[int, int]) -> models.Implementation:
+        with self._lock:
+            cursor = self._cursors.setdefault(candidates[0].action_id, itertools.count())
+            return candidates[next(cursor) % len(candidates)]
+
+
+class LeastInFlight(Scheduler):
+    def __init__(self, load: Optional[Load] = None) -> None:
+        self.load = load or in_flight
+
+    def _loads(self, candidates: Sequence[models.Implementation], planned: Mapping[int, int]) -> Dict[int, int]:
+        counts = self.load.counts({candidate.agent_id for candidate in candidates})
+        return {agent_id: count + planned.get(agent_id, 0) for agent_id, count in counts.items()}
+
+    def choose(self, candidates: Sequence[models.Implementation], planned: Mapping[int, int]) -> models.Implementation:
+        loads = self._loads(candidates, planned)
+        return min(candidates, key=lambda candidate: (loads[candidate.agent_id], candidate.pk))
+
+
+class WeightedCapacity(LeastInFlight):
+    def choose(self, candidates: Sequence[models.Implementation], planned: Mapping[int, int]) -> models.Implementation:
+        loads = self._loads(candidates, planned)
+        # The agent whose queue drains soonest if work runs ``capacity`` at a time.
+        return min(candidates, key=lambda candidate: ((loads[candidate.agent_id] + 1) / max(candidate.agent.capacity, 1), candidate.pk))
+
+
+SCHEDULERS = {
+    "first": FirstAvailable,
+    "round_robin": RoundRobin,
+    "least_in_flight": LeastInFlight,
+    "weighted": WeightedCapacity,
+}
+
+
+@lru_cache(maxsize=None)
+def _scheduler(name: str) -> Scheduler:
+    # One instance per name and process: round-robin cursors must outlive a single assign.
+    scheduler_class = SCHEDULERS.get(name) or import_string(name)
+    return scheduler_class()
+
+
+def get_scheduler() -> Scheduler:
+    """The scheduler configured by ``settings.REKUEST_SCHEDULER``."""
+    return _scheduler(settings.REKUEST_SCHEDULER)
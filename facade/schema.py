@@ -1,5 +1,6 @@
 import strawberry
 import strawberry_django
+from django.conf import settings
 from facade import models, mutations, queries, subscriptions, types
 from kante.types import Info
 from rekuest_core.constants import interface_types
@@ -47,6 +48,7 @@ class Query:
     shortcuts: list[types.Shortcut] = field(description="List of shortcuts.")
     toolboxes: list[types.Toolbox] = field(description="List of toolboxes containing shortcuts.")
     action = field(resolver=queries.action, description="Fetch a specific action.")
+    search_actions = field(resolver=queries.search_actions, description="Search the organization's actions by name, key, description and collection, ranked best first.")
     my_tasks = field(resolver=queries.my_tasks, description="Fetch the root tasks this client created (caller-scoped).")
     reusable_task_for = field(resolver=queries.reusable_task_for, description="The latest completed run of a PURE action with these exact args, or null — the replay primitive. Reuse decisions belong to the orchestrator.")
     event = field(resolver=queries.event, description="Fetch a specific event.")
@@ -169,7 +171,8 @@ class Mutation:
     ack = mutation(resolver=mutations.ack, description="Acknowledge a task.")
     bounce = mutation(resolver=mutations.bounce, description="Bounce an agent so it reconnects.")
     kick = mutation(resolver=mutations.kick, description="Kick an agent to force disconnect. It will fail and not reconnect.")
-    assign = mutation(resolver=mutations.assign, description="Assign a task to an agent.")
+    assign = mutation(resolver=mutations.aassign if settings.REKUEST_ASSIGN_PIPELINE == "async" else mutations.assign, description="Assign a task to an agent.")
+    assign_many = mutation(resolver=mutations.assign_many, description="Assign a batch of tasks in one request (e.g. a parameter sweep), returned in input order.")
     cancel = mutation(resolver=mutations.cancel, description="Cancel an active task.")
     pause = mutation(resolver=mutations.pause, description="Pause an ongoing task.")
     resume = mutation(resolver=mutations.resume, description="Resume a paused task.")
@@ -258,6 +261,7 @@ class Subscription:
     watch_agent = subscription(resolver=subscriptions.watch_agent, description="Watch an agent: yields snapshots for all states then streams patches.")
     child_tasks = subscription(resolver=subscriptions.child_tasks, description="Subscribe to all descendant task changes of a task.")
     agent_tasks = subscription(resolver=subscriptions.agent_tasks, description="Subscribe to task create/update for a specific agent.")
+    task_board = subscription(resolver=subscriptions.watch_task_board, description="Subscribe to the organization's task counters by state, action and agent.")
 
 
 schema = kante.Schema(
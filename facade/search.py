@@ -0,0 +1,84 @@
+"""Ranked action search (the ``searchActions`` query and the command palette).
+
+Each Action carries a ``search_vector``: a weighted ``simple`` tsvector over its name and
+key (A), description (B) and collection names (C), GIN-indexed. It includes the collection
+names, so it cannot be a generated column: database triggers (migration 0029) compute it
+whenever an action's name, key or description is written, its collections change or one of
+them is renamed — whichever code path, ORM save or bulk ``update()``, did the write.
+:func:`refresh_search_vectors` rewrites it in one statement, for repairs.
+
+A search matches an action when every typed term prefixes a word of its document (the
+last, half-typed term included) or its name contains the text, answered by the trigram
+index on ``UPPER(name)`` that also serves the plain ``name__icontains`` filters. Results are
+ranked by text rank, a name-prefix boost and trigram similarity of the name.
+"""
+
+import re
+import typing as t
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db import connection
+from django.db.models import Case, F, FloatField, Q, QuerySet, Value, When
+from django.db.models.functions import Coalesce
+
+from facade import models
+
+SEARCH_CONFIG = "simple"
+
+# The action's weighted document; ``a`` is the facade_action row.
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(a.name, '') || ' ' || coalesce(a.key, '')), 'A')"
+    " || setweight(to_tsvector('simple', coalesce(a.description, '')), 'B')"
+    " || setweight(to_tsvector('simple', coalesce((SELECT string_agg(c.name, ' ') FROM facade_collection c"
+    " JOIN facade_action_collections ac ON ac.collection_id = c.id WHERE ac.action_id = a.id), '')), 'C')"
+)
+
+# Ranking boost of an action whose name starts with the typed text (autocomplete).
+PREFIX_BOOST = 1.0
+MAX_LIMIT = 100
+
+_TERM_RE = re.compile(r"[^\W_]+")
+
+
+def refresh_search_vectors(action_ids: t.Iterable[int] | None = None) -> int:
+    """Rewrite the search vectors of ``action_ids`` (every action when None); returns the rows."""
+    sql = f"UPDATE facade_action a SET search_vector = {SEARCH_VECTOR_SQL}"
+    params: list[t.Any] = []
+    if action_ids is not None:
+        sql += " WHERE a.id = ANY(%s)"
+        params.append(list(action_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+def prefix_query(text: str) -> str | None:
+    """The ``to_tsquery`` text requiring a word prefixed by every term, or None without terms.
+
+    Terms are runs of letters and digits, so the raw query cannot carry tsquery operators.
+    """
+    terms = _TERM_RE.findall(text.lower())
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def search_actions(text: str, organization_id: t.Any, limit: int = 20, offset: int = 0) -> QuerySet:
+    """The organization's actions matching ``text``, best first."""
+    text = text.strip()
+    queryset = models.Action.objects.filter(organization_id=organization_id)
+    if not text:
+        return queryset.none()
+
+    matches = Q(name__icontains=text)
+    rank = TrigramSimilarity("name", text) + Case(When(name__istartswith=text, then=Value(PREFIX_BOOST)), default=Value(0.0), output_field=FloatField())
+    tsquery = prefix_query(text)
+    if tsquery is not None:
+        query = SearchQuery(tsquery, search_type="raw", config=SEARCH_CONFIG)
+        matches |= Q(search_vector=query)
+        # A NULL vector (a row the triggers never saw) ranks as no text match.
+        rank = rank + Coalesce(SearchRank(F("search_vector"), query), Value(0.0), output_field=FloatField())
+
+    limit = max(0, min(limit, MAX_LIMIT))
+    offset = max(0, offset)
+    return queryset.filter(matches).annotate(search_rank=rank).order_by("-search_rank", "name", "id")[offset : offset + limit]
@@ -1,7 +1,7 @@
 from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from facade import models, channels, channel_events, transport
+from facade import admission, availability, dependency_cache, enums, models, channels, channel_events, scheduling, task_board, transport, usages
 from authentikate.models import Organization
 
 import logging
@@ -48,8 +48,18 @@ def action_singal(sender, instance=None, created=None, **kwargs):
             _broadcast_on_commit(channels.action_channel, channel_events.ActionEvent(update=instance.id), [f"actions_{instance.organization.id}"])
 
 
+# The Agent fields the availability index projects.
+_AVAILABILITY_FIELDS = frozenset({"kind", "connected"})
+
+
 @receiver(post_save, sender=models.Agent)
-def agent_post_save(sender, instance: models.Agent = None, created=None, **kwargs):
+def agent_post_save(sender, instance: models.Agent = None, created=None, update_fields=None, **kwargs):
+    # Liveness transitions (connect / disconnect / revoke) are saves: resolved dependencies and
+    # cached caller agents may now name an agent that is gone, or miss one that arrived.
+    transaction.on_commit(dependency_cache.dependency_cache.invalidate)
+    transaction.on_commit(transport.forget_caller_agents)
+    if instance and not created and (update_fields is None or _AVAILABILITY_FIELDS & set(update_fields)):
+        availability.set_agent_available(instance)
     if instance:
         _broadcast_on_commit(
             channels.agent_updated_channel,
@@ -60,6 +70,8 @@ def agent_post_save(sender, instance: models.Agent = None, created=None, **kwarg
 
 @receiver(post_delete, sender=models.Agent)
 def agent_post_delete(sender, instance: models.Agent = None, **kwargs):
+    transaction.on_commit(dependency_cache.dependency_cache.invalidate)
+    transaction.on_commit(transport.forget_caller_agents)
     if instance:
         _broadcast_on_commit(
             channels.agent_updated_channel,
@@ -70,18 +82,48 @@ def agent_post_delete(sender, instance: models.Agent = None, **kwargs):
 
 @receiver(post_save, sender=models.Task)
 def task_post_save(sender, instance: models.Task = None, created=None, **kwargs):
+    announce_task_saved(instance, created=bool(created))
+
+
+def announce_task_saved(instance: models.Task, created: bool) -> None:
+    """The ``post_save`` fan-out of one Task row, callable for rows ``bulk_create`` wrote.
+
+    ``bulk_create`` sends no signals, so a bulk writer (``RedisControllBackend.assign_many``)
+    calls this per created row to keep the change feeds, the task board and the scheduler's
+    in-flight counts in step (and, on a terminal update, lets held work through admission).
+    """
     # Root-task change feed: a freshly created root task is fanned out to both the caller's
     # feed (mytasks) and the org-wide feed (tasks). Child tasks never reach these feeds.
     if created and instance.root_id is None and instance.caller_id:
         _broadcast_on_commit(
             channels.task_event_channel,
-            channel_events.TaskEventCreatedEvent(create=str(instance.id)),
+            channel_events.TaskEventCreatedEvent(
+                create=str(instance.id),
+                action=instance.action_id,
+                agent=instance.agent_id,
+                acted_on=instance.acted_on,
+            ),
             [
                 f"root_tasks_caller_{instance.caller_id}",
                 f"root_tasks_org_{instance.caller.organization_id}",
             ],
         )
 
+    # Task board: move the org's per-kind counters. The values are captured now — the instance
+    # may be mutated again before the commit hook runs.
+    transaction.on_commit(
+        lambda args=(instance.id, instance.caller_id, instance.latest_event_kind, instance.action_id, instance.agent_id, instance.is_done, bool(created)): task_board.record(*args)
+    )
+
+    # Scheduler load: this worker's view of the agent's unfinished tasks (assign adds the task,
+    # its terminal transition removes it).
+    transaction.on_commit(lambda args=(instance.agent_id, instance.id, instance.is_done): scheduling.in_flight.record(*args))
+
+    # Admission: a task that stopped occupying a slot of its agent (finished, or its executor
+    # was lost) lets the agent's held work through.
+    if instance.agent_id and not created and not instance.pending and (instance.is_done or instance.latest_event_kind == enums.TaskEventKind.DISCONNECTED):
+        transaction.on_commit(lambda agent_id=instance.agent_id: admission.release_if_held(agent_id))
+
     # Agent feed: any task (root or child) run by an agent is fanned out to that agent's
     # detail-page feed, so the agent's "latest tasks" list updates live on create and on
     # every status/is_done transition (which re-saves the Task row → arrives here as update).
@@ -99,6 +141,29 @@ def task_post_save(sender, instance: models.Task = None, created=None, **kwargs)
         _broadcast_on_commit(channels.child_task_channel, event, list(topics))
 
 
+def announce_tasks_updated(root_id: int, rows: list[tuple[int, int | None, int | None]]) -> None:
+    """The feed fan-out of a set-based update of ``root_id``'s descendants, one event per feed.
+
+    ``rows`` are the ``(id, agent_id, parent_id)`` of the tasks a single ``UPDATE`` changed
+    (``RedisControllBackend._request_descendants_control``). Only the agent and child feeds
+    are told: such an update moves neither the event kind nor ``is_done``, so the task board,
+    the in-flight counts and admission have nothing to do.
+    """
+    by_agent: dict[int, list[int]] = {}
+    by_parent: dict[int, list[int]] = {}
+    for task_id, agent_id, parent_id in rows:
+        if agent_id:
+            by_agent.setdefault(agent_id, []).append(task_id)
+        if parent_id and parent_id != root_id:
+            by_parent.setdefault(parent_id, []).append(task_id)
+
+    for agent_id, ids in by_agent.items():
+        _broadcast_on_commit(channels.agent_task_channel, channel_events.ChildTaskEvent(updates=ids), [f"agent_tasks_{agent_id}"])
+    _broadcast_on_commit(channels.child_task_channel, channel_events.ChildTaskEvent(updates=[row[0] for row in rows]), [f"child_tasks_{root_id}"])
+    for parent_id, ids in by_parent.items():
+        _broadcast_on_commit(channels.child_task_channel, channel_events.ChildTaskEvent(updates=ids), [f"child_tasks_{parent_id}"])
+
+
 @receiver(post_save, sender=models.TaskEvent)
 def task_event_post_save(sender, instance: models.TaskEvent = None, created=None, **kwargs):
     logger.info("Task Event received")
@@ -109,7 +174,9 @@ def task_event_post_save(sender, instance: models.TaskEvent = None, created=None
 
 @receiver(post_save, sender=models.Implementation)
 def implementation_post_save(sender, instance: models.Implementation = None, created=None, **kwargs):
+    transaction.on_commit(dependency_cache.dependency_cache.invalidate)
     if created:
+        availability.project_implementation(instance)
         _broadcast_on_commit(channels.new_implementation_channel, channel_events.ImplementationEvent(create=instance.id))
     else:
         _broadcast_on_commit(channels.new_implementation_channel, channel_events.ImplementationEvent(update=instance.id), [f"implementation_{instance.id}"])
@@ -117,10 +184,19 @@ def implementation_post_save(sender, instance: models.Implementation = None, cre
 
 @receiver(post_delete, sender=models.Implementation)
 def implementation_post_del(sender, instance: models.Implementation = None, **kwargs):
+    transaction.on_commit(dependency_cache.dependency_cache.invalidate)
     if instance:
+        # The availability row went with the cascade; recount the action's live agents.
+        usages.refresh_live_agents([instance.action_id])
         _broadcast_on_commit(channels.new_implementation_channel, channel_events.ImplementationEvent(delete=instance.id), [f"implementation_{instance.id}"])
 
 
+@receiver(post_save, sender=models.Dependency)
+@receiver(post_delete, sender=models.Dependency)
+def dependency_changed(sender, instance: models.Dependency = None, **kwargs):
+    transaction.on_commit(dependency_cache.dependency_cache.invalidate)
+
+
 @receiver(post_save, sender=models.Patch)
 def patch_post_save(sender, instance: models.Patch = None, created=None, **kwargs):
     print("Patch post save signal received for patch:", instance)
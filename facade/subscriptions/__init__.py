@@ -1,5 +1,5 @@
 from .action import new_actions
-from .task import mytasks, tasks, child_tasks, agent_tasks
+from .task import mytasks, tasks, child_tasks, agent_tasks, watch_task_board
 from .implementation import implementation_change, implementations
 from .state import state_update_events, latest_patches, watch_state, watch_agent
 from .agent import agents
@@ -17,5 +17,6 @@ __all__ = [
     "watch_agent",
     "child_tasks",
     "agent_tasks",
+    "watch_task_board",
     "agents",
 ]
@@ -0,0 +1,41 @@
+"""Subscribe-before-replay plumbing for the resumable (``since``) feeds.
+
+A feed resumed from a cursor must neither miss a change that lands while its backlog is
+being read nor yield one twice. ``kante``'s ``Channel.listen`` only joins its groups when
+first iterated, i.e. *after* any backlog query the resolver would run — so a row committed
+in between is in neither. :func:`subscribed` instead joins the groups up front and hands back
+the (already buffering) live stream; the resolver then reads its backlog and drains the live
+stream, skipping the ids it has already replayed.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, TypeVar
+
+from kante.channel import Channel
+from kante.context import WsContext
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+async def _validated(channel: Channel[T], raw_messages: AsyncIterator[dict]) -> AsyncGenerator[T, None]:
+    # Same decoding as ``Channel.listen``: an invalid payload is logged and dropped.
+    async for raw in raw_messages:
+        try:
+            yield channel.model.model_validate(raw.get("message"))
+        except ValidationError as e:
+            logger.warning(f"[{channel.name}] Invalid message received: {e}")
+
+
+@asynccontextmanager
+async def subscribed(context: WsContext, channel: Channel[T], groups: list[str]) -> AsyncIterator[AsyncGenerator[T, None]]:
+    """Join ``groups`` on ``channel`` now and yield the live stream, buffered from this point on.
+
+    Messages broadcast while the caller is still replaying queue up in the consumer and are
+    delivered once it starts iterating; the groups are left again when the block exits.
+    """
+    async with context.consumer.listen_to_channel(f"channel.{channel.name}", groups=groups) as raw_messages:
+        yield _validated(channel, raw_messages)
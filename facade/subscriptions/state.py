@@ -2,11 +2,12 @@ from kante.types import Info
 import strawberry
 import datetime
 from facade import types, models, scalars, enums, logic
-from typing import AsyncGenerator, Union
+from typing import AsyncGenerator, Awaitable, Callable, Union
 from facade.channels import (
     state_update_channel,
     patch_channel,
 )
+from facade.subscriptions.resume import subscribed
 from asgiref.sync import sync_to_async
 
 
@@ -80,6 +81,75 @@ class StatePatchEvent:
     session_id: str
     timestamp: datetime.datetime
 
+    @classmethod
+    def from_model(cls, patch: models.Patch) -> "StatePatchEvent":
+        return cls(
+            state_id=strawberry.ID(str(patch.state_id)),
+            agent_id=strawberry.ID(str(patch.agent_id)) if patch.agent_id else strawberry.ID(""),
+            op=patch.op,
+            path=patch.path,
+            value=patch.value,
+            global_revision=patch.global_rev,
+            session_id=patch.session_id,
+            timestamp=patch.timestamp,
+            interface=patch.interface,
+        )
+
+
+@strawberry.type(description="A plain snapshot of a state's current value.")
+class AgentSnapshotEvent:
+    agent_id: strawberry.ID
+    values: scalars.Args
+    global_revision: int
+    session_id: str
+    timestamp: datetime.datetime
+
+
+async def _resume_patches(
+    info: Info,
+    topics: list[str],
+    agent_id: int,
+    since: int,
+    snapshot: Callable[[], Awaitable[StateSnapshotEvent | AgentSnapshotEvent]],
+    **scope,
+) -> AsyncGenerator[StateSnapshotEvent | AgentSnapshotEvent | StatePatchEvent, None]:
+    """Replay the patches after revision ``since``, then continue live on ``topics``.
+
+    ``global_rev`` counts across all of an agent's states and restarts with every session, so
+    the cursor is only honoured if the agent's current session contains it (as a patch or
+    snapshot revision); otherwise the watcher is re-based on a fresh ``snapshot()`` and
+    replay continues from that snapshot's revision. ``scope`` narrows the ``Patch`` rows
+    (``state_id=`` for a single state). The live stream is joined before any query and drops
+    the patches already replayed or folded into the snapshot.
+    """
+    async with subscribed(info.context, patch_channel, topics) as live:
+        session = await models.Session.objects.filter(agent_id=agent_id).order_by("-created_at").afirst()
+        resumable = session is not None and (
+            await models.Patch.objects.filter(session=session, global_rev=since).aexists()
+            or await models.Snapshot.objects.filter(session=session, global_rev=since).aexists()
+        )
+        if not resumable:
+            current = await snapshot()
+            yield current
+            since = current.global_revision
+
+        replayed: set[int] = set()
+        if session is not None:
+            async for patch in models.Patch.objects.filter(session=session, global_rev__gt=since, **scope).order_by("global_rev"):
+                replayed.add(patch.id)
+                yield StatePatchEvent.from_model(patch)
+
+        async for message in live:
+            if message.create in replayed:
+                continue
+            try:
+                patch = await models.Patch.objects.aget(id=message.create)
+            except models.Patch.DoesNotExist:
+                continue
+            if session is not None and patch.session_id == session.id and patch.global_rev <= since:
+                continue
+            yield StatePatchEvent.from_model(patch)
+
 
 async def watch_state(
     self,
@@ -87,8 +157,13 @@ async def watch_state(
     state_id: strawberry.ID | None = None,
     agent_id: strawberry.ID | None = None,
     interface: str | None = None,
+    since: int | None = None,
 ) -> AsyncGenerator[StateSnapshotEvent | StatePatchEvent, None]:
-    """Watch a state: yields the current snapshot then streams patches and state updates."""
+    """Watch a state: yields the current snapshot then streams patches and state updates.
+
+    Pass the last ``global_revision`` seen as ``since`` to replay only the patches missed
+    instead of a fresh snapshot (one is still sent if that revision is no longer current).
+    """
 
     if state_id:
         state = await models.State.objects.select_related("agent").aget(id=state_id)
@@ -98,72 +173,72 @@ async def watch_state(
             interface=interface,
         )
 
-    returned = await sync_to_async(logic.get_latest_state)(state.agent, state_id=state.id)
-
-    yield StateSnapshotEvent(
-        state_id=strawberry.ID(str(state_id)),
-        agent_id=strawberry.ID(str(state.agent_id)),
-        interface=state.interface,
-        value=returned.get("states", {}).get(state.interface),
-        global_revision=returned.get("global_revision", 0),
-        session_id=returned.get("session_id"),
-        timestamp=returned.get("timestamp"),
-    )
+    async def snapshot() -> StateSnapshotEvent:
+        returned = await sync_to_async(logic.get_latest_state)(state.agent, state_id=state.id)
+        return StateSnapshotEvent(
+            state_id=strawberry.ID(str(state.id)),
+            agent_id=strawberry.ID(str(state.agent_id)),
+            interface=state.interface,
+            value=returned.get("states", {}).get(state.interface),
+            global_revision=returned.get("global_revision", 0),
+            session_id=returned.get("session_id"),
+            timestamp=returned.get("timestamp"),
+        )
 
     topics = [
         f"state_{state.id}",
         f"patches_state_{state.id}",
     ]
 
+    if since is not None:
+        async for event in _resume_patches(info, topics, state.agent_id, since, snapshot, state_id=state.id):
+            yield event
+        return
+
+    yield await snapshot()
+
     async for message in patch_channel.listen(info.context, topics):
         # TODO: optimize by NOT using a model here but sending the raw patch data in the channel message (from the agent to this receiver)
         try:
             patch = await models.Patch.objects.aget(id=message.create)
-            yield StatePatchEvent(
-                state_id=strawberry.ID(str(patch.state_id)),
-                agent_id=strawberry.ID(str(patch.agent_id)) if patch.agent_id else strawberry.ID(""),
-                op=patch.op,
-                path=patch.path,
-                value=patch.value,
-                global_revision=patch.global_rev,
-                session_id=patch.session_id,
-                timestamp=patch.timestamp,
-                interface=patch.interface,
-            )
+            yield StatePatchEvent.from_model(patch)
         except models.Patch.DoesNotExist:
             continue
 
 
-@strawberry.type(description="A plain snapshot of a state's current value.")
-class AgentSnapshotEvent:
-    agent_id: strawberry.ID
-    values: scalars.Args
-    global_revision: int
-    session_id: str
-    timestamp: datetime.datetime
-
-
 async def watch_agent(
     self,
     info: Info,
     agent_id: strawberry.ID,
+    since: int | None = None,
 ) -> AsyncGenerator[AgentSnapshotEvent | StatePatchEvent, None]:
-    """Watch an agent: yields current snapshots for all states then streams patches and state updates."""
+    """Watch an agent: yields current snapshots for all states then streams patches and state updates.
+
+    Pass the last ``global_revision`` seen as ``since`` to replay only the patches missed
+    instead of a fresh snapshot (one is still sent if that revision is no longer current).
+    """
 
     agent = await models.Agent.objects.aget(id=agent_id)
 
-    # Yield a snapshot for each state of this agent
-    state = await sync_to_async(logic.get_latest_state)(agent)
+    async def snapshot() -> AgentSnapshotEvent:
+        # A snapshot covering every state of this agent
+        state = await sync_to_async(logic.get_latest_state)(agent)
+        return AgentSnapshotEvent(
+            agent_id=strawberry.ID(str(agent.id)),
+            values=state.get("states", {}),
+            global_revision=state.get("global_revision", 0),
+            session_id=state.get("session_id"),
+            timestamp=state.get("timestamp"),
+        )
 
     topics = [f"patches_agent_{agent.pk}"]
 
-    yield AgentSnapshotEvent(
-        agent_id=strawberry.ID(str(agent.id)),
-        values=state.get("states", {}),
-        global_revision=state.get("global_revision", 0),
-        session_id=state.get("session_id"),
-        timestamp=state.get("timestamp"),
-    )
+    if since is not None:
+        async for event in _resume_patches(info, topics, agent.id, since, snapshot, agent_id=agent.id):
+            yield event
+        return
+
+    yield await snapshot()
 
     async for message in patch_channel.listen(info.context, topics):
         try:
@@ -172,16 +247,6 @@ async def watch_agent(
             if not patch.agent_id or str(patch.agent_id) != str(agent.id):
                 continue
 
-            yield StatePatchEvent(
-                state_id=strawberry.ID(str(patch.state_id)),
-                agent_id=strawberry.ID(str(patch.agent_id)),
-                op=patch.op,
-                path=patch.path,
-                value=patch.value,
-                global_revision=patch.global_rev,
-                session_id=patch.session_id,
-                timestamp=patch.timestamp,
-                interface=patch.interface,
-            )
+            yield StatePatchEvent.from_model(patch)
         except models.Patch.DoesNotExist:
             continue
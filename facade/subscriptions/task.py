@@ -1,11 +1,18 @@
+import asyncio
 import datetime
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from kante.types import Info
+import redis.asyncio as aredis
 import strawberry
-from facade import models, enums, types
+from django.db.models import Min, Q
+from facade import filters, models, enums, task_board, types
+from facade.consumers.agent_queue import _async_pool
 from rekuest_core import scalars as rscalars
 from typing import AsyncGenerator
 from facade.channels import task_event_channel, child_task_channel, agent_task_channel
+from facade.subscriptions.resume import subscribed
 
 
 @strawberry.type(description="Slim, non-traversable snapshot of a task for change feeds.")
@@ -90,11 +97,91 @@ async def _build_change(message) -> TaskChangeEvent:
     return TaskChangeEvent(event=TaskEventChange.from_model(event), create=None)
 
 
+async def _updated_tasks(message) -> list[models.Task]:
+    """The tasks a child / agent feed ``update`` (or batched ``updates``) message names, in one query."""
+    ids = message.updates if message.updates else [message.update]
+    return [task async for task in models.Task.objects.filter(id__in=ids).order_by("id")]
+
+
+async def _resume_cursor(since: strawberry.ID) -> tuple[int, datetime.datetime]:
+    """The id and ``created_at`` of the cursor event ``since``, or of the nearest older one.
+
+    Events go with their task, so the client's own cursor may be gone; an id older than every
+    remaining event cannot be placed and is rejected rather than replaying the whole scope.
+    """
+    try:
+        cursor = int(since)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid resume cursor {since!r}: pass the id of the last TaskEvent seen") from None
+    created_at = await models.TaskEvent.objects.filter(id__lte=cursor).order_by("-id").values_list("created_at", flat=True).afirst()
+    if created_at is None:
+        raise ValueError(f"Unknown resume cursor {since!r}: no TaskEvent at or before it exists, subscribe without since")
+    return cursor, created_at
+
+
+async def _resume_root_tasks(
+    info: Info,
+    topic: str,
+    since: strawberry.ID,
+    scope: Q,
+    filter: filters.TaskChangeFilter | None = None,
+) -> AsyncGenerator[TaskChangeEvent, None]:
+    """Replay a root-task feed after TaskEvent ``since``, then continue live on ``topic``.
+
+    ``scope`` restricts ``Task`` rows to the feed's audience and ``filter`` (if any) applies
+    to backlog and live stream alike. Events commit out of id order under concurrent writers,
+    so an event with an older id can commit after the client's cursor; the backlog therefore
+    starts ``REKUEST_RESUME_COMMIT_SKEW`` seconds before the cursor event's ``created_at``:
+    the root tasks created since then (``task_root_caller_created_idx``) and the events from
+    the first id created since then on, in id order (``taskevent_created_idx`` finds that id). Only what the client provably saw is dropped — the cursor
+    event and the tasks it already had events of — so events just before the cursor may be
+    sent again (clients dedupe by id). The live stream is joined *before* either query and
+    skips every id already replayed, by id set rather than high-water mark for the same reason.
+    """
+    cursor, cursor_at = await _resume_cursor(since)
+    replay_from = cursor_at - datetime.timedelta(seconds=settings.REKUEST_RESUME_COMMIT_SKEW)
+
+    async with subscribed(info.context, task_event_channel, [topic]) as live:
+        if filter is not None:
+            scope &= filter.as_q()
+        roots = models.Task.objects.filter(scope, root__isnull=True)
+        # The window as an id bound (``taskevent_created_idx``): the replay below is then one
+        # primary-key range. The cursor event itself lies in the window, so there is one.
+        window = await models.TaskEvent.objects.filter(created_at__gte=replay_from).aaggregate(first=Min("id"))
+        first_id = min(window["first"] or cursor, cursor)
+        known = models.TaskEvent.objects.filter(id__gte=first_id, id__lte=cursor, task__in=roots).values("task_id")
+        tasks = roots.filter(created_at__gte=replay_from).exclude(id__in=known)
+
+        replayed_tasks: set[int] = set()
+        async for task in tasks.order_by("created_at", "id"):
+            replayed_tasks.add(task.id)
+            yield TaskChangeEvent(create=TaskChange.from_model(task), event=None)
+
+        replayed_events: set[int] = {cursor}
+        events = models.TaskEvent.objects.filter(id__gte=first_id, task__in=roots).exclude(id=cursor)
+        if filter is not None and filter.kinds:
+            events = events.filter(kind__in=filter.kinds)
+        async for event in events.order_by("id"):
+            replayed_events.add(event.id)
+            yield TaskChangeEvent(event=TaskEventChange.from_model(event), create=None)
+
+        async for message in live:
+            if message.create in replayed_tasks or message.event in replayed_events:
+                continue
+            if filter is not None and not filter.matches(message):
+                continue
+            yield await _build_change(message)
+
+
 async def mytasks(
     self,
     info: Info,
+    since: strawberry.ID | None = None,
 ) -> AsyncGenerator[TaskChangeEvent, None]:
-    """Subscribe to root tasks (and their events) created by this client (caller-scoped)."""
+    """Subscribe to root tasks (and their events) created by this client (caller-scoped).
+
+    Pass the id of the last TaskEvent seen as ``since`` to first replay what was missed.
+    """
 
     caller, _ = await models.Caller.objects.aget_or_create(
         client=info.context.request.client,
@@ -102,6 +189,11 @@ async def mytasks(
         organization=info.context.request.organization,
     )
 
+    if since is not None:
+        async for change in _resume_root_tasks(info, f"root_tasks_caller_{caller.id}", since, Q(caller=caller)):
+            yield change
+        return
+
     async for message in task_event_channel.listen(info.context, [f"root_tasks_caller_{caller.id}"]):
         yield await _build_change(message)
 
@@ -109,12 +201,26 @@ async def mytasks(
 async def tasks(
     self,
     info: Info,
+    since: strawberry.ID | None = None,
+    filter: filters.TaskChangeFilter | None = None,
 ) -> AsyncGenerator[TaskChangeEvent, None]:
-    """Subscribe to root task changes (and their events) across the whole organization."""
+    """Subscribe to root task changes (and their events) across the whole organization.
+
+    Pass the id of the last TaskEvent seen as ``since`` to first replay what was missed, and a
+    ``filter`` to receive only the matching changes — it is evaluated against the broadcast
+    itself, so the changes it drops are never loaded.
+    """
 
     organization = info.context.request.organization
 
+    if since is not None:
+        async for change in _resume_root_tasks(info, f"root_tasks_org_{organization.id}", since, Q(caller__organization=organization), filter):
+            yield change
+        return
+
     async for message in task_event_channel.listen(info.context, [f"root_tasks_org_{organization.id}"]):
+        if filter is not None and not filter.matches(message):
+            continue
         yield await _build_change(message)
 
 
@@ -135,24 +241,124 @@ async def agent_tasks(
         if message.create:
             task = await models.Task.objects.aget(id=message.create)
             yield AgentTaskUpdate(create=task, update=None)
-        elif message.update:
-            task = await models.Task.objects.aget(id=message.update)
-            yield AgentTaskUpdate(create=None, update=task)
+        elif message.update or message.updates:
+            for task in await _updated_tasks(message):
+                yield AgentTaskUpdate(create=None, update=task)
+
+
+async def _resume_child_tasks(info: Info, task: models.Task, since: datetime.datetime) -> AsyncGenerator[ChildTaskEvent, None]:
+    """Replay the descendants of ``task`` changed after ``since``, then continue live.
+
+    Child feeds carry task snapshots rather than events, so the cursor is the ``updated_at``
+    of the last ``TaskChange`` seen and each changed descendant is replayed once, in its
+    current state. A live update is skipped while the row is still the one replayed.
+    """
+    async with subscribed(info.context, child_task_channel, [f"child_tasks_{task.id}"]) as live:
+        replayed: dict[int, datetime.datetime] = {}
+        # The same audience the signal fans out to: the whole subtree of a root, the direct
+        # children of an intermediate task.
+        descendants = models.Task.objects.filter(Q(parent_id=task.id) | Q(root_id=task.id), updated_at__gt=since)
+        async for child in descendants.order_by("updated_at", "id"):
+            replayed[child.id] = child.updated_at
+            change = TaskChange.from_model(child)
+            if child.created_at > since:
+                yield ChildTaskEvent(create=change, update=None)
+            else:
+                yield ChildTaskEvent(update=change, create=None)
+
+        async for message in live:
+            if message.create:
+                if message.create in replayed:
+                    continue
+                child = await models.Task.objects.aget(id=message.create)
+                yield ChildTaskEvent(create=TaskChange.from_model(child), update=None)
+            elif message.update or message.updates:
+                for child in await _updated_tasks(message):
+                    if replayed.get(child.id) == child.updated_at:
+                        continue
+                    yield ChildTaskEvent(update=TaskChange.from_model(child), create=None)
 
 
 async def child_tasks(
     self,
     info: Info,
     id: strawberry.ID,
+    since: datetime.datetime | None = None,
 ) -> AsyncGenerator[ChildTaskEvent, None]:
-    """Subscribe to all descendant task changes of a given task (any task whose root or parent is it)."""
+    """Subscribe to all descendant task changes of a given task (any task whose root or parent is it).
+
+    Pass the ``updated_at`` of the last change seen as ``since`` to first replay what was missed.
+    """
 
     task = await models.Task.objects.aget(id=id)
 
+    if since is not None:
+        async for change in _resume_child_tasks(info, task, since):
+            yield change
+        return
+
     async for message in child_task_channel.listen(info.context, [f"child_tasks_{task.id}"]):
         if message.create:
             child = await models.Task.objects.aget(id=message.create)
             yield ChildTaskEvent(create=TaskChange.from_model(child), update=None)
-        elif message.update:
-            child = await models.Task.objects.aget(id=message.update)
-            yield ChildTaskEvent(update=TaskChange.from_model(child), create=None)
+        elif message.update or message.updates:
+            for child in await _updated_tasks(message):
+                yield ChildTaskEvent(update=TaskChange.from_model(child), create=None)
+
+
+@strawberry.type(description="One task-board counter: the tasks currently in ``kind``, overall or for one action or agent.")
+class TaskBoardCount:
+    kind: enums.TaskEventKind
+    action: strawberry.ID | None
+    agent: strawberry.ID | None
+    count: int
+
+    @classmethod
+    def from_field(cls, field: str, count: int) -> "TaskBoardCount":
+        # ``kind:{KIND}`` | ``action:{id}:{KIND}`` | ``agent:{id}:{KIND}`` (see ``facade.task_board``)
+        scope, *rest = field.split(":")
+        return cls(
+            kind=enums.TaskEventKind(rest[-1]),
+            action=strawberry.ID(rest[0]) if scope == "action" else None,
+            agent=strawberry.ID(rest[0]) if scope == "agent" else None,
+            count=count,
+        )
+
+
+@strawberry.type(description="A change of the organization's task board: every counter on the first update, then only the changed ones (zero when a counter emptied).")
+class TaskBoardUpdate:
+    snapshot: bool
+    counts: list[TaskBoardCount]
+
+
+async def watch_task_board(
+    self,
+    info: Info,
+) -> AsyncGenerator[TaskBoardUpdate, None]:
+    """Subscribe to the organization's task counters by state, action and agent.
+
+    The counters are maintained server-side (``facade.task_board``) and read once per
+    ``REKUEST_TASK_BOARD_INTERVAL``; only the counters that changed since the last push are sent.
+    """
+
+    organization = info.context.request.organization
+    await sync_to_async(task_board.ensure)(organization.id)
+
+    connection = aredis.Redis(connection_pool=_async_pool(settings.AGENT_REDIS_HOST, settings.AGENT_REDIS_PORT))
+    sent: dict[str, int] | None = None
+    while True:
+        raw = await connection.hgetall(task_board.counts_key(organization.id))
+        if not raw:
+            # The board went away (eviction, a flushed or restarted redis): build it again.
+            await sync_to_async(task_board.ensure)(organization.id)
+            raw = await connection.hgetall(task_board.counts_key(organization.id))
+        counts = task_board.parse(raw)
+        if sent is None:
+            yield TaskBoardUpdate(snapshot=True, counts=[TaskBoardCount.from_field(f, n) for f, n in counts.items()])
+        else:
+            changed = {f: n for f, n in counts.items() if sent.get(f) != n}
+            changed.update({f: 0 for f in sent.keys() - counts.keys()})
+            if changed:
+                yield TaskBoardUpdate(snapshot=False, counts=[TaskBoardCount.from_field(f, n) for f, n in changed.items()])
+        sent = counts
+        await asyncio.sleep(settings.REKUEST_TASK_BOARD_INTERVAL)
@@ -0,0 +1,168 @@
+"""Per-organization task counters behind the ``taskBoard`` subscription.
+
+A dashboard's "tasks per state" tiles used to re-run the ``taskStats`` aggregate over the
+whole task table on a timer, once per client. Instead the server keeps the counts itself, in
+redis (so every worker sees the same board), and moves them on each task transition:
+
+- ``…:{org}:counts`` — a hash of counters: ``kind:{KIND}``, ``action:{id}:{KIND}`` and
+  ``agent:{id}:{KIND}``, each the number of the org's tasks whose ``latest_event_kind`` is KIND.
+- ``…:{org}:tasks`` — the last counted ``kind|action|agent`` of every *unfinished* task, so a
+  transition knows what to decrement. Finished tasks leave it: they do not transition again.
+
+A board is built lazily — :func:`ensure` runs one ``GROUP BY`` the first time an org is
+watched — and only built boards are maintained: the transition script is loaded once and run
+by its SHA (``EVALSHA``), and its first step is an ``EXISTS`` on the board, so an org nobody
+watches costs one tiny round-trip per transition and no script evaluation beyond that check. :func:`rebuild` is also the repair
+path for drift from bulk ``update()`` calls, which bypass ``post_save``.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from functools import lru_cache
+from typing import Optional
+
+import redis
+from django.conf import settings
+from redis.commands.core import Script
+from django.db.models import Count
+
+from facade import models
+from facade.consumers.agent_queue import _sync_pool
+
+logger = logging.getLogger(__name__)
+
+BOARD_PREFIX = "rekuest:task_board"
+# Marks a built board: an org without tasks still has a (non-empty) counts hash.
+BUILT_FIELD = "_built"
+
+
+def counts_key(organization_id: int) -> str:
+    return f"{BOARD_PREFIX}:{organization_id}:counts"
+
+
+def tasks_key(organization_id: int) -> str:
+    return f"{BOARD_PREFIX}:{organization_id}:tasks"
+
+
+# KEYS: counts, tasks. ARGV: task id, "kind|action|agent", is_done ("1"/"0"), created ("1"/"0").
+# One atomic script per transition, so concurrent workers never interleave a decrement/increment.
+_TRANSITION = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  return 0
+end
+local function bump(entry, by)
+  local kind, action, agent = string.match(entry, '^([^|]*)|([^|]*)|([^|]*)$')
+  local fields = {'kind:' .. kind, 'action:' .. action .. ':' .. kind}
+  if agent ~= '' then
+    table.insert(fields, 'agent:' .. agent .. ':' .. kind)
+  end
+  for _, field in ipairs(fields) do
+    if redis.call('HINCRBY', KEYS[1], field, by) <= 0 then
+      redis.call('HDEL', KEYS[1], field)
+    end
+  end
+end
+local previous = redis.call('HGET', KEYS[2], ARGV[1])
+if previous then
+  if previous ~= ARGV[2] then
+    bump(previous, -1)
+    bump(ARGV[2], 1)
+  end
+elseif ARGV[4] == '1' or ARGV[3] == '0' then
+  -- New, or unfinished but untracked (a transition that raced the build). A finished task
+  -- that is not tracked was already counted in its terminal kind.
+  bump(ARGV[2], 1)
+end
+if ARGV[3] == '1' then
+  redis.call('HDEL', KEYS[2], ARGV[1])
+else
+  redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+end
+return 1
+"""
+
+
+def _connection() -> redis.Redis:
+    return redis.Redis(connection_pool=_sync_pool(settings.AGENT_REDIS_HOST, settings.AGENT_REDIS_PORT))
+
+
+@lru_cache(maxsize=None)
+def _transition() -> Script:
+    # Registered once per process: later calls send the SHA, and redis-py reloads the body
+    # itself should the server have lost it (NOSCRIPT after a restart or SCRIPT FLUSH).
+    return _connection().register_script(_TRANSITION)
+
+
+@lru_cache(maxsize=4096)
+def _caller_organization(caller_id: int) -> Optional[int]:
+    # A caller's organization never changes, so the lookup is cached per process.
+    return models.Caller.objects.filter(id=caller_id).values_list("organization_id", flat=True).first()
+
+
+def _kind(kind) -> str:
+    # A TextChoices member or its raw value, depending on how the row was loaded.
+    return getattr(kind, "value", kind)
+
+
+def _entry(kind, action_id: int, agent_id: Optional[int]) -> str:
+    return f"{_kind(kind)}|{action_id}|{agent_id or ''}"
+
+
+def _fields(kind, action_id: int, agent_id: Optional[int]) -> list[str]:
+    kind = _kind(kind)
+    fields = [f"kind:{kind}", f"action:{action_id}:{kind}"]
+    if agent_id:
+        fields.append(f"agent:{agent_id}:{kind}")
+    return fields
+
+
+def record(task_id: int, caller_id: Optional[int], kind, action_id: int, agent_id: Optional[int], is_done: bool, created: bool) -> None:
+    """Move the counters of the task's organization for one saved task (best-effort)."""
+    if not caller_id:
+        return
+    organization_id = _caller_organization(caller_id)
+    if organization_id is None:
+        return
+    try:
+        _transition()(
+            keys=[counts_key(organization_id), tasks_key(organization_id)],
+            args=[task_id, _entry(kind, action_id, agent_id), "1" if is_done else "0", "1" if created else "0"],
+        )
+    except redis.RedisError:
+        # The board is a cache over the task table: a lost update is repaired by ``rebuild``,
+        # never worth failing the task write that triggered it.
+        logger.warning("Could not update the task board for organization %s", organization_id, exc_info=True)
+
+
+def rebuild(organization_id: int) -> None:
+    """(Re)build the board of ``organization_id`` from the task table (one ``GROUP BY``, one scan of the open tasks)."""
+    tasks = models.Task.objects.filter(caller__organization_id=organization_id)
+
+    counts: Counter[str] = Counter()
+    for row in tasks.values("latest_event_kind", "action_id", "agent_id").annotate(n=Count("id")).order_by():
+        for field in _fields(row["latest_event_kind"], row["action_id"], row["agent_id"]):
+            counts[field] += row["n"]
+
+    open_tasks = {str(pk): _entry(kind, action_id, agent_id) for pk, kind, action_id, agent_id in tasks.filter(is_done=False).values_list("id", "latest_event_kind", "action_id", "agent_id")}
+
+    pipe = _connection().pipeline(transaction=True)
+    pipe.delete(counts_key(organization_id), tasks_key(organization_id))
+    pipe.hset(counts_key(organization_id), mapping={BUILT_FIELD: 1, **counts})
+    if open_tasks:
+        pipe.hset(tasks_key(organization_id), mapping=open_tasks)
+    pipe.execute()
+
+
+def ensure(organization_id: int) -> None:
+    """Build the board of ``organization_id`` unless it already exists."""
+    if not _connection().exists(counts_key(organization_id)):
+        rebuild(organization_id)
+
+
+def parse(counts: dict[bytes, bytes]) -> dict[str, int]:
+    """A raw ``HGETALL`` of a counts hash as ``{field: count}``, without the build marker."""
+    parsed = {key.decode("utf-8"): int(value) for key, value in counts.items()}
+    parsed.pop(BUILT_FIELD, None)
+    return parsed
@@ -3,10 +3,12 @@
 Two best-effort notifiers over the authoritative DB rows:
 
 - :func:`deliver_to_agent` — a single ToAgent command to one agent: redis queue for a
-  WEBSOCKET agent, HMAC-signed POST for a WEBHOOK HookAgent.
+  WEBSOCKET agent, HMAC-signed POST for a WEBHOOK HookAgent (:func:`deliver_many_to_agent`
+  for a run of them, e.g. a bulk assign; :func:`deliver_to_agents` for runs to several agents).
 - :func:`publish_task_event` — fan a persisted ``TaskEvent`` out to its
-  caller: the channel layer (GraphQL subscription + live WS forward) and, if the caller is a
-  HookAgent, a webhook POST.
+  caller: the channel layer (GraphQL subscriptions) and, if the caller is a reachable agent
+  (a live WEBSOCKET agent or a HookAgent), the ``…Event`` mirror over that agent's own
+  transport (queue or webhook POST).
 
 Both run only AFTER the relevant row is persisted, so a failed notification is recoverable
 from the DB — the real-time layer never has to be reliable, only prompt.
@@ -15,12 +17,26 @@ from the DB — the real-time layer never has to be reliable, only prompt.
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Sequence, Tuple
 
-from facade import caller_events, channel_events, channels, enums, hooks, messages, models
+from facade import caller_events, channel_events, channels, enums, hooks, liveness, messages, models
 from facade.consumers.agent_queue import RedisAgentQueue
 
 logger = logging.getLogger(__name__)
 
+# The Agent columns :func:`deliver_to_agent` reads — load with ``.only(*AGENT_TRANSPORT_FIELDS)``.
+AGENT_TRANSPORT_FIELDS = ("id", "kind", "hook_url", "hook_url_secret", "hook_batch_window_ms", "hook_batch_max")
+# How long a caller's agent row is reused for its mirrors. Well under the heartbeat interval, so
+# a cached ``last_seen`` never ages a live agent past the stale window.
+CALLER_AGENT_TTL_SECONDS = 2.0
+CALLER_AGENT_MAX_ENTRIES = 1024
+
+_caller_agents: OrderedDict[int, Tuple[float, models.Agent | None]] = OrderedDict()
+_caller_agents_lock = threading.Lock()
+
 
 def deliver_to_agent(agent: models.Agent, message: messages.ToAgentMessage) -> None:
     """Send one ToAgent message to ``agent`` over its transport (queue or webhook)."""
@@ -31,48 +47,164 @@ def deliver_to_agent(agent: models.Agent, message: messages.ToAgentMessage) -> N
         RedisAgentQueue.from_settings().push(str(agent.pk), body)
 
 
+async def adeliver_to_agent(agent: models.Agent, message: messages.ToAgentMessage) -> None:
+    """:func:`deliver_to_agent` on the event loop: an async queue push or an async webhook POST."""
+    body = message.model_dump_json()
+    if agent.kind == enums.AgentKind.WEBHOOK.value:
+        await hooks.adeliver_to_hook(agent, body)
+    else:
+        await RedisAgentQueue.from_settings().apush(str(agent.pk), body)
+
+
+def deliver_many_to_agent(agent: models.Agent, outgoing: Sequence[messages.ToAgentMessage]) -> None:
+    """Send several ToAgent messages to ``agent``, in order, over its transport.
+
+    A WEBSOCKET agent gets them in one queue push; a WEBHOOK agent gets one POST each, which
+    its batch window (``hook_batch_window_ms``) coalesces when the agent has one configured.
+    """
+    bodies = [message.model_dump_json() for message in outgoing]
+    if agent.kind == enums.AgentKind.WEBHOOK.value:
+        for body in bodies:
+            hooks.deliver_to_hook(agent, body)
+    else:
+        RedisAgentQueue.from_settings().push_many(str(agent.pk), bodies)
+
+
+def deliver_to_agents(batches: Sequence[Tuple[models.Agent, Sequence[messages.ToAgentMessage]]]) -> None:
+    """Send a run of ToAgent messages to each of several agents.
+
+    Every WEBSOCKET agent's run goes into its queue in one pipelined redis round-trip (e.g. an
+    interrupt propagated over a task tree); WEBHOOK agents get theirs as :func:`deliver_many_to_agent` does.
+    """
+    queued: Dict[str, List[str]] = {}
+    for agent, outgoing in batches:
+        if agent.kind == enums.AgentKind.WEBHOOK.value:
+            deliver_many_to_agent(agent, outgoing)
+        else:
+            queued.setdefault(str(agent.pk), []).extend(message.model_dump_json() for message in outgoing)
+    RedisAgentQueue.from_settings().push_batches(queued)
+
+
 def publish_task_event(event: models.TaskEvent) -> None:
-    """Fan a persisted task event out to its caller (channel layer + webhook)."""
+    """Fan a persisted task event out to its caller (GraphQL feeds + the caller agent's transport)."""
     task = event.task
-    caller_id = task.caller_id
-    if not caller_id:
+    if not task.caller_id:
+        return
+    _broadcast_root_event(event, task)
+    _deliver_caller_event(event, task)
+
+
+def publish_task_events(events: Sequence[models.TaskEvent]) -> None:
+    """:func:`publish_task_event` for a run of events written together (a set-based transition).
+
+    The tasks are loaded in one query and every caller agent gets its ``…Event`` mirrors in
+    one delivery, instead of a task read, an agent lookup and a push per event.
+    """
+    tasks = models.Task.objects.select_related("caller").in_bulk({event.task_id for event in events})
+    callers: Dict[int, models.Caller] = {}
+    mirrors: Dict[int, List[messages.ToAgentMessage]] = {}
+    for event in events:
+        task = tasks[event.task_id]
+        event.task = task
+        if not task.caller_id:
+            continue
+        _broadcast_root_event(event, task)
+        message = caller_events.build_execution_event(event)  # pyright: ignore[reportArgumentType]  # see _deliver_caller_event
+        if message is not None:
+            callers[task.caller_id] = task.caller
+            mirrors.setdefault(task.caller_id, []).append(message)
+
+    for caller_id, outgoing in mirrors.items():
+        agent = _caller_agent(callers[caller_id])
+        if agent is not None:
+            deliver_many_to_agent(agent, outgoing)
+
+
+def _broadcast_root_event(event: models.TaskEvent, task: models.Task) -> None:
+    # Root-task events feed the slim GraphQL change feeds (mytasks / tasks), which fan out to
+    # both the caller's feed and the org-wide feed. The agent-socket mirror does NOT ride the
+    # channel layer: it is built once here and pushed, already serialized, to the caller.
+    if task.root_id is not None:
         return
-    # The live WS forward (agent socket) consumes every caller event, root and child alike, on
-    # ``task_caller_{caller_id}``. Root-task events additionally feed the slim GraphQL change
-    # feeds (mytasks / tasks), which fan out to both the caller's feed and the org-wide feed.
-    topics = [f"task_caller_{caller_id}"]
-    if task.root_id is None:
-        topics += [
-            f"root_tasks_caller_{caller_id}",
-            f"root_tasks_org_{task.caller.organization_id}",
-        ]
     channels.task_event_channel.broadcast(
-        channel_events.TaskEventCreatedEvent(event=event.id),  # pyright: ignore[reportCallIssue]  # pydantic Field(None) default
-        topics,
+        channel_events.TaskEventCreatedEvent(  # pyright: ignore[reportCallIssue]  # pydantic Field(None) default
+            event=event.id,
+            kind=getattr(event.kind, "value", event.kind),
+            action=task.action_id,
+            agent=task.agent_id,
+            acted_on=task.acted_on,
+        ),
+        [
+            f"root_tasks_caller_{task.caller_id}",
+            f"root_tasks_org_{task.caller.organization_id}",
+        ],
     )
-    _deliver_caller_event_to_webhook(event, task)
 
 
-def _deliver_caller_event_to_webhook(event: models.TaskEvent, task: models.Task) -> None:
-    """If the task's caller is a HookAgent, POST the …Event mirror to its hook_url."""
+def _caller_agent(caller: models.Caller) -> models.Agent | None:
+    """The agent a caller's mirrors go to (transport columns only), or None.
+
+    None for a plain GraphQL caller, a HookAgent without a ``hook_url`` and a WEBSOCKET agent
+    that is not live: its queue is only drained by a connected socket, so mirrors pushed while
+    it is away would pile up unbounded (and it replays its tasks from the DB on reconnect).
+
+    The row is looked up once per :data:`CALLER_AGENT_TTL_SECONDS` per caller instead of on
+    every event; liveness is evaluated on each call, and an agent save (connect / disconnect)
+    in this process drops the cache via :func:`forget_caller_agents`.
+    """
+    now = time.monotonic()
+    with _caller_agents_lock:
+        entry = _caller_agents.get(caller.pk)
+        if entry is not None and now - entry[0] <= CALLER_AGENT_TTL_SECONDS:
+            _caller_agents.move_to_end(caller.pk)
+            agent = entry[1]
+        else:
+            entry = None
+    if entry is None:
+        agent = (
+            models.Agent.objects.filter(
+                client_id=caller.client_id,
+                user_id=caller.user_id,
+                organization_id=caller.organization_id,
+            )
+            .only(*AGENT_TRANSPORT_FIELDS, "connected", "last_seen")
+            .first()
+        )
+        with _caller_agents_lock:
+            _caller_agents[caller.pk] = (now, agent)
+            _caller_agents.move_to_end(caller.pk)
+            while len(_caller_agents) > CALLER_AGENT_MAX_ENTRIES:
+                _caller_agents.popitem(last=False)
+    if agent is None:
+        return None
+    if agent.kind == enums.AgentKind.WEBHOOK.value:
+        return agent if agent.hook_url else None
+    return agent if liveness.agent_is_live(agent.connected, agent.last_seen) else None
+
+
+def forget_caller_agents() -> None:
+    """Drop the cached caller agents (an agent connected, disconnected or went away)."""
+    with _caller_agents_lock:
+        _caller_agents.clear()
+
+
+def _deliver_caller_event(event: models.TaskEvent, task: models.Task) -> None:
+    """If the task's caller is a reachable agent, deliver the …Event mirror to that agent.
+
+    The mirror is built once, at event creation, and handed to :func:`deliver_to_agent`: a
+    WEBSOCKET caller gets it on its agent queue (its listen loop forwards the serialized frame
+    verbatim — no DB read, no pydantic rebuild on the receiving worker), a HookAgent caller as a
+    signed POST to its ``hook_url``. A plain GraphQL caller has no agent and gets nothing here,
+    nor does an offline WEBSOCKET agent (see :func:`_caller_agent`).
+    """
     caller = task.caller
     if caller is None:
         return
-    agent = (
-        models.Agent.objects.filter(
-            client_id=caller.client_id,
-            user_id=caller.user_id,
-            organization_id=caller.organization_id,
-            kind=enums.AgentKind.WEBHOOK.value,
-        )
-        .exclude(hook_url__isnull=True)
-        .exclude(hook_url="")
-        .first()
-    )
+    agent = _caller_agent(caller)
     if agent is None:
         return
     # A Django model satisfies EventLike at runtime, but pyright can't see through the
     # TextChoicesField descriptor to verify it structurally (needs a mypy plugin).
     message = caller_events.build_execution_event(event)  # pyright: ignore[reportArgumentType]
     if message is not None:
-        hooks.deliver_to_hook(agent, message.model_dump_json())
+        deliver_to_agent(agent, message)
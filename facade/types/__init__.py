@@ -76,6 +76,7 @@ from .structure import (
     PortUsage,
     Structure,
     StructurePackage,
+    UsageCounts,
 )
 from .testcase import TestCase, TestResult
 from .threed import Placement, Space, ThreeDModel
@@ -138,6 +139,7 @@ __all__ = [
     "Interface",
     "Structure",
     "PortUsage",
+    "UsageCounts",
     "TaskBoundary",
     "SessionBoundary",
     "Session",
@@ -46,6 +46,10 @@ class Agent:
     kind: enums.AgentKind = strawberry_django.field(description="Kind of the agent.")
     hook_url: str | None = strawberry_django.field(description="Webhook URL for this Agent (only if webhook)", default=None)
     hook_url_secret: str | None = strawberry_django.field(description="Webhook URL secret for this Agent (only if webhook)", default=None)
+    hook_batch_window_ms: int = strawberry_django.field(description="Batching window (ms) for outbound webhook deliveries; 0 means one POST per message (only if webhook)")
+    hook_batch_max: int = strawberry_django.field(description="Maximum messages per batched webhook POST (only if webhook)")
+    capacity: int = strawberry_django.field(description="Declared relative capacity used by the weighted scheduler.")
+    max_concurrency: int = strawberry_django.field(description="The most tasks dispatched to this agent at once (0 = unlimited); the rest are held server-side.")
     tasks: list["Task"] = strawberry_django.field(description="Tasks executed by this agent.")
     app: App = strawberry_django.field(description="The app this agent belongs to.")
     release: Release = strawberry_django.field(description="The release this agent belongs to.")
@@ -29,6 +29,7 @@ class Implementation:
     lower_order_implementations: list["Implementation"] = strawberry_django.field(description="The higher-order implementations that wrap this implementation.")
     higher_order_config: rscalars.AnyDefault = strawberry_django.field(description="Projection config (bound params, arg/dependency/return maps) when this is a higher-order implementation.")
     needs_token: bool = strawberry_django.field(description="Whether a signed provenance token is minted when this implementation is assigned.")
+    max_concurrency: int = strawberry_django.field(description="The most tasks of this implementation dispatched to its agent at once (0 = unlimited).")
     provenance_audience: Optional[list[str]] = strawberry_django.field(description="Declared audience for the provenance token's `aud`, or null to derive it at dispatch.")
 
     @strawberry_django.field(description="Constructed name for display, combining interface and agent name.")
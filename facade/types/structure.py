@@ -1,16 +1,16 @@
-"""Virtual structure/interface/package types, derived entirely from the port rows.
+"""Virtual structure/interface/package types, read from the structure-usage index.
 
 There is no catalog table: a "structure" is nothing more than a distinct ``@package/key``
 identifier referenced by some action's port. The types here are plain strawberry types
-(no Django model, no DB id — the identifier IS the identity), enumerated from the indexed
-``identifier`` column of the relational ArgPort/ReturnPort rows and scoped to the
-requesting organization. Registration writes nothing; the enumeration can never drift
-from what ports actually reference.
-
-Usage lookups ("which actions consume @mikro/image?") are likewise answered from the port
-rows. ``modifiers`` (container nesting like ``["list"]``) are reconstructed from the
-materialized ``key_path``: every dot-prefix of a row's path is an ancestor row, so one
-extra query fetches all ancestors for all usages.
+(no Django model, no DB id — the identifier IS the identity), enumerated from
+``models.StructureUsage`` — the per-organization projection of the relational
+ArgPort/ReturnPort rows that registration rewrites with the action's ports
+(:mod:`facade.usages`) — so listing and counting never aggregate the port tables.
+
+Usage lookups ("which actions consume @mikro/image?") are narrowed to the using actions
+through the index, then read from their port rows. ``modifiers`` (container nesting like
+``["list"]``) are reconstructed from the materialized ``key_path``: every dot-prefix of a
+row's path is an ancestor row, so one extra query fetches all ancestors for all usages.
 """
 
 from __future__ import annotations
@@ -19,6 +19,8 @@ import strawberry
 from asgiref.sync import sync_to_async
 from strawberry.types import Info
 
+from django.db.models import Count, Q
+
 from facade import models
 
 
@@ -31,9 +33,31 @@ class PortUsage:
     modifiers: list[str] = strawberry.field(description="Container nesting between the root port and the using port, e.g. ['dict', 'list'].")
 
 
+@strawberry.type(description="How many of the org's actions use a structure or interface, read from the structure-usage index.")
+class UsageCounts:
+    input_actions: int = strawberry.field(description="Actions using it in their arguments.")
+    output_actions: int = strawberry.field(description="Actions using it in their returns.")
+    live_actions: int = strawberry.field(description="Actions using it that an available agent can run right now.")
+
+
+def _usage_rows(info: Info, kind: str):
+    return models.StructureUsage.objects.filter(organization=info.context.request.organization, kind=kind)
+
+
+def _usage_counts(info: Info, identifier: str, kind: str) -> UsageCounts:
+    counts = _usage_rows(info, kind).filter(identifier=identifier.lower()).aggregate(
+        input_actions=Count("action", filter=Q(direction="args"), distinct=True),
+        output_actions=Count("action", filter=Q(direction="returns"), distinct=True),
+        live_actions=Count("action", filter=Q(live_agents__gt=0), distinct=True),
+    )
+    return UsageCounts(**counts)
+
+
 def _port_usages(info: Info, identifier: str, kind: str, port_model: type[models.ArgPort] | type[models.ReturnPort]) -> list[PortUsage]:
     """All usages of ``identifier`` (case-insensitive) among ports of ``kind`` in one table, scoped to the requesting org."""
-    rows = list(port_model.objects.filter(identifier__iexact=identifier, kind=kind, action__organization=info.context.request.organization).select_related("action"))
+    direction = "args" if port_model is models.ArgPort else "returns"
+    using = _usage_rows(info, kind).filter(identifier=identifier.lower(), direction=direction).values("action_id")
+    rows = list(port_model.objects.filter(action_id__in=using, identifier__iexact=identifier, kind=kind).select_related("action"))
     if not rows:
         return []
 
@@ -60,16 +84,12 @@ def _port_usages(info: Info, identifier: str, kind: str, port_model: type[models
 
 def _distinct_identifiers(info: Info, kind: str, search: str | None = None, package_key: str | None = None) -> list[str]:
     """Distinct (lowercased) '@package/key' identifiers of ``kind`` referenced by the org's ports."""
-    identifiers: set[str] = set()
-    for port_model in (models.ArgPort, models.ReturnPort):
-        queryset = port_model.objects.filter(kind=kind, identifier__isnull=False, action__organization=info.context.request.organization)
-        if search:
-            queryset = queryset.filter(identifier__icontains=search)
-        if package_key:
-            queryset = queryset.filter(identifier__istartswith=f"@{package_key}/")
-        identifiers.update(queryset.values_list("identifier", flat=True).distinct())
-    # Identifiers without a package part ('@pkg/key') were never catalogued; keep that rule.
-    return sorted({identifier.lower() for identifier in identifiers if "/" in identifier})
+    queryset = _usage_rows(info, kind)
+    if search:
+        queryset = queryset.filter(identifier__icontains=search)
+    if package_key:
+        queryset = queryset.filter(identifier__startswith=f"@{package_key.lower()}/")
+    return list(queryset.order_by("identifier").values_list("identifier", flat=True).distinct())
 
 
 def _package_of(identifier: str) -> str:
@@ -107,6 +127,10 @@ class Interface:
     def package(self) -> StructurePackage:
         return StructurePackage(key=_package_of(self.identifier))
 
+    @strawberry.field(description="How many actions use this interface, and how many of them can run right now.")
+    async def usage_counts(self, info: Info) -> UsageCounts:
+        return await sync_to_async(_usage_counts)(info, self.identifier, "INTERFACE")
+
     @strawberry.field(description="Usages of this interface as an input in actions (derived from the relational arg ports).")
     async def input_usages(self, info: Info) -> list[PortUsage]:
         return await sync_to_async(_port_usages)(info, self.identifier, "INTERFACE", models.ArgPort)
@@ -128,6 +152,10 @@ class Structure:
     def package(self) -> StructurePackage:
         return StructurePackage(key=_package_of(self.identifier))
 
+    @strawberry.field(description="How many actions use this structure, and how many of them can run right now.")
+    async def usage_counts(self, info: Info) -> UsageCounts:
+        return await sync_to_async(_usage_counts)(info, self.identifier, "STRUCTURE")
+
     @strawberry.field(description="Usages of this structure as an input in actions (derived from the relational arg ports).")
     async def input_usages(self, info: Info) -> list[PortUsage]:
         return await sync_to_async(_port_usages)(info, self.identifier, "STRUCTURE", models.ArgPort)
@@ -19,13 +19,16 @@ from facade.types.dependency import ResolvedAgentDependency
 class Task:
     id: strawberry.ID = strawberry_django.field(description="Unique ID of the task.")
     reference: str | None = strawberry_django.field(description="Optional external reference for tracking.")
+    idempotency_key: str | None = strawberry_django.field(description="The idempotency key of the assign that created the task, if the caller sent one.")
     is_done: bool = strawberry_django.field(description="Indicates if the task is completed.")
+    pending: bool = strawberry_django.field(description="Indicates if the task is held by the server because its agent or implementation is at its max_concurrency (not yet sent to the agent).")
     args: rscalars.AnyDefault = strawberry_django.field(description="Arguments used in the task.")
     args_hash: str | None = strawberry_django.field(description="Canonical sha256 of the assign args — the replay-discovery key.")
     dependencies: rscalars.AnyDefault = strawberry_django.field(description="The used dependencies for this assignemnet")
     resolution: Optional["Resolution"] = strawberry.field(description="Resolution used to resolve dependencies for this task.")
     root: Optional["Task"] = strawberry.field(description="Root task in the creation chain.")
     parent: Optional["Task"] = strawberry.field(description="Parent task that triggered this one.")
+    replay_of: Optional["Task"] = strawberry_django.field(description="The prior completed run whose result this task reused instead of being dispatched.")
     action: "Action" = strawberry.field(description="Action assigned.")
     capture: bool = strawberry.field(description="Indicates if the task is being captured for logging or debugging.")
     implementation: Optional["Implementation"] = strawberry.field(description="Implementation assigned to execute. Null until the task is mapped to one.")
@@ -0,0 +1,54 @@
+"""Writers of the structure-usage index (``models.StructureUsage``).
+
+The index projects every action's port rows to ``(identifier, kind, direction, port_count)``
+rows and counts the agents that can run the action, so the structure browser reads one
+indexed table. It is written at the places its inputs change:
+
+* **Registration** — :func:`refresh_usages` after the action's port rows were synced. It
+  rewrites the action's rows, live counts included, in two statements (a DELETE and an
+  INSERT … SELECT), whatever the size of its port trees.
+* **Liveness transitions** — the ``facade.availability`` writers call
+  :func:`refresh_live_agents` for the actions whose availability rows they changed; deleting
+  an Implementation (which cascades to its availability row) does so from its signal.
+
+It only speaks SQL (no model imports), so the backfill migration can call it too.
+"""
+
+import typing as t
+
+from django.db import connection
+
+# The agents that can run the action ``{action_id}`` right now.
+LIVE_AGENTS_SQL = "(SELECT COUNT(DISTINCT av.agent_id) FROM facade_actionavailability av WHERE av.action_id = {action_id} AND av.available)"
+
+# Identifiers without a package part ('@pkg/key') were never catalogued.
+_USAGE_SELECT = (
+    "SELECT a.organization_id, p.action_id, lower(p.identifier), p.kind, '{direction}', COUNT(*), "
+    + LIVE_AGENTS_SQL.format(action_id="p.action_id")
+    + " FROM {table} p JOIN facade_action a ON a.id = p.action_id"
+    " WHERE p.kind IN ('STRUCTURE', 'INTERFACE') AND p.identifier LIKE '%%/%%'{where}"
+    " GROUP BY a.organization_id, p.action_id, lower(p.identifier), p.kind"
+)
+
+
+def refresh_usages(action_ids: t.Iterable[int] | None = None) -> None:
+    """Rewrite the usage rows of ``action_ids`` (every action when None), live counts included."""
+    where, params = "", []
+    if action_ids is not None:
+        where, params = " AND p.action_id = ANY(%s)", [list(action_ids)]
+    select = " UNION ALL ".join(_USAGE_SELECT.format(direction=direction, table=table, where=where) for direction, table in (("args", "facade_argport"), ("returns", "facade_returnport")))
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM facade_structureusage" + (" WHERE action_id = ANY(%s)" if action_ids is not None else ""), params)
+        cursor.execute(f"INSERT INTO facade_structureusage (organization_id, action_id, identifier, kind, direction, port_count, live_agents) {select}", params * 2)
+
+
+def refresh_live_agents(action_ids: t.Iterable[int] | None = None) -> int:
+    """Recount the live agents on the usage rows of ``action_ids`` (every row when None); returns the rows."""
+    sql = "UPDATE facade_structureusage u SET live_agents = " + LIVE_AGENTS_SQL.format(action_id="u.action_id")
+    params: list[t.Any] = []
+    if action_ids is not None:
+        sql += " WHERE u.action_id = ANY(%s)"
+        params.append(list(action_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
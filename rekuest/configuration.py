@@ -8,7 +8,7 @@ with a ``ValidationError`` if they are not supplied via config or environment.
 """
 
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import (
@@ -54,6 +54,7 @@ class PostgresSettings(BaseModel):
     password: str = Field(description="Database password. Secret — must be set.")
     host: str = Field(description="Database host.")
     port: int = Field(default=5432, description="Database port.")
+    server_side_binding: bool = Field(default=False, description="Bind query parameters server-side (psycopg 3), so statements repeated with a stable text — e.g. the port matcher's cached demand plans — are prepared by the server.")
 
 
 class RedisSettings(BaseModel):
@@ -73,6 +74,13 @@ class RekuestBlock(BaseModel):
     grace_default: int = Field(default=30, description="Default reclaim grace window (seconds) after a disconnect.")
     grace_physical: int = Field(default=5, description="Grace window (seconds) for effect:physical work.")
     progress_lease: int = Field(default=0, description="Progress lease (seconds); 0 disables the wedged-task lease.")
+    task_board_interval: float = Field(default=2.0, description="Cadence (seconds) at which the taskBoard subscription pushes counter changes.")
+    resume_commit_skew: float = Field(default=5.0, description="How far (seconds) before a resume cursor the since-feeds replay, to catch events that committed after it with an older timestamp.")
+    scheduler: str = Field(default="least_in_flight", description="How an action-targeted assign picks among available implementations: least_in_flight, weighted, round_robin, first, or a dotted path to a facade.scheduling.Scheduler.")
+    assign_pipeline: Literal["sync", "async"] = Field(default="sync", description="How the assign mutation runs: sync (the whole assign in the ORM thread) or async (one ORM hop, then the queue push / webhook POST on the event loop).")
+    dispatch: Literal["inline", "outbox"] = Field(default="inline", description="How an assigned task's Assign is sent: inline (minted and pushed by the mutation) or outbox (a TaskOutbox row written with the task, drained in batches by a dispatcher loop).")
+    outbox_interval: float = Field(default=1.0, description="Longest time (seconds) an outbox row waits for the dispatcher when no commit wakes it; bounds the dispatch lag after a crash.")
+    outbox_lease: float = Field(default=60.0, description="How long (seconds) a dispatcher's claim on outbox rows lasts; rows not deleted by then are sent again.")
 
 
 class ProvenanceBlock(BaseModel):
@@ -59,6 +59,31 @@ REKUEST_GRACE = {
     "PROGRESS_LEASE": conf.rekuest.progress_lease,
 }
 
+# Seconds between two ``taskBoard`` pushes: counter changes within one interval are coalesced
+# into a single diff, so a busy org costs each dashboard one message per tick.
+REKUEST_TASK_BOARD_INTERVAL = conf.rekuest.task_board_interval
+
+# Seconds before the cursor event a resumed ``since`` feed starts replaying: events commit out
+# of id order, so one with an older id and timestamp can commit after the client's cursor.
+REKUEST_RESUME_COMMIT_SKEW = conf.rekuest.resume_commit_skew
+
+# How an assign by action / action hash picks among the action's available implementations
+# (``facade.scheduling``): a built-in name or a dotted path to a ``Scheduler`` subclass.
+REKUEST_SCHEDULER = conf.rekuest.scheduler
+
+# How the ``assign`` mutation runs: "sync" (``RedisControllBackend.assign`` in the thread pool)
+# or "async" (``aassign``: one ORM hop, then the delivery on the event loop).
+REKUEST_ASSIGN_PIPELINE = conf.rekuest.assign_pipeline
+
+# How an assigned task's Assign is sent: "inline" (by the mutation) or "outbox" (a
+# ``TaskOutbox`` row in the task's transaction, drained by ``facade.outbox``).
+REKUEST_DISPATCH = conf.rekuest.dispatch
+# Longest wait (seconds) of the outbox dispatcher between drains when nothing wakes it.
+REKUEST_OUTBOX_INTERVAL = conf.rekuest.outbox_interval
+# Seconds a dispatcher's claim on outbox rows lasts. The Assigns are sent outside any
+# transaction; rows still there once the lease expired (a crash mid-send) are sent again.
+REKUEST_OUTBOX_LEASE = conf.rekuest.outbox_lease
+
 # Application definition
 USE_X_FORWARDED_HOST = conf.django.use_x_forwarded_host
 
@@ -179,6 +204,9 @@ DATABASES = {
         "PASSWORD": conf.postgres.password,
         "HOST": conf.postgres.host,
         "PORT": conf.postgres.port,
+        # Server-side binding lets psycopg prepare statements it sees repeatedly (the port
+        # matcher renders one stable text per demand shape, see facade.managers).
+        "OPTIONS": {"server_side_binding": conf.postgres.server_side_binding},
     }
 }
 
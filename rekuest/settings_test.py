@@ -40,3 +40,6 @@ REKUEST_GRACE = {"DEFAULT": 0, "PHYSICAL": 0}
 # tests/integration/docker-compose.yaml). Replaces the old redis-factory monkeypatch.
 AGENT_REDIS_HOST = "localhost"
 AGENT_REDIS_PORT = 6666
+
+# Tick the taskBoard subscription fast enough for a test to observe a diff.
+REKUEST_TASK_BOARD_INTERVAL = 0.2
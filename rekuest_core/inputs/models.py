@@ -405,6 +405,7 @@ class ImplementationInputModel(BaseModel):
     effect: enums.EffectClass = Field(
         default=enums.EffectClass.NONE, description="The effect class of this implementation. NONE work is freely retryable/reclaimable; PHYSICAL work touches the real world and an ambiguous failure is terminal (never retried). Declared by the implementation here — never by the caller."
     )
+    max_concurrency: int = Field(default=0, ge=0, description="The most tasks of this implementation Rekuest dispatches to the agent at once; further tasks are held server-side until one finishes. 0 (the default) means unlimited.")
 
 
 class StateDefinitionInputModel(BaseModel):
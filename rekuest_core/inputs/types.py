@@ -474,6 +474,7 @@ class ImplementationInput:
     needs_token: bool = True
     provenance_audience: list[str] | None = None
     effect: enums.EffectClass = enums.EffectClass.NONE
+    max_concurrency: int = 0
     dependencies: list[AgentDependencyInput] = strawberry.field(default_factory=list)
 
 
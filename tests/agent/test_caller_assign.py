@@ -8,6 +8,9 @@ returns the same task with ``created=False``.
 ``parent`` is mandatory: an agent may only assign work beneath a task it is already running.
 Root tasks come solely from the GraphQL ``assign`` mutation, where the initiator is an
 accountable human (the human-root invariant in ``docs/design/provenance.md``).
+
+``AssignRequestBatch`` carries several such requests in one frame and is answered by one
+``AssignResponseBatch`` — same rules per request.
 """
 
 import pytest
@@ -68,3 +71,47 @@ class TestAssignRequest:
         assert "parent" in (result.error or "")
         assert await Task.objects.filter(reference="r-3").acount() == 0
         await session.disconnect()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+class TestAssignRequestBatch:
+    async def test_batch_acks_each_request_in_order(self, agent_ws):
+        session = await open_agent(agent_ws, "batchassign-agent")
+        impl = await build_implementation_for_agent(session.agent.pk, "batchassign")
+        parent = await build_task("batchassign-parent")
+
+        requests = [
+            messages.AssignRequest(reference="b-1", implementation=str(impl.pk), parent=str(parent.pk), args={"i": 1}),
+            messages.AssignRequest(reference="b-2", implementation=str(impl.pk), args={"i": 2}),  # parentless: refused alone
+            messages.AssignRequest(reference="b-3", implementation=str(impl.pk), parent=str(parent.pk), args={"i": 3}),
+        ]
+        batch = messages.AssignRequestBatch(requests=requests)
+        await session.send(batch)
+        result = await session.receive(messages.AssignResponseBatch)
+
+        assert result.request == batch.id
+        assert [r.request for r in result.responses] == [r.id for r in requests]
+        first, refused, third = result.responses
+        assert first.created is True and first.task and third.created is True and third.task
+        assert refused.task is None and "parent" in (refused.error or "")
+
+        # Resending the batch is idempotent per reference.
+        await session.send(messages.AssignRequestBatch(requests=[requests[0], requests[2]]))
+        again = await session.receive(messages.AssignResponseBatch)
+        assert [r.task for r in again.responses] == [first.task, third.task]
+        assert all(r.created is False for r in again.responses)
+        assert await Task.objects.filter(reference__in=["b-1", "b-2", "b-3"]).acount() == 2
+        await session.disconnect()
+
+    async def test_batch_dispatches_assign_commands_in_order(self, agent_ws):
+        session = await open_agent(agent_ws, "batchassign2-agent")
+        impl = await build_implementation_for_agent(session.agent.pk, "batchassign2")
+        parent = await build_task("batchassign2-parent")
+
+        await session.send(messages.AssignRequestBatch(requests=[messages.AssignRequest(reference=f"bd-{i}", implementation=str(impl.pk), parent=str(parent.pk), args={"i": i}) for i in range(3)]))
+
+        received = [await session.receive(messages.Assign) for _ in range(3)]
+        assert [a.args for a in received] == [{"i": 0}, {"i": 1}, {"i": 2}]
+        assert all(a.interface == impl.interface for a in received)
+        await session.disconnect()
@@ -1,12 +1,20 @@
-"""Redis round-trip: a backend ``broadcast`` is relayed to the connected agent."""
+"""Redis round-trip: a backend ``broadcast`` is relayed to the connected agent.
+
+A loaded ``Agent`` is delivered to without a lookup, and ``transport.deliver_to_agents``
+queues each agent's run of messages (one pipelined push) in order.
+"""
 
 import uuid
 
 import pytest
 from asgiref.sync import sync_to_async
 
-from facade import messages
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from facade import messages, transport
 from facade.consumers.async_consumer import AgentConsumer
+from facade.models import Agent
 
 from tests.agent.helpers import open_agent
 
@@ -32,3 +40,24 @@ class TestAgentDelivery:
         received = await session.receive(messages.Assign)
         assert received.task == assign.task
         assert received.args == {"a": 1}
+
+    async def test_broadcast_to_a_loaded_agent_skips_the_lookup(self, agent_ws):
+        session = await open_agent(agent_ws, "delivery-agent-2")
+        agent = await Agent.objects.aget(pk=session.agent_pk)
+
+        def _broadcast():
+            with CaptureQueriesContext(connection) as queries:
+                AgentConsumer.broadcast(agent, messages.Cancel(task="loaded-1"))
+            return len(queries.captured_queries)
+
+        assert await sync_to_async(_broadcast)() == 0
+        assert (await session.receive(messages.Cancel)).task == "loaded-1"
+
+    async def test_deliver_to_agents_keeps_each_run_in_order(self, agent_ws):
+        session = await open_agent(agent_ws, "delivery-agent-3")
+        agent = await Agent.objects.aget(pk=session.agent_pk)
+
+        await sync_to_async(transport.deliver_to_agents)([(agent, [messages.Interrupt(task=f"tree-{i}") for i in range(3)])])
+
+        received = [(await session.receive(messages.Interrupt)).task for _ in range(3)]
+        assert received == ["tree-0", "tree-1", "tree-2"]
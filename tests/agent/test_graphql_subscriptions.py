@@ -9,6 +9,9 @@ agent tests use) and asserts it receives the right *slim* events under the right
 - ``childTasks(id)`` — the whole descendant subtree of one task (direct children AND deeper ones,
   via the parent/root fan-out).
 - ``agents``   — slim agent changes across the organization (create/update/delete, FKs as bare ids).
+- ``since``    — the resumable form of the task feeds: the backlog after a cursor first, then live.
+- ``filter``   — ``tasks`` narrowed server-side, against the broadcast payload.
+- ``taskBoard`` — the org's server-maintained task counters: a snapshot, then diffs per tick.
 
 Sequencing note: the test channel layer is in-memory, so a broadcast only reaches a subscription
 that has *already joined* its group. Every test therefore does ``_start`` → ``sleep(WARMUP)`` →
@@ -19,9 +22,10 @@ import asyncio
 import json
 
 import pytest
+from asgiref.sync import sync_to_async
 from kante.testing.ws import GraphQLWebSocketTestClient
 
-from facade import messages
+from facade import channel_events, enums, filters, messages, task_board
 from rekuest.asgi import application
 from tests.agent.helpers import open_agent
 from tests.factories import (
@@ -61,6 +65,42 @@ CHILD_TASKS = """
     }
 """
 
+MYTASKS_SINCE = """
+    subscription MyTasks($since: ID!) {
+        mytasks(since: $since) {
+            create { id }
+            event { id task kind }
+        }
+    }
+"""
+
+CHILD_TASKS_SINCE = """
+    subscription ChildTasks($id: ID!, $since: DateTime!) {
+        childTasks(id: $id, since: $since) {
+            create { id }
+            update { id isDone }
+        }
+    }
+"""
+
+TASKS_FILTERED = """
+    subscription Tasks($filter: TaskChangeFilter!) {
+        tasks(filter: $filter) {
+            create { id agent }
+            event { task kind }
+        }
+    }
+"""
+
+TASK_BOARD = """
+    subscription {
+        taskBoard {
+            snapshot
+            counts { kind action agent count }
+        }
+    }
+"""
+
 AGENTS = """
     subscription {
         agents {
@@ -221,6 +261,47 @@ class TestTaskSubscriptions:
             assert created["root"] == str(root.id)
             await _stop(client)
 
+    async def test_tasks_filter_drops_other_agents_work(self, backend_stack):
+        # Same sentinel technique: a root run by another agent is dropped server-side, so the
+        # first create delivered is the one run by the filtered agent.
+        other = await seed_agent("sub-filter-other", token="test")
+        wanted = await seed_agent("sub-filter-wanted", token="test2")
+
+        async with GraphQLWebSocketTestClient(application, connection_params={"token": "test"}) as client:
+            await _start(client, TASKS_FILTERED, variables={"filter": {"agents": [str(wanted.pk)]}})
+            await asyncio.sleep(WARMUP)
+
+            await build_task_for_agent_caller(other.pk, "sub-filter-dropped")
+            sentinel = await build_task_for_agent_caller(wanted.pk, "sub-filter-kept")
+
+            msg = await _recv(client, lambda d: _create(d, "tasks") is not None)
+            create = _create(msg["payload"]["data"], "tasks")
+            assert create["id"] == str(sentinel.id) and create["agent"] == str(wanted.pk)
+            await _stop(client)
+
+    async def test_task_board_pushes_counter_diffs(self, backend_stack):
+        agent = await seed_agent("sub-board", token="test")
+        # The board lives in redis across test databases — start this org's from the table.
+        await sync_to_async(task_board.rebuild)(agent.organization_id)
+
+        def started(counts, **scope):
+            matches = [c["count"] for c in counts if c["kind"] == "STARTED" and c["action"] == scope.get("action") and c["agent"] == scope.get("agent")]
+            return matches[0] if matches else 0
+
+        async with GraphQLWebSocketTestClient(application, connection_params={"token": "test"}) as client:
+            await _start(client, TASK_BOARD)
+            msg = await _recv(client, lambda d: (d.get("taskBoard") or {}).get("snapshot") is True)
+            before = started(msg["payload"]["data"]["taskBoard"]["counts"])
+
+            task = await build_task_for_agent_caller(agent.pk, "sub-board-task")  # created STARTED
+
+            msg = await _recv(client, lambda d: (d.get("taskBoard") or {}).get("snapshot") is False)
+            counts = msg["payload"]["data"]["taskBoard"]["counts"]
+            assert started(counts) == before + 1
+            assert started(counts, action=str(task.action_id)) == 1
+            assert started(counts, agent=str(agent.pk)) >= 1
+            await _stop(client)
+
     async def test_agents_emits_slim_create_and_update(self, backend_stack):
         # The agents feed carries slim, non-traversable agent snapshots (FKs as bare ids).
         async with GraphQLWebSocketTestClient(application, connection_params={"token": "test"}) as client:
@@ -239,3 +320,85 @@ class TestTaskSubscriptions:
             msg = await _recv(client, lambda d: (d.get("agents") or {}).get("update") is not None)
             assert msg["payload"]["data"]["agents"]["update"]["id"] == str(agent.pk)
             await _stop(client)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+class TestResumableSubscriptions:
+    async def test_mytasks_since_replays_missed_events_then_streams(self, backend_stack):
+        agent = await seed_agent("sub-since", token="test")
+        root = await build_task_for_agent_caller(agent.pk, "sub-since-root")
+        seen = await build_task_event(root.pk, kind="PROGRESS", progress=10)
+        missed = await build_task_event(root.pk, kind="PROGRESS", progress=50)
+        late = await build_task_for_agent_caller(agent.pk, "sub-since-late")
+
+        async with GraphQLWebSocketTestClient(application, connection_params={"token": "test"}) as client:
+            await _start(client, MYTASKS_SINCE, variables={"since": str(seen.id)})
+
+            # The backlog: the root created after the cursor, then the event after it.
+            msg = await _recv(client, lambda d: _create(d) is not None)
+            assert _create(msg["payload"]["data"])["id"] == str(late.id)
+            msg = await _recv(client, lambda d: _event(d) is not None)
+            assert _event(msg["payload"]["data"])["id"] == str(missed.id)
+
+            # … then the live stream, with nothing replayed twice in between.
+            done = await build_task_event(root.pk, kind="COMPLETED")
+            msg = await _recv(client, lambda d: _event(d) is not None or _create(d) is not None)
+            assert _event(msg["payload"]["data"])["id"] == str(done.id)
+            await _stop(client)
+
+    async def test_mytasks_since_replays_older_ids_within_the_commit_skew(self, backend_stack):
+        agent = await seed_agent("sub-since-skew", token="test")
+        root = await build_task_for_agent_caller(agent.pk, "sub-since-skew-root")
+        # Lower id, but (say) committed after the client already saw ``cursor``.
+        older = await build_task_event(root.pk, kind="PROGRESS", progress=10)
+        cursor = await build_task_event(root.pk, kind="PROGRESS", progress=20)
+
+        async with GraphQLWebSocketTestClient(application, connection_params={"token": "test"}) as client:
+            await _start(client, MYTASKS_SINCE, variables={"since": str(cursor.id)})
+
+            msg = await _recv(client, lambda d: _event(d) is not None)
+            assert _event(msg["payload"]["data"])["id"] == str(older.id)
+            done = await build_task_event(root.pk, kind="COMPLETED")
+            msg = await _recv(client, lambda d: _event(d) is not None or _create(d) is not None)
+            assert _event(msg["payload"]["data"])["id"] == str(done.id)
+            await _stop(client)
+
+    @pytest.mark.parametrize("since", ["not-an-id", "0"])
+    async def test_mytasks_since_rejects_cursors_it_cannot_place(self, backend_stack, since):
+        await seed_agent(f"sub-since-bad-{since}", token="test")
+
+        async with GraphQLWebSocketTestClient(application, connection_params={"token": "test"}) as client:
+            await _start(client, MYTASKS_SINCE, variables={"since": since})
+
+            msg = await client.receive_until(lambda m: _is_data(m) or m.get("type") == "error", 6)
+            errors = msg["payload"]["errors"] if msg["type"] == "data" else [msg["payload"]]
+            assert "resume cursor" in errors[0]["message"]
+            await _stop(client)
+
+    async def test_child_tasks_since_replays_changed_descendants(self, backend_stack):
+        agent = await seed_agent("sub-child-since", token="test")
+        root = await build_task_for_agent_caller(agent.pk, "sub-child-since-root")
+        before = await build_task_for_agent_caller(agent.pk, "sub-child-since-old", parent=root, root=root)
+        cursor = before.updated_at
+        after = await build_task_for_agent_caller(agent.pk, "sub-child-since-new", parent=root, root=root)
+
+        async with GraphQLWebSocketTestClient(application, connection_params={"token": "test"}) as client:
+            await _start(client, CHILD_TASKS_SINCE, variables={"id": str(root.id), "since": cursor.isoformat()})
+
+            msg = await _recv(client, lambda d: _create(d, "childTasks") is not None)
+            assert _create(msg["payload"]["data"], "childTasks")["id"] == str(after.id)
+            await _stop(client)
+
+
+def test_task_change_filter_matches_the_payload_alone():
+    create = channel_events.TaskEventCreatedEvent(create=1, action=3, agent=5, acted_on=["@mikro/image:9"])
+    event = channel_events.TaskEventCreatedEvent(event=2, action=3, agent=5, kind="PROGRESS")
+
+    assert filters.TaskChangeFilter(actions=["3"], agents=["5"]).matches(create)
+    assert not filters.TaskChangeFilter(agents=["6"]).matches(create)
+    assert filters.TaskChangeFilter(acted_on=["@mikro/image:9", "x"]).matches(create)
+    assert not filters.TaskChangeFilter(acted_on=["x"]).matches(event)
+    # ``kinds`` narrows events only; task creates pass it.
+    only_done = filters.TaskChangeFilter(kinds=[enums.TaskEventKind.COMPLETED])
+    assert only_done.matches(create) and not only_done.matches(event)
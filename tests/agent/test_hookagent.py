@@ -79,6 +79,43 @@ def test_broadcast_to_webhook_posts_signed(post_recorder):
     assert call["headers"][hooks.SIGNATURE_HEADER] == hooks.sign("topsecret", body)
 
 
+@pytest.mark.django_db(transaction=True)
+def test_batched_webhook_delivery_posts_one_signed_array(post_recorder):
+    agent = _build_webhook_agent("hook-batch", secret="topsecret")
+    agent.hook_batch_window_ms = 60_000  # long enough that only the explicit flush sends
+    agent.save(update_fields=["hook_batch_window_ms"])
+
+    AgentConsumer.broadcast(str(agent.pk), messages.Cancel(task="ass-1"))
+    AgentConsumer.broadcast(str(agent.pk), messages.Interrupt(task="ass-2"))
+    assert post_recorder.calls == []  # buffered, not yet sent
+
+    assert hooks.batcher.flush(agent.pk) is True
+    assert len(post_recorder.calls) == 1
+    body = post_recorder.calls[0]["content"]
+    assert [m["type"] for m in json.loads(body)] == [
+        messages.ToAgentMessageType.CANCEL.value,
+        messages.ToAgentMessageType.INTERRUPT.value,
+    ]
+    assert post_recorder.calls[0]["headers"][hooks.SIGNATURE_HEADER] == hooks.sign("topsecret", body)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_batched_webhook_delivery_flushes_when_full(post_recorder):
+    agent = _build_webhook_agent("hook-batch-full")
+    agent.hook_batch_window_ms = 60_000
+    agent.hook_batch_max = 2
+    agent.save(update_fields=["hook_batch_window_ms", "hook_batch_max"])
+
+    for i in range(3):
+        AgentConsumer.broadcast(str(agent.pk), messages.Cancel(task=f"ass-{i}"))
+
+    assert len(post_recorder.calls) == 1  # the first two filled the batch
+    assert len(json.loads(post_recorder.calls[0]["content"])) == 2
+    assert agent.pk in hooks.batcher  # the third is still buffered
+    hooks.batcher.flush(agent.pk)
+    assert len(json.loads(post_recorder.calls[1]["content"])) == 1
+
+
 # --------------------------------------------------------------------------- #
 # Caller-event callback (signal → POST)
 # --------------------------------------------------------------------------- #
@@ -158,6 +195,33 @@ class TestHookIntake:
         assert refreshed.is_done is True
 
 
+    async def test_batched_events_over_http_reply_in_order(self, post_recorder):
+        agent = await build_webhook_agent("hook-in-batch", secret="sek")
+        first = await build_task("hook-in-batch-a")
+        second = await build_task("hook-in-batch-b")
+
+        batch = [
+            messages.Progress(task=str(first.pk), progress=50),
+            messages.Completed(task=str(first.pk)),
+            messages.Completed(task=str(second.pk)),
+        ]
+        body = ("[" + ",".join(m.model_dump_json() for m in batch) + "]").encode("utf-8")
+        request = RequestFactory().post(
+            f"/agi/http/{agent.pk}",
+            data=body,
+            content_type="application/json",
+            **{f"HTTP_{hooks.SIGNATURE_HEADER.upper().replace('-', '_')}": hooks.sign("sek", body)},
+        )
+        response = await hook_intake(request, str(agent.pk))
+
+        assert response.status_code == 200
+        data = json.loads(response.content)
+        assert data[0] == {}  # Progress has no reply
+        assert [d["event"] for d in data[1:]] == [batch[1].id, batch[2].id]
+        assert (await Task.objects.aget(pk=first.pk)).is_done is True
+        assert (await Task.objects.aget(pk=second.pk)).is_done is True
+
+
 # --------------------------------------------------------------------------- #
 # Connectivity — a webhook agent is selectable despite connected=False
 # --------------------------------------------------------------------------- #
@@ -40,6 +40,49 @@ def test_deliver_to_agent_routes_by_kind(monkeypatch):
     assert len(posted) == 1 and posted[0][0] is hook
 
 
+@pytest.mark.django_db(transaction=True)
+def test_caller_event_mirror_is_pushed_to_the_caller_agents_queue(monkeypatch):
+    from facade.models import Agent, TaskEvent
+    from tests.factories import _build_task, _build_task_for_agent_caller
+
+    pushed = []
+    monkeypatch.setattr(transport.RedisAgentQueue, "from_settings", classmethod(lambda cls: type("Q", (), {"push": lambda self, a, b: pushed.append((a, b))})()))
+
+    executor = _build_task("mirror-exec")  # just to have an agent to be the caller
+    agent = Agent.objects.get(pk=executor.agent_id)
+    Agent.objects.filter(pk=agent.pk).update(kind=enums.AgentKind.WEBSOCKET.value, connected=True, last_seen=timezone.now())
+    task = _build_task_for_agent_caller(agent.pk, "mirror")
+    transport.forget_caller_agents()
+
+    event = TaskEvent.objects.create(task=task, kind=enums.TaskEventKind.PROGRESS, progress=42)
+
+    # Built once at event creation and queued already serialized for the caller agent — no
+    # channel-layer group in between.
+    mirrors = [messages.ProgressEvent.model_validate_json(b) for a, b in pushed if a == str(agent.pk)]
+    assert len(mirrors) == 1
+    assert mirrors[0].task == str(task.pk) and mirrors[0].event == str(event.pk) and mirrors[0].progress == 42
+
+
+@pytest.mark.django_db(transaction=True)
+def test_caller_event_mirror_skips_an_offline_caller_agent(monkeypatch):
+    from facade.models import Agent, TaskEvent
+    from tests.factories import _build_task, _build_task_for_agent_caller
+
+    pushed = []
+    monkeypatch.setattr(transport.RedisAgentQueue, "from_settings", classmethod(lambda cls: type("Q", (), {"push": lambda self, a, b: pushed.append((a, b))})()))
+
+    executor = _build_task("mirror-off-exec")
+    agent = Agent.objects.get(pk=executor.agent_id)
+    # Connected on paper, but its heartbeat lapsed: nobody drains its queue.
+    Agent.objects.filter(pk=agent.pk).update(kind=enums.AgentKind.WEBSOCKET.value, connected=True, last_seen=timezone.now() - timedelta(hours=1))
+    task = _build_task_for_agent_caller(agent.pk, "mirror-off")
+    transport.forget_caller_agents()
+
+    TaskEvent.objects.create(task=task, kind=enums.TaskEventKind.PROGRESS, progress=42)
+
+    assert [a for a, _ in pushed if a == str(agent.pk)] == []
+
+
 @pytest.mark.django_db(transaction=True)
 @pytest.mark.asyncio
 class TestReconcileOps:
@@ -205,8 +205,8 @@ def _build_task_for_agent_caller(agent_pk, prefix, parent=None, root=None):
     """A task whose ``caller`` is the agent's own identity.
 
     Used by the caller-event return tests: because the task's caller matches the
-    registered agent's caller (group ``task_caller_{caller_id}``), events on it are streamed
-    back to that agent's socket as ``Caller*`` messages.
+    registered agent's caller identity, events on it are pushed onto that agent's queue and
+    streamed back to its socket as ``…Event`` messages.
 
     ``parent``/``root`` wire the task into a tree — pass ``parent=root_task, root=root_task``
     for a direct child, or ``parent=child, root=root_task`` for a deeper descendant. Leaving
@@ -266,7 +266,7 @@ def _build_task_event(task_pk, kind=enums.TaskEventChoices.COMPLETED, message=No
     )
 
 
-def _build_implementation_for_agent(agent_pk, prefix, needs_token=True):
+def _build_implementation_for_agent(agent_pk, prefix, needs_token=True, max_concurrency=0):
     """An Action + Implementation owned by ``agent`` (connectable assign target)."""
     agent = Agent.objects.select_related("app", "release", "organization").get(pk=agent_pk)
     action = Action.objects.create(
@@ -284,6 +284,7 @@ def _build_implementation_for_agent(agent_pk, prefix, needs_token=True):
         action=action,
         agent=agent,
         needs_token=needs_token,
+        max_concurrency=max_concurrency,
     )
 
 
@@ -13,6 +13,7 @@ from kante.context import HttpContext
 from authentikate.models import App, Client, Release
 
 from facade import models
+from facade.mutations.implementation import rebuild_state_definition_ports
 from facade.schema import schema
 
 AGENTS_QUERY = """
@@ -35,6 +36,7 @@ def _seed_agents(context):
         description="counter",
         ports=[{"key": "count", "kind": "INT", "identifier": None, "nullable": False, "children": []}],
     )
+    rebuild_state_definition_ports(counter_definition)
 
     agents = {}
     for name, with_state in [("stateful", True), ("stateless", False)]:
@@ -11,7 +11,8 @@ from types import SimpleNamespace
 import pytest
 
 from facade import managers, models
-from facade.descriptors import compile_descriptors_to_jsonpath
+from facade.descriptors import compile_descriptors_to_jsonpath, descriptor_facts
+from facade.fingerprints import refresh_fingerprints
 from rekuest_core.enums import PortKind
 
 from tests.factories import create_action_for_organization, create_registry_bundle
@@ -60,6 +61,7 @@ def _make_ports(action, specs, PortModel, descriptor_key, parent=None, parent_pa
             kind=spec.get("kind"),
             identifier=spec.get("identifier"),
             compiled_jsonpath=compile_descriptors_to_jsonpath([SimpleNamespace(**d) for d in spec.get(descriptor_key, [])]),
+            descriptor_facts=descriptor_facts([SimpleNamespace(**d) for d in spec.get(descriptor_key, [])]),
             nullable=bool(spec.get("nullable", False)),
         )
         _make_ports(action, spec.get("children", []), PortModel, descriptor_key, parent=row, parent_path=current_path)
@@ -72,6 +74,7 @@ def make_action(org, prefix, args=None, returns=None):
     action.arg_count = len(args or [])
     action.return_count = len(returns or [])
     action.save(update_fields=["arg_count", "return_count"])
+    refresh_fingerprints(action)
     return action
 
 
@@ -153,6 +156,22 @@ def test_micro_constraint_rejected(catalog):
     assert set(ids) == {catalog.a2.id}
 
 
+def test_micro_constraint_list_candidate_passes_the_fact_prefilter(catalog):
+    # JSONPath compares a list candidate element-wise; the descriptor facts must too.
+    ids = port_demand_ids([pm(identifier="@mikro/image", descriptors={"axes": ["z", "c"]})], type="args")
+    assert set(ids) == {catalog.a1.id, catalog.a2.id, catalog.a3.id}
+
+
+def test_descriptor_first_search(catalog):
+    def search(**descriptors):
+        subquery = managers.get_action_descriptor_subquery([SimpleNamespace(key=k, value=v) for k, v in descriptors.items()], organization_id=catalog.org1.id)
+        return set(models.Action.objects.filter(id__in=subquery).values_list("id", flat=True))
+
+    # Only ports that constrain the descriptor count: a2's unconstrained image port does not.
+    assert search(axes="c") == {catalog.a1.id}
+    assert search(axes="z") == set()
+
+
 def test_nested_match_two_levels_deep(catalog):
     # options(DICT) -> advanced(DICT) -> mask(STRUCTURE @mikro/mask): only a2.
     demand = pm(
@@ -0,0 +1,66 @@
+"""Ranked action search (``facade.search``, the ``searchActions`` query).
+
+Actions match when every typed term prefixes a word of their name, key, description or
+collection names, or when their name contains the text; a name that starts with the text
+ranks first.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from facade import search
+from facade.models import Action, Collection
+
+from tests.factories import create_action_for_organization, create_registry_bundle
+
+
+@pytest.fixture
+def catalog(db):
+    user, _, org, _ = create_registry_bundle("search")
+    _, _, other_org, _ = create_registry_bundle("search-other")
+    segment = create_action_for_organization(org, "seg", name="Segment Image", key="segment_image", description="Stardist nuclei segmentation")
+    threshold = create_action_for_organization(org, "thr", name="Threshold", key="otsu_threshold", description="Binarize an image")
+    measure = create_action_for_organization(org, "mea", name="Measure Areas", key="measure", description="Region statistics")
+    measure.collections.add(Collection.objects.create(name="Morphometry", description="", creator=user, organization=org))
+    foreign = create_action_for_organization(other_org, "for", name="Segment Cells", key="segment_cells", description="")
+    return SimpleNamespace(org=org, segment=segment, threshold=threshold, measure=measure, foreign=foreign)
+
+
+def ids(text, catalog, **kwargs):
+    return [action.id for action in search.search_actions(text, catalog.org.id, **kwargs)]
+
+
+def test_prefix_terms_match_any_field(catalog):
+    assert ids("segm", catalog) == [catalog.segment.id]
+    assert ids("otsu", catalog) == [catalog.threshold.id]
+    assert ids("morpho", catalog) == [catalog.measure.id]
+    assert ids("nuclei seg", catalog) == [catalog.segment.id]
+
+
+def test_name_prefix_ranks_first_and_pages(catalog):
+    # "image" is in segment's name and threshold's description; the name match wins.
+    assert ids("image", catalog) == [catalog.segment.id, catalog.threshold.id]
+    assert ids("image", catalog, limit=1, offset=1) == [catalog.threshold.id]
+
+
+def test_the_vector_follows_every_write(catalog):
+    # A full save of an instance whose in-memory vector is stale.
+    catalog.segment.description = "Cellpose masks"
+    catalog.segment.save()
+    assert ids("cellpose", catalog) == [catalog.segment.id]
+    assert ids("stardist", catalog) == []
+
+    # A bulk update, a collection rename and a membership change bypass save() entirely.
+    Action.objects.filter(pk=catalog.threshold.pk).update(key="li_minimum")
+    assert ids("minim", catalog) == [catalog.threshold.id]
+    Collection.objects.filter(name="Morphometry").update(name="Histology")
+    assert ids("histo", catalog) == [catalog.measure.id]
+    catalog.measure.collections.clear()
+    assert ids("histo", catalog) == []
+
+
+def test_empty_or_symbol_only_queries(catalog):
+    assert ids("   ", catalog) == []
+    assert search.prefix_query("&|!") is None
+    assert ids("&|!", catalog) == []
@@ -0,0 +1,98 @@
+"""Level-batched dependency resolution (``logic.auto_resolve``).
+
+The whole tree is resolved one level at a time, each level in a fixed number of statements:
+the query count depends on the tree's depth, not on how many dependencies a level holds.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rekuest_core.inputs.models import ImplementationInputModel
+
+from facade import models
+from facade.logic import auto_resolve
+from facade.mutations.implementation import _create_implementation
+
+from tests.factories import _build_state_for_agent, create_agent_for_registry, create_registry_bundle
+
+WIDTH = 4
+
+
+def _implementation(name, dependencies=()):
+    return ImplementationInputModel.model_validate(
+        {
+            "interface": name.lower(),
+            "definition": {"key": name.lower(), "version": "1", "name": name, "kind": "FUNCTION", "args": [], "returns": []},
+            "dependencies": [{"key": dependency.lower(), "action_dependencies": [{"key": dependency.lower(), "demand": {"name": dependency}}], "prefered_instances": 1} for dependency in dependencies],
+        }
+    )
+
+
+def _agent(org, prefix):
+    user, _, _, caller = create_registry_bundle(prefix)
+    return create_agent_for_registry(caller, user, org, prefix)
+
+
+@pytest.fixture
+def tree(db):
+    """orchestrate -> step0..step3 (one worker); step0 -> leaf (another agent)."""
+    user, _, org, caller = create_registry_bundle("batchres")
+    orchestrator = create_agent_for_registry(caller, user, org, "batchres-main")
+    worker = _agent(org, "batchres-worker")
+    leaf_agent = _agent(org, "batchres-leaf")
+
+    leaf = _create_implementation(_implementation("Leaf"), leaf_agent)
+    steps = [_create_implementation(_implementation(f"Step{i}", ["Leaf"] if i == 0 else []), worker) for i in range(WIDTH)]
+    main = _create_implementation(_implementation("Orchestrate", [f"Step{i}" for i in range(WIDTH)]), orchestrator)
+    info = SimpleNamespace(context=SimpleNamespace(request=SimpleNamespace(organization=org, user=user)))
+    return SimpleNamespace(org=org, user=user, info=info, main=main, steps=steps, leaf=leaf)
+
+
+def test_tree_is_resolved_level_by_level(tree):
+    resolution = models.Resolution.objects.create(name="batchres", implementation=tree.main, creator=tree.user, organization=tree.org)
+
+    with CaptureQueriesContext(connection) as ctx:
+        auto_resolve(tree.info, tree.main, resolution)
+
+    top = {resolved.key: resolved for resolved in models.ResolvedDependency.objects.filter(resolution=resolution)}
+    assert {key: resolved.implementation_id for key, resolved in top.items()} == {f"step{i}": step.id for i, step in enumerate(tree.steps)}
+
+    # step0 has a dependency of its own, resolved into its own downstream resolution.
+    downstream = top["step0"].down_stream_resolution
+    assert downstream is not None and downstream.implementation_id == tree.steps[0].id
+    assert list(downstream.resolved_dependencies.values_list("key", "implementation_id")) == [("leaf", tree.leaf.id)]
+    assert all(top[f"step{i}"].down_stream_resolution is None for i in range(1, WIDTH))
+
+    # Three levels (the last one finds no dependencies), at most five statements each.
+    assert len(ctx) <= 11, "\n".join(query["sql"][:120] for query in ctx.captured_queries)
+
+
+def test_unprovided_demand_raises(tree):
+    # The Leaf action still exists, but no agent implements it any more.
+    models.Implementation.objects.filter(pk=tree.leaf.pk).delete()
+    resolution = models.Resolution.objects.create(name="batchres-missing", implementation=tree.main, creator=tree.user, organization=tree.org)
+
+    with pytest.raises(ValueError, match="No agent found that can satisfy dependency leaf"):
+        auto_resolve(tree.info, tree.main, resolution)
+
+
+def test_state_only_dependency_needs_a_matching_state(tree):
+    watcher = ImplementationInputModel.model_validate(
+        {
+            "interface": "watch",
+            "definition": {"key": "watch", "version": "1", "name": "Watch", "kind": "FUNCTION", "args": [], "returns": []},
+            "dependencies": [{"key": "stage", "state_dependencies": [{"key": "position", "demand": {"hash": "batchres-stage-state-hash"}}], "prefered_instances": 1}],
+        }
+    )
+    watch = _create_implementation(watcher, _agent(tree.org, "batchres-watch"))
+    resolution = models.Resolution.objects.create(name="batchres-state", implementation=watch, creator=tree.user, organization=tree.org)
+
+    with pytest.raises(ValueError, match="No agent found that can satisfy dependency stage"):
+        auto_resolve(tree.info, watch, resolution)
+
+    # Any agent of the org carrying the State satisfies it; there is nothing to bind.
+    _build_state_for_agent(tree.leaf.agent_id, "stage", "batchres-stage")
+    auto_resolve(tree.info, watch, resolution)
+    assert not resolution.resolved_dependencies.exists()
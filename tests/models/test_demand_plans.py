@@ -0,0 +1,67 @@
+"""Compiled demand plans (``facade.managers.demand_plans``).
+
+A demand's statement depends only on its shape, so it is rendered once per shape and later
+demands of that shape are only bound: same text, their own values, the same results as a
+freshly rendered statement.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from facade import managers
+from facade.management.commands import bench_demand_plans
+from rekuest_core.enums import PortKind
+
+from tests.factories import create_registry_bundle
+from tests.models.test_action_matching import action_demand, make_action, pm
+
+
+def _demand(identifier):
+    return SimpleNamespace(kind="args", matches=[pm(kind=PortKind.STRUCTURE, identifier=identifier, nullable=False)], force_length=None, force_non_nullable_length=None, force_structure_length=None)
+
+
+@pytest.fixture
+def catalog(db):
+    _, _, org, _ = create_registry_bundle("plans")
+    a1 = make_action(org, "plans-a1", args=[{"key": "image", "kind": "STRUCTURE", "identifier": "@mikro/image", "nullable": False}])
+    a2 = make_action(
+        org,
+        "plans-a2",
+        args=[{"key": "image", "kind": "STRUCTURE", "identifier": "@mikro/image", "nullable": True}, {"key": "options", "kind": "DICT", "children": [{"key": "mask", "kind": "STRUCTURE", "identifier": "@mikro/mask"}]}],
+    )
+    return SimpleNamespace(org=org, a1=a1, a2=a2)
+
+
+def test_repeated_shape_reuses_the_plan(catalog):
+    managers.demand_plans.clear()
+
+    image = managers.get_action_ids_by_port_demands([_demand("@mikro/image")], organization_id=catalog.org.id)
+    assert len(managers.demand_plans) == 1
+    mask = managers.get_action_ids_by_port_demands([_demand("@mikro/mask")], organization_id=catalog.org.id)
+    assert len(managers.demand_plans) == 1
+
+    assert set(image) == {catalog.a1.id}  # a2's image port is nullable
+    assert mask == []  # the mask port is nested, not a root
+    first_sql, first_params = managers._port_demand_statement([_demand("@mikro/image")], catalog.org.id)
+    second_sql, second_params = managers._port_demand_statement([_demand("@mikro/mask")], catalog.org.id)
+    assert first_sql == second_sql and first_params != second_params
+
+    # A cold render answers the same.
+    managers.demand_plans.clear()
+    assert managers.get_action_ids_by_port_demands([_demand("@mikro/image")], organization_id=catalog.org.id) == image
+
+
+def test_action_demand_plans_are_shared_across_values(catalog):
+    managers.demand_plans.clear()
+
+    by_name = [managers.get_action_ids_by_action_demands([action_demand(name=action.name)])[0] for action in (catalog.a1, catalog.a2)]
+
+    assert by_name == [[catalog.a1.id], [catalog.a2.id]]
+    assert len(managers.demand_plans) == 1
+
+
+def test_benchmark_runs_every_workload():
+    for render in bench_demand_plans.workloads().values():
+        assert bench_demand_plans.throughput(render, 10, cold=True) > 0
+        assert bench_demand_plans.throughput(render, 10, cold=False) > 0
@@ -1,7 +1,7 @@
 """Registration write-path efficiency and safety.
 
-Pins the three write-path properties: relational ports are bulk-created level-by-level
-(query count scales with tree DEPTH, not port count), reconnecting with an unchanged
+Pins the three write-path properties: relational ports are synced, missing rows bulk-created
+level-by-level (query count scales with tree DEPTH, not port count), reconnecting with an unchanged
 definition hash skips the rebuild entirely (while legacy actions missing relational state
 are still healed), and ``_create_implementation`` is atomic — a mid-flight failure leaves
 no partial Action/port rows behind.
@@ -61,18 +61,23 @@ def test_rebuild_query_count_scales_with_depth_not_ports(django_assert_max_num_q
     implementation = _create_implementation(_implementation_input(), agent)
     action = implementation.action
     definition = _implementation_input().definition
+    models.ArgPort.objects.filter(action=action).delete()
+    models.ReturnPort.objects.filter(action=action).delete()
 
-    # 9 total port rows across depth 3 (args) + depth 1 (returns): the bulk path needs one
-    # INSERT per level per table (3 + 1), plus Django's delete-cascade collector (3 per table)
-    # and the counts update = 11 — below the old one-INSERT-per-port floor (9 inserts + 6
-    # delete queries + update = 16), and constant in port count for a fixed depth.
-    with django_assert_max_num_queries(11):
+    # 9 total port rows across depth 3 (args) + depth 1 (returns): the sync reads each table
+    # once and needs one INSERT per level per table (3 + 1) = 6 — constant in port count for
+    # a fixed depth.
+    with django_assert_max_num_queries(6):
         rebuild_relational_ports(action, definition)
 
     assert action.arg_ports.count() == 8
     assert action.return_ports.count() == 1
     assert action.arg_ports.get(key_path="options.nested.deep").kind == "INT"
 
+    # Rows already in line with the definition are only read.
+    with django_assert_max_num_queries(2):
+        rebuild_relational_ports(action, definition)
+
 
 @pytest.mark.django_db
 def test_reconnect_same_definition_skips_rebuild(monkeypatch, django_assert_max_num_queries):
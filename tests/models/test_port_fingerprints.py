@@ -0,0 +1,76 @@
+"""Port fingerprints (``facade.fingerprints``) and the matcher's containment fast path.
+
+``rebuild_relational_ports`` stores the fingerprints of an action's root ports; a purely
+structural root match is then answered by ``@>`` on them instead of a correlated ``EXISTS``,
+with the same result. Matches on key, nullable, descriptors or children keep the EXISTS engine.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from facade import managers
+from facade.fingerprints import fingerprint, match_fingerprint
+from facade.mutations.implementation import rebuild_relational_ports
+from rekuest_core.enums import PortKind
+from rekuest_core.inputs.models import DefinitionInputModel
+
+from tests.factories import create_action_for_organization, create_registry_bundle
+from tests.models.test_action_matching import pm
+
+
+def make_registered_action(org, prefix, args):
+    definition = DefinitionInputModel.model_validate({"key": prefix, "version": "1", "name": prefix, "kind": "FUNCTION", "args": args, "returns": []})
+    action = create_action_for_organization(org, prefix, args=[port.model_dump() for port in definition.args], returns=[])
+    rebuild_relational_ports(action, definition)
+    return action
+
+
+def exact_args_ids(matches, force_length, organization_id):
+    demand = SimpleNamespace(kind="args", matches=matches, force_length=force_length, force_non_nullable_length=None, force_structure_length=None)
+    return set(managers.get_action_ids_by_port_demands([demand], organization_id=organization_id))
+
+
+@pytest.fixture
+def catalog(db):
+    _, _, org, _ = create_registry_bundle("fingerprint")
+    image_int = make_registered_action(
+        org,
+        "fp-image-int",
+        [{"key": "image", "kind": "STRUCTURE", "identifier": "@mikro/image", "nullable": False}, {"key": "n", "kind": "INT", "nullable": False}],
+    )
+    int_image = make_registered_action(
+        org,
+        "fp-int-image",
+        [{"key": "n", "kind": "INT", "nullable": False}, {"key": "image", "kind": "STRUCTURE", "identifier": "@mikro/image", "nullable": True}],
+    )
+    image_only = make_registered_action(org, "fp-image", [{"key": "image", "kind": "STRUCTURE", "identifier": "@mikro/image", "nullable": False}])
+    return SimpleNamespace(org=org, image_int=image_int, int_image=int_image, image_only=image_only)
+
+
+def test_rebuild_stores_root_fingerprints(catalog):
+    catalog.image_int.refresh_from_db()
+    assert fingerprint(0, "STRUCTURE", "@mikro/image", None) in catalog.image_int.arg_fingerprints
+    assert fingerprint("*", "INT", None, None) in catalog.image_int.arg_fingerprints
+    assert fingerprint(1, None, None, None) in catalog.image_int.arg_fingerprints
+    assert catalog.image_int.return_fingerprints == []
+
+
+def test_exact_positional_signature(catalog):
+    matches = [pm(at=0, identifier="@mikro/image"), pm(at=1, kind=PortKind.INT)]
+    assert exact_args_ids(matches, 2, catalog.org.id) == {catalog.image_int.id}
+
+    # Unpositioned, the order no longer matters; the length still does.
+    matches = [pm(identifier="@mikro/image"), pm(kind=PortKind.INT)]
+    assert exact_args_ids(matches, 2, catalog.org.id) == {catalog.image_int.id, catalog.int_image.id}
+    assert exact_args_ids([pm(kind=PortKind.STRUCTURE)], None, catalog.org.id) == {catalog.image_int.id, catalog.int_image.id, catalog.image_only.id}
+
+
+def test_non_structural_matches_keep_the_exists_engine(catalog):
+    assert match_fingerprint(pm(identifier="@mikro/image", nullable=True)) is None
+    assert match_fingerprint(pm(key="image")) is None
+    assert match_fingerprint(pm()) is None
+
+    # Mixed: the fingerprinted INT match and the EXISTS-evaluated nullable match combine.
+    matches = [pm(kind=PortKind.INT), pm(identifier="@mikro/image", nullable=True)]
+    assert exact_args_ids(matches, None, catalog.org.id) == {catalog.int_image.id}
@@ -0,0 +1,86 @@
+"""Diff-based port-row sync on re-registration (``rebuild_relational_ports``).
+
+Rows are keyed by ``key_path``: unchanged rows keep their pk and are not written, a changed
+port is updated in place, removed ports are deleted with their subtree and new ones inserted.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rekuest_core.inputs.models import DefinitionInputModel
+
+from facade import managers
+from facade.management.commands.bench_port_sync import port_tree
+from facade.mutations.implementation import rebuild_relational_ports
+
+from tests.factories import create_action_for_organization, create_registry_bundle
+
+
+def _definition(fields=100, **changes):
+    return DefinitionInputModel.model_validate(
+        {"key": "sync", "version": "1", "name": "Sync", "kind": "FUNCTION", "args": [port.model_dump() for port in port_tree(fields, **changes)], "returns": []}
+    )
+
+
+def _match(**fields):
+    shape = dict(at=None, key=None, kind=None, identifier=None, nullable=None, descriptors=None, children=None)
+    shape.update(fields)
+    return SimpleNamespace(**shape)
+
+
+def _nested_image_demand(axes):
+    """An ``options`` field holding an image whose data carries ``axes``."""
+    image = _match(identifier="@mikro/image", descriptors=[SimpleNamespace(key="axes", value=axes)])
+    options = _match(key="options", children=[_match(children=[image])])
+    return SimpleNamespace(hash=None, key=None, app=None, version=None, name=None, arg_matches=[options], return_matches=None, force_arg_length=None, force_return_length=None, protocols=None)
+
+
+def _rows(action):
+    return dict(action.arg_ports.values_list("key_path", "id"))
+
+
+@pytest.fixture
+def action(db):
+    _, _, org, _ = create_registry_bundle("portsync")
+    action = create_action_for_organization(org, "portsync")
+    rebuild_relational_ports(action, _definition())
+    return action
+
+
+def test_one_descriptor_change_updates_one_row(action):
+    before = _rows(action)
+    assert len(before) == 501
+
+    with CaptureQueriesContext(connection) as ctx:
+        rebuild_relational_ports(action, _definition(axes="z"))
+
+    writes = [query["sql"] for query in ctx.captured_queries if not query["sql"].startswith("SELECT")]
+    assert len(writes) == 1 and writes[0].startswith("UPDATE")
+    assert _rows(action) == before
+    assert action.arg_ports.get(key_path="options.field0.image").compiled_jsonpath == '$.axes == "z"'
+
+    assert managers.get_action_ids_by_action_demands([_nested_image_demand("z")], organization_id=action.organization_id) == [[action.id]]
+
+
+def test_added_and_removed_ports_touch_only_their_rows(action):
+    before = _rows(action)
+
+    rebuild_relational_ports(action, _definition(extra=True))
+    added = _rows(action)
+    assert set(added) - set(before) == {"options.field100", "options.field100.image", "options.field100.rois", "options.field100.rois.item", "options.field100.threshold"}
+    assert all(added[path] == pk for path, pk in before.items())
+    assert action.arg_ports.get(key_path="options.field100.rois.item").parent_id == added["options.field100.rois"]
+
+    rebuild_relational_ports(action, _definition(fields=99))
+    assert _rows(action) == {path: pk for path, pk in before.items() if not path.startswith("options.field99")}
+
+
+def test_repeated_sibling_keys_fall_back_to_replacing(action):
+    definition = DefinitionInputModel.model_validate(
+        {"key": "sync", "version": "1", "name": "Sync", "kind": "FUNCTION", "args": [{"key": "x", "kind": "INT"}, {"key": "x", "kind": "FLOAT"}], "returns": []}
+    )
+    rebuild_relational_ports(action, definition)
+    assert list(action.arg_ports.order_by("index").values_list("key_path", "kind")) == [("x", "INT"), ("x", "FLOAT")]
+
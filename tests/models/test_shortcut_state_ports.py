@@ -0,0 +1,92 @@
+"""Relational port rows of Shortcuts and StateDefinitions.
+
+Both flatten their JSON ports into their own port tables (``ShortcutArgPort``/
+``ShortcutReturnPort``, ``StatePort``), so their demands get the action matcher's full
+semantics: nested children at any depth, ``nullable`` and requires/provides descriptors.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from facade import managers, models
+from facade.mutations.implementation import rebuild_shortcut_ports, rebuild_state_definition_ports
+from rekuest_core.enums import PortKind
+
+from tests.factories import create_registry_bundle
+
+IMAGE = {"key": "image", "kind": "STRUCTURE", "identifier": "@mikro/image", "nullable": False, "requires": [{"key": "axes", "operator": "EQUALS", "value": "c"}]}
+MASK = {"key": "mask", "kind": "STRUCTURE", "identifier": "@mikro/image", "nullable": True}
+
+
+def pm(at=None, key=None, kind=None, identifier=None, descriptors=None, nullable=None, children=None):
+    descriptor_list = [SimpleNamespace(key=k, value=v) for k, v in (descriptors or {}).items()] or None
+    return SimpleNamespace(at=at, key=key, kind=kind, identifier=identifier, descriptors=descriptor_list, nullable=nullable, children=children)
+
+
+def pd(*matches, kind="args", force_length=None):
+    return SimpleNamespace(kind=kind, matches=list(matches), force_length=force_length, force_non_nullable_length=None, force_structure_length=None)
+
+
+@pytest.fixture
+def shortcuts(db):
+    user, client, org, _ = create_registry_bundle("scports")
+    toolbox = models.Toolbox.objects.create(name="default", description="", creator=user, client=client, organization=org)
+
+    def shortcut(name, args):
+        created = models.Shortcut.objects.create(name=name, toolbox=toolbox, creator=user, args=args, returns=[])
+        rebuild_shortcut_ports(created)
+        return created
+
+    return SimpleNamespace(image=shortcut("image", [IMAGE]), mask=shortcut("mask", [MASK]), both=shortcut("both", [IMAGE, MASK]))
+
+
+def shortcut_ids(*demands):
+    return set(managers.get_action_ids_by_port_demands(list(demands), model="facade_shortcut"))
+
+
+def test_shortcut_ports_are_flattened(shortcuts):
+    assert list(shortcuts.both.arg_ports.order_by("index").values_list("key_path", "nullable")) == [("image", False), ("mask", True)]
+
+    rebuild_shortcut_ports(shortcuts.both)
+    assert shortcuts.both.arg_ports.count() == 2
+
+
+def test_shortcut_demands_match_nullable_and_descriptors(shortcuts):
+    assert shortcut_ids(pd(pm(identifier="@mikro/image", nullable=True))) == {shortcuts.mask.id, shortcuts.both.id}
+    assert shortcut_ids(pd(pm(identifier="@mikro/image", descriptors={"axes": "c"}, nullable=False))) == {shortcuts.image.id, shortcuts.both.id}
+    assert shortcut_ids(pd(pm(identifier="@mikro/image", descriptors={"axes": "z"}, nullable=False))) == set()
+    assert shortcut_ids(pd(pm(identifier="@mikro/image"), force_length=1)) == {shortcuts.image.id, shortcuts.mask.id}
+
+
+@pytest.fixture
+def nested_state(db):
+    definition = models.StateDefinition.objects.create(
+        name="Tracks",
+        hash="nested-state-hash",
+        description="tracks",
+        ports=[
+            {
+                "key": "tracks",
+                "kind": "LIST",
+                "nullable": False,
+                "children": [{"key": "track", "kind": "DICT", "nullable": False, "children": [{"key": "roi", "kind": "STRUCTURE", "identifier": "@mikro/roi", "nullable": False, "provides": [{"key": "dims", "operator": "EQUALS", "value": 2}]}]}],
+            }
+        ],
+    )
+    rebuild_state_definition_ports(definition)
+    return definition
+
+
+def test_state_matches_below_the_first_level(nested_state):
+    roi = pm(identifier="@mikro/roi")
+    list_of_dicts_of_rois = pm(kind=PortKind.LIST, children=[pm(kind=PortKind.DICT, children=[roi])])
+    assert managers.get_state_ids_by_demands([list_of_dicts_of_rois]) == [nested_state.id]
+
+    wrong_dims = pm(kind=PortKind.LIST, children=[pm(kind=PortKind.DICT, children=[pm(identifier="@mikro/roi", descriptors={"dims": 3})])])
+    assert managers.get_state_ids_by_demands([wrong_dims]) == []
+
+
+def test_state_batch_keeps_demand_order(nested_state):
+    found, missing = managers.get_state_ids_by_demand_batch([[pm(kind=PortKind.LIST)], [pm(kind=PortKind.INT)]])
+    assert (found, missing) == ([nested_state.id], [])
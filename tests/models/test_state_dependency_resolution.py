@@ -15,7 +15,7 @@ from rekuest_core.inputs.models import ImplementationInputModel, StateDependency
 
 from facade import models
 from facade.logic import auto_resolve
-from facade.mutations.implementation import _create_implementation
+from facade.mutations.implementation import _create_implementation, rebuild_state_definition_ports
 
 from tests.factories import create_agent_for_registry, create_registry_bundle
 
@@ -76,6 +76,7 @@ def setup(db):
         description="counter",
         ports=[{"key": "count", "kind": "INT", "identifier": None, "nullable": False, "children": []}],
     )
+    rebuild_state_definition_ports(counter_definition)
     models.State.objects.create(definition=counter_definition, interface="counter", key="counter", app_identifier="statedep-stateful-app", agent=agent_with_state, value={"count": 0})
 
     main_impl = _create_implementation(_orchestrator_input(), orchestrator_agent)
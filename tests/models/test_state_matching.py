@@ -3,7 +3,7 @@
 Guards the state demand path that was previously broken on two fronts: the raw SQL targeted a
 non-existent ``facade_stateschema`` table, and the consuming filters referenced a ``state_schema``
 field that no longer exists (the FK is ``definition``). These verify ``get_state_ids_by_demands``
-resolves real StateDefinition ids by their port descriptors.
+resolves real StateDefinition ids from their relational port rows (``models.StatePort``).
 """
 
 from types import SimpleNamespace
@@ -11,6 +11,7 @@ from types import SimpleNamespace
 import pytest
 
 from facade import managers, models
+from facade.mutations.implementation import rebuild_state_definition_ports
 from rekuest_core.enums import PortKind
 
 
@@ -32,6 +33,8 @@ def state_defs(db):
         description="tracker",
         ports=[{"key": "position", "kind": "STRUCTURE", "identifier": "@mikro/roi", "nullable": False, "children": []}],
     )
+    for definition in (counter, tracker):
+        rebuild_state_definition_ports(definition)
     return SimpleNamespace(counter=counter, tracker=tracker)
 
 
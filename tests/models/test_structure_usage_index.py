@@ -0,0 +1,69 @@
+"""The structure-usage index (``models.StructureUsage``, ``facade.usages``).
+
+Registration writes one row per action, direction and identifier; the agents' liveness
+transitions and the implementation's deletion recount ``live_agents``.
+"""
+
+import pytest
+from rekuest_core.inputs.models import ImplementationInputModel
+
+from facade import enums, models
+from facade.mutations.implementation import _create_implementation
+
+from tests.factories import _build_webhook_agent
+
+
+def _masker_input(returns_identifier="@mikro/mask"):
+    return ImplementationInputModel.model_validate(
+        {
+            "interface": "masker",
+            "definition": {
+                "key": "masker",
+                "version": "1",
+                "name": "Masker",
+                "kind": "FUNCTION",
+                "args": [
+                    {"key": "image", "kind": "STRUCTURE", "identifier": "@mikro/Image"},
+                    {"key": "reference", "kind": "STRUCTURE", "identifier": "@mikro/image", "nullable": True},
+                    {"key": "name", "kind": "STRUCTURE", "identifier": "unpackaged"},
+                ],
+                "returns": [{"key": "masks", "kind": "LIST", "children": [{"key": "mask", "kind": "STRUCTURE", "identifier": returns_identifier}]}],
+            },
+        }
+    )
+
+
+def _rows(action):
+    return set(action.structure_usages.values_list("identifier", "kind", "direction", "port_count", "live_agents"))
+
+
+@pytest.mark.django_db(transaction=True)
+def test_registration_writes_the_rows():
+    agent = _build_webhook_agent("usage-register")
+    action = _create_implementation(_masker_input(), agent).action
+
+    assert _rows(action) == {("@mikro/image", "STRUCTURE", "args", 2, 1), ("@mikro/mask", "STRUCTURE", "returns", 1, 1)}
+    assert set(action.structure_usages.values_list("organization_id", flat=True)) == {agent.organization_id}
+
+    changed = _create_implementation(_masker_input("@mikro/label"), agent).action
+    assert ("@mikro/label", "STRUCTURE", "returns", 1, 1) in _rows(changed)
+    assert not models.StructureUsage.objects.filter(identifier="@mikro/mask").exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_liveness_and_deletion_recount_live_agents():
+    agent = _build_webhook_agent("usage-live")
+    implementation = _create_implementation(_masker_input(), agent)
+    action = implementation.action
+
+    agent.kind = enums.AgentKind.WEBSOCKET.value
+    agent.connected = False
+    agent.save()
+    assert {row[-1] for row in _rows(action)} == {0}
+
+    agent.connected = True
+    agent.save(update_fields=["connected"])
+    assert {row[-1] for row in _rows(action)} == {1}
+
+    implementation.delete()
+    assert {row[-1] for row in _rows(action)} == {0}
@@ -0,0 +1,93 @@
+"""Server-side admission (``facade.admission``): ``max_concurrency`` holds excess work.
+
+Drives the real ``assign`` path against a live agent socket: a task over the agent's (or the
+implementation's) limit is saved ``pending`` and not sent, the agent's next terminal task
+releases it onto the queue, and a held task is cancelled without a round trip to the agent.
+"""
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from facade import enums, inputs, messages
+from facade.backend import controll_backend
+from facade.models import Agent, Task, TaskEvent
+
+from tests.agent.helpers import open_agent
+from tests.factories import build_implementation_for_agent
+
+
+class _Info:
+    """Minimal stand-in for the Strawberry ``Info`` the backend reads."""
+
+    def __init__(self, context):
+        self.context = context
+
+
+def _finish(task_id):
+    task = Task.objects.get(pk=task_id)
+    task.is_done = True
+    task.latest_event_kind = enums.TaskEventKind.COMPLETED
+    task.save()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+class TestAdmission:
+    async def test_excess_task_is_held_then_released_on_completion(self, agent_ws, authenticated_context):
+        session = await open_agent(agent_ws, "admit-agent")
+        impl = await build_implementation_for_agent(session.agent.pk, "admit")
+        await Agent.objects.filter(pk=session.agent.pk).aupdate(max_concurrency=1)
+
+        info = _Info(authenticated_context)
+        first = await sync_to_async(controll_backend.assign)(info, inputs.AssignInputModel(implementation=str(impl.pk), args={"x": 1}))
+        second = await sync_to_async(controll_backend.assign)(info, inputs.AssignInputModel(implementation=str(impl.pk), args={"x": 2}))
+
+        assert first.pending is False
+        assert second.pending is True and second.latest_event_kind == enums.TaskEventKind.QUEUED
+        assert (await session.receive(messages.Assign)).task == str(first.pk)
+
+        # The first task's terminal transition frees the slot: the held task goes out.
+        await sync_to_async(_finish)(first.pk)
+        assert (await session.receive(messages.Assign)).task == str(second.pk)
+
+        await second.arefresh_from_db()
+        assert second.pending is False
+        kinds = [e.kind async for e in TaskEvent.objects.filter(task=second).order_by("id")]
+        assert kinds == [enums.TaskEventKind.QUEUED, enums.TaskEventKind.BOUND]
+        await session.disconnect()
+
+    async def test_implementation_limit_holds_a_batch_in_order(self, agent_ws, authenticated_context):
+        session = await open_agent(agent_ws, "admit2-agent")
+        impl = await build_implementation_for_agent(session.agent.pk, "admit2", max_concurrency=2)
+
+        info = _Info(authenticated_context)
+        tasks = await sync_to_async(controll_backend.assign_many)(info, [inputs.AssignInputModel(implementation=str(impl.pk), args={"x": i}) for i in range(4)])
+
+        assert [task.pending for task in tasks] == [False, False, True, True]
+        received = [(await session.receive(messages.Assign)).task for _ in range(2)]
+        assert received == [str(tasks[0].pk), str(tasks[1].pk)]
+
+        # Oldest held first.
+        await sync_to_async(_finish)(tasks[1].pk)
+        assert (await session.receive(messages.Assign)).task == str(tasks[2].pk)
+        assert await Task.objects.filter(pk=tasks[3].pk, pending=True).aexists()
+        await session.disconnect()
+
+    async def test_cancel_settles_a_held_task_without_the_agent(self, agent_ws, authenticated_context):
+        session = await open_agent(agent_ws, "admit3-agent")
+        impl = await build_implementation_for_agent(session.agent.pk, "admit3", max_concurrency=1)
+
+        info = _Info(authenticated_context)
+        await sync_to_async(controll_backend.assign)(info, inputs.AssignInputModel(implementation=str(impl.pk), args={"x": 1}))
+        held = await sync_to_async(controll_backend.assign)(info, inputs.AssignInputModel(implementation=str(impl.pk), args={"x": 2}))
+        assert held.pending is True
+
+        # Pausing work that never started is refused rather than queued for the agent.
+        with pytest.raises(ValueError):
+            await sync_to_async(controll_backend.pause)(inputs.PauseInputModel(task=str(held.pk)))
+
+        cancelled = await sync_to_async(controll_backend.cancel)(inputs.CancelInputModel(task=str(held.pk)))
+        assert cancelled.is_done is True and cancelled.pending is False
+        assert cancelled.latest_event_kind == enums.TaskEventKind.CANCELLED
+        assert not await TaskEvent.objects.filter(task=held, kind=enums.TaskEventKind.CANCELLING).aexists()
+        await session.disconnect()
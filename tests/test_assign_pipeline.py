@@ -0,0 +1,53 @@
+"""The async assign pipeline (``RedisControllBackend.aassign``) and its load test.
+
+``aassign`` writes the task in one ORM hop and delivers the Assign from the event loop; the
+connected agent must receive exactly what the sync ``assign`` would have sent. The
+``loadtest_assign`` runner is driven with a small burst through both pipelines.
+"""
+
+import pytest
+
+from facade import inputs, messages
+from facade.backend import controll_backend
+from facade.management.commands import loadtest_assign
+from facade.models import Task
+
+from tests.agent.helpers import open_agent
+from tests.factories import build_implementation_for_agent
+
+
+class _Info:
+    """Minimal stand-in for the Strawberry ``Info`` the backend reads."""
+
+    def __init__(self, context):
+        self.context = context
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+class TestAsyncAssign:
+    async def test_async_assign_delivers_the_assign(self, agent_ws, authenticated_context):
+        session = await open_agent(agent_ws, "aassign-agent")
+        impl = await build_implementation_for_agent(session.agent.pk, "aassign")
+
+        task = await controll_backend.aassign(_Info(authenticated_context), inputs.AssignInputModel(implementation=str(impl.pk), args={"x": 1}, reference="aassign-ref"))
+
+        assign = await session.receive(messages.Assign)
+        assert assign.task == str(task.pk)
+        assert assign.reference == "aassign-ref" and assign.args == {"x": 1}
+        assert assign.token is not None  # minted like the sync path
+        await session.disconnect()
+
+    async def test_load_test_runs_both_pipelines(self, agent_ws):
+        session = await open_agent(agent_ws, "loadtest-agent")
+        await build_implementation_for_agent(session.agent.pk, "loadtest", needs_token=False)
+
+        results = await loadtest_assign.run(session.agent.pk, concurrency=10, probe_interval=0.001, keep=False)
+
+        assert set(results) == {"sync", "async"}
+        assert all(result.p50 <= result.p99 <= result.slowest for result in results.values())
+        received = {(await session.receive(messages.Assign)).reference for _ in range(20)}
+        assert received == {f"{loadtest_assign.REFERENCE_PREFIX}-{pipeline}-{index}" for pipeline in ("sync", "async") for index in range(10)}
+        # Cleaned up after the run.
+        assert not await Task.objects.filter(reference__startswith=loadtest_assign.REFERENCE_PREFIX).aexists()
+        await session.disconnect()
@@ -0,0 +1,63 @@
+"""The availability index (``models.ActionAvailability``, ``facade.availability``).
+
+Every implementation has a row projecting ``(action, agent, available)``; registration writes
+it and the agent's liveness transitions (saves of ``connected`` / ``kind``) flip ``available``.
+Candidate selection reads the index and still confirms heartbeat freshness.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from facade import enums
+from facade.backend import controll_backend
+from facade.models import ActionAvailability, Agent
+
+from tests.factories import _build_implementation_for_agent, _build_webhook_agent
+
+
+@pytest.mark.django_db(transaction=True)
+def test_implementation_is_projected_on_creation():
+    agent = _build_webhook_agent("avail-create")
+    impl = _build_implementation_for_agent(agent.pk, "avail-create")
+
+    row = ActionAvailability.objects.get(implementation=impl)
+    assert (row.action_id, row.agent_id, row.organization_id, row.available) == (impl.action_id, agent.pk, agent.organization_id, True)
+
+    impl.delete()
+    assert not ActionAvailability.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_liveness_transitions_flip_the_flag():
+    agent = _build_webhook_agent("avail-flip")
+    impl = _build_implementation_for_agent(agent.pk, "avail-flip")
+
+    agent.kind = enums.AgentKind.WEBSOCKET.value
+    agent.connected = False
+    agent.save()
+    assert ActionAvailability.objects.get(implementation=impl).available is False
+    with pytest.raises(ValueError):
+        controll_backend._available_implementations(impl.action)
+
+    agent.connected = True
+    agent.last_seen = timezone.now()
+    agent.save(update_fields=["connected", "last_seen"])
+    assert ActionAvailability.objects.get(implementation=impl).available is True
+    assert controll_backend._available_implementations(impl.action) == [impl]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stale_heartbeat_is_confirmed_on_read():
+    agent = _build_webhook_agent("avail-stale")
+    impl = _build_implementation_for_agent(agent.pk, "avail-stale")
+    agent.kind = enums.AgentKind.WEBSOCKET.value
+    agent.connected = True
+    agent.save()
+
+    # The heartbeat stopped without a transition: the row still says available.
+    Agent.objects.filter(pk=agent.pk).update(last_seen=timezone.now() - timedelta(minutes=5))
+    assert ActionAvailability.objects.get(implementation=impl).available is True
+    with pytest.raises(ValueError):
+        controll_backend._available_implementations(impl.action)
@@ -0,0 +1,45 @@
+"""The ``bench_matcher`` command on a tiny synthetic catalog: generation, plans and the regression gate."""
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from facade import models
+
+ACTIONS = 40
+
+
+def bench(**options):
+    call_command("bench_matcher", actions=ACTIONS, iterations=2, stdout=StringIO(), **options)
+
+
+@pytest.mark.django_db
+def test_catalog_rows_match_their_definitions(tmp_path):
+    bench(plans=str(tmp_path))
+
+    actions = models.Action.objects.filter(organization__slug=f"bench-matcher-{ACTIONS}-0")
+    assert actions.count() == ACTIONS
+    for action in actions:
+        assert action.arg_ports.filter(parent__isnull=True).count() == action.arg_count == len(action.args)
+        assert action.return_ports.filter(parent__isnull=True).count() == action.return_count
+    assert "Buffers" in (tmp_path / "port_descriptors.txt").read_text()
+    assert (tmp_path / "actions_x3.txt").exists()
+
+
+@pytest.mark.django_db
+def test_regressions_past_the_threshold_fail(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    bench(write_baseline=str(baseline))
+    bench(baseline=str(baseline), threshold=1000)
+
+    recorded = json.loads(baseline.read_text())
+    recorded["workloads"]["port nested"]["p95"] = 0.0
+    baseline.write_text(json.dumps(recorded))
+    with pytest.raises(CommandError, match="port nested"):
+        bench(baseline=str(baseline))
+
+    with pytest.raises(CommandError, match="baseline was taken"):
+        call_command("bench_matcher", actions=ACTIONS + 1, iterations=1, baseline=str(baseline), stdout=StringIO())
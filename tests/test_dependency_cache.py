@@ -0,0 +1,75 @@
+"""Resolved dependency dicts are cached (``facade.dependency_cache``) and invalidated by signals.
+
+The resolution itself is pinned at a constant number of queries per dependency however many
+agents it spans, a repeat resolution is served without touching the database, and an agent
+save (a liveness transition) invalidates it.
+"""
+
+import pytest
+from authentikate.models import App, Client, Release
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from facade import enums
+from facade.backend import build_dependency_dict
+from facade.caller_context import CallerContext
+from facade.dependency_cache import dependency_cache
+from facade.models import Action, Agent, Dependency, Implementation
+
+from tests.factories import create_registry_bundle
+
+
+def _webhook_agent(index, user, org, release):
+    client = Client.objects.create(client_id=f"depcache-client-{index}")
+    return Agent.objects.create(
+        app=release.app,
+        hash=f"depcache-hash-{index}",
+        release=release,
+        user=user,
+        client=client,
+        organization=org,
+        kind=enums.AgentKind.WEBHOOK.value,
+        hook_url="https://hook.example/in",
+    )
+
+
+def _implementation(agent, key):
+    action, _ = Action.objects.get_or_create(
+        hash=f"depcache-{key}-hash",
+        defaults=dict(app=agent.app, key=key, version="1.0.0", name=key, description=key, organization=agent.organization),
+    )
+    return Implementation.objects.create(release=agent.release, interface=f"{key}-{agent.pk}", action=action, agent=agent)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_resolution_is_cached_until_an_agent_changes():
+    dependency_cache.clear()
+    user, _, org, _ = create_registry_bundle("depcache")
+    release = Release.objects.create(app=App.objects.create(identifier="depcache-app"), version="1.0.0")
+
+    host = _webhook_agent(0, user, org, Release.objects.create(app=App.objects.create(identifier="depcache-host-app"), version="1.0.0"))
+    workers = [_webhook_agent(i, user, org, release) for i in range(1, 5)]
+    for worker in workers:
+        _implementation(worker, "acquire")
+
+    implementation = _implementation(host, "experiment")
+    Dependency.objects.create(implementation=implementation, key="scope", app_filter="depcache-app", auto_resolvable=True, action_demands=[{"key": "acquire"}])
+
+    ctx = CallerContext(user=user, client=None, organization=org)
+
+    # Dependency rows + the agents + every agent's implementation — not a lookup per agent.
+    with CaptureQueriesContext(connection) as cold:
+        resolved = build_dependency_dict(implementation, ctx, [])
+    assert len(cold.captured_queries) == 3
+    assert {entry["agent"] for entry in resolved["scope"]} == {str(worker.pk) for worker in workers}
+
+    with CaptureQueriesContext(connection) as warm:
+        assert build_dependency_dict(implementation, ctx, []) == resolved
+    assert len(warm.captured_queries) == 0
+
+    # A liveness transition is an agent save: the next resolution goes back to the table.
+    workers[0].connected = True
+    workers[0].save(update_fields=["connected"])
+    with CaptureQueriesContext(connection) as invalidated:
+        build_dependency_dict(implementation, ctx, [])
+    assert len(invalidated.captured_queries) == 3
@@ -8,7 +8,7 @@ from types import SimpleNamespace
 
 import pytest
 
-from facade.descriptors import compile_descriptors_to_jsonpath
+from facade.descriptors import candidate_facts, compile_descriptors_to_jsonpath, descriptor_facts
 
 
 def d(key, operator, value):
@@ -82,3 +82,14 @@ def test_invalid_key_is_rejected_to_prevent_jsonpath_injection():
 def test_unsupported_operator_raises():
     with pytest.raises(ValueError):
         compile_descriptors_to_jsonpath([d("axes", "NONSENSE", "c")])
+
+
+def test_descriptor_facts_keep_only_indexable_constraints():
+    facts = descriptor_facts([d("axes", "EQUALS", "c"), d("$.channels", "EXISTS", True), d("size", "GTE", 10), d("options.mask", "EQUALS", 1), d("t", "EXISTS", False)])
+    assert facts == ['["axes","c"]', '["channels"]']
+
+
+def test_candidate_facts_cover_the_matching_port_facts():
+    candidate = candidate_facts({"axes": ["c", "x"], "size": 2.0, "meta": {"a": 1}})
+    assert set(descriptor_facts([d("axes", "EQUALS", "c"), d("size", "EQUALS", 2), d("meta", "EXISTS", True)])) <= set(candidate)
+    assert '["axes","z"]' not in candidate
@@ -0,0 +1,84 @@
+"""Idempotent GraphQL assigns (``AssignInput.idempotencyKey``, ``facade.idempotency``).
+
+A retried assign with the same key returns the first attempt's task and is never dispatched
+twice: from the redis cache, from the row when the cache is cold, and — for two attempts
+that race past both — from the ``ON CONFLICT`` insert.
+"""
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from facade import idempotency, inputs, messages
+from facade.backend import controll_backend
+from facade.caller_context import CallerContext
+from facade.models import Task
+
+from tests.agent.helpers import open_agent
+from tests.factories import build_implementation_for_agent
+
+
+class _Info:
+    """Minimal stand-in for the Strawberry ``Info`` the backend reads."""
+
+    def __init__(self, context):
+        self.context = context
+
+
+def _assign(info, impl, key):
+    return controll_backend.assign(info, inputs.AssignInputModel(implementation=str(impl.pk), args={"x": 1}, idempotency_key=key))
+
+
+def _assign_counting_queries(info, impl, key):
+    with CaptureQueriesContext(connection) as queries:
+        task = _assign(info, impl, key)
+    return task, len(queries.captured_queries)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+class TestIdempotentAssign:
+    async def test_retry_returns_the_first_task_without_dispatching_again(self, agent_ws, authenticated_context):
+        session = await open_agent(agent_ws, "idem-agent")
+        impl = await build_implementation_for_agent(session.agent.pk, "idem", needs_token=False)
+        info = _Info(authenticated_context)
+
+        first = await sync_to_async(_assign)(info, impl, "retry-1")
+        assert (await session.receive(messages.Assign)).task == str(first.pk)
+
+        # Served from the cache: one primary-key fetch.
+        retried, queries = await sync_to_async(_assign_counting_queries)(info, impl, "retry-1")
+        assert retried.pk == first.pk and queries == 1
+
+        # With the cache gone the row still answers.
+        await sync_to_async(idempotency._connection().delete)(idempotency.cache_key(CallerContext.from_info(info), "retry-1"))
+        retried = await sync_to_async(_assign)(info, impl, "retry-1")
+        assert retried.pk == first.pk
+
+        other = await sync_to_async(_assign)(info, impl, "retry-2")
+        assert other.pk != first.pk
+        assert (await session.receive(messages.Assign)).task == str(other.pk)
+        assert await Task.objects.filter(idempotency_key="retry-1").acount() == 1
+        await session.disconnect()
+
+    async def test_conflicting_insert_loses_to_the_existing_row(self, agent_ws, authenticated_context):
+        session = await open_agent(agent_ws, "idem-race-agent")
+        impl = await build_implementation_for_agent(session.agent.pk, "idem-race", needs_token=False)
+        first = await sync_to_async(_assign)(_Info(authenticated_context), impl, "race-1")
+
+        # An attempt that raced past the lookups: its insert does nothing.
+        duplicate = Task(
+            action_id=first.action_id,
+            agent_id=first.agent_id,
+            implementation_id=first.implementation_id,
+            caller_id=first.caller_id,
+            args={},
+            latest_event_kind=first.latest_event_kind,
+            latest_instruct_kind=first.latest_instruct_kind,
+            idempotency_key="race-1",
+        )
+        assert await sync_to_async(idempotency.insert_claimed)(duplicate) is False
+        assert duplicate.pk is None
+        assert await Task.objects.filter(idempotency_key="race-1").acount() == 1
+        await session.disconnect()
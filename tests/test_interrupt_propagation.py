@@ -0,0 +1,82 @@
+"""Set-based interrupt propagation over a task tree (``RedisControllBackend._request_descendants_control``).
+
+Interrupting a root stamps every running descendant in one ``UPDATE``, writes their
+INTERRUPTING events in one insert and hands each agent its run of ``Interrupt`` messages in a
+single delivery — so the query count of an interrupt does not grow with the size of the tree.
+"""
+
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from facade import enums, inputs, messages, transport
+from facade.backend import controll_backend
+from facade.models import Task, TaskEvent
+
+from tests.factories import _build_task, _build_task_for_agent_caller
+
+
+class _Queue:
+    def __init__(self, pushed):
+        self.pushed = pushed
+
+    def push(self, agent, body):
+        self.pushed.append((agent, [body]))
+
+    def push_many(self, agent, bodies):
+        self.pushed.append((agent, list(bodies)))
+
+    def push_batches(self, batches):
+        self.pushed.extend((agent, list(bodies)) for agent, bodies in batches.items())
+
+
+def _tree(agent_pk, prefix, size):
+    root = _build_task_for_agent_caller(agent_pk, prefix)
+    children = [
+        Task.objects.create(
+            caller=root.caller,
+            action=root.action,
+            agent=root.agent,
+            implementation=root.implementation,
+            parent=root,
+            root=root,
+            latest_event_kind=enums.TaskEventKind.STARTED,
+            latest_instruct_kind=enums.TaskInstructChoices.ASSIGN,
+        )
+        for _ in range(size)
+    ]
+    return root, children
+
+
+def _interrupt(root):
+    with CaptureQueriesContext(connection) as queries:
+        controll_backend.interrupt(inputs.InterruptInputModel(task=str(root.pk)))
+    return len(queries.captured_queries)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_interrupt_reaches_every_descendant_in_constant_queries(monkeypatch):
+    pushed = []
+    monkeypatch.setattr(transport.RedisAgentQueue, "from_settings", classmethod(lambda cls: _Queue(pushed)))
+
+    agent_pk = _build_task("propagate-exec").agent_id
+    small_root, _ = _tree(agent_pk, "propagate-small", 3)
+    large_root, children = _tree(agent_pk, "propagate-large", 30)
+
+    small = _interrupt(small_root)
+    pushed.clear()
+    large = _interrupt(large_root)
+    assert large == small
+
+    assert set(Task.objects.filter(root=large_root).values_list("latest_instruct_kind", flat=True)) == {enums.TaskInstructKind.INTERRUPT}
+    assert TaskEvent.objects.filter(task__root=large_root, kind=enums.TaskEventKind.INTERRUPTING).count() == len(children)
+
+    frames = [json.loads(body) for agent, bodies in pushed if agent == str(agent_pk) for body in bodies]
+    # The executor's Interrupts: the root's first, then one per descendant, in one delivery.
+    interrupts = [frame["task"] for frame in frames if frame["type"] == messages.ToAgentMessageType.INTERRUPT]
+    assert interrupts[0] == str(large_root.pk)
+    assert sorted(interrupts[1:]) == sorted(str(child.pk) for child in children)
+    # The agent is also the tree's caller: every INTERRUPTING event is mirrored back to it.
+    assert sum(frame["type"] == messages.ToAgentMessageType.INTERRUPTING_EVENT for frame in frames) == len(children) + 1
@@ -0,0 +1,152 @@
+"""The assign outbox (``REKUEST_DISPATCH = "outbox"``, ``facade.outbox``).
+
+In outbox mode an assign writes its task and a ``TaskOutbox`` row and sends nothing; the
+dispatcher's drain leases the row, sends the Assign with a freshly minted token and deletes
+the row. Rows of tasks that finished in the meantime are dropped without a message, and rows
+whose lease expired are sent again.
+"""
+
+import json
+
+import pytest
+from django.db import connection
+
+from facade import enums, inputs, outbox, transport
+from facade.backend import controll_backend
+from facade.caller_context import CallerContext
+from facade.models import Task, TaskOutbox
+
+from tests.factories import _build_implementation_for_agent, _build_webhook_agent
+
+
+@pytest.fixture
+def posted(monkeypatch, settings):
+    settings.REKUEST_DISPATCH = "outbox"
+    # The test drains by hand instead of the dispatcher thread.
+    monkeypatch.setattr(outbox, "wake", lambda: None)
+    posts = []
+    monkeypatch.setattr(transport.hooks, "deliver_to_hook", lambda agent, body: posts.append(json.loads(body)))
+    return posts
+
+
+def _assign(agent, impl, reference):
+    ctx = CallerContext(user=agent.user, client=agent.client, organization=agent.organization)
+    return controll_backend.assign(ctx, inputs.AssignInputModel(implementation=str(impl.pk), args={"x": 1}, reference=reference))
+
+
+@pytest.mark.django_db(transaction=True)
+def test_assign_is_sent_by_the_drain(posted):
+    agent = _build_webhook_agent("outbox")
+    impl = _build_implementation_for_agent(agent.pk, "outbox")
+
+    first = _assign(agent, impl, "outbox-1")
+    second = _assign(agent, impl, "outbox-2")
+
+    assert posted == []
+    assert TaskOutbox.objects.filter(task__in=[first, second]).count() == 2
+
+    assert outbox.drain() == 2
+    assert [(post["task"], post["reference"]) for post in posted] == [(str(first.pk), "outbox-1"), (str(second.pk), "outbox-2")]
+    assert all(post["token"] for post in posted)  # minted per caller by the drain
+    assert not TaskOutbox.objects.exists()
+    assert outbox.drain() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_finished_task_is_dropped(posted):
+    agent = _build_webhook_agent("outbox-done")
+    impl = _build_implementation_for_agent(agent.pk, "outbox-done", needs_token=False)
+
+    task = _assign(agent, impl, "outbox-done-1")
+    Task.objects.filter(pk=task.pk).update(is_done=True, latest_event_kind=enums.TaskEventKind.CANCELLED)
+
+    assert controll_backend.dispatch_outbox() == 1
+    assert posted == []
+    assert not TaskOutbox.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sends_outside_a_transaction_and_resends_expired_leases(posted, monkeypatch, settings):
+    agent = _build_webhook_agent("outbox-lease")
+    impl = _build_implementation_for_agent(agent.pk, "outbox-lease", needs_token=False)
+    task = _assign(agent, impl, "outbox-lease-1")
+
+    # A dispatcher that died after claiming the row: its lease keeps the others off it …
+    assert outbox.claim("dead-dispatcher") == [task.outbox.pk]
+    assert controll_backend.dispatch_outbox() == 0
+
+    # … until it expires; the resend then runs without holding a transaction.
+    settings.REKUEST_OUTBOX_LEASE = 0
+    in_transaction = []
+    monkeypatch.setattr(transport.hooks, "deliver_to_hook", lambda agent, body: in_transaction.append(connection.in_atomic_block) or posted.append(json.loads(body)))
+    assert controll_backend.dispatch_outbox() == 1
+    assert [post["task"] for post in posted] == [str(task.pk)]
+    assert in_transaction == [False]
+    assert not TaskOutbox.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_webhook_runs_renew_the_lease_and_skip_withdrawn_rows(posted, monkeypatch, settings):
+    agent = _build_webhook_agent("outbox-renew")
+    impl = _build_implementation_for_agent(agent.pk, "outbox-renew", needs_token=False)
+    first = _assign(agent, impl, "outbox-renew-1")
+    second = _assign(agent, impl, "outbox-renew-2")
+
+    # Every POST renews (half of a zero lease is always spent); the second row is withdrawn
+    # while the first POST is in flight, so the renewal drops it.
+    settings.REKUEST_OUTBOX_LEASE = 0
+    monkeypatch.setattr(transport.hooks, "deliver_to_hook", lambda agent, body: TaskOutbox.objects.filter(task=second).delete() or posted.append(json.loads(body)))
+    assert controll_backend.dispatch_outbox() == 2
+    assert [post["task"] for post in posted] == [str(first.pk)]
+    assert not TaskOutbox.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_cancel_before_the_drain_settles_without_the_agent(posted):
+    agent = _build_webhook_agent("outbox-cancel")
+    impl = _build_implementation_for_agent(agent.pk, "outbox-cancel", needs_token=False)
+    task = _assign(agent, impl, "outbox-cancel-1")
+
+    cancelled = controll_backend.cancel(inputs.CancelInputModel(task=str(task.pk)))
+
+    assert (cancelled.is_done, cancelled.latest_event_kind) == (True, enums.TaskEventKind.CANCELLED)
+    assert not TaskOutbox.objects.exists()
+    assert outbox.drain() == 0
+    assert posted == []  # neither the Cancel nor the Assign
+
+
+@pytest.mark.django_db(transaction=True)
+def test_interrupt_of_a_leased_row_is_settled_by_the_drain(posted, settings):
+    agent = _build_webhook_agent("outbox-leased")
+    impl = _build_implementation_for_agent(agent.pk, "outbox-leased", needs_token=False)
+    task = _assign(agent, impl, "outbox-leased-1")
+
+    # A dispatcher holds the row, so the interrupt goes through the agent …
+    outbox.claim("live-dispatcher")
+    controll_backend.interrupt(inputs.InterruptInputModel(task=str(task.pk)))
+    assert [post["type"] for post in posted] == ["INTERRUPT"]
+
+    # … and should the row come round again, the drain settles the task instead of starting it.
+    settings.REKUEST_OUTBOX_LEASE = 0
+    assert controll_backend.dispatch_outbox() == 1
+    assert len(posted) == 1
+    task.refresh_from_db()
+    assert (task.is_done, task.latest_event_kind) == (True, enums.TaskEventKind.INTERRUPTED)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_bulk_and_released_assigns_go_through_the_outbox(posted):
+    agent = _build_webhook_agent("outbox-bulk")
+    impl = _build_implementation_for_agent(agent.pk, "outbox-bulk", needs_token=False, max_concurrency=1)
+    ctx = CallerContext(user=agent.user, client=agent.client, organization=agent.organization)
+
+    first, held = controll_backend.assign_many(ctx, [inputs.AssignInputModel(implementation=str(impl.pk), args={"x": n}, reference=f"outbox-bulk-{n}") for n in range(2)])
+    assert held.pending and posted == []
+    assert list(TaskOutbox.objects.values_list("task_id", flat=True)) == [first.pk]
+
+    Task.objects.filter(pk=first.pk).update(is_done=True, latest_event_kind=enums.TaskEventKind.COMPLETED)
+    assert controll_backend.release_held(agent.pk) == [held]
+    assert posted == []
+
+    assert outbox.drain() == 2
+    assert [post["task"] for post in posted] == [str(held.pk)]
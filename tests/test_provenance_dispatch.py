@@ -99,3 +99,23 @@ class TestProvenanceDispatch:
 
         assert received["type"] == messages.ToAgentMessageType.ASSIGN.value
         assert received["token"] is None
+
+    async def test_assign_many_dispatches_one_token_per_task_in_order(self, agent_ws, authenticated_context):
+        agent = await seed_agent("prov-agent-3")
+        impl = await build_impl(agent.pk, needs_token=True)
+
+        communicator = await agent_ws()
+        await register(communicator, instance_id="prov-agent-3")
+
+        info = _Info(authenticated_context)
+        tasks = await sync_to_async(controll_backend.assign_many)(info, [inputs.AssignInputModel(implementation=str(impl.pk), args={"x": i}) for i in range(3)])
+
+        received = [await communicator.receive_json_from(timeout=RECEIVE_TIMEOUT) for _ in tasks]
+        await communicator.disconnect()
+
+        # Queued in one push, popped in input order — each with its own task-bound token.
+        assert [r["task"] for r in received] == [str(t.pk) for t in tasks]
+        claims = [_decode(r["token"]).claims for r in received]
+        assert [c["tsk"] for c in claims] == [str(t.pk) for t in tasks]
+        assert [c["ahs"] for c in claims] == [canonical.args_hash({"x": i}) for i in range(3)]
+        assert len({c["jti"] for c in claims}) == 3
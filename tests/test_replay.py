@@ -0,0 +1,87 @@
+"""Opt-in server-side reuse of pure results (``AssignInput.reuse``, ``facade.replay``).
+
+An assign with a reuse policy on a pure action returns a completed task mirroring a matching
+prior run — its yields, then COMPLETED — and nothing is sent to the agent. A run outside the
+policy (too old) is not reused, and an assign without a policy is always dispatched.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from facade import enums, inputs, replay, transport
+from facade.backend import controll_backend
+from facade.caller_context import CallerContext
+from facade.models import Task, TaskEvent
+from facade.provenance.canonical import args_hash
+
+from tests.factories import _build_implementation_for_agent, _build_webhook_agent
+
+ARGS = {"x": 1}
+
+
+def _prior_run(impl, finished_ago):
+    prior = Task.objects.create(
+        action=impl.action,
+        agent=impl.agent,
+        implementation=impl,
+        args=ARGS,
+        args_hash=args_hash(ARGS),
+        is_done=True,
+        finished_at=timezone.now() - finished_ago,
+        latest_event_kind=enums.TaskEventKind.COMPLETED,
+        latest_instruct_kind=enums.TaskInstructKind.ASSIGN,
+    )
+    TaskEvent.objects.create(task=prior, kind=enums.TaskEventKind.YIELD, returns={"y": 2})
+    TaskEvent.objects.create(task=prior, kind=enums.TaskEventKind.COMPLETED)
+    return prior
+
+
+@pytest.fixture
+def posted(monkeypatch):
+    posts = []
+    monkeypatch.setattr(transport.hooks, "deliver_to_hook", lambda agent, body: posts.append(body))
+    return posts
+
+
+@pytest.mark.django_db(transaction=True)
+def test_matching_run_is_mirrored_without_dispatch(posted):
+    replay.replay_cache.clear()
+    agent = _build_webhook_agent("replay")
+    impl = _build_implementation_for_agent(agent.pk, "replay", needs_token=False)
+    impl.action.pure = True
+    impl.action.save()
+    prior = _prior_run(impl, timedelta(minutes=1))
+    ctx = CallerContext(user=agent.user, client=agent.client, organization=agent.organization)
+
+    task = controll_backend.assign(ctx, inputs.AssignInputModel(implementation=str(impl.pk), args=ARGS, reuse=inputs.ReuseInputModel(max_age=3600, same_version=True)))
+
+    assert task.replay_of_id == prior.pk and task.is_done and task.latest_event_kind == enums.TaskEventKind.COMPLETED
+    events = list(TaskEvent.objects.filter(task=task).order_by("id"))
+    assert [(event.kind, event.returns, event.delegated_to_id) for event in events] == [
+        (enums.TaskEventKind.YIELD, {"y": 2}, prior.pk),
+        (enums.TaskEventKind.COMPLETED, None, prior.pk),
+    ]
+    assert posted == []
+    assert replay.replay_cache.get((impl.action.organization_id, impl.action.hash, args_hash(ARGS))).task_id == prior.pk
+
+    # Too old for the policy, and no policy at all: both are dispatched.
+    stale = controll_backend.assign(ctx, inputs.AssignInputModel(implementation=str(impl.pk), args=ARGS, reuse=inputs.ReuseInputModel(max_age=1)))
+    fresh = controll_backend.assign(ctx, inputs.AssignInputModel(implementation=str(impl.pk), args=ARGS))
+    assert stale.replay_of_id is None and fresh.replay_of_id is None
+    assert len(posted) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_impure_action_is_never_reused(posted):
+    replay.replay_cache.clear()
+    agent = _build_webhook_agent("replay-impure")
+    impl = _build_implementation_for_agent(agent.pk, "replay-impure", needs_token=False)
+    _prior_run(impl, timedelta(minutes=1))
+    ctx = CallerContext(user=agent.user, client=agent.client, organization=agent.organization)
+
+    task = controll_backend.assign(ctx, inputs.AssignInputModel(implementation=str(impl.pk), args=ARGS, reuse=inputs.ReuseInputModel()))
+
+    assert task.replay_of_id is None and not task.is_done
+    assert len(posted) == 1
@@ -0,0 +1,71 @@
+"""Load-aware implementation selection (``facade.scheduling``).
+
+The strategies are exercised over lightweight candidate fakes with a fixed load, the
+``simulate_scheduling`` command's fleet simulation pins that the load-aware strategies beat the
+old first-row pick on makespan, and the in-flight view is checked against real task rows.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from facade import enums, scheduling
+from facade.management.commands.simulate_scheduling import build_fleet, build_workload, simulate
+
+
+class _Load:
+    def __init__(self, counts):
+        self._counts = counts
+
+    def counts(self, agent_ids):
+        return {agent_id: self._counts.get(agent_id, 0) for agent_id in agent_ids}
+
+
+def _candidates(*capacities):
+    return [SimpleNamespace(pk=pk, agent_id=pk, action_id=1, agent=SimpleNamespace(capacity=capacity)) for pk, capacity in enumerate(capacities, start=1)]
+
+
+def test_least_in_flight_picks_the_idlest_agent():
+    candidates = _candidates(1, 1, 1)
+    scheduler = scheduling.LeastInFlight(_Load({1: 3, 2: 1, 3: 2}))
+    assert scheduler.choose(candidates, {}).agent_id == 2
+    # Picks already planned by the same (bulk) request count as load.
+    assert scheduler.choose(candidates, {2: 2}).agent_id == 3
+
+
+def test_weighted_scales_load_by_capacity():
+    candidates = _candidates(1, 4)
+    scheduler = scheduling.WeightedCapacity(_Load({1: 1, 2: 3}))
+    # (3 + 1) / 4 slots beats (1 + 1) / 1 slot.
+    assert scheduler.choose(candidates, {}).agent_id == 2
+
+
+def test_round_robin_rotates_per_action():
+    candidates = _candidates(1, 1, 1)
+    scheduler = scheduling.RoundRobin()
+    assert [scheduler.choose(candidates, {}).agent_id for _ in range(4)] == [1, 2, 3, 1]
+
+
+def test_simulated_makespan_beats_first_available():
+    capacities = build_fleet(20, seed=7)
+    workload = build_workload(1000, spread=30.0, mean_duration=1.0, seed=7)
+    makespan = {name: simulate(name, capacities, workload).makespan for name in scheduling.SCHEDULERS}
+
+    # Everything on one agent vs. spread over the fleet.
+    assert makespan["least_in_flight"] < makespan["first"] / 5
+    assert makespan["weighted"] <= makespan["round_robin"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_in_flight_follows_assign_and_terminal_transitions():
+    from tests.factories import _build_task
+
+    scheduling.in_flight.clear()
+    task = _build_task("inflight")
+    assert scheduling.in_flight.counts([task.agent_id]) == {task.agent_id: 1}
+
+    # Outside a transaction the post_save commit hook runs at once.
+    task.is_done = True
+    task.latest_event_kind = enums.TaskEventKind.COMPLETED
+    task.save()
+    assert scheduling.in_flight.counts([task.agent_id]) == {task.agent_id: 0}